@@ -31,6 +31,7 @@ Tương thích với Odoo 18.0
         'base', 
         'web', 
         'mail',
+        'bus',
         # HR Core Dependencies
         'hr',
         'hr_contract',
@@ -51,6 +52,8 @@ Tương thích với Odoo 18.0
     ],
     'data': [
         'security/ir.model.access.csv',
+        'security/sbotchat_security.xml',
+        'data/sbotchat_cron.xml',
         'views/sbotchat_views.xml',
         'views/sbotchat_menus.xml',
     ],
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Chat Telemetry
+Ghi nhận thời gian từng vòng gọi LLM, từng HR function, token usage và hit / miss
+memo HR function của một lượt chat; kết quả được lưu vào sbotchat.message cùng
+các dòng timing chi tiết.
+"""
+
+import threading
+import time
+
+# Giá DeepSeek (USD / 1 triệu tokens): input cache hit, input cache miss, output
+MODEL_PRICING = {
+    'deepseek-chat': (0.07, 0.27, 1.10),
+    'deepseek-reasoner': (0.14, 0.55, 2.19),
+}
+
+
+def estimate_cost(model, prompt_tokens, completion_tokens, cached_tokens=0):
+    """Chi phí ước tính (USD) của một lượt theo bảng giá model"""
+    cache_hit_price, cache_miss_price, output_price = MODEL_PRICING.get(model, MODEL_PRICING['deepseek-chat'])
+    cached_tokens = min(cached_tokens, prompt_tokens)
+    return (
+        cached_tokens * cache_hit_price
+        + (prompt_tokens - cached_tokens) * cache_miss_price
+        + completion_tokens * output_price
+    ) / 1_000_000
+
+
+class TurnTelemetry:
+    """Thu thập số liệu của một lượt chat (không chạm DB - dùng được trong worker thread / generator)"""
+
+    # Tổng context cache toàn process (trang debug)
+    _cache_lock = threading.Lock()
+    _cache_totals = {'calls': 0, 'hit_tokens': 0, 'miss_tokens': 0}
+
+    def __init__(self, model):
+        self.model = model
+        self.started = time.monotonic()
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cached_tokens = 0
+        self.cache_miss_tokens = 0
+        self.memo_hits = 0
+        self.memo_misses = 0
+        self.timings = []
+
+    def record_llm(self, elapsed, usage=None):
+        """Một vòng gọi LLM; usage là block 'usage' của DeepSeek (có thể thiếu khi lỗi)"""
+        usage = usage or {}
+        cache_hit = usage.get('prompt_cache_hit_tokens', 0)
+        cache_miss = usage.get('prompt_cache_miss_tokens', 0)
+        self.prompt_tokens += usage.get('prompt_tokens', 0)
+        self.completion_tokens += usage.get('completion_tokens', 0)
+        self.cached_tokens += cache_hit
+        self.cache_miss_tokens += cache_miss
+        self.timings.append({
+            'kind': 'llm',
+            'name': self.model,
+            'iteration': self.llm_iterations + 1,
+            'duration': elapsed,
+            'success': bool(usage),
+            'cache_hit_tokens': cache_hit,
+            'cache_miss_tokens': cache_miss,
+        })
+        if usage:
+            with self._cache_lock:
+                self._cache_totals['calls'] += 1
+                self._cache_totals['hit_tokens'] += cache_hit
+                self._cache_totals['miss_tokens'] += cache_miss
+
+    def record_tool(self, name, elapsed, success=True):
+        self.timings.append({
+            'kind': 'tool',
+            'name': name,
+            'iteration': self.llm_iterations,
+            'duration': elapsed,
+            'success': success,
+        })
+
+    def record_memo(self, hit):
+        """Một lần tra memo kết quả HR function của turn"""
+        if hit:
+            self.memo_hits += 1
+        else:
+            self.memo_misses += 1
+
+    @property
+    def llm_iterations(self):
+        return sum(1 for timing in self.timings if timing['kind'] == 'llm')
+
+    def _total(self, kind):
+        return sum(timing['duration'] for timing in self.timings if timing['kind'] == kind)
+
+    def message_values(self):
+        """Giá trị telemetry ghi vào sbotchat.message của câu trả lời"""
+        return {
+            'model_used': self.model,
+            'prompt_tokens': self.prompt_tokens,
+            'completion_tokens': self.completion_tokens,
+            'cached_tokens': self.cached_tokens,
+            'cache_miss_tokens': self.cache_miss_tokens,
+            'tokens_used': self.prompt_tokens + self.completion_tokens,
+            'response_time': time.monotonic() - self.started,
+            'llm_iterations': self.llm_iterations,
+            'llm_time': self._total('llm'),
+            'tool_time': self._total('tool'),
+            'tool_memo_hits': self.memo_hits,
+            'tool_memo_misses': self.memo_misses,
+            'estimated_cost': estimate_cost(self.model, self.prompt_tokens, self.completion_tokens, self.cached_tokens),
+            'timing_ids': [(0, 0, timing) for timing in self.timings],
+        }
+
+    @classmethod
+    def get_cache_metrics(cls):
+        """Tỷ lệ prompt tokens được phục vụ từ DeepSeek context cache"""
+        with cls._cache_lock:
+            metrics = dict(cls._cache_totals)
+        total = metrics['hit_tokens'] + metrics['miss_tokens']
+        metrics['hit_ratio'] = round(metrics['hit_tokens'] / total, 3) if total else 0.0
+        return metrics
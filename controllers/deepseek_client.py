@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+"""
+DeepSeek LLM Client
+HTTP client dùng chung toàn process cho mọi lời gọi DeepSeek API:
+requests.Session với connection pool keep-alive, tái sử dụng kết nối giữa
+các vòng lặp tool-calling và giữa các request.
+
+Gateway: retry với exponential backoff (có jitter, tôn trọng Retry-After),
+circuit breaker theo endpoint và hedged request tùy chọn khi request chậm
+hơn ngưỡng p95.
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = 'https://api.deepseek.com'
+DEFAULT_POOL_SIZE = 10
+
+# Retry: 429 / 5xx / timeout / lỗi kết nối
+RETRYABLE_STATUS = frozenset([429, 500, 502, 503, 504])
+DEFAULT_MAX_RETRIES = 2
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 8.0
+# Retry-After dài hơn mức này thì trả lỗi ngay thay vì giữ worker
+MAX_RETRY_AFTER = 30
+
+# Circuit breaker: mở sau N lỗi liên tiếp, thử lại (half-open) sau reset timeout
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 30
+
+# Hedging: bắn request thứ hai khi request đầu chậm hơn p95 latency gần đây
+HEDGE_PERCENTILE = 0.95
+HEDGE_MIN_SAMPLES = 20
+HEDGE_MIN_DELAY = 2.0
+LATENCY_WINDOW = 200
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Circuit breaker đang mở - DeepSeek API đang lỗi, từ chối gọi ngay"""
+
+
+class CircuitBreaker:
+    """Circuit breaker closed -> open -> half-open cho một endpoint"""
+
+    def __init__(self, failure_threshold=CIRCUIT_FAILURE_THRESHOLD, reset_timeout=CIRCUIT_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == 'open':
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                # Cho một request thử; các request khác vẫn bị từ chối tới khi có kết quả
+                self.state = 'half_open'
+                return True
+            if self.state == 'half_open':
+                return False
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = 'closed'
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == 'half_open' or self.failures >= self.failure_threshold:
+                if self.state != 'open':
+                    _logger.warning(f"Circuit breaker DeepSeek mở sau {self.failures} lỗi liên tiếp")
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+
+
+def parse_retry_after(value):
+    """Retry-After dạng số giây hoặc HTTP date -> số giây (None nếu không hợp lệ)"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def encode_chat_payload(payload, tools_json=None):
+    """Encode request body; tools_json (bytes đã encode sẵn) được ghép vào mà không serialize lại"""
+    body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+    if tools_json is None:
+        return body
+    return body[:-1] + b',"tools":' + tools_json + b'}'
+
+
+class DeepSeekClient:
+    """LLM client process-wide với pooled Session"""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, base_url=DEFAULT_BASE_URL, pool_size=DEFAULT_POOL_SIZE):
+        self.base_url = base_url.rstrip('/')
+        self.pool_size = pool_size
+
+        self.session = requests.Session()
+        self.session.headers.update({'Connection': 'keep-alive'})
+        # pool_block=False: khi pool đầy vẫn mở kết nối tạm thay vì chặn worker
+        self.adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, pool_block=False)
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+
+        self.max_retries = DEFAULT_MAX_RETRIES
+        self.hedge_requests = False
+        self._breakers = {}
+        self._breakers_lock = threading.Lock()
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._hedge_executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix='sbotchat_llm_hedge')
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'calls': 0,
+            'retries': 0,
+            'failures': 0,
+            'circuit_rejections': 0,
+            'hedged': 0,
+            'hedge_wins': 0,
+        }
+
+    @classmethod
+    def get_instance(cls, base_url=None, pool_size=None):
+        """Lấy client dùng chung; tạo lại khi base_url hoặc pool_size thay đổi.
+
+        Không truyền tham số: trả về client hiện có (hoặc tạo với giá trị mặc định).
+        """
+        if base_url is None and pool_size is None and cls._instance is not None:
+            return cls._instance
+        base_url = (base_url or DEFAULT_BASE_URL).rstrip('/')
+        pool_size = int(pool_size or DEFAULT_POOL_SIZE)
+        instance = cls._instance
+        if instance is None or instance.base_url != base_url or instance.pool_size != pool_size:
+            with cls._instance_lock:
+                instance = cls._instance
+                if instance is None or instance.base_url != base_url or instance.pool_size != pool_size:
+                    if instance is not None:
+                        instance.close()
+                    _logger.info(f"Khởi tạo DeepSeek client: {base_url} (pool size {pool_size})")
+                    instance = cls._instance = cls(base_url=base_url, pool_size=pool_size)
+        return instance
+
+    def configure(self, max_retries=None, hedge_requests=None):
+        """Cập nhật chính sách gateway (đọc từ System Parameters ở mỗi request)"""
+        if max_retries is not None:
+            self.max_retries = max(int(max_retries), 0)
+        if hedge_requests is not None:
+            self.hedge_requests = bool(hedge_requests)
+        return self
+
+    def chat_completions(self, api_key, data=None, json_payload=None, stream=False, timeout=120):
+        """POST /chat/completions qua session dùng chung, trả về requests.Response.
+
+        Lỗi tạm thời (429, 5xx, timeout, mất kết nối) được retry với backoff; khi circuit
+        breaker đang mở raise CircuitOpenError ngay. Response lỗi cuối cùng được trả về
+        nguyên vẹn để caller xử lý như trước.
+        """
+        headers = {
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json',
+        }
+        if stream:
+            headers['Accept'] = 'text/event-stream'
+        url = f'{self.base_url}/chat/completions'
+        kwargs = dict(data=data, json=json_payload, headers=headers, timeout=timeout, stream=stream)
+
+        breaker = self._get_breaker('/chat/completions')
+        self._incr('calls')
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                self._incr('circuit_rejections')
+                raise CircuitOpenError('DeepSeek API tạm thời không khả dụng (circuit breaker đang mở)')
+
+            try:
+                if stream or not self.hedge_requests:
+                    response = self._post(url, kwargs)
+                else:
+                    response = self._post_hedged(url, kwargs)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                breaker.record_failure()
+                delay = self._retry_delay(attempt)
+                if attempt >= self.max_retries:
+                    self._incr('failures')
+                    raise
+                _logger.warning(f"DeepSeek API lỗi {type(e).__name__}, thử lại sau {delay:.2f}s (lần {attempt + 1})")
+            except Exception:
+                breaker.record_failure()
+                self._incr('failures')
+                raise
+            else:
+                if response.status_code not in RETRYABLE_STATUS:
+                    breaker.record_success()
+                    return response
+                # 429 là giới hạn tốc độ, không phải API hỏng
+                if response.status_code == 429:
+                    breaker.record_success()
+                else:
+                    breaker.record_failure()
+                delay = self._retry_delay(attempt, response.headers.get('Retry-After'))
+                if attempt >= self.max_retries or delay is None:
+                    self._incr('failures')
+                    return response
+                _logger.warning(f"DeepSeek API trả về {response.status_code}, thử lại sau {delay:.2f}s (lần {attempt + 1})")
+                response.close()
+
+            attempt += 1
+            self._incr('retries')
+            time.sleep(delay)
+
+    def _post(self, url, kwargs):
+        started = time.monotonic()
+        response = self.session.post(url, **kwargs)
+        if not kwargs.get('stream') and response.status_code == 200:
+            self._latencies.append(time.monotonic() - started)
+        return response
+
+    def _post_hedged(self, url, kwargs):
+        """Gửi request; nếu chưa có phản hồi sau ngưỡng p95 thì gửi thêm một bản, lấy kết quả về trước"""
+        hedge_delay = self._hedge_delay()
+        primary = self._hedge_executor.submit(self._post, url, kwargs)
+        if hedge_delay is None:
+            return primary.result()
+        done, _pending = wait([primary], timeout=hedge_delay)
+        if done:
+            return primary.result()
+
+        self._incr('hedged')
+        hedge = self._hedge_executor.submit(self._post, url, kwargs)
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response = future.result()
+                except Exception as e:
+                    error = e
+                    continue
+                if response.status_code in RETRYABLE_STATUS and pending:
+                    response.close()
+                    continue
+                if future is hedge:
+                    self._incr('hedge_wins')
+                # Đóng response của request thua khi nó hoàn tất
+                for loser in pending:
+                    loser.add_done_callback(self._close_response)
+                return response
+        raise error
+
+    @staticmethod
+    def _close_response(future):
+        if not future.cancelled() and future.exception() is None:
+            future.result().close()
+
+    def _hedge_delay(self):
+        latencies = sorted(self._latencies)
+        if len(latencies) < HEDGE_MIN_SAMPLES:
+            return None
+        p95 = latencies[min(int(len(latencies) * HEDGE_PERCENTILE), len(latencies) - 1)]
+        return max(p95, HEDGE_MIN_DELAY)
+
+    def _retry_delay(self, attempt, retry_after=None):
+        """Full-jitter exponential backoff; Retry-After của server được ưu tiên (None = không retry)"""
+        server_delay = parse_retry_after(retry_after)
+        if server_delay is not None:
+            return server_delay if server_delay <= MAX_RETRY_AFTER else None
+        return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+    def _get_breaker(self, endpoint):
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            with self._breakers_lock:
+                breaker = self._breakers.setdefault(endpoint, CircuitBreaker())
+        return breaker
+
+    def _incr(self, key):
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    def get_gateway_stats(self):
+        """Thống kê retry / circuit breaker / hedging"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['max_retries'] = self.max_retries
+        stats['hedge_requests'] = self.hedge_requests
+        stats['hedge_delay'] = self._hedge_delay()
+        stats['circuits'] = {endpoint: breaker.state for endpoint, breaker in self._breakers.items()}
+        return stats
+
+    def get_pool_stats(self):
+        """Thống kê pool: hit = request dùng lại kết nối sẵn có, miss = phải mở kết nối mới"""
+        requests_count = 0
+        connections_count = 0
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests_count += pool.num_requests
+            connections_count += pool.num_connections
+        return {
+            'base_url': self.base_url,
+            'pool_size': self.pool_size,
+            'requests': requests_count,
+            'pool_hits': max(requests_count - connections_count, 0),
+            'pool_misses': connections_count,
+        }
+
+    def close(self):
+        self._hedge_executor.shutdown(wait=False)
+        try:
+            self.session.close()
+        except Exception as e:
+            _logger.warning(f"Lỗi khi đóng DeepSeek session: {str(e)}")
@@ -1950,7 +1950,14 @@ class HRAPIController(http.Controller):
 
     @http.route('/api/hr/reports/summary', type='json', auth='user', methods=['GET'])
     def hr_reports_summary(self, **kwargs):
-        """API báo cáo tổng hợp HR"""
+        """API báo cáo tổng hợp HR (cache dùng chung giữa người dùng)"""
+        return request.env['sbotchat.aggregate.cache'].get_or_compute(
+            'api.reports_summary', self._compute_reports_summary,
+            ('hr.employee', 'hr.contract', 'hr.leave', 'hr.insurance', 'hr.applicant'),
+        )
+
+    def _compute_reports_summary(self):
+        """Tính số liệu báo cáo tổng hợp HR (không qua cache)"""
         try:
             # Thống kê tổng quan
             total_employees = request.env['hr.employee'].search_count([('active', '=', True)])
@@ -2277,7 +2284,14 @@ class HRAPIController(http.Controller):
 
     @http.route('/api/hr/dashboard/stats', type='json', auth='user', methods=['GET'])
     def hr_dashboard_stats(self, **kwargs):
-        """API thống kê dashboard HR tổng hợp"""
+        """API thống kê dashboard HR tổng hợp (cache dùng chung giữa người dùng, xem sbotchat.aggregate.cache)"""
+        return request.env['sbotchat.aggregate.cache'].get_or_compute(
+            'api.dashboard_stats', self._compute_dashboard_stats,
+            ('hr.employee', 'hr.leave', 'hr.attendance', 'hr.applicant', 'hr.insurance', 'project.project'),
+        )
+
+    def _compute_dashboard_stats(self):
+        """Tính thống kê dashboard HR tổng hợp (không qua cache)"""
         try:
             # Thống kê nhân viên
             total_employees = request.env['hr.employee'].search_count([('active', '=', True)])
@@ -2383,7 +2397,14 @@ class HRAPIController(http.Controller):
 
     @http.route('/api/hr/notifications', type='json', auth='user', methods=['GET'])
     def hr_notifications(self, **kwargs):
-        """API thông báo HR quan trọng"""
+        """API thông báo HR quan trọng (cache dùng chung giữa người dùng)"""
+        return request.env['sbotchat.aggregate.cache'].get_or_compute(
+            'api.notifications', self._compute_notifications,
+            ('hr.contract', 'hr.leave', 'hr.insurance'),
+        )
+
+    def _compute_notifications(self):
+        """Tính danh sách thông báo HR quan trọng (không qua cache)"""
         try:
             notifications = []
             
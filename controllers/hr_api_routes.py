@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+HR API Routes
+Bảng route của HRAPIController dựng một lần từ chính các decorator @http.route
+thành werkzeug Map: path + method -> handler và tham số path (<int:employee_id>...)
+được tách đúng kiểu. Agent gọi mọi endpoint HR trong process mà không cần chuỗi
+so sánh chuỗi; Map của werkzeug khớp theo từng đoạn path nên thời gian không
+phụ thuộc số route.
+"""
+
+import inspect
+import logging
+import threading
+
+from werkzeug.exceptions import MethodNotAllowed, NotFound
+from werkzeug.routing import Map, Rule
+
+from .hr_api import HRAPIController
+from .request_scope import override_http_method
+
+_logger = logging.getLogger(__name__)
+
+
+class HRAPIRouter:
+    """werkzeug Map của các route HRAPIController, dùng chung cho process"""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, controller_class=HRAPIController):
+        rules = []
+        for name, member in inspect.getmembers(controller_class, callable):
+            routing = getattr(member, 'original_routing', None)
+            if not routing:
+                continue
+            for path in routing.get('routes') or ():
+                rules.append(Rule(path, endpoint=name, methods=routing.get('methods')))
+        self.controller = controller_class()
+        self.url_map = Map(rules, strict_slashes=False)
+        self.adapter = self.url_map.bind('localhost')
+        _logger.info(f"Đã dựng bảng route HR API: {len(rules)} route")
+
+    @classmethod
+    def get(cls):
+        """Router dùng chung (dựng lần đầu sử dụng)"""
+        router = cls._instance
+        if router is None:
+            with cls._instance_lock:
+                router = cls._instance
+                if router is None:
+                    router = cls._instance = cls()
+        return router
+
+    def match(self, path, method='GET'):
+        """(tên handler, tham số path); NotFound / MethodNotAllowed nếu không có route"""
+        return self.adapter.match(path, method=method.upper())
+
+    def dispatch(self, path, method='GET', params=None):
+        """Gọi handler của path với method đã cho; tham số path ghi đè params trùng tên"""
+        try:
+            endpoint, path_args = self.match(path, method)
+        except MethodNotAllowed as e:
+            return {'success': False, 'error': f"HR API {path} không hỗ trợ {method.upper()} "
+                                               f"(hỗ trợ: {', '.join(sorted(e.valid_methods or []))})"}
+        except NotFound:
+            return {'success': False, 'error': f"Không có HR API {path}"}
+
+        with override_http_method(method):
+            return getattr(self.controller, endpoint)(**{**(params or {}), **path_args})
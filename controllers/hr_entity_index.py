@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+"""
+HR Entity Index
+Index trong bộ nhớ (theo database + công ty) cho tên / email / mã của nhân viên,
+phòng ban và vị trí công việc. Tra cứu không dấu, gần đúng bằng trigram để trả về
+id ứng viên xếp hạng mà không cần truy vấn ilike.
+
+Cập nhật tăng dần: ORM hook của hr.employee / hr.department / hr.job đánh dấu
+bản ghi thay đổi sau commit (process hiện tại); các worker khác phát hiện thay
+đổi qua kiểm tra write_date định kỳ.
+
+Index dùng chung trong công ty (build bằng sudo) nên kết quả luôn được lọc theo
+người gọi: chỉ bản ghi họ đọc được (record rules), chỉ người dùng HR được khớp
+theo mã định danh / mã chấm công, và giá trị của các field đó không bao giờ được
+trả về.
+"""
+
+import heapq
+import logging
+import threading
+import time
+
+from .hr_text_normalizer import fold, normalize
+
+_logger = logging.getLogger(__name__)
+
+# type -> (model, fields được index)
+ENTITY_SOURCES = {
+    'employee': ('hr.employee', ('name', 'work_email', 'barcode', 'identification_id')),
+    'department': ('hr.department', ('name', 'complete_name')),
+    'job': ('hr.job', ('name',)),
+}
+MODEL_TYPES = {model: entity_type for entity_type, (model, _fields) in ENTITY_SOURCES.items()}
+# Field nhạy cảm: chỉ người dùng HR được tra theo, giá trị khớp không được trả về
+SENSITIVE_FIELDS = frozenset(['barcode', 'identification_id'])
+SENSITIVE_GROUP = 'hr.group_hr_user'
+
+MIN_SCORE = 0.35
+DEFAULT_LIMIT = 5
+# Worker khác có thể đã sửa dữ liệu: kiểm tra write_date / số bản ghi sau mỗi khoảng này (giây)
+STALE_CHECK_SECONDS = 60
+
+
+def trigrams(folded):
+    padded = f'  {folded} '
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+class EntityIndex:
+    """Index của một công ty: mỗi chuỗi khóa là một slot; từ -> slot và trigram -> slot.
+
+    Slot của bản ghi bị xóa / cập nhật được đưa vào free-list và dùng lại: worker sống lâu
+    không bao giờ build lại index nên slots không được phình theo số lần cập nhật.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.slots = []
+        self.free_slots = []
+        self.words = {}
+        self.postings = {}
+        self.checked_at = time.monotonic()
+        self.watermarks = {}
+        # (model, id) đã đổi, chờ áp dụng ở lần tra cứu sau (ghi dưới khóa toàn cục của HREntityIndex)
+        self.dirty = set()
+
+    def add(self, entity_type, record):
+        key = (entity_type, record['id'])
+        self.remove(key)
+        slots = []
+        seen = set()
+        for field_name in ENTITY_SOURCES[entity_type][1]:
+            value = record.get(field_name)
+            folded = fold(value) if value else ''
+            if not folded or folded in seen:
+                continue
+            seen.add(folded)
+            grams = frozenset(trigrams(folded))
+            item = (key, field_name, value, folded, grams)
+            if self.free_slots:
+                slot = self.free_slots.pop()
+                self.slots[slot] = item
+            else:
+                slot = len(self.slots)
+                self.slots.append(item)
+            for word in set(folded.split()):
+                self.words.setdefault(word, set()).add(slot)
+            for gram in grams:
+                self.postings.setdefault(gram, set()).add(slot)
+            slots.append(slot)
+        self.entries[key] = {'name': record.get('complete_name') or record.get('name') or '', 'slots': slots}
+
+    def remove(self, key):
+        entry = self.entries.pop(key, None)
+        if not entry:
+            return
+        for slot in entry['slots']:
+            _key, _field_name, _value, folded, grams = self.slots[slot]
+            for table, tokens in ((self.words, set(folded.split())), (self.postings, grams)):
+                for token in tokens:
+                    posting = table.get(token)
+                    if posting:
+                        posting.discard(slot)
+                        if not posting:
+                            del table[token]
+            self.slots[slot] = None
+            self.free_slots.append(slot)
+
+    def search(self, query, types=None, limit=DEFAULT_LIMIT, include_sensitive=False):
+        """Top ứng viên (query: chuỗi hoặc NormalizedText) theo điểm: trùng khớp 1.0, trùng trọn từ 0.8-0.9, còn lại hệ số Dice trigram.
+
+        include_sensitive: cho phép khớp theo SENSITIVE_FIELDS (giá trị khớp vẫn không được trả về).
+
+        Slot chứa đủ các từ của truy vấn được chấm trước (giao tập theo từ). Sau đó duyệt trigram
+        từ hiếm tới phổ biến và dừng khi slot chưa gặp không thể vượt ngưỡng top-k hiện tại:
+        sau i trigram, slot chưa gặp chỉ chung tối đa n - i trigram với truy vấn.
+        """
+        folded = normalize(query).folded
+        if not folded:
+            return []
+        query_grams = frozenset(trigrams(folded))
+        total = len(query_grams)
+        padded_query = f' {folded} '
+
+        best = {}
+        visited = set()
+        threshold = MIN_SCORE
+
+        def visit(slots):
+            for slot in slots:
+                if slot in visited:
+                    continue
+                visited.add(slot)
+                key, field_name, value, candidate, grams = self.slots[slot]
+                if types and key[0] not in types:
+                    continue
+                if field_name in SENSITIVE_FIELDS and not include_sensitive:
+                    continue
+                if candidate == folded:
+                    score = 1.0
+                elif padded_query in f' {candidate} ':
+                    # Trùng trọn một hoặc nhiều từ ("lan" trong "nguyen thi lan")
+                    score = 0.9 - 0.1 * (1 - len(folded) / len(candidate))
+                else:
+                    score = 2.0 * len(query_grams & grams) / (total + len(grams))
+                if score >= MIN_SCORE and score > best.get(key, (0,))[0]:
+                    best[key] = (score, field_name, value)
+            if len(best) >= limit:
+                return max(MIN_SCORE, heapq.nlargest(limit, (item[0] for item in best.values()))[-1])
+            return MIN_SCORE
+
+        word_postings = [self.words.get(word, set()) for word in folded.split()]
+        threshold = visit(set.intersection(*word_postings))
+
+        ordered = sorted(query_grams, key=lambda gram: len(self.postings.get(gram, ())))
+        for position, gram in enumerate(ordered):
+            if 2.0 * (total - position) / (2 * total - position) < threshold:
+                break
+            threshold = visit(self.postings.get(gram, ()))
+
+        ranked = heapq.nsmallest(limit, best.items(), key=lambda item: (-item[1][0], self.entries[item[0]]['name']))
+        return [{
+            'type': key[0],
+            'id': key[1],
+            'name': self.entries[key]['name'],
+            'matched_field': field_name,
+            'matched': None if field_name in SENSITIVE_FIELDS else value,
+            'score': round(score, 3),
+        } for key, (score, field_name, value) in ranked]
+
+
+class HREntityIndex:
+    """Quản lý các EntityIndex theo (database, công ty) trong process.
+
+    Khóa toàn cục chỉ giữ khi tra / thay dict (index, khóa, dirty, số liệu). Build, cập nhật
+    và tìm kiếm một index giữ khóa riêng của (database, công ty) đó: build lần đầu hay làm mới
+    của một công ty không chặn tra cứu của công ty / database khác.
+    """
+
+    _lock = threading.Lock()
+    _index_locks = {}
+    _indexes = {}
+    _metrics = {
+        'lookups': 0,
+        'builds': 0,
+        'refreshed_records': 0,
+        'total_time': 0.0,
+    }
+
+    @classmethod
+    def resolve(cls, env, query, types=None, limit=DEFAULT_LIMIT):
+        """Ứng viên xếp hạng [{'type', 'id', 'name', 'matched_field', 'matched', 'score'}] cho tên / email / mã,
+        chỉ gồm bản ghi env đọc được"""
+        types = [entity_type for entity_type in (types or ENTITY_SOURCES) if entity_type in ENTITY_SOURCES]
+        include_sensitive = env.su or env.user.has_group(SENSITIVE_GROUP)
+        key = (env.cr.dbname, env.company.id)
+        with cls._index_lock(key):
+            index = cls._get_index(env, key)
+            started = time.perf_counter()
+            # Lấy dư để còn đủ ứng viên sau khi lọc theo quyền người gọi
+            candidates = index.search(query, types, limit * 3, include_sensitive=include_sensitive)
+            elapsed = time.perf_counter() - started
+        with cls._lock:
+            cls._metrics['lookups'] += 1
+            cls._metrics['total_time'] += elapsed
+        return cls._filter_readable(env, candidates)[:limit]
+
+    @staticmethod
+    def _filter_readable(env, candidates):
+        """Bỏ ứng viên người gọi không đọc được (ACL, record rules) - một truy vấn mỗi loại"""
+        readable = set()
+        for entity_type in {candidate['type'] for candidate in candidates}:
+            model = env[ENTITY_SOURCES[entity_type][0]]
+            ids = [candidate['id'] for candidate in candidates if candidate['type'] == entity_type]
+            if not model.has_access('read'):
+                continue
+            readable.update((entity_type, record_id) for record_id in model.search([('id', 'in', ids)]).ids)
+        return [candidate for candidate in candidates if (candidate['type'], candidate['id']) in readable]
+
+    @classmethod
+    def mark_dirty(cls, dbname, model, ids):
+        """Gọi sau commit khi bản ghi được tạo / sửa / xóa; áp dụng ở lần tra cứu sau của từng index"""
+        with cls._lock:
+            for (index_dbname, _company_id), index in cls._indexes.items():
+                if index_dbname == dbname:
+                    index.dirty.update((model, record_id) for record_id in ids)
+
+    @classmethod
+    def clear(cls, dbname=None):
+        with cls._lock:
+            for key in [key for key in cls._indexes if dbname in (None, key[0])]:
+                del cls._indexes[key]
+
+    @classmethod
+    def _index_lock(cls, key):
+        with cls._lock:
+            lock = cls._index_locks.get(key)
+            if lock is None:
+                lock = cls._index_locks[key] = threading.Lock()
+        return lock
+
+    @classmethod
+    def _get_index(cls, env, key):
+        """Index của key (gọi khi đang giữ khóa của key): build nếu chưa có, áp dụng thay đổi, làm mới nếu cũ"""
+        with cls._lock:
+            index = cls._indexes.get(key)
+        if index is None:
+            index = cls._build(env, key)
+        cls._apply_dirty(env, key, index)
+        if time.monotonic() - index.checked_at > STALE_CHECK_SECONDS:
+            index = cls._refresh_stale(env, key, index)
+        return index
+
+    @classmethod
+    def _domain(cls, env):
+        return [('company_id', 'in', [env.company.id, False])]
+
+    @classmethod
+    def _build(cls, env, key):
+        """Build index mới và thay vào dict. Index được đăng ký trước khi nạp dữ liệu để mark_dirty
+        trong lúc build không bị mất (áp dụng ngay sau build); tra cứu khác của key chờ khóa của key."""
+        started = time.monotonic()
+        index = EntityIndex()
+        with cls._lock:
+            previous = cls._indexes.get(key)
+            cls._indexes[key] = index
+        try:
+            for entity_type, (model, field_names) in ENTITY_SOURCES.items():
+                records = env[model].sudo().search_read(cls._domain(env), list(field_names) + ['write_date'])
+                for record in records:
+                    index.add(entity_type, record)
+                index.watermarks[model] = (max((record['write_date'] for record in records), default=None), len(records))
+        except Exception:
+            with cls._lock:
+                if cls._indexes.get(key) is index:
+                    if previous is None:
+                        del cls._indexes[key]
+                    else:
+                        cls._indexes[key] = previous
+            raise
+        with cls._lock:
+            cls._metrics['builds'] += 1
+        _logger.info(f"Đã build entity index công ty {key[1]}: {len(index.entries)} bản ghi "
+                     f"trong {(time.monotonic() - started) * 1000:.0f}ms")
+        return index
+
+    @classmethod
+    def _apply_dirty(cls, env, key, index):
+        """Cập nhật các bản ghi đã đánh dấu của index"""
+        with cls._lock:
+            dirty, index.dirty = index.dirty, set()
+        if not dirty:
+            return
+        by_model = {}
+        for model, record_id in dirty:
+            by_model.setdefault(model, set()).add(record_id)
+        company_id = key[1]
+        refreshed = 0
+        for model, ids in by_model.items():
+            entity_type = MODEL_TYPES[model]
+            field_names = list(ENTITY_SOURCES[entity_type][1]) + ['company_id']
+            records = {
+                record['id']: record
+                for record in env[model].sudo().search_read([('id', 'in', list(ids))], field_names)
+            }
+            for record_id in ids:
+                record = records.get(record_id)
+                if record and (not record['company_id'] or record['company_id'][0] == company_id):
+                    index.add(entity_type, record)
+                else:
+                    index.remove((entity_type, record_id))
+            refreshed += len(ids)
+        with cls._lock:
+            cls._metrics['refreshed_records'] += refreshed
+
+    @classmethod
+    def _refresh_stale(cls, env, key, index):
+        """Phát hiện thay đổi từ worker khác: bản ghi mới sửa được nạp lại, số bản ghi lệch thì build lại"""
+        index.checked_at = time.monotonic()
+        refreshed = 0
+        for entity_type, (model, field_names) in ENTITY_SOURCES.items():
+            last_write, last_count = index.watermarks.get(model, (None, 0))
+            [(max_write, count)] = env[model].sudo()._read_group(
+                cls._domain(env), aggregates=['write_date:max', '__count'])
+            if count != last_count:
+                return cls._build(env, key)
+            if max_write and (not last_write or max_write > last_write):
+                records = env[model].sudo().search_read(
+                    cls._domain(env) + ([('write_date', '>', last_write)] if last_write else []),
+                    list(field_names))
+                for record in records:
+                    index.add(entity_type, record)
+                index.watermarks[model] = (max_write, count)
+                refreshed += len(records)
+        with cls._lock:
+            cls._metrics['refreshed_records'] += refreshed
+        return index
+
+    @classmethod
+    def get_metrics(cls):
+        with cls._lock:
+            metrics = dict(cls._metrics)
+            metrics['indexes'] = len(cls._indexes)
+            metrics['entries'] = sum(len(index.entries) for index in cls._indexes.values())
+        metrics['avg_us'] = round(metrics['total_time'] / metrics['lookups'] * 1_000_000, 1) if metrics['lookups'] else 0.0
+        return metrics
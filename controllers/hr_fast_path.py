@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+HR Fast Path
+Trả lời trực tiếp các tra cứu HR đơn giản (danh sách nhân viên, nghỉ phép,
+thống kê tổng quan) bằng intent rule của HRAIAgentController và
+template _format_*, không cần vòng gọi DeepSeek.
+
+Chỉ action chỉ đọc trong whitelist, confidence đủ cao, câu ngắn, chứa cụm từ
+kích hoạt rõ ràng và không có điều kiện nào fetcher không áp dụng được (tên,
+trạng thái, ngày, lương...) mới đi đường tắt; mọi trường hợp khác chuyển cho LLM.
+"""
+
+import logging
+import re
+import threading
+import time
+
+from odoo.http import request
+
+from .hr_ai_agent import HRAIAgentController
+from .hr_entity_index import HREntityIndex
+from .hr_text_normalizer import normalize, search
+
+_logger = logging.getLogger(__name__)
+
+MIN_CONFIDENCE = 0.8
+# Câu dài hoặc nhiều bước (và / rồi / sau đó...) cần model hiểu ngữ cảnh
+MAX_WORDS = 12
+MULTI_STEP_MARKERS = (' và ', ' rồi ', 'sau đó', ' and ', ' then ', ' nếu ', ' if ', ' tại sao', ' why ')
+FAST_PATH_LIMIT = 10
+
+# action -> cụm từ bắt buộc phải có (chặt hơn keyword của _analyze_intent)
+FAST_PATH_TRIGGERS = {
+    'list_employees': ('danh sách nhân viên', 'list employee', 'tất cả nhân viên', 'all employee'),
+    'list_leaves': ('danh sách nghỉ phép', 'list leaves', 'danh sách đơn nghỉ phép', 'danh sách đơn nghỉ'),
+    'dashboard_stats': ('thống kê', 'tổng quan', 'dashboard', 'overview', 'statistics'),
+}
+
+# Từ đệm (không dấu) được phép đứng quanh cụm từ kích hoạt. Còn từ nào khác (tên nhân viên,
+# trạng thái, ngày, lương...) là điều kiện fetcher không áp dụng được -> chuyển cho LLM
+FILLER_WORDS = frozenset((
+    'cho', 'toi', 'xem', 'hien', 'thi', 'liet', 'ke', 'lay', 'tat', 'ca', 'cac', 'nhung',
+    'toan', 'bo', 'cong', 'ty', 'giup', 'vui', 'long', 'hay', 'nhe', 'voi', 'nhan', 'su', 'he', 'thong',
+    'show', 'me', 'please', 'list', 'get', 'the', 'all', 'hr',
+))
+
+# Dạng trọn từ không dấu (' danh sach nhan vien ') để so với NormalizedText.words
+_FOLDED_MARKERS = tuple(normalize(marker).words for marker in MULTI_STEP_MARKERS)
+_FOLDED_TRIGGERS = {
+    action: tuple(normalize(trigger).words for trigger in triggers)
+    for action, triggers in FAST_PATH_TRIGGERS.items()
+}
+# Phòng ban được nhắc tới phải khớp tên trong entity index ít nhất ở mức trùng trọn từ
+MIN_DEPARTMENT_SCORE = 0.8
+
+_DEPARTMENT_RE = re.compile(r'(?:phong ban|phong|department)\s+(.+?)\s*[?.!]*$')
+_WORD_RE = re.compile(r'\w+')
+
+
+class HRFastPath:
+    """Đường tắt rule-based trước vòng gọi LLM"""
+
+    _metrics_lock = threading.Lock()
+    _metrics = {
+        'hits': 0,
+        'misses': 0,
+        'total_time': 0.0,
+    }
+
+    @classmethod
+    def answer(cls, message):
+        """Trả về {'action', 'response', 'elapsed'} nếu trả lời được trực tiếp, ngược lại None"""
+        started = time.monotonic()
+        try:
+            response, action = cls._answer(message)
+        except Exception as e:
+            _logger.error(f"Lỗi fast path, chuyển cho LLM: {str(e)}")
+            response, action = None, None
+        elapsed = time.monotonic() - started
+
+        with cls._metrics_lock:
+            if response is None:
+                cls._metrics['misses'] += 1
+            else:
+                cls._metrics['hits'] += 1
+                cls._metrics['total_time'] += elapsed
+        if response is None:
+            return None
+        _logger.info(f"Fast path: {action} trả lời trong {elapsed * 1000:.1f}ms")
+        return {'action': action, 'response': response, 'elapsed': elapsed}
+
+    @classmethod
+    def _answer(cls, message):
+        normalized = normalize(message)
+        if not normalized.tokens or len(normalized.text.split()) > MAX_WORDS \
+                or any(marker in normalized.words for marker in _FOLDED_MARKERS):
+            return None, None
+
+        agent = HRAIAgentController()
+        intent = agent._analyze_intent(normalized)
+        action = intent.get('action')
+        if intent.get('confidence', 0) < MIN_CONFIDENCE or action not in FAST_PATH_TRIGGERS:
+            return None, None
+        if not any(trigger in normalized.words for trigger in _FOLDED_TRIGGERS[action]):
+            return None, None
+        if cls._unhandled_words(normalized, action):
+            return None, None
+
+        data = getattr(cls, f'_fetch_{action}')(agent, normalized)
+        if data is None or (isinstance(data, dict) and data.get('error')):
+            return None, None
+        return agent._format_response(action, {'success': True, 'data': data}), action
+
+    @staticmethod
+    def _unhandled_words(normalized, action):
+        """Các từ ngoài cụm từ kích hoạt, phòng ban (list_employees) và từ đệm"""
+        remaining = normalized.words
+        if action == 'list_employees':
+            match = _DEPARTMENT_RE.search(normalized.folded)
+            if match:
+                remaining = f" {' '.join(_WORD_RE.findall(normalized.folded[:match.start()]))} "
+        for trigger in sorted(_FOLDED_TRIGGERS[action], key=len, reverse=True):
+            remaining = remaining.replace(trigger, ' ')
+        return [word for word in remaining.split() if word not in FILLER_WORDS]
+
+    @classmethod
+    def _fetch_list_employees(cls, agent, normalized):
+        domain = [('active', '=', True)]
+        department = cls._find_department(normalized)
+        if department is False:
+            return None
+        if department:
+            domain.append(('department_id', 'child_of', department.id))
+        return request.env['hr.employee'].search_read(
+            domain, ['name', 'work_email', 'department_id'], limit=FAST_PATH_LIMIT, order='name')
+
+    @classmethod
+    def _fetch_list_leaves(cls, agent, normalized):
+        return request.env['hr.leave'].search_read(
+            [], ['employee_id', 'date_from', 'date_to', 'name', 'state'], limit=5, order='date_from desc')
+
+    @classmethod
+    def _fetch_dashboard_stats(cls, agent, normalized):
+        return agent._get_dashboard_stats()
+
+    @staticmethod
+    def _find_department(normalized):
+        """Phòng ban được nhắc tới: record, None nếu không nhắc tới, False nếu không tìm thấy"""
+        groups = search(_DEPARTMENT_RE, normalized)
+        if not groups:
+            return None
+        candidates = HREntityIndex.resolve(request.env, groups[0], types=['department'], limit=1)
+        if not candidates or candidates[0]['score'] < MIN_DEPARTMENT_SCORE:
+            return False
+        return request.env['hr.department'].browse(candidates[0]['id'])
+
+    @classmethod
+    def get_metrics(cls):
+        with cls._metrics_lock:
+            metrics = dict(cls._metrics)
+        total = metrics['hits'] + metrics['misses']
+        metrics['hit_ratio'] = round(metrics['hits'] / total, 3) if total else 0.0
+        metrics['avg_ms'] = round(metrics['total_time'] / metrics['hits'] * 1000, 1) if metrics['hits'] else 0.0
+        return metrics
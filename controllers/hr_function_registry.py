@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+HR Function Registry
+Đăng ký HR function cho function calling bằng decorator trên method _hr_* của
+controller: tên function -> handler kèm metadata (chỉ đọc / ghi, mức chi phí,
+timeout). Mỗi function có validator biên dịch một lần từ JSON schema của
+HRFunctionsSchema và chữ ký handler: ép kiểu, kiểm tra enum / bắt buộc, bỏ tham
+số handler không nhận - lời gọi sai bị từ chối trước khi chạm tới ORM.
+
+    @hr_function('get_employees', read_only=True)
+    def _hr_get_employees(self, department=None, active=True, limit=20, name=None):
+        ...
+"""
+
+import inspect
+import logging
+import re
+import threading
+from collections import namedtuple
+
+from .hr_functions_schema import HRFunctionsSchema
+
+_logger = logging.getLogger(__name__)
+
+COST_LIGHT = 'light'
+COST_HEAVY = 'heavy'
+# Timeout (giây) khi chạy song song trên thread pool
+DEFAULT_TIMEOUT = 60
+HEAVY_TIMEOUT = 120
+
+HRFunctionSpec = namedtuple('HRFunctionSpec', ['name', 'method', 'read_only', 'cost', 'timeout', 'validator'])
+
+_INTEGER_RE = re.compile(r'^[-+]?\d+$')
+_TRUE_STRINGS = frozenset(['true', '1', 'yes'])
+_FALSE_STRINGS = frozenset(['false', '0', 'no'])
+
+
+def hr_function(name, read_only=False, cost=COST_LIGHT, timeout=None):
+    """Đánh dấu method là handler của HR function `name`"""
+    def decorator(method):
+        method.hr_function = {
+            'name': name,
+            'read_only': read_only,
+            'cost': cost,
+            'timeout': timeout or (HEAVY_TIMEOUT if cost == COST_HEAVY else DEFAULT_TIMEOUT),
+        }
+        return method
+    return decorator
+
+
+class ArgumentError(ValueError):
+    """Tham số function calling không hợp lệ"""
+
+
+def _coerce_integer(value):
+    if isinstance(value, bool):
+        raise ValueError('phải là số nguyên')
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and _INTEGER_RE.match(value.strip()):
+        return int(value.strip())
+    raise ValueError('phải là số nguyên')
+
+
+def _coerce_number(value):
+    if isinstance(value, bool):
+        raise ValueError('phải là số')
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            pass
+    raise ValueError('phải là số')
+
+
+def _coerce_boolean(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str) and value.strip().lower() in _TRUE_STRINGS | _FALSE_STRINGS:
+        return value.strip().lower() in _TRUE_STRINGS
+    raise ValueError('phải là true / false')
+
+
+def _coerce_string(value):
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise ValueError('phải là chuỗi')
+
+
+def _coerce_object(value):
+    if isinstance(value, dict):
+        return value
+    raise ValueError('phải là object')
+
+
+_TYPE_COERCERS = {
+    'integer': _coerce_integer,
+    'number': _coerce_number,
+    'boolean': _coerce_boolean,
+    'string': _coerce_string,
+    'object': _coerce_object,
+}
+
+
+def compile_coercer(schema):
+    """Hàm ép kiểu / kiểm tra cho một property JSON schema (raise ValueError kèm lý do)"""
+    if schema.get('type') == 'array':
+        item_coercer = compile_coercer(schema.get('items') or {})
+
+        def coerce(value):
+            if not isinstance(value, (list, tuple)):
+                raise ValueError('phải là mảng')
+            return [item_coercer(item) for item in value]
+    else:
+        coerce = _TYPE_COERCERS.get(schema.get('type'), lambda value: value)
+
+    enum = schema.get('enum')
+    if not enum:
+        return coerce
+    allowed = frozenset(enum)
+
+    def coerce_enum(value):
+        value = coerce(value)
+        if value not in allowed:
+            raise ValueError(f"phải là một trong {', '.join(map(str, enum))}")
+        return value
+    return coerce_enum
+
+
+class ArgumentValidator:
+    """Validator của một HR function: JSON schema parameters + chữ ký handler -> kwargs hợp lệ"""
+
+    def __init__(self, name, parameters, handler):
+        self.name = name
+        signature = inspect.signature(handler)
+        accepts_any = any(param.kind == param.VAR_KEYWORD for param in signature.parameters.values())
+        handler_params = {
+            param_name: param for param_name, param in signature.parameters.items()
+            if param_name != 'self' and param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY)
+        }
+        properties = parameters.get('properties') or {}
+        required = set(parameters.get('required') or ())
+
+        # (tên, hàm ép kiểu, bắt buộc) cho các property handler nhận được
+        self.fields = [
+            (prop_name, compile_coercer(prop_schema), prop_name in required)
+            for prop_name, prop_schema in properties.items()
+            if accepts_any or prop_name in handler_params
+        ]
+        self.known = frozenset(prop_name for prop_name, _coerce, _required in self.fields)
+        # Tham số handler bắt buộc theo chữ ký nhưng tùy chọn trong schema: truyền default của schema / None
+        self.fills = {
+            param_name: (properties.get(param_name) or {}).get('default')
+            for param_name, param in handler_params.items()
+            if param.default is param.empty and param_name not in required
+        }
+
+    def __call__(self, args):
+        if not isinstance(args, dict):
+            raise ArgumentError('tham số phải là JSON object')
+        errors = []
+        kwargs = dict(self.fills)
+        for prop_name, coerce, required in self.fields:
+            value = args.get(prop_name)
+            if value is None:
+                if required:
+                    errors.append(f'thiếu {prop_name}')
+                continue
+            try:
+                kwargs[prop_name] = coerce(value)
+            except ValueError as e:
+                errors.append(f'{prop_name} {e}')
+        if errors:
+            raise ArgumentError('; '.join(errors))
+        unknown = set(args) - self.known
+        if unknown:
+            _logger.info(f"HR function {self.name}: bỏ qua tham số không hỗ trợ {sorted(unknown)}")
+        return kwargs
+
+
+class HRFunctionRegistry:
+    """Các HR function đã đăng ký của một controller class, validator theo version catalog"""
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, controller_class, catalog):
+        self.version = catalog.version
+        schemas = {tool['function']['name']: tool['function'].get('parameters') or {} for tool in catalog.tools}
+        self.functions = {}
+        for attr_name, member in inspect.getmembers(controller_class, callable):
+            meta = getattr(member, 'hr_function', None)
+            if not isinstance(meta, dict):
+                continue
+            name = meta['name']
+            if name in self.functions:
+                raise ValueError(f"HR function {name} được đăng ký hai lần ({self.functions[name].method}, {attr_name})")
+            if name not in schemas:
+                _logger.warning(f"HR function {name} không có trong HRFunctionsSchema - model sẽ không gọi được")
+            self.functions[name] = HRFunctionSpec(
+                name, attr_name, meta['read_only'], meta['cost'], meta['timeout'],
+                ArgumentValidator(name, schemas.get(name, {}), member),
+            )
+        _logger.info(f"Đã đăng ký {len(self.functions)} HR functions cho {controller_class.__name__}")
+
+    @classmethod
+    def get(cls, controller_class):
+        """Registry của controller_class (dựng lại khi catalog schema đổi version)"""
+        catalog = HRFunctionsSchema.get_catalog()
+        registry = cls._instances.get(controller_class)
+        if registry is None or registry.version != catalog.version:
+            with cls._instances_lock:
+                registry = cls._instances.get(controller_class)
+                if registry is None or registry.version != catalog.version:
+                    registry = cls._instances[controller_class] = cls(controller_class, catalog)
+        return registry
@@ -3,14 +3,90 @@
 HR Functions Schema for AI Function Calling
 Contains the complete schema definitions for HR-related functions
 Extracted from main.py _get_hr_functions_schema method for better organization
+
+The catalog is built and validated once per process and kept as pre-encoded
+JSON bytes, so the request body can embed it without re-serializing.
 """
 
+import hashlib
+import json
+import logging
+import threading
+from collections import namedtuple
+
+_logger = logging.getLogger(__name__)
+
+ToolCatalog = namedtuple('ToolCatalog', ['tools', 'names', 'encoded', 'tools_json', 'version'])
+
+
 class HRFunctionsSchema:
     """Class containing HR functions schema for AI function calling"""
-    
+
+    _catalog = None
+    _catalog_lock = threading.Lock()
+
+    @classmethod
+    def get_schema(cls):
+        """Get HR functions schema for AI function calling (cached per process)"""
+        return list(cls.get_catalog().tools)
+
+    @classmethod
+    def get_catalog(cls):
+        """Catalog đã validate: tools, thứ tự tên, JSON bytes từng tool, JSON bytes cả list, version hash"""
+        catalog = cls._catalog
+        if catalog is None:
+            with cls._catalog_lock:
+                catalog = cls._catalog
+                if catalog is None:
+                    catalog = cls._catalog = cls._build_catalog(cls._build_schema())
+        return catalog
+
+    @classmethod
+    def get_tools_json(cls, names=None):
+        """JSON bytes của danh sách tools (toàn bộ hoặc tập con theo names, giữ thứ tự catalog)"""
+        catalog = cls.get_catalog()
+        if names is None:
+            return catalog.tools_json
+        wanted = set(names)
+        return b'[' + b','.join(catalog.encoded[name] for name in catalog.names if name in wanted) + b']'
+
+    @classmethod
+    def get_schema_version(cls):
+        """Hash nội dung catalog - thay đổi khi schema thay đổi (module upgrade)"""
+        return cls.get_catalog().version
+
+    @staticmethod
+    def _build_catalog(schema):
+        """Validate schema một lần và encode sẵn từng tool"""
+        tools = []
+        names = []
+        encoded = {}
+        for tool in schema:
+            function = tool.get('function') or {}
+            name = function.get('name')
+            if tool.get('type') != 'function' or not name:
+                raise ValueError(f"Tool schema không hợp lệ: {tool}")
+            parameters = function.get('parameters') or {}
+            if parameters.get('type') != 'object':
+                raise ValueError(f"Tool {name}: parameters phải có type 'object'")
+            missing = set(parameters.get('required', [])) - set(parameters.get('properties', {}))
+            if missing:
+                raise ValueError(f"Tool {name}: required không có trong properties: {sorted(missing)}")
+            if name in encoded:
+                _logger.warning(f"Bỏ qua định nghĩa trùng lặp của HR function {name}")
+                continue
+            tools.append(tool)
+            names.append(name)
+            encoded[name] = json.dumps(tool, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+        tools_json = b'[' + b','.join(encoded[name] for name in names) + b']'
+        version = hashlib.sha256(tools_json).hexdigest()[:16]
+        _logger.info(f"Đã nạp HR tool catalog: {len(names)} functions, version {version}")
+        return ToolCatalog(tuple(tools), tuple(names), encoded, tools_json, version)
+
     @staticmethod
-    def get_schema():
-        """Get HR functions schema for AI function calling"""
+    def _build_schema():
+        """Raw schema definitions"""
         return [
             {
                 "type": "function",
@@ -202,6 +278,37 @@ class HRFunctionsSchema:
                     }
                 }
             },
+            {
+                "type": "function",
+                "function": {
+                    "name": "resolve_entity",
+                    "description": "Tìm ID nhân viên / phòng ban / vị trí công việc từ tên, email hoặc mã (không phân biệt dấu, chấp nhận gõ sai). Trả về danh sách ứng viên xếp hạng theo độ khớp",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "query": {"type": "string", "description": "Tên, email hoặc mã cần tìm"},
+                            "entity_type": {"type": "string", "enum": ["employee", "department", "job"], "description": "Chỉ tìm loại này (bỏ trống = tất cả)"},
+                            "limit": {"type": "integer", "description": "Số ứng viên tối đa", "default": 5}
+                        },
+                        "required": ["query"]
+                    }
+                }
+            },
+            {
+                "type": "function",
+                "function": {
+                    "name": "get_employee_360",
+                    "description": "Hồ sơ tổng hợp của MỘT nhân viên trong một lần gọi: thông tin cá nhân, phòng ban, chức vụ, quản lý, hợp đồng đang hiệu lực, số ngày phép còn lại theo loại và các lần chấm công gần nhất. Dùng thay cho chuỗi get_employees / get_employee_detail / get_contracts / get_employee_leaves / get_attendance_summary khi người dùng hỏi chung về một nhân viên",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "employee_id": {"type": "integer", "description": "ID nhân viên"},
+                            "name": {"type": "string", "description": "Tên nhân viên (dùng khi chưa biết ID)"},
+                            "attendance_limit": {"type": "integer", "description": "Số lần chấm công gần nhất (tối đa 20)", "default": 5}
+                        }
+                    }
+                }
+            },
             {
                 "type": "function",
                 "function": {
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+HR Intent Matcher
+Biên dịch INTENT_RULES một lần thành automaton Aho-Corasick: một lượt duyệt tin
+nhắn trả về mọi keyword xuất hiện, sau đó mỗi rule / variant chỉ còn là phép giao
+tập id keyword thay vì quét lại tin nhắn cho từng keyword.
+
+Kết quả của match() giống hệt thứ tự if / elif của _analyze_intent trước đây.
+Khi không rule nào khớp, match() thử thêm một lượt trên bản bỏ dấu của tin nhắn
+("nhan vien" khớp keyword "nhân viên"), so khớp trọn từ để keyword ngắn sau khi
+bỏ dấu ("tìm" -> "tim") không khớp nhầm vào giữa từ khác.
+"""
+
+import threading
+from collections import deque
+
+from .hr_intent_rules import INTENT_RULES, INTENT_FALLBACK
+from .hr_text_normalizer import normalize
+
+
+class AhoCorasick:
+    """Automaton so khớp đồng thời nhiều chuỗi con (keyword -> id)"""
+
+    def __init__(self, keywords):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [()]
+        for keyword_id, keyword in enumerate(keywords):
+            state = 0
+            for char in keyword:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                state = next_state
+            self.output[state] += (keyword_id,)
+
+        # BFS: fail link + gộp output của fail state để mỗi bước chỉ đọc một tuple
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] += self.output[self.fail[next_state]]
+
+    def find_all(self, text):
+        """Tập id các keyword xuất hiện trong text (một lượt duyệt)"""
+        goto, fail, output = self.goto, self.fail, self.output
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+
+class HRIntentMatcher:
+    """INTENT_RULES đã biên dịch: rule / variant giữ frozenset id keyword"""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, rules=INTENT_RULES, fallback=INTENT_FALLBACK):
+        keyword_ids = {}
+
+        def compile_keywords(keywords):
+            return frozenset(keyword_ids.setdefault(keyword, len(keyword_ids)) for keyword in keywords)
+
+        self.rules = []
+        for priority, rule in enumerate(rules):
+            variants = rule.get('variants') or [{'result': rule['result']}]
+            self.rules.append((priority, compile_keywords(rule['keywords']), [
+                (compile_keywords(variant['keywords']) if variant.get('keywords') else None, variant['result'])
+                for variant in variants
+            ]))
+        self.fallback = fallback
+        self.keywords = list(keyword_ids)
+        self.automaton = AhoCorasick(self.keywords)
+        # Cùng id keyword, dạng ' tu khoa ' (bỏ dấu, trọn từ) để so với NormalizedText.words
+        self.folded_automaton = AhoCorasick([normalize(keyword).words for keyword in self.keywords])
+
+        # keyword id -> rule ưu tiên cao nhất có keyword đó ở điều kiện ngoài cùng
+        self.first_rule = [None] * len(self.keywords)
+        for priority, keywords, _variants in reversed(self.rules):
+            for keyword_id in keywords:
+                self.first_rule[keyword_id] = priority
+
+    @classmethod
+    def get(cls):
+        """Matcher dùng chung cho cả process (biên dịch lần đầu sử dụng)"""
+        matcher = cls._instance
+        if matcher is None:
+            with cls._instance_lock:
+                matcher = cls._instance
+                if matcher is None:
+                    matcher = cls._instance = cls()
+        return matcher
+
+    def match(self, text, words=None):
+        """Intent của rule ưu tiên cao nhất khớp text (đã lower), hoặc fallback.
+
+        words: NormalizedText.words của tin nhắn - lượt so khớp không dấu khi text không khớp rule nào.
+        """
+        for automaton, haystack in ((self.automaton, text), (self.folded_automaton, words)):
+            if haystack is None:
+                continue
+            found = automaton.find_all(haystack)
+            priorities = [self.first_rule[keyword_id] for keyword_id in found if self.first_rule[keyword_id] is not None]
+            if priorities:
+                return dict(self._pick_variant(self.rules[min(priorities)][2], found))
+        return dict(self.fallback)
+
+    def match_all(self, text):
+        """Mọi rule khớp text, theo thứ tự ưu tiên: [{..intent, 'priority': n}]"""
+        found = self.automaton.find_all(text)
+        return [
+            dict(self._pick_variant(variants, found), priority=priority)
+            for priority, keywords, variants in self.rules
+            if not keywords.isdisjoint(found)
+        ]
+
+    def match_sequential(self, text):
+        """Cách đánh giá cũ (quét text cho từng keyword theo thứ tự) - dùng để đối chiếu và benchmark"""
+        for _priority, keywords, variants in self.rules:
+            if any(self.keywords[keyword_id] in text for keyword_id in keywords):
+                for variant_keywords, result in variants:
+                    if variant_keywords is None or any(self.keywords[keyword_id] in text for keyword_id in variant_keywords):
+                        return dict(result)
+        return dict(self.fallback)
+
+    @staticmethod
+    def _pick_variant(variants, found):
+        for keywords, result in variants:
+            if keywords is None or not keywords.isdisjoint(found):
+                return result
+        return variants[-1][1]
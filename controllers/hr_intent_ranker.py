@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+HR Intent Ranker
+Bộ xếp hạng intent thống kê: n-gram ký tự (2-4, không dấu) được hash vào không
+gian cố định, trọng số TF-IDF, mỗi rule của INTENT_RULES là một centroid chuẩn
+hóa; điểm là cosine qua inverted index rồi softmax với nhiệt độ đã hiệu chỉnh ->
+top-k action kèm xác suất. Thuần Python, không cần NumPy.
+
+Huấn luyện từ keyword của INTENT_RULES và (tùy chọn) corpus câu có nhãn:
+    python3 tests/train_intent_ranker.py --corpus utterances.tsv
+ghi model vào data/intent_ranker.json; không có file thì model được huấn luyện
+từ keyword (~0.7s) trên thread nền khởi động bởi warm_up(), không chặn request.
+
+suggest() chỉ trả intent chỉ đọc (GET): đoán từ câu sai chính tả không đủ chắc
+để tự chạy thao tác ghi (duyệt đơn, xóa hàng loạt...) - những câu đó rơi về
+fallback / LLM.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+import zlib
+from collections import Counter, defaultdict
+
+from .hr_intent_rules import INTENT_RULES
+from .hr_text_normalizer import fold, normalize
+
+_logger = logging.getLogger(__name__)
+
+MODEL_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'intent_ranker.json')
+MODEL_VERSION = 1
+HASH_BUCKETS = 1 << 18
+NGRAM_RANGE = (2, 4)
+DEFAULT_TOP_K = 3
+TEMPERATURES = (0.02, 0.03, 0.05, 0.07, 0.1, 0.15, 0.2, 0.3)
+MAX_CENTROID_FEATURES = 400
+# Ngưỡng để dùng kết quả ranker khi không rule nào khớp: cosine tối thiểu (lọc câu chào hỏi,
+# ngoài lề) và xác suất top-1 tối thiểu; độ tin cậy bị chặn dưới ngưỡng fast path (0.8)
+MIN_SIMILARITY = 0.3
+MIN_PROBABILITY = 0.5
+MAX_CONFIDENCE = 0.75
+# Method HTTP của intent mà suggest() được phép trả về
+SUGGEST_METHODS = frozenset(['GET'])
+
+
+def ngram_features(folded, ngram_range=NGRAM_RANGE, buckets=HASH_BUCKETS):
+    """Counter bucket -> số lần xuất hiện của các n-gram ký tự (có biên từ) của chuỗi đã bỏ dấu"""
+    padded = f' {folded} '
+    features = Counter()
+    low, high = ngram_range
+    for size in range(low, high + 1):
+        for index in range(len(padded) - size + 1):
+            gram = padded[index:index + size]
+            if gram.strip():
+                features[zlib.crc32(gram.encode('utf-8')) % buckets] += 1
+    return features
+
+
+def rules_fingerprint(rules=INTENT_RULES):
+    """Hash nội dung bảng rule - model lưu sẵn chỉ dùng được với đúng bảng rule đã huấn luyện"""
+    return hashlib.sha256(json.dumps(rules, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+class HRIntentRanker:
+    """Xếp hạng rule của INTENT_RULES theo centroid TF-IDF n-gram ký tự, chọn variant bằng keyword không dấu.
+
+    Mỗi lớp là một rule (cùng thứ tự ưu tiên với HRIntentMatcher); action trả về là variant
+    của rule đó khớp với tin nhắn sau khi bỏ dấu, giống cách rule chọn variant.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+    _warm_up_thread = None
+
+    def __init__(self, idf, centroids, temperature, rules=INTENT_RULES):
+        self.idf = idf
+        self.centroids = centroids
+        self.temperature = temperature
+        self.variants = [
+            [(tuple(fold(keyword) for keyword in variant.get('keywords') or ()), variant['result'])
+             for variant in rule.get('variants') or [{'result': rule['result']}]]
+            for rule in rules
+        ]
+        self.action_rules = {}
+        for priority, variants in enumerate(self.variants):
+            for _keywords, result in variants:
+                self.action_rules.setdefault(result['action'], priority)
+        self.postings = defaultdict(list)
+        for priority, centroid in enumerate(centroids):
+            for bucket, weight in centroid.items():
+                self.postings[bucket].append((priority, weight))
+
+    @classmethod
+    def get(cls, wait=True):
+        """Ranker dùng chung cho process: nạp data/intent_ranker.json hoặc huấn luyện từ keyword.
+
+        wait=False: không chặn khi model chưa sẵn sàng - khởi động warm_up() và trả None.
+        """
+        ranker = cls._instance
+        if ranker is None:
+            thread = cls.warm_up()
+            if wait:
+                thread.join()
+            ranker = cls._instance
+        return ranker
+
+    @classmethod
+    def warm_up(cls):
+        """Nạp / huấn luyện ranker trên thread nền, một lần cho mỗi process; trả về thread đó"""
+        with cls._instance_lock:
+            thread = cls._warm_up_thread
+            if thread is None:
+                thread = cls._warm_up_thread = threading.Thread(
+                    target=cls._build_instance, name='sbotchat-intent-ranker', daemon=True)
+                thread.start()
+        return thread
+
+    @classmethod
+    def _build_instance(cls):
+        try:
+            cls._instance = cls.load(MODEL_PATH) if os.path.exists(MODEL_PATH) else cls.train()
+        except Exception as e:
+            _logger.error(f"Không nạp được intent ranker: {str(e)}")
+            with cls._instance_lock:
+                cls._warm_up_thread = None
+
+    @classmethod
+    def _reset_after_fork(cls):
+        """Thread nền không sống sót qua fork (worker prefork): chưa có model thì huấn luyện lại ở process con"""
+        cls._instance_lock = threading.Lock()
+        if cls._instance is None:
+            cls._warm_up_thread = None
+
+    @classmethod
+    def train(cls, examples=None, calibration=None, rules=INTENT_RULES):
+        """Huấn luyện từ keyword ngoài cùng của rules + examples [(text, action)].
+
+        calibration [(text, action)] dùng để chọn nhiệt độ softmax (mặc định: dữ liệu huấn luyện).
+        """
+        ranker = cls({}, [], TEMPERATURES[0], rules)
+        training = [(keyword, priority) for priority, rule in enumerate(rules) for keyword in rule['keywords']]
+        training += ranker._label(examples)
+
+        documents = [Counter() for _rule in rules]
+        for text, priority in training:
+            documents[priority].update(ngram_features(fold(text)))
+
+        total = len(documents)
+        document_frequency = Counter(bucket for document in documents for bucket in document)
+        idf = {bucket: math.log((1 + total) / (1 + count)) + 1.0 for bucket, count in document_frequency.items()}
+        centroids = [cls._prune(cls._normalize({bucket: (1 + math.log(count)) * idf[bucket]
+                                                for bucket, count in document.items()}))
+                     for document in documents]
+
+        ranker = cls(idf, centroids, TEMPERATURES[0], rules)
+        ranker.temperature = ranker._fit_temperature(ranker._label(calibration) if calibration else training)
+        _logger.info(f"Đã huấn luyện intent ranker: {total} rules, {len(training)} câu, nhiệt độ {ranker.temperature}")
+        return ranker
+
+    def rank(self, text, k=DEFAULT_TOP_K):
+        """Top-k [{'action', 'score', 'similarity', 'priority'}] theo xác suất đã hiệu chỉnh (softmax cosine / nhiệt độ)
+
+        text: chuỗi hoặc NormalizedText.
+        """
+        normalized = normalize(text)
+        similarities = self._similarities(normalized.folded)
+        if not similarities:
+            return []
+        probabilities = self._softmax(similarities)
+        folded = f' {normalized.folded} '
+        ranked = []
+        for priority, probability in sorted(probabilities.items(), key=lambda item: -item[1])[:k]:
+            result = next(result for keywords, result in self.variants[priority]
+                          if not keywords or any(keyword in folded for keyword in keywords))
+            ranked.append({
+                'action': result['action'],
+                'score': round(probability, 4),
+                'similarity': round(similarities[priority], 4),
+                'priority': priority,
+            })
+        return ranked
+
+    def suggest(self, text, k=DEFAULT_TOP_K):
+        """Intent chỉ đọc cho tin nhắn không khớp rule nào (kèm 'candidates' top-k).
+
+        None nếu ranker không đủ chắc chắn hoặc intent top-1 là thao tác ghi (method khác GET).
+        """
+        ranked = self.rank(text, k)
+        if not ranked or ranked[0]['similarity'] < MIN_SIMILARITY or ranked[0]['score'] < MIN_PROBABILITY:
+            return None
+        intent = self.intent_for(ranked[0])
+        if intent.get('method') not in SUGGEST_METHODS:
+            return None
+        intent['confidence'] = round(min(ranked[0]['score'], MAX_CONFIDENCE), 3)
+        intent['candidates'] = [{'action': item['action'], 'score': item['score']} for item in ranked]
+        return intent
+
+    def intent_for(self, item):
+        """Intent dict (api_endpoint, method...) cho một phần tử của rank()"""
+        return dict(next(result for _keywords, result in self.variants[item['priority']]
+                         if result['action'] == item['action']))
+
+    def _label(self, examples):
+        labeled = []
+        for text, action in examples or ():
+            if action in self.action_rules:
+                labeled.append((text, self.action_rules[action]))
+            else:
+                _logger.warning(f"Intent ranker: bỏ qua câu có action không có trong INTENT_RULES: {action}")
+        return labeled
+
+    def _similarities(self, folded):
+        vector = self._normalize({
+            bucket: (1 + math.log(count)) * self.idf[bucket]
+            for bucket, count in ngram_features(folded).items() if bucket in self.idf
+        })
+        similarities = defaultdict(float)
+        for bucket, weight in vector.items():
+            for priority, centroid_weight in self.postings.get(bucket, ()):
+                similarities[priority] += weight * centroid_weight
+        return similarities
+
+    def _softmax(self, similarities, temperature=None):
+        """Xác suất từng rule; rule không chung n-gram nào có cosine 0"""
+        scale = 1.0 / (temperature or self.temperature)
+        best = max(similarities.values())
+        exponents = {priority: math.exp((value - best) * scale) for priority, value in similarities.items()}
+        normalizer = sum(exponents.values()) + (len(self.centroids) - len(similarities)) * math.exp(-best * scale)
+        return {priority: value / normalizer for priority, value in exponents.items()}
+
+    def _fit_temperature(self, examples):
+        """Nhiệt độ softmax có negative log-likelihood nhỏ nhất trên examples [(text, rule)]"""
+        scored = [(self._similarities(fold(text)), priority) for text, priority in examples]
+        scored = [(similarities, priority) for similarities, priority in scored if similarities]
+        if not scored:
+            return self.temperature
+
+        def negative_log_likelihood(temperature):
+            return -sum(math.log(max(self._softmax(similarities, temperature).get(priority, 0.0), 1e-12))
+                        for similarities, priority in scored)
+
+        return min(TEMPERATURES, key=negative_log_likelihood)
+
+    @staticmethod
+    def _normalize(vector):
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        return {bucket: weight / norm for bucket, weight in vector.items()} if norm else {}
+
+    @staticmethod
+    def _prune(centroid):
+        """Giữ MAX_CENTROID_FEATURES trọng số lớn nhất - inverted index ngắn hơn, cosine gần như không đổi"""
+        if len(centroid) <= MAX_CENTROID_FEATURES:
+            return centroid
+        kept = dict(sorted(centroid.items(), key=lambda item: -item[1])[:MAX_CENTROID_FEATURES])
+        return HRIntentRanker._normalize(kept)
+
+    def save(self, path=MODEL_PATH):
+        with open(path, 'w', encoding='utf-8') as handle:
+            json.dump({
+                'version': MODEL_VERSION,
+                'buckets': HASH_BUCKETS,
+                'ngram_range': list(NGRAM_RANGE),
+                'rules': rules_fingerprint(),
+                'temperature': self.temperature,
+                'idf': {str(bucket): round(weight, 5) for bucket, weight in self.idf.items()},
+                'centroids': [{str(bucket): round(weight, 6) for bucket, weight in centroid.items()}
+                              for centroid in self.centroids],
+            }, handle, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path=MODEL_PATH):
+        with open(path, encoding='utf-8') as handle:
+            data = json.load(handle)
+        if (data.get('version'), data.get('buckets'), tuple(data.get('ngram_range', ())), data.get('rules')) != \
+                (MODEL_VERSION, HASH_BUCKETS, NGRAM_RANGE, rules_fingerprint()):
+            _logger.warning(f"Model intent ranker {path} không khớp bảng rule hiện tại, huấn luyện lại từ keyword")
+            return cls.train()
+        return cls(
+            {int(bucket): weight for bucket, weight in data['idf'].items()},
+            [{int(bucket): weight for bucket, weight in centroid.items()} for centroid in data['centroids']],
+            data['temperature'],
+        )
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=HRIntentRanker._reset_after_fork)
@@ -0,0 +1,1517 @@
+# -*- coding: utf-8 -*-
+"""
+HR Intent Rules
+Bảng keyword của HRAIAgentController._analyze_intent dưới dạng dữ liệu.
+
+Thứ tự rule là thứ tự ưu tiên: rule đầu tiên có keyword xuất hiện trong tin nhắn
+(so khớp chuỗi con trên chữ thường) quyết định intent. Rule có 'variants' chọn
+variant đầu tiên khớp keyword; variant cuối không có keyword là mặc định.
+Bảng được HRIntentMatcher biên dịch một lần thành automaton Aho-Corasick.
+"""
+
+INTENT_RULES = [
+    # ======================= EMPLOYEE MANAGEMENT INTENTS =======================
+    # 1. /api/hr/employees (GET, POST)
+    {
+        'keywords': [
+            'danh sách nhân viên', 'list employee', 'all employee', 'tất cả nhân viên', 'hiển thị nhân viên',
+            'show employee', 'xem nhân viên', 'view employee', 'tạo nhân viên', 'create employee',
+            'thêm nhân viên', 'add employee',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_employee', 'api_endpoint': '/api/hr/employees', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_employees', 'api_endpoint': '/api/hr/employees', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 2. /api/hr/employee/<int:employee_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết nhân viên', 'employee detail', 'thông tin nhân viên', 'employee info',
+            'cập nhật nhân viên', 'update employee', 'sửa nhân viên', 'edit employee', 'xóa nhân viên',
+            'delete employee', 'archive employee',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_employee', 'api_endpoint': '/api/hr/employee/{employee_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete', 'archive'],
+                'result': {'intent': 'hr_action', 'action': 'delete_employee', 'api_endpoint': '/api/hr/employee/{employee_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_employee_detail', 'api_endpoint': '/api/hr/employee/{employee_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 3. /api/hr/employee/<int:employee_id>/status (GET, PUT)
+    {
+        'keywords': [
+            'trạng thái nhân viên', 'employee status', 'status nhân viên', 'tình trạng nhân viên',
+            'employee state', 'hoạt động nhân viên',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'thay đổi', 'change'],
+                'result': {'intent': 'hr_action', 'action': 'update_employee_status', 'api_endpoint': '/api/hr/employee/{employee_id}/status', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_employee_status', 'api_endpoint': '/api/hr/employee/{employee_id}/status', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 4. /api/hr/employee/departments (GET, POST)
+    {
+        'keywords': [
+            'phòng ban', 'department', 'departments', 'bộ phận', 'danh sách phòng ban', 'list department',
+            'tạo phòng ban', 'create department',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_department', 'api_endpoint': '/api/hr/employee/departments', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_departments', 'api_endpoint': '/api/hr/employee/departments', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 5. /api/hr/employee/department/<int:department_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết phòng ban', 'department detail', 'thông tin phòng ban', 'cập nhật phòng ban',
+            'update department', 'sửa phòng ban', 'edit department', 'xóa phòng ban', 'delete department',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_department', 'api_endpoint': '/api/hr/employee/department/{department_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'delete_department', 'api_endpoint': '/api/hr/employee/department/{department_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_department_detail', 'api_endpoint': '/api/hr/employee/department/{department_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 6. /api/hr/employee/jobs (GET, POST)
+    {
+        'keywords': [
+            'vị trí công việc', 'job position', 'jobs', 'chức vụ', 'danh sách vị trí', 'list job',
+            'tạo vị trí', 'create job',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_job', 'api_endpoint': '/api/hr/employee/jobs', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_jobs', 'api_endpoint': '/api/hr/employee/jobs', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 7. /api/hr/employee/job/<int:job_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết vị trí', 'job detail', 'thông tin vị trí', 'cập nhật vị trí', 'update job', 'sửa vị trí',
+            'edit job', 'xóa vị trí', 'delete job',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_job', 'api_endpoint': '/api/hr/employee/job/{job_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'delete_job', 'api_endpoint': '/api/hr/employee/job/{job_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_job_detail', 'api_endpoint': '/api/hr/employee/job/{job_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 8. /api/hr/employee/<int:employee_id>/bhxh-history (GET, POST)
+    {
+        'keywords': [
+            'lịch sử bhxh', 'bhxh history', 'bhxh transaction', 'giao dịch bhxh', 'lịch sử bảo hiểm',
+            'insurance history',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_bhxh_history', 'api_endpoint': '/api/hr/employee/{employee_id}/bhxh-history', 'method': 'POST', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_bhxh_history', 'api_endpoint': '/api/hr/employee/{employee_id}/bhxh-history', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 9. /api/hr/employee/<int:employee_id>/projects-assignments (GET, POST)
+    {
+        'keywords': [
+            'phân bổ dự án', 'project assignment', 'dự án nhân viên', 'employee project', 'gán dự án',
+            'assign project',
+        ],
+        'variants': [
+            {
+                'keywords': ['phân bổ', 'assign', 'gán', 'tạo', 'create'],
+                'result': {'intent': 'hr_action', 'action': 'assign_project', 'api_endpoint': '/api/hr/employee/{employee_id}/projects-assignments', 'method': 'POST', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_project_assignments', 'api_endpoint': '/api/hr/employee/{employee_id}/projects-assignments', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 10. /api/hr/employee/<int:employee_id>/shifts-assignments (GET, POST)
+    {
+        'keywords': [
+            'ca làm việc', 'shift assignment', 'shifts', 'ca trực', 'phân ca', 'assign shift', 'lịch trực',
+        ],
+        'variants': [
+            {
+                'keywords': ['phân ca', 'assign', 'tạo', 'create', 'thêm'],
+                'result': {'intent': 'hr_action', 'action': 'assign_shift', 'api_endpoint': '/api/hr/employee/{employee_id}/shifts-assignments', 'method': 'POST', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_shift_assignments', 'api_endpoint': '/api/hr/employee/{employee_id}/shifts-assignments', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 11. /api/hr/employee/<int:employee_id>/personal-income-tax (GET, POST)
+    {
+        'keywords': [
+            'thuế tncn', 'personal income tax', 'thuế thu nhập', 'quyết toán thuế', 'tax calculation',
+            'personal tax',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'tính', 'calculate'],
+                'result': {'intent': 'hr_action', 'action': 'create_personal_tax', 'api_endpoint': '/api/hr/employee/{employee_id}/personal-income-tax', 'method': 'POST', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_personal_tax', 'api_endpoint': '/api/hr/employee/{employee_id}/personal-income-tax', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 12. /api/hr/employee/<int:employee_id>/shifts (GET, POST)
+    {
+        'keywords': ['ca nhân viên', 'employee shifts', 'shifts của nhân viên', 'lịch ca', 'shift schedule'],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_employee_shift', 'api_endpoint': '/api/hr/employee/{employee_id}/shifts', 'method': 'POST', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_employee_shifts', 'api_endpoint': '/api/hr/employee/{employee_id}/shifts', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # ======================= LEAVE MANAGEMENT INTENTS =======================
+    # 13. /api/hr/leave-types (GET, POST)
+    {
+        'keywords': [
+            'loại nghỉ phép', 'leave type', 'leave types', 'kiểu nghỉ phép', 'danh sách loại nghỉ',
+            'list leave type', 'tạo loại nghỉ', 'create leave type',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_leave_type', 'api_endpoint': '/api/hr/leave-types', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_leave_types', 'api_endpoint': '/api/hr/leave-types', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 14. /api/hr/leave-type/<int:leave_type_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết loại nghỉ', 'leave type detail', 'thông tin loại nghỉ', 'cập nhật loại nghỉ',
+            'update leave type', 'sửa loại nghỉ', 'edit leave type', 'xóa loại nghỉ', 'delete leave type',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_leave_type', 'api_endpoint': '/api/hr/leave-type/{leave_type_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'delete_leave_type', 'api_endpoint': '/api/hr/leave-type/{leave_type_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_leave_type_detail', 'api_endpoint': '/api/hr/leave-type/{leave_type_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 15. /api/hr/leave-allocations (GET, POST)
+    {
+        'keywords': [
+            'phân bổ nghỉ phép', 'leave allocation', 'leave allocations', 'cấp phát nghỉ', 'danh sách phân bổ',
+            'list allocation', 'tạo phân bổ', 'create allocation',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_leave_allocation', 'api_endpoint': '/api/hr/leave-allocations', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_leave_allocations', 'api_endpoint': '/api/hr/leave-allocations', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 16. /api/hr/leave-allocation/<int:allocation_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết phân bổ', 'allocation detail', 'thông tin phân bổ', 'cập nhật phân bổ',
+            'update allocation', 'sửa phân bổ', 'edit allocation', 'xóa phân bổ', 'delete allocation',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_leave_allocation', 'api_endpoint': '/api/hr/leave-allocation/{allocation_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete', 'cancel'],
+                'result': {'intent': 'hr_action', 'action': 'delete_leave_allocation', 'api_endpoint': '/api/hr/leave-allocation/{allocation_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_leave_allocation_detail', 'api_endpoint': '/api/hr/leave-allocation/{allocation_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 17. /api/hr/leave-allocation/<int:allocation_id>/approve (POST)
+    {
+        'keywords': ['phê duyệt phân bổ', 'approve allocation', 'duyệt phân bổ', 'approval allocation'],
+        'result': {'intent': 'hr_action', 'action': 'approve_leave_allocation', 'api_endpoint': '/api/hr/leave-allocation/{allocation_id}/approve', 'method': 'POST', 'confidence': 0.9},
+    },
+    # 18. /api/hr/leaves (GET, POST)
+    {
+        'keywords': [
+            'nghỉ phép', 'leave request', 'leaves', 'đơn nghỉ', 'danh sách nghỉ phép', 'list leaves',
+            'tạo đơn nghỉ', 'create leave',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new', 'đăng ký'],
+                'result': {'intent': 'hr_action', 'action': 'create_leave', 'api_endpoint': '/api/hr/leaves', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_leaves', 'api_endpoint': '/api/hr/leaves', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 19. /api/hr/leave/<int:leave_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết nghỉ phép', 'leave detail', 'thông tin đơn nghỉ', 'cập nhật nghỉ phép', 'update leave',
+            'sửa đơn nghỉ', 'edit leave', 'hủy đơn nghỉ', 'cancel leave',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_leave', 'api_endpoint': '/api/hr/leave/{leave_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['hủy', 'cancel', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'cancel_leave', 'api_endpoint': '/api/hr/leave/{leave_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_leave_detail', 'api_endpoint': '/api/hr/leave/{leave_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 20. /api/hr/leave/<int:leave_id>/approve (POST)
+    {
+        'keywords': ['phê duyệt nghỉ phép', 'approve leave', 'duyệt đơn nghỉ', 'approval leave'],
+        'result': {'intent': 'hr_action', 'action': 'approve_leave', 'api_endpoint': '/api/hr/leave/{leave_id}/approve', 'method': 'POST', 'confidence': 0.9},
+    },
+    # 21. /api/hr/leave/<int:leave_id>/refuse (POST)
+    {
+        'keywords': ['từ chối nghỉ phép', 'refuse leave', 'reject leave', 'deny leave'],
+        'result': {'intent': 'hr_action', 'action': 'refuse_leave', 'api_endpoint': '/api/hr/leave/{leave_id}/refuse', 'method': 'POST', 'confidence': 0.9},
+    },
+    # ======================= CONTRACT MANAGEMENT INTENTS =======================
+    # 22. /api/hr/contracts (GET, POST)
+    {
+        'keywords': [
+            'hợp đồng', 'contract', 'contracts', 'hợp đồng lao động', 'danh sách hợp đồng', 'list contract',
+            'tạo hợp đồng', 'create contract',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_contract', 'api_endpoint': '/api/hr/contracts', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_contracts', 'api_endpoint': '/api/hr/contracts', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 23. /api/hr/contract/<int:contract_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết hợp đồng', 'contract detail', 'thông tin hợp đồng', 'cập nhật hợp đồng',
+            'update contract', 'sửa hợp đồng', 'edit contract', 'hủy hợp đồng', 'cancel contract',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_contract', 'api_endpoint': '/api/hr/contract/{contract_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['hủy', 'cancel', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'cancel_contract', 'api_endpoint': '/api/hr/contract/{contract_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_contract_detail', 'api_endpoint': '/api/hr/contract/{contract_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # ======================= ATTENDANCE MANAGEMENT INTENTS =======================
+    # 24. /api/hr/attendances (GET, POST)
+    {
+        'keywords': [
+            'chấm công', 'attendance', 'attendances', 'điểm danh', 'danh sách chấm công', 'list attendance',
+            'tạo chấm công', 'create attendance',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_attendance', 'api_endpoint': '/api/hr/attendances', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_attendances', 'api_endpoint': '/api/hr/attendances', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 25. /api/hr/attendance/<int:attendance_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết chấm công', 'attendance detail', 'thông tin chấm công', 'cập nhật chấm công',
+            'update attendance', 'sửa chấm công', 'edit attendance', 'xóa chấm công', 'delete attendance',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_attendance', 'api_endpoint': '/api/hr/attendance/{attendance_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'delete_attendance', 'api_endpoint': '/api/hr/attendance/{attendance_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_attendance_detail', 'api_endpoint': '/api/hr/attendance/{attendance_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 26. /api/hr/employee/<int:employee_id>/checkin (POST)
+    {
+        'keywords': ['check in', 'checkin', 'vào ca', 'bắt đầu làm việc', 'check-in'],
+        'result': {'intent': 'hr_action', 'action': 'employee_checkin', 'api_endpoint': '/api/hr/employee/{employee_id}/checkin', 'method': 'POST', 'confidence': 0.9},
+    },
+    # 27. /api/hr/employee/<int:employee_id>/checkout (POST)
+    {
+        'keywords': ['check out', 'checkout', 'ra ca', 'kết thúc làm việc', 'check-out'],
+        'result': {'intent': 'hr_action', 'action': 'employee_checkout', 'api_endpoint': '/api/hr/employee/{employee_id}/checkout', 'method': 'POST', 'confidence': 0.9},
+    },
+    # 28. /api/hr/attendance/summary (GET)
+    {
+        'keywords': ['tóm tắt chấm công', 'attendance summary', 'báo cáo chấm công', 'attendance report'],
+        'result': {'intent': 'hr_action', 'action': 'attendance_summary', 'api_endpoint': '/api/hr/attendance/summary', 'method': 'GET', 'confidence': 0.9},
+    },
+    # 29. /api/hr/attendance/overtime (GET)
+    {
+        'keywords': ['giờ làm thêm', 'overtime', 'tăng ca', 'overtime hours'],
+        'result': {'intent': 'hr_action', 'action': 'attendance_overtime', 'api_endpoint': '/api/hr/attendance/overtime', 'method': 'GET', 'confidence': 0.9},
+    },
+    # 30. /api/hr/attendance/missing (GET)
+    {
+        'keywords': ['chấm công thiếu', 'missing attendance', 'attendance missing', 'thiếu chấm công'],
+        'result': {'intent': 'hr_action', 'action': 'attendance_missing', 'api_endpoint': '/api/hr/attendance/missing', 'method': 'GET', 'confidence': 0.9},
+    },
+    # ======================= PAYROLL MANAGEMENT INTENTS =======================
+    # 31. /api/hr/payslips (GET, POST)
+    {
+        'keywords': [
+            'bảng lương', 'payslip', 'payslips', 'phiếu lương', 'danh sách bảng lương', 'list payslip',
+            'tạo bảng lương', 'create payslip',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_payslip', 'api_endpoint': '/api/hr/payslips', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_payslips', 'api_endpoint': '/api/hr/payslips', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 32. /api/hr/payslip/<int:payslip_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết bảng lương', 'payslip detail', 'thông tin bảng lương', 'cập nhật bảng lương',
+            'update payslip', 'sửa bảng lương', 'edit payslip', 'hủy bảng lương', 'cancel payslip',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_payslip', 'api_endpoint': '/api/hr/payslip/{payslip_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['hủy', 'cancel', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'cancel_payslip', 'api_endpoint': '/api/hr/payslip/{payslip_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_payslip_detail', 'api_endpoint': '/api/hr/payslip/{payslip_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 33. /api/hr/payslip/<int:payslip_id>/compute (POST)
+    {
+        'keywords': ['tính lương', 'compute payslip', 'calculate salary', 'tính toán bảng lương'],
+        'result': {'intent': 'hr_action', 'action': 'compute_payslip', 'api_endpoint': '/api/hr/payslip/{payslip_id}/compute', 'method': 'POST', 'confidence': 0.9},
+    },
+    # 34. /api/hr/payslip/<int:payslip_id>/lines (GET)
+    {
+        'keywords': ['dòng bảng lương', 'payslip lines', 'chi tiết dòng lương', 'payslip line detail'],
+        'result': {'intent': 'hr_action', 'action': 'get_payslip_lines', 'api_endpoint': '/api/hr/payslip/{payslip_id}/lines', 'method': 'GET', 'confidence': 0.9},
+    },
+    # 35. /api/hr/payroll/salary-rules (GET, POST)
+    {
+        'keywords': [
+            'quy tắc lương', 'salary rule', 'salary rules', 'rule lương', 'danh sách quy tắc',
+            'list salary rule', 'tạo quy tắc', 'create salary rule',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_salary_rule', 'api_endpoint': '/api/hr/payroll/salary-rules', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_salary_rules', 'api_endpoint': '/api/hr/payroll/salary-rules', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 36. /api/hr/payroll/salary-rule/<int:rule_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết quy tắc lương', 'salary rule detail', 'thông tin quy tắc', 'cập nhật quy tắc',
+            'update salary rule', 'sửa quy tắc', 'edit salary rule', 'xóa quy tắc', 'delete salary rule',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_salary_rule', 'api_endpoint': '/api/hr/payroll/salary-rule/{rule_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'delete_salary_rule', 'api_endpoint': '/api/hr/payroll/salary-rule/{rule_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_salary_rule_detail', 'api_endpoint': '/api/hr/payroll/salary-rule/{rule_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 37. /api/hr/payroll/structures (GET, POST)
+    {
+        'keywords': [
+            'cấu trúc lương', 'payroll structure', 'salary structure', 'structure lương', 'danh sách cấu trúc',
+            'list structure', 'tạo cấu trúc', 'create structure',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_payroll_structure', 'api_endpoint': '/api/hr/payroll/structures', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_payroll_structures', 'api_endpoint': '/api/hr/payroll/structures', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 38. /api/hr/payroll/structure/<int:structure_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết cấu trúc lương', 'structure detail', 'thông tin cấu trúc', 'cập nhật cấu trúc',
+            'update structure', 'sửa cấu trúc', 'edit structure', 'xóa cấu trúc', 'delete structure',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_payroll_structure', 'api_endpoint': '/api/hr/payroll/structure/{structure_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'delete_payroll_structure', 'api_endpoint': '/api/hr/payroll/structure/{structure_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_payroll_structure_detail', 'api_endpoint': '/api/hr/payroll/structure/{structure_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # ======================= INSURANCE MANAGEMENT INTENTS =======================
+    # 39. /api/hr/insurances (GET, POST)
+    {
+        'keywords': [
+            'bảo hiểm', 'insurance', 'insurances', 'bảo hiểm nhân viên', 'danh sách bảo hiểm',
+            'list insurance', 'tạo bảo hiểm', 'create insurance',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_insurance', 'api_endpoint': '/api/hr/insurances', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_insurances', 'api_endpoint': '/api/hr/insurances', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 40. /api/hr/insurance/<int:insurance_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết bảo hiểm', 'insurance detail', 'thông tin bảo hiểm', 'cập nhật bảo hiểm',
+            'update insurance', 'sửa bảo hiểm', 'edit insurance', 'hủy bảo hiểm', 'cancel insurance',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_insurance', 'api_endpoint': '/api/hr/insurance/{insurance_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['hủy', 'cancel', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'cancel_insurance', 'api_endpoint': '/api/hr/insurance/{insurance_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_insurance_detail', 'api_endpoint': '/api/hr/insurance/{insurance_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 41. /api/hr/insurance/policies (GET, POST)
+    {
+        'keywords': [
+            'chính sách bảo hiểm', 'insurance policy', 'insurance policies', 'policy bảo hiểm',
+            'danh sách chính sách', 'list policy', 'tạo chính sách', 'create policy',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_insurance_policy', 'api_endpoint': '/api/hr/insurance/policies', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_insurance_policies', 'api_endpoint': '/api/hr/insurance/policies', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 42. /api/hr/insurance/policy/<int:policy_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết chính sách', 'policy detail', 'thông tin chính sách', 'cập nhật chính sách',
+            'update policy', 'sửa chính sách', 'edit policy', 'xóa chính sách', 'delete policy',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_insurance_policy', 'api_endpoint': '/api/hr/insurance/policy/{policy_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'delete_insurance_policy', 'api_endpoint': '/api/hr/insurance/policy/{policy_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_insurance_policy_detail', 'api_endpoint': '/api/hr/insurance/policy/{policy_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 43. /api/hr/employee/<int:employee_id>/bhxh (GET, POST, PUT)
+    {
+        'keywords': [
+            'bhxh', 'bhyt', 'bhtn', 'bảo hiểm xã hội', 'bảo hiểm y tế', 'bảo hiểm thất nghiệp',
+            'social insurance', 'health insurance',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new', 'đăng ký'],
+                'result': {'intent': 'hr_action', 'action': 'create_employee_bhxh', 'api_endpoint': '/api/hr/employee/{employee_id}/bhxh', 'method': 'POST', 'confidence': 0.9},
+            },
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_employee_bhxh', 'api_endpoint': '/api/hr/employee/{employee_id}/bhxh', 'method': 'PUT', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_employee_bhxh', 'api_endpoint': '/api/hr/employee/{employee_id}/bhxh', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 44. /api/hr/insurance/payments (GET, POST)
+    {
+        'keywords': [
+            'thanh toán bảo hiểm', 'insurance payment', 'insurance payments', 'payment bảo hiểm',
+            'danh sách thanh toán', 'list payment', 'tạo thanh toán', 'create payment',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_insurance_payment', 'api_endpoint': '/api/hr/insurance/payments', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_insurance_payments', 'api_endpoint': '/api/hr/insurance/payments', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 45. /api/hr/insurance/payment/<int:payment_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết thanh toán', 'payment detail', 'thông tin thanh toán', 'cập nhật thanh toán',
+            'update payment', 'sửa thanh toán', 'edit payment', 'hủy thanh toán', 'cancel payment',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_insurance_payment', 'api_endpoint': '/api/hr/insurance/payment/{payment_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['hủy', 'cancel', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'cancel_insurance_payment', 'api_endpoint': '/api/hr/insurance/payment/{payment_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_insurance_payment_detail', 'api_endpoint': '/api/hr/insurance/payment/{payment_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 46. /api/hr/insurance/benefits (GET, POST)
+    {
+        'keywords': [
+            'quyền lợi bảo hiểm', 'insurance benefit', 'insurance benefits', 'benefit bảo hiểm',
+            'danh sách quyền lợi', 'list benefit', 'tạo quyền lợi', 'create benefit',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_insurance_benefit', 'api_endpoint': '/api/hr/insurance/benefits', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_insurance_benefits', 'api_endpoint': '/api/hr/insurance/benefits', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 47. /api/hr/insurance/benefit/<int:benefit_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết quyền lợi', 'benefit detail', 'thông tin quyền lợi', 'cập nhật quyền lợi',
+            'update benefit', 'sửa quyền lợi', 'edit benefit', 'hủy quyền lợi', 'cancel benefit',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_insurance_benefit', 'api_endpoint': '/api/hr/insurance/benefit/{benefit_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['hủy', 'cancel', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'cancel_insurance_benefit', 'api_endpoint': '/api/hr/insurance/benefit/{benefit_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_insurance_benefit_detail', 'api_endpoint': '/api/hr/insurance/benefit/{benefit_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 48. /api/hr/insurance/documents (GET, POST)
+    {
+        'keywords': [
+            'hồ sơ bảo hiểm', 'insurance document', 'insurance documents', 'document bảo hiểm',
+            'danh sách hồ sơ', 'list document', 'tạo hồ sơ', 'create document',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_insurance_document', 'api_endpoint': '/api/hr/insurance/documents', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_insurance_documents', 'api_endpoint': '/api/hr/insurance/documents', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 49. /api/hr/insurance/document/<int:document_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết hồ sơ', 'document detail', 'thông tin hồ sơ', 'cập nhật hồ sơ', 'update document',
+            'sửa hồ sơ', 'edit document', 'hủy hồ sơ', 'cancel document',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_insurance_document', 'api_endpoint': '/api/hr/insurance/document/{document_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['hủy', 'cancel', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'cancel_insurance_document', 'api_endpoint': '/api/hr/insurance/document/{document_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_insurance_document_detail', 'api_endpoint': '/api/hr/insurance/document/{document_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 50. /api/hr/insurance/reports (GET, POST)
+    {
+        'keywords': ['báo cáo bảo hiểm', 'insurance report', 'insurance reports', 'report bảo hiểm'],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_insurance_report', 'api_endpoint': '/api/hr/insurance/reports', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_insurance_reports', 'api_endpoint': '/api/hr/insurance/reports', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # ======================= PROJECT & TASK MANAGEMENT INTENTS =======================
+    # 51. /api/hr/projects (GET, POST)
+    {
+        'keywords': [
+            'dự án', 'project', 'projects', 'project hr', 'danh sách dự án', 'list project', 'tạo dự án',
+            'create project',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_project', 'api_endpoint': '/api/hr/projects', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_projects', 'api_endpoint': '/api/hr/projects', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 52. /api/hr/project/<int:project_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết dự án', 'project detail', 'thông tin dự án', 'cập nhật dự án', 'update project',
+            'sửa dự án', 'edit project', 'xóa dự án', 'delete project', 'archive project',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_project', 'api_endpoint': '/api/hr/project/{project_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete', 'archive'],
+                'result': {'intent': 'hr_action', 'action': 'delete_project', 'api_endpoint': '/api/hr/project/{project_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_project_detail', 'api_endpoint': '/api/hr/project/{project_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 53. /api/hr/project/<int:project_id>/tasks (GET, POST)
+    {
+        'keywords': [
+            'task dự án', 'project task', 'project tasks', 'task trong dự án', 'danh sách task', 'list task',
+            'tạo task', 'create task',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_project_task', 'api_endpoint': '/api/hr/project/{project_id}/tasks', 'method': 'POST', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_project_tasks', 'api_endpoint': '/api/hr/project/{project_id}/tasks', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 54. /api/hr/tasks (GET, POST)
+    {
+        'keywords': [
+            'công việc', 'task', 'tasks', 'nhiệm vụ', 'danh sách công việc', 'list task', 'tạo công việc',
+            'create task',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_task', 'api_endpoint': '/api/hr/tasks', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_tasks', 'api_endpoint': '/api/hr/tasks', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 55. /api/hr/task/<int:task_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết task', 'task detail', 'thông tin task', 'chi tiết công việc', 'cập nhật task',
+            'update task', 'sửa task', 'edit task', 'xóa task', 'delete task', 'archive task',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_task', 'api_endpoint': '/api/hr/task/{task_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete', 'archive'],
+                'result': {'intent': 'hr_action', 'action': 'delete_task', 'api_endpoint': '/api/hr/task/{task_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_task_detail', 'api_endpoint': '/api/hr/task/{task_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 56. /api/hr/task/<int:task_id>/assign (POST)
+    {
+        'keywords': ['phân công task', 'assign task', 'gán task', 'phân công công việc'],
+        'result': {'intent': 'hr_action', 'action': 'assign_task', 'api_endpoint': '/api/hr/task/{task_id}/assign', 'method': 'POST', 'confidence': 0.9},
+    },
+    # ======================= SKILLS MANAGEMENT INTENTS =======================
+    # 57. /api/hr/skills (GET, POST)
+    {
+        'keywords': [
+            'kỹ năng', 'skill', 'skills', 'năng lực', 'danh sách kỹ năng', 'list skill', 'tạo kỹ năng',
+            'create skill',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_skill', 'api_endpoint': '/api/hr/skills', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_skills', 'api_endpoint': '/api/hr/skills', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 58. /api/hr/skill/<int:skill_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết kỹ năng', 'skill detail', 'thông tin kỹ năng', 'cập nhật kỹ năng', 'update skill',
+            'sửa kỹ năng', 'edit skill', 'xóa kỹ năng', 'delete skill',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_skill', 'api_endpoint': '/api/hr/skill/{skill_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'delete_skill', 'api_endpoint': '/api/hr/skill/{skill_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_skill_detail', 'api_endpoint': '/api/hr/skill/{skill_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 59. /api/hr/skill-types (GET, POST)
+    {
+        'keywords': [
+            'loại kỹ năng', 'skill type', 'skill types', 'phân loại kỹ năng', 'danh sách loại',
+            'list skill type', 'tạo loại', 'create skill type',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_skill_type', 'api_endpoint': '/api/hr/skill-types', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_skill_types', 'api_endpoint': '/api/hr/skill-types', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 60. /api/hr/skill-type/<int:skill_type_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết loại kỹ năng', 'skill type detail', 'thông tin loại kỹ năng', 'cập nhật loại kỹ năng',
+            'update skill type', 'sửa loại kỹ năng', 'edit skill type', 'xóa loại kỹ năng',
+            'delete skill type',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_skill_type', 'api_endpoint': '/api/hr/skill-type/{skill_type_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'delete_skill_type', 'api_endpoint': '/api/hr/skill-type/{skill_type_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_skill_type_detail', 'api_endpoint': '/api/hr/skill-type/{skill_type_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 61. /api/hr/skill-levels (GET, POST)
+    {
+        'keywords': [
+            'cấp độ kỹ năng', 'skill level', 'skill levels', 'level kỹ năng', 'danh sách cấp độ',
+            'list skill level', 'tạo cấp độ', 'create skill level',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_skill_level', 'api_endpoint': '/api/hr/skill-levels', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_skill_levels', 'api_endpoint': '/api/hr/skill-levels', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 62. /api/hr/skill-level/<int:skill_level_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết cấp độ', 'skill level detail', 'thông tin cấp độ', 'cập nhật cấp độ',
+            'update skill level', 'sửa cấp độ', 'edit skill level', 'xóa cấp độ', 'delete skill level',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_skill_level', 'api_endpoint': '/api/hr/skill-level/{skill_level_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'delete_skill_level', 'api_endpoint': '/api/hr/skill-level/{skill_level_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_skill_level_detail', 'api_endpoint': '/api/hr/skill-level/{skill_level_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 63. /api/hr/employee/<int:employee_id>/skills (GET, POST)
+    {
+        'keywords': [
+            'kỹ năng nhân viên', 'employee skill', 'employee skills', 'skill của nhân viên',
+            'danh sách kỹ năng nhân viên', 'list employee skill', 'thêm kỹ năng', 'add skill',
+        ],
+        'variants': [
+            {
+                'keywords': ['thêm', 'add', 'tạo', 'create', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'add_employee_skill', 'api_endpoint': '/api/hr/employee/{employee_id}/skills', 'method': 'POST', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_employee_skills', 'api_endpoint': '/api/hr/employee/{employee_id}/skills', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 64. /api/hr/employee-skill/<int:employee_skill_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết kỹ năng nhân viên', 'employee skill detail', 'thông tin kỹ năng nhân viên',
+            'cập nhật kỹ năng nhân viên', 'update employee skill', 'sửa kỹ năng nhân viên',
+            'edit employee skill', 'xóa kỹ năng nhân viên', 'delete employee skill',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_employee_skill', 'api_endpoint': '/api/hr/employee-skill/{employee_skill_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'delete_employee_skill', 'api_endpoint': '/api/hr/employee-skill/{employee_skill_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_employee_skill_detail', 'api_endpoint': '/api/hr/employee-skill/{employee_skill_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 65. /api/hr/resume-lines (GET, POST)
+    {
+        'keywords': [
+            'sơ yếu lý lịch', 'resume line', 'resume lines', 'lý lịch', 'danh sách sơ yếu', 'list resume',
+            'tạo sơ yếu', 'create resume',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_resume_line', 'api_endpoint': '/api/hr/resume-lines', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_resume_lines', 'api_endpoint': '/api/hr/resume-lines', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 66. /api/hr/resume-line/<int:resume_line_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết sơ yếu', 'resume line detail', 'thông tin sơ yếu', 'cập nhật sơ yếu',
+            'update resume line', 'sửa sơ yếu', 'edit resume line', 'xóa sơ yếu', 'delete resume line',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_resume_line', 'api_endpoint': '/api/hr/resume-line/{resume_line_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'delete_resume_line', 'api_endpoint': '/api/hr/resume-line/{resume_line_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_resume_line_detail', 'api_endpoint': '/api/hr/resume-line/{resume_line_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 67. /api/hr/employee/<int:employee_id>/resume (GET)
+    {
+        'keywords': ['lý lịch nhân viên', 'employee resume', 'resume nhân viên', 'cv nhân viên'],
+        'result': {'intent': 'hr_action', 'action': 'get_employee_resume', 'api_endpoint': '/api/hr/employee/{employee_id}/resume', 'method': 'GET', 'confidence': 0.9},
+    },
+    # ======================= TIMESHEET MANAGEMENT INTENTS =======================
+    # 68. /api/hr/timesheets (GET, POST)
+    {
+        'keywords': [
+            'timesheet', 'timesheets', 'báo công', 'giờ công', 'danh sách timesheet', 'list timesheet',
+            'tạo timesheet', 'create timesheet',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_timesheet', 'api_endpoint': '/api/hr/timesheets', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_timesheets', 'api_endpoint': '/api/hr/timesheets', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 69. /api/hr/timesheet/<int:timesheet_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết timesheet', 'timesheet detail', 'thông tin timesheet', 'cập nhật timesheet',
+            'update timesheet', 'sửa timesheet', 'edit timesheet', 'xóa timesheet', 'delete timesheet',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_timesheet', 'api_endpoint': '/api/hr/timesheet/{timesheet_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'delete_timesheet', 'api_endpoint': '/api/hr/timesheet/{timesheet_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_timesheet_detail', 'api_endpoint': '/api/hr/timesheet/{timesheet_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 70. /api/hr/employee/<int:employee_id>/timesheets (GET, POST)
+    {
+        'keywords': [
+            'timesheet nhân viên', 'employee timesheet', 'employee timesheets', 'timesheet của nhân viên',
+            'báo công nhân viên', 'giờ công nhân viên',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_employee_timesheet', 'api_endpoint': '/api/hr/employee/{employee_id}/timesheets', 'method': 'POST', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_employee_timesheets', 'api_endpoint': '/api/hr/employee/{employee_id}/timesheets', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 71. /api/hr/project/<int:project_id>/timesheets (GET)
+    {
+        'keywords': [
+            'timesheet dự án', 'project timesheet', 'project timesheets', 'timesheet theo dự án',
+            'báo công dự án', 'giờ công dự án',
+        ],
+        'result': {'intent': 'hr_action', 'action': 'get_project_timesheets', 'api_endpoint': '/api/hr/project/{project_id}/timesheets', 'method': 'GET', 'confidence': 0.9},
+    },
+    # 72. /api/hr/task/<int:task_id>/timesheets (GET)
+    {
+        'keywords': [
+            'timesheet task', 'task timesheet', 'task timesheets', 'timesheet theo task', 'báo công task',
+            'giờ công task',
+        ],
+        'result': {'intent': 'hr_action', 'action': 'get_task_timesheets', 'api_endpoint': '/api/hr/task/{task_id}/timesheets', 'method': 'GET', 'confidence': 0.9},
+    },
+    # 73. /api/hr/timesheet/summary (GET)
+    {
+        'keywords': ['tóm tắt timesheet', 'timesheet summary', 'báo cáo timesheet', 'timesheet report'],
+        'result': {'intent': 'hr_action', 'action': 'timesheet_summary', 'api_endpoint': '/api/hr/timesheet/summary', 'method': 'GET', 'confidence': 0.9},
+    },
+    # 74. /api/hr/timesheet/validate (POST)
+    {
+        'keywords': ['xác nhận timesheet', 'validate timesheet', 'duyệt timesheet', 'approve timesheet'],
+        'result': {'intent': 'hr_action', 'action': 'validate_timesheet', 'api_endpoint': '/api/hr/timesheet/validate', 'method': 'POST', 'confidence': 0.9},
+    },
+    # 75. /api/hr/timesheet/copy (POST)
+    {
+        'keywords': ['sao chép timesheet', 'copy timesheet', 'duplicate timesheet', 'nhân bản timesheet'],
+        'result': {'intent': 'hr_action', 'action': 'copy_timesheet', 'api_endpoint': '/api/hr/timesheet/copy', 'method': 'POST', 'confidence': 0.9},
+    },
+    # ======================= RECRUITMENT MANAGEMENT INTENTS =======================
+    # 76. /api/hr/applicants (GET, POST)
+    {
+        'keywords': [
+            'ứng viên', 'applicant', 'applicants', 'ứng cử viên', 'danh sách ứng viên', 'list applicant',
+            'tạo ứng viên', 'create applicant',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_applicant', 'api_endpoint': '/api/hr/applicants', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_applicants', 'api_endpoint': '/api/hr/applicants', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 77. /api/hr/applicant/<int:applicant_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết ứng viên', 'applicant detail', 'thông tin ứng viên', 'cập nhật ứng viên',
+            'update applicant', 'sửa ứng viên', 'edit applicant', 'xóa ứng viên', 'delete applicant',
+            'archive applicant',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_applicant', 'api_endpoint': '/api/hr/applicant/{applicant_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete', 'archive'],
+                'result': {'intent': 'hr_action', 'action': 'delete_applicant', 'api_endpoint': '/api/hr/applicant/{applicant_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_applicant_detail', 'api_endpoint': '/api/hr/applicant/{applicant_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 78. /api/hr/applicant/<int:applicant_id>/status (GET, PUT)
+    {
+        'keywords': [
+            'trạng thái ứng viên', 'applicant status', 'status ứng viên', 'cập nhật trạng thái ứng viên',
+            'update applicant status',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_applicant_status', 'api_endpoint': '/api/hr/applicant/{applicant_id}/status', 'method': 'PUT', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_applicant_status', 'api_endpoint': '/api/hr/applicant/{applicant_id}/status', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 79. /api/hr/applicant/<int:applicant_id>/hire (POST)
+    {
+        'keywords': ['tuyển dụng ứng viên', 'hire applicant', 'nhận việc', 'tuyển dụng'],
+        'result': {'intent': 'hr_action', 'action': 'hire_applicant', 'api_endpoint': '/api/hr/applicant/{applicant_id}/hire', 'method': 'POST', 'confidence': 0.9},
+    },
+    # 80. /api/hr/applicant/<int:applicant_id>/refuse (POST)
+    {
+        'keywords': ['từ chối ứng viên', 'refuse applicant', 'reject applicant', 'loại bỏ ứng viên'],
+        'result': {'intent': 'hr_action', 'action': 'refuse_applicant', 'api_endpoint': '/api/hr/applicant/{applicant_id}/refuse', 'method': 'POST', 'confidence': 0.9},
+    },
+    # 81. /api/hr/recruitment/jobs (GET, POST)
+    {
+        'keywords': [
+            'vị trí tuyển dụng', 'recruitment job', 'recruitment jobs', 'job tuyển dụng', 'danh sách vị trí',
+            'list recruitment job', 'tạo vị trí', 'create recruitment job',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_recruitment_job', 'api_endpoint': '/api/hr/recruitment/jobs', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_recruitment_jobs', 'api_endpoint': '/api/hr/recruitment/jobs', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 82. /api/hr/recruitment/job/<int:job_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết vị trí tuyển dụng', 'recruitment job detail', 'thông tin vị trí tuyển dụng',
+            'cập nhật vị trí tuyển dụng', 'update recruitment job', 'sửa vị trí tuyển dụng',
+            'edit recruitment job', 'xóa vị trí tuyển dụng', 'delete recruitment job',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_recruitment_job', 'api_endpoint': '/api/hr/recruitment/job/{job_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete', 'archive'],
+                'result': {'intent': 'hr_action', 'action': 'delete_recruitment_job', 'api_endpoint': '/api/hr/recruitment/job/{job_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_recruitment_job_detail', 'api_endpoint': '/api/hr/recruitment/job/{job_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 83. /api/hr/recruitment/stages (GET, POST)
+    {
+        'keywords': [
+            'giai đoạn tuyển dụng', 'recruitment stage', 'recruitment stages', 'stage tuyển dụng',
+            'danh sách giai đoạn', 'list recruitment stage', 'tạo giai đoạn', 'create recruitment stage',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_recruitment_stage', 'api_endpoint': '/api/hr/recruitment/stages', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_recruitment_stages', 'api_endpoint': '/api/hr/recruitment/stages', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 84. /api/hr/recruitment/stage/<int:stage_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết giai đoạn tuyển dụng', 'recruitment stage detail', 'thông tin giai đoạn',
+            'cập nhật giai đoạn', 'update recruitment stage', 'sửa giai đoạn', 'edit recruitment stage',
+            'xóa giai đoạn', 'delete recruitment stage',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_recruitment_stage', 'api_endpoint': '/api/hr/recruitment/stage/{stage_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'delete_recruitment_stage', 'api_endpoint': '/api/hr/recruitment/stage/{stage_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_recruitment_stage_detail', 'api_endpoint': '/api/hr/recruitment/stage/{stage_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 85. /api/hr/candidates (GET, POST)
+    {
+        'keywords': [
+            'candidate', 'candidates', 'ứng cử viên', 'thí sinh', 'danh sách candidate', 'list candidate',
+            'tạo candidate', 'create candidate',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_candidate', 'api_endpoint': '/api/hr/candidates', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_candidates', 'api_endpoint': '/api/hr/candidates', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 86. /api/hr/candidate/<int:candidate_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết candidate', 'candidate detail', 'thông tin candidate', 'cập nhật candidate',
+            'update candidate', 'sửa candidate', 'edit candidate', 'xóa candidate', 'delete candidate',
+            'archive candidate',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_candidate', 'api_endpoint': '/api/hr/candidate/{candidate_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete', 'archive'],
+                'result': {'intent': 'hr_action', 'action': 'delete_candidate', 'api_endpoint': '/api/hr/candidate/{candidate_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_candidate_detail', 'api_endpoint': '/api/hr/candidate/{candidate_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # ======================= EXPENSE MANAGEMENT INTENTS =======================
+    # 87. /api/hr/expenses (GET, POST)
+    {
+        'keywords': [
+            'chi phí', 'expense', 'expenses', 'khoản chi', 'danh sách chi phí', 'list expense', 'tạo chi phí',
+            'create expense',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_expense', 'api_endpoint': '/api/hr/expenses', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_expenses', 'api_endpoint': '/api/hr/expenses', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 88. /api/hr/expense/<int:expense_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết chi phí', 'expense detail', 'thông tin chi phí', 'cập nhật chi phí', 'update expense',
+            'sửa chi phí', 'edit expense', 'hủy chi phí', 'cancel expense',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_expense', 'api_endpoint': '/api/hr/expense/{expense_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['hủy', 'cancel', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'cancel_expense', 'api_endpoint': '/api/hr/expense/{expense_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_expense_detail', 'api_endpoint': '/api/hr/expense/{expense_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 89. /api/hr/expense-sheets (GET, POST)
+    {
+        'keywords': [
+            'bảng chi phí', 'expense sheet', 'expense sheets', 'sheet chi phí', 'danh sách bảng chi phí',
+            'list expense sheet', 'tạo bảng chi phí', 'create expense sheet',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_expense_sheet', 'api_endpoint': '/api/hr/expense-sheets', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_expense_sheets', 'api_endpoint': '/api/hr/expense-sheets', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 90. /api/hr/expense-sheet/<int:sheet_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết bảng chi phí', 'expense sheet detail', 'thông tin bảng chi phí', 'cập nhật bảng chi phí',
+            'update expense sheet', 'sửa bảng chi phí', 'edit expense sheet', 'hủy bảng chi phí',
+            'cancel expense sheet',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_expense_sheet', 'api_endpoint': '/api/hr/expense-sheet/{sheet_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['hủy', 'cancel', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'cancel_expense_sheet', 'api_endpoint': '/api/hr/expense-sheet/{sheet_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_expense_sheet_detail', 'api_endpoint': '/api/hr/expense-sheet/{sheet_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 91. /api/hr/expense-sheet/<int:sheet_id>/submit (POST)
+    {
+        'keywords': ['nộp bảng chi phí', 'submit expense sheet', 'gửi bảng chi phí', 'submit expense'],
+        'result': {'intent': 'hr_action', 'action': 'submit_expense_sheet', 'api_endpoint': '/api/hr/expense-sheet/{sheet_id}/submit', 'method': 'POST', 'confidence': 0.9},
+    },
+    # 92. /api/hr/expense-sheet/<int:sheet_id>/approve (POST)
+    {
+        'keywords': [
+            'phê duyệt bảng chi phí', 'approve expense sheet', 'duyệt bảng chi phí', 'approve expense',
+        ],
+        'result': {'intent': 'hr_action', 'action': 'approve_expense_sheet', 'api_endpoint': '/api/hr/expense-sheet/{sheet_id}/approve', 'method': 'POST', 'confidence': 0.9},
+    },
+    # ======================= HOMEWORKING MANAGEMENT INTENTS =======================
+    # 93. /api/hr/homeworking-requests (GET, POST)
+    {
+        'keywords': [
+            'làm việc tại nhà', 'homeworking', 'homeworking request', 'work from home', 'yêu cầu làm tại nhà',
+            'remote work', 'wfh',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new', 'yêu cầu'],
+                'result': {'intent': 'hr_action', 'action': 'create_homeworking_request', 'api_endpoint': '/api/hr/homeworking-requests', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_homeworking_requests', 'api_endpoint': '/api/hr/homeworking-requests', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 94. /api/hr/homeworking-request/<int:request_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết yêu cầu làm tại nhà', 'homeworking request detail', 'thông tin homeworking',
+            'cập nhật yêu cầu làm tại nhà', 'update homeworking request', 'sửa homeworking',
+            'hủy yêu cầu làm tại nhà', 'cancel homeworking request',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_homeworking_request', 'api_endpoint': '/api/hr/homeworking-request/{request_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['hủy', 'cancel', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'cancel_homeworking_request', 'api_endpoint': '/api/hr/homeworking-request/{request_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_homeworking_request_detail', 'api_endpoint': '/api/hr/homeworking-request/{request_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 95. /api/hr/work-locations (GET, POST)
+    {
+        'keywords': [
+            'địa điểm làm việc', 'work location', 'work locations', 'location làm việc', 'danh sách địa điểm',
+            'list work location', 'tạo địa điểm', 'create work location',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_work_location', 'api_endpoint': '/api/hr/work-locations', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_work_locations', 'api_endpoint': '/api/hr/work-locations', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # ======================= WORK ENTRY MANAGEMENT INTENTS =======================
+    # 96. /api/hr/work-entries (GET, POST)
+    {
+        'keywords': [
+            'bút toán công việc', 'work entry', 'work entries', 'entry công việc', 'danh sách work entry',
+            'list work entry', 'tạo work entry', 'create work entry',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_work_entry', 'api_endpoint': '/api/hr/work-entries', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_work_entries', 'api_endpoint': '/api/hr/work-entries', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 97. /api/hr/work-entry/<int:entry_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết work entry', 'work entry detail', 'thông tin bút toán', 'cập nhật work entry',
+            'update work entry', 'sửa work entry', 'edit work entry', 'hủy work entry', 'cancel work entry',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_work_entry', 'api_endpoint': '/api/hr/work-entry/{entry_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['hủy', 'cancel', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'cancel_work_entry', 'api_endpoint': '/api/hr/work-entry/{entry_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_work_entry_detail', 'api_endpoint': '/api/hr/work-entry/{entry_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 98. /api/hr/employee/<int:employee_id>/work-entries (GET)
+    {
+        'keywords': [
+            'work entry nhân viên', 'employee work entry', 'employee work entries', 'bút toán nhân viên',
+        ],
+        'result': {'intent': 'hr_action', 'action': 'get_employee_work_entries', 'api_endpoint': '/api/hr/employee/{employee_id}/work-entries', 'method': 'GET', 'confidence': 0.9},
+    },
+    # ======================= CALENDAR MANAGEMENT INTENTS =======================
+    # 99. /api/hr/calendar-events (GET, POST)
+    {
+        'keywords': [
+            'sự kiện lịch', 'calendar event', 'calendar events', 'event lịch', 'danh sách sự kiện',
+            'list calendar event', 'tạo sự kiện', 'create calendar event',
+        ],
+        'variants': [
+            {
+                'keywords': ['tạo', 'create', 'thêm', 'add', 'new'],
+                'result': {'intent': 'hr_action', 'action': 'create_calendar_event', 'api_endpoint': '/api/hr/calendar-events', 'method': 'POST', 'confidence': 0.9},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'list_calendar_events', 'api_endpoint': '/api/hr/calendar-events', 'method': 'GET', 'confidence': 0.9}},
+        ],
+    },
+    # 100. /api/hr/calendar-event/<int:event_id> (GET, PUT, DELETE)
+    {
+        'keywords': [
+            'chi tiết sự kiện', 'calendar event detail', 'thông tin sự kiện', 'cập nhật sự kiện',
+            'update calendar event', 'sửa sự kiện', 'edit calendar event', 'xóa sự kiện',
+            'delete calendar event',
+        ],
+        'variants': [
+            {
+                'keywords': ['cập nhật', 'update', 'sửa', 'edit'],
+                'result': {'intent': 'hr_action', 'action': 'update_calendar_event', 'api_endpoint': '/api/hr/calendar-event/{event_id}', 'method': 'PUT', 'confidence': 0.85},
+            },
+            {
+                'keywords': ['xóa', 'delete'],
+                'result': {'intent': 'hr_action', 'action': 'delete_calendar_event', 'api_endpoint': '/api/hr/calendar-event/{event_id}', 'method': 'DELETE', 'confidence': 0.85},
+            },
+            {'result': {'intent': 'hr_action', 'action': 'get_calendar_event_detail', 'api_endpoint': '/api/hr/calendar-event/{event_id}', 'method': 'GET', 'confidence': 0.85}},
+        ],
+    },
+    # 101. /api/hr/employee/<int:employee_id>/calendar-events (GET)
+    {
+        'keywords': ['lịch nhân viên', 'employee calendar', 'employee calendar events', 'sự kiện nhân viên'],
+        'result': {'intent': 'hr_action', 'action': 'get_employee_calendar_events', 'api_endpoint': '/api/hr/employee/{employee_id}/calendar-events', 'method': 'GET', 'confidence': 0.9},
+    },
+    # ======================= FLEET MANAGEMENT INTENTS =======================
+    # 102. /api/hr/fleet-vehicles (GET)
+    {
+        'keywords': [
+            'xe công ty', 'fleet vehicle', 'fleet vehicles', 'xe fleet', 'danh sách xe', 'list fleet vehicle',
+            'vehicle công ty',
+        ],
+        'result': {'intent': 'hr_action', 'action': 'list_fleet_vehicles', 'api_endpoint': '/api/hr/fleet-vehicles', 'method': 'GET', 'confidence': 0.9},
+    },
+    # 103. /api/hr/employee/<int:employee_id>/fleet-vehicles (GET)
+    {
+        'keywords': ['xe nhân viên', 'employee vehicle', 'employee fleet', 'xe của nhân viên'],
+        'result': {'intent': 'hr_action', 'action': 'get_employee_fleet_vehicles', 'api_endpoint': '/api/hr/employee/{employee_id}/fleet-vehicles', 'method': 'GET', 'confidence': 0.9},
+    },
+    # ======================= REPORTS & ANALYTICS INTENTS =======================
+    # 104. /api/hr/reports/summary (GET)
+    {
+        'keywords': [
+            'báo cáo tổng hợp hr', 'hr reports summary', 'báo cáo hr', 'hr summary', 'tóm tắt hr', 'hr report',
+            'summary report',
+        ],
+        'result': {'intent': 'hr_action', 'action': 'hr_reports_summary', 'api_endpoint': '/api/hr/reports/summary', 'method': 'GET', 'confidence': 0.9},
+    },
+    # 105. /api/hr/reports/export (POST)
+    {
+        'keywords': [
+            'xuất báo cáo hr', 'export hr report', 'xuất báo cáo excel', 'export excel', 'xuất báo cáo pdf',
+            'export pdf', 'export hr',
+        ],
+        'result': {'intent': 'hr_action', 'action': 'export_hr_report', 'api_endpoint': '/api/hr/reports/export', 'method': 'POST', 'confidence': 0.9},
+    },
+    # 106. /api/hr/dashboard/stats (GET)
+    {
+        'keywords': [
+            'thống kê dashboard hr', 'hr dashboard stats', 'dashboard hr', 'thống kê hr',
+            'dashboard statistics', 'hr stats',
+        ],
+        'result': {'intent': 'hr_action', 'action': 'hr_dashboard_stats', 'api_endpoint': '/api/hr/dashboard/stats', 'method': 'GET', 'confidence': 0.9},
+    },
+    # 107. /api/hr/analytics/trend (GET)
+    {
+        'keywords': [
+            'phân tích xu hướng hr', 'hr analytics trend', 'phân tích hr', 'trend hr', 'xu hướng hr',
+            'hr trend', 'analytics hr',
+        ],
+        'result': {'intent': 'hr_action', 'action': 'hr_analytics_trend', 'api_endpoint': '/api/hr/analytics/trend', 'method': 'GET', 'confidence': 0.9},
+    },
+    # 108. /api/hr/notifications (GET)
+    {
+        'keywords': [
+            'thông báo hr', 'hr notifications', 'notification hr', 'thông báo quan trọng', 'alerts hr',
+            'hr alerts',
+        ],
+        'result': {'intent': 'hr_action', 'action': 'hr_notifications', 'api_endpoint': '/api/hr/notifications', 'method': 'GET', 'confidence': 0.9},
+    },
+    # 109. /api/hr/export/complete (POST)
+    {
+        'keywords': [
+            'xuất báo cáo tổng hợp', 'export complete hr', 'xuất báo cáo đầy đủ', 'export all hr',
+            'xuất toàn bộ hr', 'complete export',
+        ],
+        'result': {'intent': 'hr_action', 'action': 'export_complete_hr', 'api_endpoint': '/api/hr/export/complete', 'method': 'POST', 'confidence': 0.9},
+    },
+    # ======================= BULK OPERATIONS INTENTS =======================
+    # 110. /api/hr/bulk/update (POST)
+    {
+        'keywords': [
+            'cập nhật hàng loạt', 'bulk update', 'update hàng loạt', 'batch update', 'cập nhật nhiều',
+            'mass update',
+        ],
+        'result': {'intent': 'hr_action', 'action': 'bulk_update_hr', 'api_endpoint': '/api/hr/bulk/update', 'method': 'POST', 'confidence': 0.9},
+    },
+    # 111. /api/hr/bulk/delete (POST)
+    {
+        'keywords': [
+            'xóa hàng loạt', 'bulk delete', 'delete hàng loạt', 'batch delete', 'xóa nhiều', 'mass delete',
+            'archive hàng loạt',
+        ],
+        'result': {'intent': 'hr_action', 'action': 'bulk_delete_hr', 'api_endpoint': '/api/hr/bulk/delete', 'method': 'POST', 'confidence': 0.9},
+    },
+    # ======================= ADVANCED UTILITIES INTENTS =======================
+    # 112. /api/hr/employee/<int:employee_id>/document-check (GET)
+    {
+        'keywords': [
+            'kiểm tra tài liệu nhân viên', 'employee document check', 'document check', 'check tài liệu',
+            'verify documents', 'kiểm tra giấy tờ',
+        ],
+        'result': {'intent': 'hr_action', 'action': 'check_employee_documents', 'api_endpoint': '/api/hr/employee/{employee_id}/document-check', 'method': 'GET', 'confidence': 0.9},
+    },
+    # 113. /api/hr/employee/<int:employee_id>/performance-summary (GET)
+    {
+        'keywords': [
+            'tóm tắt hiệu suất nhân viên', 'employee performance summary', 'performance summary',
+            'hiệu suất nhân viên', 'employee performance', 'đánh giá hiệu suất',
+        ],
+        'result': {'intent': 'hr_action', 'action': 'employee_performance_summary', 'api_endpoint': '/api/hr/employee/{employee_id}/performance-summary', 'method': 'GET', 'confidence': 0.9},
+    },
+    # 114. /api/hr/search/global (GET)
+    {
+        'keywords': [
+            'tìm kiếm toàn cục hr', 'hr global search', 'global search', 'tìm kiếm hr', 'search hr',
+            'search toàn bộ',
+        ],
+        'result': {'intent': 'hr_action', 'action': 'hr_global_search', 'api_endpoint': '/api/hr/search/global', 'method': 'GET', 'confidence': 0.9},
+    },
+    # ======================= ATTENDANCE ADVANCED INTENTS =======================
+    # 115. /api/hr/attendance/summary (GET)
+    {
+        'keywords': ['tóm tắt chấm công', 'attendance summary', 'báo cáo chấm công', 'attendance report'],
+        'result': {'intent': 'hr_action', 'action': 'attendance_summary', 'api_endpoint': '/api/hr/attendance/summary', 'method': 'GET', 'confidence': 0.9},
+    },
+    # 116. /api/hr/attendance/overtime (GET)
+    {
+        'keywords': [
+            'tính toán giờ làm thêm', 'attendance overtime', 'overtime calculation', 'giờ làm thêm',
+            'overtime report', 'báo cáo overtime',
+        ],
+        'result': {'intent': 'hr_action', 'action': 'attendance_overtime', 'api_endpoint': '/api/hr/attendance/overtime', 'method': 'GET', 'confidence': 0.9},
+    },
+    # ======================= EXISTING FALLBACK LOGIC =======================
+    # Dashboard stats
+    {
+        'keywords': ['thống kê', 'statistics', 'dashboard', 'báo cáo tổng quan', 'tổng quan', 'overview'],
+        'result': {'intent': 'hr_action', 'action': 'dashboard_stats', 'api_endpoint': '/api/hr/dashboard/stats', 'method': 'GET', 'confidence': 0.8},
+    },
+    # Global search
+    {
+        'keywords': ['tìm kiếm', 'search', 'find', 'tìm', 'tra cứu', 'lookup'],
+        'result': {'intent': 'hr_action', 'action': 'global_search', 'api_endpoint': '/api/hr/search/global', 'method': 'GET', 'confidence': 0.7},
+    },
+]
+
+# Default fallback khi không rule nào khớp
+INTENT_FALLBACK = {'intent': 'hr_action', 'action': 'dashboard_stats', 'api_endpoint': '/api/hr/dashboard/stats', 'method': 'GET', 'confidence': 0.5}
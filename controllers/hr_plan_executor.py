@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+HR Plan Executor
+Chế độ plan-then-execute: model trả về một lần toàn bộ kế hoạch (DAG các HR
+function call, tham chiếu kết quả giữa các bước), server chạy DAG theo từng tầng
+(các bước độc lập chạy song song qua _execute_tool_calls) rồi gọi model một lần
+để viết câu trả lời - phần lớn lượt chat chỉ cần 2 vòng gọi LLM.
+
+Tham chiếu: giá trị tham số là chuỗi "$<step_id>.<đường dẫn>", ví dụ
+"$s1.data.0.id" lấy id của phần tử đầu trong data của kết quả bước s1.
+"""
+
+import json
+import logging
+import re
+
+_logger = logging.getLogger(__name__)
+
+MAX_PLAN_STEPS = 8
+REF_PREFIX = '$'
+_STEP_ID_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]{0,31}$')
+
+# Gửi như tin nhắn system cuối cùng (sau tin nhắn user) để prefix system prompt + tools giữ nguyên cho context cache
+PLAN_PROMPT = """CHẾ ĐỘ LẬP KẾ HOẠCH: không gọi function trực tiếp và không trả lời người dùng ở bước này.
+Trả về DUY NHẤT một JSON object dạng:
+{"steps": [{"id": "s1", "function": "<tên HR function trong tools>", "arguments": {...}}]}
+- Tối đa 8 bước, id duy nhất (s1, s2, ...).
+- Dùng kết quả bước trước làm tham số bằng chuỗi "$<id>.<đường dẫn>", ví dụ "$s1.data.0.id".
+- Các bước không tham chiếu nhau sẽ được chạy song song; server tự chạy toàn bộ kế hoạch.
+- Nếu câu hỏi không cần dữ liệu HR, trả về {"steps": []}."""
+
+
+class PlanError(ValueError):
+    """Kế hoạch không hợp lệ - lượt chat quay về vòng lặp function calling thông thường"""
+
+
+class HRExecutionPlan:
+    """DAG các bước HR function đã validate"""
+
+    def __init__(self, steps):
+        self.steps = steps
+
+    @classmethod
+    def parse(cls, content, known_functions):
+        """Parse JSON kế hoạch của model; raise PlanError khi sai cấu trúc, function lạ hoặc có chu trình"""
+        try:
+            data = json.loads(cls._strip_code_fence(content or ''))
+        except ValueError as e:
+            raise PlanError(f'Kế hoạch không phải JSON hợp lệ: {e}')
+        raw_steps = data.get('steps') if isinstance(data, dict) else None
+        if not isinstance(raw_steps, list):
+            raise PlanError('Kế hoạch thiếu danh sách "steps"')
+        if len(raw_steps) > MAX_PLAN_STEPS:
+            raise PlanError(f'Kế hoạch có {len(raw_steps)} bước, tối đa {MAX_PLAN_STEPS}')
+
+        steps = []
+        seen = set()
+        for raw in raw_steps:
+            if not isinstance(raw, dict):
+                raise PlanError('Mỗi bước phải là một object')
+            step_id = str(raw.get('id') or f's{len(steps) + 1}')
+            function_name = raw.get('function')
+            arguments = raw.get('arguments') or {}
+            if not _STEP_ID_RE.match(step_id) or step_id in seen:
+                raise PlanError(f'Id bước không hợp lệ hoặc bị trùng: {step_id}')
+            if function_name not in known_functions:
+                raise PlanError(f'Function không tồn tại: {function_name}')
+            if not isinstance(arguments, dict):
+                raise PlanError(f'Tham số của bước {step_id} phải là object')
+            seen.add(step_id)
+            steps.append({
+                'id': step_id,
+                'function': function_name,
+                'arguments': arguments,
+                'depends': cls._collect_refs(arguments),
+            })
+
+        for step in steps:
+            unknown = step['depends'] - seen
+            if unknown:
+                raise PlanError(f'Bước {step["id"]} tham chiếu bước không tồn tại: {", ".join(sorted(unknown))}')
+        plan = cls(steps)
+        plan.levels()
+        return plan
+
+    def levels(self):
+        """Chia các bước thành tầng theo thứ tự topo: mọi bước trong một tầng chỉ phụ thuộc tầng trước"""
+        done = set()
+        remaining = list(self.steps)
+        levels = []
+        while remaining:
+            level = [step for step in remaining if step['depends'] <= done]
+            if not level:
+                raise PlanError('Kế hoạch có tham chiếu vòng')
+            levels.append(level)
+            done.update(step['id'] for step in level)
+            remaining = [step for step in remaining if step['id'] not in done]
+        return levels
+
+    @staticmethod
+    def _strip_code_fence(content):
+        content = content.strip()
+        if content.startswith('```'):
+            content = content.strip('`')
+            if content.startswith('json'):
+                content = content[len('json'):]
+        return content
+
+    @classmethod
+    def _collect_refs(cls, value):
+        if isinstance(value, str):
+            return {value[len(REF_PREFIX):].split('.', 1)[0]} if value.startswith(REF_PREFIX) else set()
+        if isinstance(value, dict):
+            return set().union(*(cls._collect_refs(item) for item in value.values()))
+        if isinstance(value, list):
+            return set().union(*(cls._collect_refs(item) for item in value))
+        return set()
+
+
+class HRPlanExecutor:
+    """Chạy HRExecutionPlan bằng _execute_tool_calls của controller, tầng này sang tầng khác"""
+
+    def __init__(self, controller, turn_state):
+        self.controller = controller
+        self.turn_state = turn_state
+
+    def execute(self, plan):
+        """Trả về [(tool_call, result)] theo thứ tự bước; tool_call mang tham số đã resolve"""
+        outputs = {}
+        executed = {}
+        for level in plan.levels():
+            tool_calls = []
+            for step in level:
+                try:
+                    arguments = self.resolve(step['arguments'], outputs)
+                except PlanError as e:
+                    arguments = step['arguments']
+                    executed[step['id']] = (self._tool_call(step, arguments), {'error': str(e)})
+                    outputs[step['id']] = executed[step['id']][1]
+                    continue
+                tool_calls.append(self._tool_call(step, arguments))
+
+            if tool_calls:
+                # Bước chỉ đọc trong cùng tầng chạy song song, bước ghi tuần tự
+                for tool_call, result in self.controller._execute_tool_calls(tool_calls, self.turn_state):
+                    step_id = tool_call['id'][len('plan_'):]
+                    executed[step_id] = (tool_call, result)
+                    outputs[step_id] = result
+
+        return [executed[step['id']] for step in plan.steps]
+
+    @staticmethod
+    def _tool_call(step, arguments):
+        return {
+            'id': f'plan_{step["id"]}',
+            'type': 'function',
+            'function': {
+                'name': step['function'],
+                'arguments': json.dumps(arguments, ensure_ascii=False, default=str),
+            },
+        }
+
+    @classmethod
+    def resolve(cls, value, outputs):
+        """Thay các chuỗi "$id.path" bằng giá trị tương ứng trong kết quả các bước trước"""
+        if isinstance(value, str) and value.startswith(REF_PREFIX):
+            step_id, _, path = value[len(REF_PREFIX):].partition('.')
+            result = outputs.get(step_id)
+            if isinstance(result, dict) and 'error' in result:
+                raise PlanError(f'Bỏ qua vì bước {step_id} lỗi: {result["error"]}')
+            return cls._lookup(result, path, value)
+        if isinstance(value, dict):
+            return {key: cls.resolve(item, outputs) for key, item in value.items()}
+        if isinstance(value, list):
+            return [cls.resolve(item, outputs) for item in value]
+        return value
+
+    @staticmethod
+    def _lookup(result, path, reference):
+        current = result
+        for part in path.split('.') if path else []:
+            if isinstance(current, dict) and part not in current and 'data' in current:
+                # Kết quả HR function thường bọc trong 'data' - cho phép bỏ qua cấp này
+                current = current['data']
+            if isinstance(current, dict) and part in current:
+                current = current[part]
+            elif isinstance(current, list) and part.lstrip('-').isdigit() and -len(current) <= int(part) < len(current):
+                current = current[int(part)]
+            else:
+                raise PlanError(f'Không tìm thấy giá trị cho tham chiếu {reference}')
+        return current
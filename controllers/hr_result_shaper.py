@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+HR Result Shaper
+Thu gọn kết quả HR function trước khi đưa vào message list của LLM:
+chiếu field theo từng function, giới hạn số dòng (kèm marker "còn nữa"),
+tóm tắt số liệu của các dòng bị cắt và cắt chuỗi quá dài.
+Kết quả được gửi lại ở mọi vòng lặp sau nên mỗi byte đều bị trả nhiều lần.
+"""
+
+import json
+import logging
+import threading
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ROWS = 20
+MAX_STRING_CHARS = 500
+BYTES_PER_TOKEN = 3.5
+
+# Field giữ lại cho từng function: {function_name: {key trong result: [fields]}}
+# key trỏ tới một dict hoặc list các dict trong kết quả; chỉ bỏ dữ liệu model không dùng được
+# (ảnh chữ ký base64, tham số đầu vào lặp lại), giữ mọi field nghiệp vụ
+CONTRACT_FIELDS = [
+    'id', 'name', 'start_date', 'end_date', 'status', 'type', 'duration', 'renewal_date',
+    'termination_reason', 'signing_date', 'signatory', 'attachment', 'revision_history',
+    'approval_status', 'approval_date', 'approval_signatory', 'amendment_history', 'amendment_status',
+    'amendment_approval_status', 'amendment_approval_date', 'amendment_approval_signatory',
+    'amendment_approval_attachment',
+]
+FUNCTION_PROJECTIONS = {
+    'get_contract_details': {
+        'contract': CONTRACT_FIELDS,
+    },
+    'get_contracts': {
+        'contracts': CONTRACT_FIELDS,
+    },
+    'get_project_timesheets': {
+        'timesheets': ['id', 'date', 'unit_amount', 'name'],
+    },
+}
+
+# Số dòng tối đa riêng cho từng function (mặc định DEFAULT_MAX_ROWS)
+FUNCTION_MAX_ROWS = {
+    'get_attendance_summary': 10,
+    'get_project_timesheets': 15,
+    'get_timesheets': 15,
+}
+
+
+class HRResultShaper:
+    """Compaction layer cho kết quả tool calls"""
+
+    _metrics_lock = threading.Lock()
+    _metrics = {
+        'results': 0,
+        'bytes_before': 0,
+        'bytes_after': 0,
+    }
+
+    @classmethod
+    def shape(cls, function_name, result):
+        """Trả về (content JSON string, stats) cho một kết quả tool call"""
+        original = json.dumps(result, ensure_ascii=False, default=str)
+        compacted = cls.compact(function_name, result)
+        content = json.dumps(compacted, ensure_ascii=False, default=str, separators=(',', ':'))
+
+        bytes_before = len(original.encode('utf-8'))
+        bytes_after = len(content.encode('utf-8'))
+        stats = {
+            'function': function_name,
+            'bytes_before': bytes_before,
+            'bytes_after': bytes_after,
+            'tokens_before': int(bytes_before / BYTES_PER_TOKEN),
+            'tokens_after': int(bytes_after / BYTES_PER_TOKEN),
+        }
+        with cls._metrics_lock:
+            cls._metrics['results'] += 1
+            cls._metrics['bytes_before'] += bytes_before
+            cls._metrics['bytes_after'] += bytes_after
+
+        if bytes_after < bytes_before:
+            _logger.info(f"Thu gọn kết quả {function_name}: {bytes_before} -> {bytes_after} bytes "
+                         f"(~{stats['tokens_before']} -> ~{stats['tokens_after']} tokens)")
+        return content, stats
+
+    @classmethod
+    def compact(cls, function_name, result):
+        """Áp dụng projection, row cap, tóm tắt số liệu và cắt chuỗi"""
+        if not isinstance(result, (dict, list)):
+            return result
+
+        max_rows = FUNCTION_MAX_ROWS.get(function_name, DEFAULT_MAX_ROWS)
+        projections = FUNCTION_PROJECTIONS.get(function_name, {})
+
+        if isinstance(result, list):
+            return cls._compact_list(result, None, max_rows)[0]
+
+        compacted = {}
+        for key, value in result.items():
+            fields = projections.get(key)
+            if isinstance(value, list):
+                rows, extra = cls._compact_list(value, fields, max_rows)
+                compacted[key] = rows
+                for extra_key, extra_value in extra.items():
+                    compacted[f'{key}_{extra_key}'] = extra_value
+            elif isinstance(value, dict):
+                compacted[key] = cls._compact_dict(value, fields)
+            elif value is not None:
+                compacted[key] = cls._compact_value(value)
+        return compacted
+
+    @classmethod
+    def _compact_list(cls, rows, fields, max_rows):
+        extra = {}
+        if len(rows) > max_rows:
+            extra['more_available'] = len(rows) - max_rows
+            extra['total'] = len(rows)
+            summary = cls._summarize_numbers(rows)
+            if summary:
+                extra['summary'] = summary
+            rows = rows[:max_rows]
+        return [cls._compact_dict(row, fields) if isinstance(row, dict) else cls._compact_value(row) for row in rows], extra
+
+    @classmethod
+    def _compact_dict(cls, row, fields=None):
+        if fields:
+            row = {field: row[field] for field in fields if field in row}
+        return {
+            key: cls._compact_value(value) if not isinstance(value, dict) else cls._compact_dict(value)
+            for key, value in row.items()
+            if value is not None and value != [] and value != ''
+        }
+
+    @staticmethod
+    def _compact_value(value):
+        if isinstance(value, str) and len(value) > MAX_STRING_CHARS:
+            return value[:MAX_STRING_CHARS] + f'… [đã cắt {len(value) - MAX_STRING_CHARS} ký tự]'
+        if isinstance(value, float):
+            return round(value, 2)
+        if isinstance(value, list) and len(value) > DEFAULT_MAX_ROWS:
+            return value[:DEFAULT_MAX_ROWS] + [f'… còn {len(value) - DEFAULT_MAX_ROWS} mục']
+        return value
+
+    @staticmethod
+    def _summarize_numbers(rows):
+        """sum/avg/min/max cho các field số trên toàn bộ dòng (kể cả dòng bị cắt)"""
+        values = {}
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            for key, value in row.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool) and key != 'id' and not key.endswith('_id'):
+                    values.setdefault(key, []).append(value)
+        return {
+            key: {
+                'sum': round(sum(numbers), 2),
+                'avg': round(sum(numbers) / len(numbers), 2),
+                'min': min(numbers),
+                'max': max(numbers),
+            }
+            for key, numbers in values.items()
+        }
+
+    @classmethod
+    def get_metrics(cls):
+        with cls._metrics_lock:
+            metrics = dict(cls._metrics)
+        metrics['bytes_saved'] = metrics['bytes_before'] - metrics['bytes_after']
+        metrics['tokens_saved'] = int(metrics['bytes_saved'] / BYTES_PER_TOKEN)
+        return metrics
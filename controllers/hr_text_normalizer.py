@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+HR Text Normalizer
+Chuẩn hóa tin nhắn tiếng Việt một lần cho mọi bước xử lý rule-based (intent
+matcher, intent ranker, trích xuất tham số, fast path, entity index, tool
+selector): Unicode NFC, chuẩn hóa dấu câu / khoảng trắng, chữ thường, bỏ dấu
+và tách từ. Kết quả được memo LRU vì cùng một câu (tin nhắn, lịch sử hội thoại)
+được xử lý nhiều lần trong một turn và giữa các turn.
+
+Bản bỏ dấu có cùng độ dài với bản gốc (mỗi ký tự NFC -> một ký tự), nên regex
+viết không dấu chạy trên folded vẫn lấy lại được đoạn gốc còn dấu qua vị trí.
+"""
+
+import functools
+import re
+import unicodedata
+from collections import namedtuple
+
+NORMALIZE_CACHE_SIZE = 2048
+
+# Dấu câu "thông minh" của bộ gõ / copy từ Word -> ASCII; ký tự vô hình bị bỏ
+_PUNCTUATION = str.maketrans({
+    '\u201c': '"', '\u201d': '"', '\u201e': '"', '\u00ab': '"', '\u00bb': '"',
+    '\u2018': "'", '\u2019': "'", '\u201a': "'",
+    '\u2013': '-', '\u2014': '-', '\u2212': '-',
+    '\u2026': '.',
+    '\u00a0': ' ', '\u3000': ' ',
+    '\u200b': None, '\u200c': None, '\u200d': None, '\ufeff': None,
+})
+_WORD_RE = re.compile(r'\w+')
+
+# text: NFC, dấu câu / khoảng trắng đã chuẩn hóa, giữ chữ hoa
+# lower: text chữ thường
+# folded: lower bỏ dấu (đ -> d), cùng độ dài với text
+# tokens: các từ của folded
+# words: ' tok1 tok2 ... ' - so khớp trọn từ, không phụ thuộc dấu câu
+NormalizedText = namedtuple('NormalizedText', ['text', 'lower', 'folded', 'tokens', 'words'])
+
+
+@functools.lru_cache(maxsize=None)
+def _fold_char(char):
+    if char in 'đĐ':
+        return 'd' if char == 'đ' else 'D'
+    base = ''.join(part for part in unicodedata.normalize('NFD', char) if not unicodedata.combining(part))
+    return base if len(base) == 1 else char
+
+
+def _fold_aligned(text):
+    return ''.join(map(_fold_char, text))
+
+
+def fold(text):
+    """Chuẩn hóa để so khớp: bỏ dấu tiếng Việt, đ -> d, chữ thường, gộp khoảng trắng"""
+    text = unicodedata.normalize('NFC', str(text or ''))
+    return _fold_aligned(' '.join(text.lower().split()))
+
+
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize(message):
+    text = ' '.join(unicodedata.normalize('NFC', message).translate(_PUNCTUATION).split())
+    lower = text.lower()
+    if len(lower) != len(text):
+        # Vài ký tự hiếm đổi độ dài khi lower() (İ...) - giữ căn chỉnh vị trí giữa các bản
+        text = lower
+    folded = _fold_aligned(lower)
+    tokens = tuple(_WORD_RE.findall(folded))
+    return NormalizedText(text, lower, folded, tokens, f" {' '.join(tokens)} ")
+
+
+def normalize(message):
+    """NormalizedText của message (memo LRU); message đã chuẩn hóa thì trả lại nguyên"""
+    if isinstance(message, NormalizedText):
+        return message
+    return _normalize(str(message or ''))
+
+
+def search(regex, message):
+    """Chạy regex (viết không dấu, chữ thường) trên bản folded; trả về tuple nhóm bắt được
+    cắt từ text gốc (còn dấu, giữ chữ hoa), None nếu không khớp"""
+    normalized = normalize(message)
+    match = regex.search(normalized.folded)
+    if not match:
+        return None
+    return tuple(
+        normalized.text[start:end] if start >= 0 else None
+        for start, end in (match.span(group) for group in range(1, regex.groups + 1))
+    )
+
+
+def get_metrics():
+    info = _normalize.cache_info()
+    total = info.hits + info.misses
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'size': info.currsize,
+        'max_size': info.maxsize,
+        'hit_ratio': round(info.hits / total, 3) if total else 0.0,
+    }
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+HR Tool Memo
+Memo kết quả HR function chỉ đọc trong một lượt chat (tùy chọn: trong cả cuộc
+trò chuyện). Model thường gọi lại cùng function với cùng tham số ở các vòng sau
+(get_employees -> get_departments -> get_employees...) - lời gọi trùng trả kết
+quả đã có thay vì chạy lại truy vấn ORM.
+
+Khóa: tên function + kwargs đã qua validator của HRFunctionRegistry (đã ép kiểu,
+bỏ tham số lạ, điền default) nên {"limit": "5"} và {"limit": 5} trùng nhau.
+Memo bị xóa khi:
+- một function ghi chạy trong lượt (hoặc cuộc trò chuyện),
+- phiên bản dữ liệu của các model HR thay đổi (kiểm tra trước mỗi nhóm tool
+  calls - bắt được cả thay đổi từ người dùng / worker khác, kể cả xóa): phiên
+  bản được hook create / write / unlink của ORM tăng khi transaction commit
+  (sbotchat.aggregate.cache.version), ghi chưa commit trong transaction hiện
+  tại được đếm riêng. Không quét bảng HR nào; ghi bằng SQL thô bỏ qua ORM thì
+  chỉ bị bắt bởi TTL / hết lượt,
+- (phạm vi cuộc trò chuyện) mục quá CONVERSATION_MEMO_TTL giây.
+"""
+
+import copy
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from odoo.addons.sbotchat.models.sbotchat_aggregate_cache import WRITES_KEY
+
+from .hr_function_registry import ArgumentError
+
+_logger = logging.getLogger(__name__)
+
+SCOPE_OFF = 'off'
+SCOPE_TURN = 'turn'
+SCOPE_CONVERSATION = 'conversation'
+SCOPES = (SCOPE_OFF, SCOPE_TURN, SCOPE_CONVERSATION)
+
+# Model HR mà kết quả HR function phụ thuộc - đổi dữ liệu ở đây làm memo mất hiệu lực.
+# Mỗi model cần hook sbotchat.aggregate.cache.mixin (models/sbotchat_aggregate_cache.py)
+WATCHED_MODELS = (
+    'hr.employee', 'hr.department', 'hr.job', 'hr.contract', 'hr.attendance',
+    'hr.leave', 'hr.leave.allocation', 'hr.leave.type', 'hr.applicant', 'hr.payslip',
+    'account.analytic.line', 'hr.employee.skill',
+)
+MAX_MEMO_ENTRIES = 64
+CONVERSATION_MEMO_TTL = 300
+MAX_CONVERSATION_MEMOS = 256
+
+
+def data_version(env, models=WATCHED_MODELS):
+    """(phiên bản đã commit của từng model, số lần ghi chưa commit trong transaction hiện tại).
+
+    Một truy vấn theo khóa trên bảng phiên bản nhỏ, không phụ thuộc kích thước bảng HR.
+    """
+    versions = env['sbotchat.aggregate.cache.version']._get_versions(models)
+    return tuple(versions.get(model, 0) for model in models), env.cr.precommit.data.get(WRITES_KEY, 0)
+
+
+class ToolResultMemo:
+    """Kết quả HR function chỉ đọc theo (function, tham số chuẩn hóa)"""
+
+    # Memo theo cuộc trò chuyện: (db, uid, conversation_id) -> ToolResultMemo, LRU
+    _conversations = OrderedDict()
+    _conversations_lock = threading.Lock()
+
+    def __init__(self, ttl=None):
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_conversation(cls, dbname, uid, conversation_id):
+        """Memo dùng chung giữa các lượt của một cuộc trò chuyện (theo người dùng)"""
+        key = (dbname, uid, conversation_id)
+        with cls._conversations_lock:
+            memo = cls._conversations.pop(key, None) or cls(ttl=CONVERSATION_MEMO_TTL)
+            cls._conversations[key] = memo
+            while len(cls._conversations) > MAX_CONVERSATION_MEMOS:
+                cls._conversations.popitem(last=False)
+        return memo
+
+    @staticmethod
+    def key(spec, function_args):
+        """Khóa memo của lời gọi; None khi tham số không hợp lệ (để handler báo lỗi như thường)"""
+        try:
+            kwargs = spec.validator(function_args if function_args is not None else {})
+        except ArgumentError:
+            return None
+        return spec.name, json.dumps(kwargs, sort_keys=True, ensure_ascii=False, default=str)
+
+    def sync(self, env):
+        """Xóa memo nếu dữ liệu HR đã đổi kể từ lần ghi nhận trước (bỏ qua khi memo rỗng và đã có phiên bản)"""
+        if not self.entries and self.version is not None:
+            return
+        version = data_version(env)
+        with self._lock:
+            if version != self.version:
+                self._clear('dữ liệu HR đã thay đổi')
+            self.version = version
+
+    def get(self, key):
+        """Bản sao kết quả đã memo, None nếu chưa có / đã hết hạn"""
+        if key is None:
+            return None
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and self.ttl and time.monotonic() - entry[0] > self.ttl:
+                del self.entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(entry[1])
+
+    def put(self, key, result):
+        """Ghi kết quả thành công vào memo"""
+        if key is None or not isinstance(result, dict) or 'error' in result or result.get('success') is False:
+            return
+        with self._lock:
+            self.entries[key] = (time.monotonic(), copy.deepcopy(result))
+            self.entries.move_to_end(key)
+            while len(self.entries) > MAX_MEMO_ENTRIES:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, env=None, reason='function ghi dữ liệu'):
+        """Xóa memo; ghi nhận phiên bản dữ liệu sau thay đổi (env) để giữ được kết quả đọc sau đó"""
+        version = data_version(env) if env is not None else None
+        with self._lock:
+            self._clear(reason)
+            self.version = version
+
+    def _clear(self, reason):
+        if self.entries:
+            _logger.info(f"Xóa memo HR function ({len(self.entries)} mục): {reason}")
+            self.invalidations += 1
+        self.entries.clear()
+
+    def get_metrics(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self.entries),
+            'invalidations': self.invalidations,
+        }
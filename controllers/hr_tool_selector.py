@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+HR Tool Selector
+Chọn tập con HR functions liên quan tới tin nhắn người dùng để gửi cho LLM,
+thay vì gửi toàn bộ catalog trong mỗi vòng lặp function calling.
+"""
+
+import json
+import logging
+import math
+import threading
+from collections import Counter
+
+from .hr_functions_schema import HRFunctionsSchema
+from .hr_text_normalizer import normalize
+
+_logger = logging.getLogger(__name__)
+
+# Luôn gửi kèm - đủ để model tự tìm id / tra cứu khi tập con bị thiếu
+CORE_TOOLS = (
+    'get_employees',
+    'get_employee_detail',
+    'get_employee_360',
+    'resolve_entity',
+    'get_departments',
+    'search_hr_global',
+    'get_dashboard_stats',
+)
+
+DEFAULT_TOP_N = 20
+
+# Meta-tool gửi kèm tập con: model gọi khi cần chức năng không có trong danh sách
+WIDEN_TOOL_NAME = 'request_more_hr_tools'
+WIDEN_TOOL = {
+    "type": "function",
+    "function": {
+        "name": WIDEN_TOOL_NAME,
+        "description": "Gọi khi không có HR function phù hợp trong danh sách hiện tại để nhận toàn bộ danh sách HR functions",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "need": {"type": "string", "description": "Mô tả ngắn chức năng cần dùng"}
+            }
+        }
+    }
+}
+_WIDEN_TOOL_JSON = json.dumps(WIDEN_TOOL, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+# Ước lượng token từ bytes JSON (schema tiếng Việt + ký tự JSON)
+BYTES_PER_TOKEN = 3.5
+
+# Token trong tên action/function không mang nghĩa phân biệt
+GENERIC_NAME_TOKENS = frozenset(['get', 'list', 'create', 'update', 'delete', 'hr', 'new', 'detail', 'employee'])
+
+
+def _tokenize(text):
+    """Từ đơn + bigram âm tiết không dấu (tiếng Việt: 'nhan vien', 'nghi phep'...)"""
+    words = list(normalize(text).tokens)
+    return words + [f'{a} {b}' for a, b in zip(words, words[1:])]
+
+
+class HRToolSelector:
+    """Chấm điểm HR functions theo độ liên quan với tin nhắn và lịch sử gần đây"""
+
+    _index = None
+    _index_lock = threading.Lock()
+    _metrics_lock = threading.Lock()
+    _metrics = {
+        'selections': 0,
+        'widened': 0,
+        'tools_sent': 0,
+        'tools_full': 0,
+        'prompt_tokens_saved': 0,
+    }
+
+    @classmethod
+    def _get_index(cls):
+        """Index (theo version catalog): token -> idf, tool -> Counter(token)"""
+        catalog = HRFunctionsSchema.get_catalog()
+        index = cls._index
+        if index is None or index['version'] != catalog.version:
+            with cls._index_lock:
+                index = cls._index
+                if index is None or index['version'] != catalog.version:
+                    index = cls._index = cls._build_index(catalog)
+        return index
+
+    @staticmethod
+    def _build_index(catalog):
+        documents = {}
+        for tool in catalog.tools:
+            function = tool['function']
+            name_tokens = function['name'].split('_')
+            text = ' '.join([
+                ' '.join(name_tokens),
+                function.get('description', ''),
+                ' '.join(function.get('parameters', {}).get('properties', {}).keys()).replace('_', ' '),
+            ])
+            # Tên function quan trọng hơn mô tả
+            documents[function['name']] = Counter(_tokenize(text)) + Counter(name_tokens)
+
+        document_frequency = Counter()
+        for tokens in documents.values():
+            document_frequency.update(tokens.keys())
+        total = len(documents)
+        idf = {token: math.log(1 + total / count) for token, count in document_frequency.items()}
+        return {'version': catalog.version, 'documents': documents, 'idf': idf}
+
+    @classmethod
+    def score(cls, message, history_texts=None, intent_action=None):
+        """Điểm liên quan của từng function: {name: score}"""
+        index = cls._get_index()
+        idf = index['idf']
+
+        query = Counter(_tokenize(message))
+        # Lịch sử gần đây có trọng số thấp hơn tin nhắn hiện tại
+        for text in history_texts or []:
+            for token, count in Counter(_tokenize(text)).items():
+                query[token] += count * 0.3
+
+        action_tokens = set()
+        if intent_action:
+            action_tokens = set(intent_action.split('_')) - GENERIC_NAME_TOKENS
+
+        scores = {}
+        for name, document in index['documents'].items():
+            score = 0.0
+            for token, weight in query.items():
+                if token in document:
+                    score += weight * idf.get(token, 0.0)
+            if intent_action:
+                if name == intent_action:
+                    score += 10.0
+                elif action_tokens:
+                    overlap = action_tokens & (set(name.split('_')) - GENERIC_NAME_TOKENS)
+                    score += 3.0 * len(overlap)
+            scores[name] = score
+        return scores
+
+    @classmethod
+    def select(cls, message, history_texts=None, intent_action=None, top_n=DEFAULT_TOP_N):
+        """Trả về danh sách tên function (core + top-N) theo thứ tự catalog, hoặc None = toàn bộ catalog"""
+        catalog = HRFunctionsSchema.get_catalog()
+        if not top_n or top_n + len(CORE_TOOLS) >= len(catalog.names):
+            return None
+
+        scores = cls.score(message, history_texts, intent_action)
+        ranked = sorted((name for name in scores if scores[name] > 0), key=lambda name: -scores[name])
+        selected = set(CORE_TOOLS) | set(ranked[:top_n])
+        names = [name for name in catalog.names if name in selected]
+
+        cls._record_selection(catalog, names)
+        return names
+
+    @classmethod
+    def get_tools_json(cls, names=None):
+        """JSON bytes gửi cho LLM: toàn bộ catalog (names=None) hoặc tập con + meta-tool mở rộng"""
+        if names is None:
+            return HRFunctionsSchema.get_tools_json()
+        return HRFunctionsSchema.get_tools_json(names)[:-1] + (b',' if names else b'') + _WIDEN_TOOL_JSON + b']'
+
+    @classmethod
+    def _record_selection(cls, catalog, names):
+        full_bytes = len(catalog.tools_json)
+        subset_bytes = len(cls.get_tools_json(names))
+        saved_tokens = int((full_bytes - subset_bytes) / BYTES_PER_TOKEN)
+        with cls._metrics_lock:
+            cls._metrics['selections'] += 1
+            cls._metrics['tools_sent'] += len(names)
+            cls._metrics['tools_full'] += len(catalog.names)
+            cls._metrics['prompt_tokens_saved'] += saved_tokens
+        _logger.info(f"Tool selection: gửi {len(names)}/{len(catalog.names)} HR functions, tiết kiệm ~{saved_tokens} prompt tokens")
+
+    @classmethod
+    def record_widening(cls, function_name):
+        """Model cần function ngoài tập con - vòng lặp sau sẽ gửi toàn bộ catalog"""
+        with cls._metrics_lock:
+            cls._metrics['widened'] += 1
+        _logger.info(f"Tool selection: model cần {function_name} ngoài tập con, mở rộng sang toàn bộ catalog")
+
+    @classmethod
+    def get_metrics(cls):
+        with cls._metrics_lock:
+            metrics = dict(cls._metrics)
+        selections = metrics['selections'] or 1
+        metrics['avg_tools_sent'] = round(metrics['tools_sent'] / selections, 1)
+        metrics['avg_prompt_tokens_saved'] = round(metrics['prompt_tokens_saved'] / selections, 1)
+        return metrics
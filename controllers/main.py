@@ -1,18 +1,109 @@
 # -*- coding: utf-8 -*-
 
+import copy
 import json
 import requests
 import time
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from odoo import http, _, fields
 from odoo.http import request
+from odoo.osv import expression
+from odoo.addons.sbotchat.models.sbotchat_conversation import estimate_tokens
+from odoo.addons.sbotchat.models.sbotchat_aggregate_cache import get_metrics as get_aggregate_cache_metrics
+from odoo.addons.sbotchat.models.sbotchat_dashboard import (
+    get_overview_counts, attendance_summary, checkin_row, dashboard_timezone, dashboard_today, local_day_bounds,
+    receives_dashboard_deltas,
+)
 import logging
 
+from .deepseek_client import (
+    DeepSeekClient, CircuitOpenError, DEFAULT_BASE_URL, DEFAULT_POOL_SIZE, DEFAULT_MAX_RETRIES, encode_chat_payload,
+)
+from .chat_telemetry import TurnTelemetry
+from .hr_ai_agent import HRAIAgentController
+from .hr_entity_index import HREntityIndex
+from .hr_text_normalizer import get_metrics as get_normalize_metrics
+from .hr_fast_path import HRFastPath
+from .hr_plan_executor import HRExecutionPlan, HRPlanExecutor, PlanError, PLAN_PROMPT
+from .hr_function_registry import HRFunctionRegistry, ArgumentError, hr_function, COST_HEAVY
+from .hr_tool_memo import ToolResultMemo, SCOPES, SCOPE_OFF, SCOPE_CONVERSATION, SCOPE_TURN
 from .hr_functions_schema import HRFunctionsSchema
+from .hr_result_shaper import HRResultShaper
+from .hr_tool_selector import HRToolSelector, WIDEN_TOOL_NAME, BYTES_PER_TOKEN, DEFAULT_TOP_N as DEFAULT_TOOL_TOP_N
+from .request_scope import scoped_env
 
 _logger = logging.getLogger(__name__)
 
+# Context window của từng model (tokens) và token budget mặc định cho lịch sử hội thoại
+MODEL_CONTEXT_TOKENS = {
+    'deepseek-chat': 64000,
+    'deepseek-reasoner': 64000,
+}
+DEFAULT_HISTORY_TOKEN_BUDGET = 6000
+
+# Thread pool dùng chung cho tool calls chỉ đọc - giới hạn số cursor mở đồng thời
+MAX_PARALLEL_TOOL_CALLS = 4
+_TOOL_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_PARALLEL_TOOL_CALLS, thread_name_prefix='sbotchat_tool')
+
+# System prompt cố định - không chèn dữ liệu theo người dùng/thời gian để DeepSeek
+# phục vụ prefix (system prompt + tools) từ context cache
+HR_SYSTEM_PROMPT = """Bạn là trợ lý AI thông minh cho hệ thống HR của công ty. Bạn có thể:
+
+🏢 **Quản lý nhân viên**: Xem danh sách, thông tin chi tiết nhân viên (hồ sơ tổng hợp một người: get_employee_360)
+👥 **Chấm công**: Check-in/out, xem báo cáo attendance 
+📅 **Nghỉ phép**: Tạo đơn, phê duyệt, theo dõi trạng thái
+📊 **Báo cáo**: Thống kê tổng quan, phân tích dữ liệu HR
+🔍 **Tìm kiếm**: Tìm kiếm thông tin trong toàn bộ hệ thống
+
+**Quy tắc giao tiếp:**
+- Luôn thân thiện, chuyên nghiệp
+- Giải thích rõ ràng kết quả của các action
+- Hỏi thông tin cần thiết nếu user không cung cấp đủ
+- Format dữ liệu dễ đọc (bảng, danh sách)
+- Đưa ra gợi ý hữu ích
+
+**Lưu ý:** Khi cần thực hiện action HR, hãy sử dụng các function tools có sẵn."""
+
+HR_CAPABILITIES_PROMPT = """🤖 **BẠN CÓ KHẢ NĂNG ĐẶC BIỆT:**
+- Bạn có thể truy cập và xử lý dữ liệu HR thông qua 116 API endpoints
+- Bạn hiểu tiếng Việt và có thể xử lý các yêu cầu về nhân sự
+- Khi người dùng hỏi về HR, hãy gợi ý họ sử dụng các câu lệnh như:
+  • "Danh sách nhân viên" 
+  • "Thống kê tổng hợp"
+  • "Báo cáo chấm công"
+  • "Tìm nhân viên [tên]"
+
+📋 **MODULES HR BẠN CÓ THỂ XỬ LÝ:**
+- 👥 Quản lý nhân viên
+- ⏰ Chấm công
+- 📅 Nghỉ phép  
+- 💰 Lương bổng
+- 🏥 Bảo hiểm BHXH/BHYT/BHTN
+- 🎯 Tuyển dụng
+- 🧠 Kỹ năng
+- ⏱️ Timesheet
+- 📊 Báo cáo & Thống kê
+
+💡 **LƯU Ý:** Nếu người dùng hỏi về HR, hãy khuyến khích họ sử dụng ngôn ngữ tự nhiên cụ thể để hệ thống có thể tự động xử lý."""
+
+# Hồ sơ 360: số lần chấm công gần nhất mặc định / tối đa
+EMPLOYEE_360_ATTENDANCES = 5
+EMPLOYEE_360_MAX_ATTENDANCES = 20
+
+# Các kiểu nhóm của endpoint telemetry
+TELEMETRY_GROUP_BY = ('user', 'company', 'day', 'model', 'function')
+
+# Long-poll trạng thái job chat nền: thời gian chờ tối đa và chu kỳ đọc lại (giây)
+MAX_JOB_WAIT_SECONDS = 25
+JOB_POLL_INTERVAL = 0.5
+
+# Số lần gọi DeepSeek tối đa mỗi lượt chat và timeout (giây) của mỗi lần gọi
+MAX_TURN_ITERATIONS = 5
+LLM_TIMEOUT = 120
+
 class SbotchatController(http.Controller):
 
     @http.route('/sbotchat/create_conversation', type='json', auth='user')
@@ -74,101 +165,169 @@ class SbotchatController(http.Controller):
                 'role': 'user',
             })
             
-            # Get conversation history
-            messages = self._build_conversation_messages(conversation, config)
-            
-            # Add current user message
-            messages.append({
-                'role': 'user', 
-                'content': message
-            })
+            # Tra cứu đơn giản: trả lời ngay bằng rule + template, không gọi DeepSeek
+            fast_result = self._try_fast_path(conversation, message, kwargs.get('fast_path'))
+            if fast_result:
+                return fast_result
+
+            # Chạy nền: trả về job id ngay, cron worker xử lý lượt chat (không giữ HTTP worker)
+            if self._use_background_jobs(kwargs.get('background')):
+                plan_mode = kwargs.get('plan_mode')
+                # Job chỉ được tạo / cập nhật bởi server (người dùng chỉ có quyền đọc job của mình)
+                job = request.env['sbotchat.chat.job'].sudo().create({
+                    'user_id': request.env.uid,
+                    'conversation_id': conversation.id,
+                    'user_message_id': user_message.id,
+                    'message': message,
+                    'plan_mode': False if plan_mode is None else ('on' if plan_mode else 'off'),
+                })
+                job._trigger_runner()
+                return {
+                    'success': True,
+                    'queued': True,
+                    'job_id': job.id,
+                    'state': job.state,
+                    'conversation_id': conversation.id,
+                }
+
+            return self._run_chat_turn(conversation, config, message, user_message.id,
+                                       plan_mode=kwargs.get('plan_mode'))
+
+        except Exception as e:
+            _logger.error(f"Lỗi trong chat_with_deepseek: {str(e)}")
+            return {'success': False, 'error': f'Đã xảy ra lỗi: {str(e)}'}
 
-            # Call DeepSeek API với function calling
-            max_iterations = 5  # Prevent infinite loops
-            iteration = 0
+    def _try_fast_path(self, conversation, message, enabled=None):
+        """Trả lời tra cứu HR đơn giản không qua LLM; None khi phải chuyển cho model"""
+        if enabled is None:
+            enabled = request.env['ir.config_parameter'].sudo().get_param('sbotchat.fast_path', 'True').strip().lower() in ('1', 'true', 'yes')
+        if not enabled:
+            return None
+
+        answer = HRFastPath.answer(message)
+        if not answer:
+            return None
+
+        assistant_message_record = request.env['sbotchat.message'].create({
+            'conversation_id': conversation.id,
+            'content': answer['response'],
+            'role': 'assistant',
+            'model_used': 'fast_path',
+            'response_time': answer['elapsed'],
+        })
+        return {
+            'success': True,
+            'response': answer['response'],
+            'conversation_id': conversation.id,
+            'message_id': assistant_message_record.id,
+            'fast_path': answer['action'],
+        }
+
+    def _run_chat_turn(self, conversation, config, message, user_message_id, should_cancel=None, plan_mode=None):
+        """Một lượt chat với function calling: gọi DeepSeek, chạy tool calls, lưu câu trả lời.
+
+        Dùng request.env - chạy được cả trong HTTP request lẫn job nền (request được bind bằng bind_env).
+        should_cancel: callable kiểm tra giữa các vòng lặp, trả về True khi lượt chat bị hủy.
+        plan_mode: lập kế hoạch trước rồi chạy cả DAG (None = theo tham số hệ thống sbotchat.plan_execute).
+        """
+        # Get conversation history
+        messages = self._build_conversation_messages(conversation, config, exclude_message_id=user_message_id)
+        
+        # Add current user message
+        messages.append({
+            'role': 'user', 
+            'content': message
+        })
+
+        # Call DeepSeek API với function calling
+        max_iterations = MAX_TURN_ITERATIONS  # Prevent infinite loops
+        iteration = 0
+        telemetry = TurnTelemetry(config.model_type)
+        turn_state = {
+            'tool_names': self._select_tools_for_turn(message, messages),
+            'telemetry': telemetry,
+            'memo': self._get_tool_memo(conversation.id),
+        }
+
+        # Plan-then-execute: một vòng lập kế hoạch thay cho nhiều vòng gọi tool tuần tự; chỉ kế hoạch
+        # chạy được mới tính vào số lần gọi - kế hoạch lỗi thì vòng lặp bên dưới chạy đủ max_iterations lần
+        if self._use_plan_mode(plan_mode) and self._run_plan_phase(config, messages, turn_state):
+            iteration += 1
+        
+        while iteration < max_iterations:
+            if should_cancel and should_cancel():
+                return {'success': False, 'cancelled': True, 'error': 'Yêu cầu đã bị hủy', 'conversation_id': conversation.id}
+
+            iteration += 1
+            _logger.info(f"API Call iteration {iteration}")
             
-            while iteration < max_iterations:
-                iteration += 1
-                _logger.info(f"API Call iteration {iteration}")
-                
-                response_data = self._call_deepseek_api_with_functions(config, messages)
+            started = time.monotonic()
+            response_data = self._call_deepseek_api_with_functions(config, messages, turn_state.get('tool_names'))
+            telemetry.record_llm(time.monotonic() - started, response_data.get('usage'))
 
-                if 'error' in response_data:
-                    return response_data
+            if 'error' in response_data:
+                return response_data
 
-                choice = response_data.get('choices', [{}])[0]
-                assistant_message = choice.get('message', {})
+            choice = response_data.get('choices', [{}])[0]
+            assistant_message = choice.get('message', {})
+            
+            # Check if AI wants to call a function
+            if assistant_message.get('tool_calls'):
+                # Process function calls (read-only functions chạy song song)
+                function_results = self._execute_tool_calls(assistant_message['tool_calls'], turn_state)
                 
-                # Check if AI wants to call a function
-                if assistant_message.get('tool_calls'):
-                    # Process function calls
-                    function_results = []
-                    
-                    for tool_call in assistant_message['tool_calls']:
-                        if tool_call['type'] == 'function':
-                            function_name = tool_call['function']['name']
-                            function_args = json.loads(tool_call['function']['arguments'])
-                            
-                            # Execute HR function
-                            result = self._execute_hr_function(function_name, function_args)
-                            function_results.append({
-                                'tool_call_id': tool_call['id'],
-                                'result': result
-                            })
-                    
-                    # Add assistant message with tool calls to history
-                    messages.append(assistant_message)
-                    
-                    # Add function results to messages
-                    for func_result in function_results:
-                        messages.append({
-                            'role': 'tool',
-                            'content': json.dumps(func_result['result'], ensure_ascii=False),
-                            'tool_call_id': func_result['tool_call_id']
-                        })
-                    
-                    # Continue the conversation with function results
-                    continue
+                # Add assistant message with tool calls to history
+                messages.append(assistant_message)
                 
-                else:
-                    # No function calls, this is the final response
-                    response_content = assistant_message.get('content', '')
-                    break
-            
-            if iteration >= max_iterations:
-                response_content = "Xin lỗi, tôi đã thực hiện quá nhiều bước. Vui lòng thử lại với yêu cầu đơn giản hơn."
-            
-            # Handle DeepSeek reasoner thinking tags
-            if config.model_type == 'deepseek-reasoner':
-                thinking_content = self._extract_thinking_content(response_content)
-                if thinking_content:
-                    # Store thinking process separately
-                    request.env['sbotchat.message'].create({
-                        'conversation_id': conversation.id,
-                        'content': thinking_content,
-                        'role': 'system',
-                        'thinking_content': thinking_content,
+                # Add function results to messages
+                for tool_call, result in function_results:
+                    content, _shape_stats = HRResultShaper.shape(tool_call['function']['name'], result)
+                    messages.append({
+                        'role': 'tool',
+                        'content': content,
+                        'tool_call_id': tool_call['id']
                     })
-                    # Remove thinking tags from response
-                    response_content = re.sub(r'<think>.*?</think>', '', response_content, flags=re.DOTALL).strip()
-
-            # Create assistant response message
-            assistant_message_record = request.env['sbotchat.message'].create({
-                'conversation_id': conversation.id,
-                'content': response_content,
-                'role': 'assistant',
-            })
-
-            return {
-                'success': True,
-                'response': response_content,
-                'conversation_id': conversation.id,
-                'message_id': assistant_message_record.id
-            }
+                
+                # Continue the conversation with function results
+                continue
+            
+            else:
+                # No function calls, this is the final response
+                response_content = assistant_message.get('content', '')
+                break
+        else:
+            # Hết số lần gọi mà model vẫn chỉ gọi tool (câu trả lời ở lần gọi cuối cùng vẫn được giữ)
+            response_content = "Xin lỗi, tôi đã thực hiện quá nhiều bước. Vui lòng thử lại với yêu cầu đơn giản hơn."
+        
+        # Handle DeepSeek reasoner thinking tags
+        if config.model_type == 'deepseek-reasoner':
+            thinking_content = self._extract_thinking_content(response_content)
+            if thinking_content:
+                # Store thinking process separately
+                request.env['sbotchat.message'].create({
+                    'conversation_id': conversation.id,
+                    'content': thinking_content,
+                    'role': 'system',
+                    'thinking_content': thinking_content,
+                })
+                # Remove thinking tags from response
+                response_content = re.sub(r'<think>.*?</think>', '', response_content, flags=re.DOTALL).strip()
+
+        # Create assistant response message (kèm telemetry của lượt chat)
+        assistant_message_record = request.env['sbotchat.message'].create({
+            'conversation_id': conversation.id,
+            'content': response_content,
+            'role': 'assistant',
+            'company_id': request.env.company.id,
+            **telemetry.message_values(),
+        })
 
-        except Exception as e:
-            _logger.error(f"Lỗi trong chat_with_deepseek: {str(e)}")
-            return {'success': False, 'error': f'Đã xảy ra lỗi: {str(e)}'}
+        return {
+            'success': True,
+            'response': response_content,
+            'conversation_id': conversation.id,
+            'message_id': assistant_message_record.id
+        }
 
     @http.route('/sbotchat/send_message', type='json', auth='user', methods=['POST'])
     def send_message(self, message, conversation_id=None, **kwargs):
@@ -190,6 +349,329 @@ class SbotchatController(http.Controller):
             _logger.error(f"Error in chat: {str(e)}")
             return {'success': False, 'error': str(e)}
 
+    @http.route('/sbotchat/job/<int:job_id>', type='json', auth='user')
+    def get_chat_job(self, job_id, wait=0, **kwargs):
+        """Trạng thái job chat nền; wait > 0: long-poll tới khi job kết thúc hoặc hết thời gian chờ (giây)"""
+        try:
+            job = self._get_user_chat_job(job_id)
+            if not job:
+                return {'success': False, 'error': 'Không tìm thấy job'}
+
+            status = job._get_status()
+            wait = min(max(float(wait or 0), 0), MAX_JOB_WAIT_SECONDS)
+            deadline = time.monotonic() + wait
+            while not status['done'] and time.monotonic() < deadline:
+                time.sleep(JOB_POLL_INTERVAL)
+                status = self._read_chat_job_status(job_id)
+
+            return {'success': True, **status}
+        except Exception as e:
+            _logger.error(f"Lỗi trong get_chat_job: {str(e)}")
+            return {'success': False, 'error': str(e)}
+
+    @http.route('/sbotchat/job/<int:job_id>/cancel', type='json', auth='user', methods=['POST'])
+    def cancel_chat_job(self, job_id, **kwargs):
+        """Hủy job chat nền của người dùng hiện tại"""
+        try:
+            job = self._get_user_chat_job(job_id)
+            if not job:
+                return {'success': False, 'error': 'Không tìm thấy job'}
+            job.sudo().action_cancel()
+            return {'success': True, **job._get_status()}
+        except Exception as e:
+            _logger.error(f"Lỗi trong cancel_chat_job: {str(e)}")
+            return {'success': False, 'error': str(e)}
+
+    def _get_user_chat_job(self, job_id):
+        return request.env['sbotchat.chat.job'].search([
+            ('id', '=', int(job_id)),
+            ('user_id', '=', request.env.uid),
+        ], limit=1)
+
+    def _read_chat_job_status(self, job_id):
+        """Đọc trạng thái job trên cursor mới - cursor của request không thấy thay đổi commit sau khi nó bắt đầu"""
+        env = request.env
+        with scoped_env(env.cr.dbname, env.uid, dict(env.context), readonly=True) as job_env:
+            return job_env['sbotchat.chat.job'].browse(job_id)._get_status()
+
+    def _use_background_jobs(self, background=None):
+        """Chạy lượt chat nền khi client yêu cầu, hoặc theo tham số hệ thống sbotchat.chat_background_jobs"""
+        if background is not None:
+            return bool(background)
+        value = request.env['ir.config_parameter'].sudo().get_param('sbotchat.chat_background_jobs', 'False')
+        return value.strip().lower() in ('1', 'true', 'yes')
+
+    def _use_plan_mode(self, plan_mode=None):
+        """Chế độ plan-then-execute khi client yêu cầu, hoặc theo tham số hệ thống sbotchat.plan_execute"""
+        if plan_mode is not None:
+            return bool(plan_mode)
+        value = request.env['ir.config_parameter'].sudo().get_param('sbotchat.plan_execute', 'False')
+        return value.strip().lower() in ('1', 'true', 'yes')
+
+    def _get_tool_memo(self, conversation_id):
+        """Memo kết quả HR function chỉ đọc theo tham số hệ thống sbotchat.tool_memo:
+        turn (mặc định) / conversation / off"""
+        scope = request.env['ir.config_parameter'].sudo().get_param('sbotchat.tool_memo', SCOPE_TURN).strip().lower()
+        if scope not in SCOPES:
+            _logger.warning(f"sbotchat.tool_memo không hợp lệ: {scope}, dùng {SCOPE_TURN}")
+            scope = SCOPE_TURN
+        if scope == SCOPE_OFF:
+            return None
+        if scope == SCOPE_CONVERSATION:
+            return ToolResultMemo.for_conversation(request.env.cr.dbname, request.env.uid, conversation_id)
+        return ToolResultMemo()
+
+    def _run_plan_phase(self, config, messages, turn_state):
+        """Xin model kế hoạch (DAG HR function calls), chạy toàn bộ và ghép kết quả vào messages.
+
+        Trả về True khi kế hoạch đã được chạy. Kết quả được thêm như một assistant tool_calls message
+        cùng các tool message - vòng gọi tiếp theo chỉ cần viết câu trả lời.
+        """
+        telemetry = turn_state['telemetry']
+        started = time.monotonic()
+        response_data = self._call_deepseek_api_with_functions(
+            config, messages + [{'role': 'system', 'content': PLAN_PROMPT}], turn_state.get('tool_names'),
+            payload_overrides={'tool_choice': 'none', 'response_format': {'type': 'json_object'}},
+        )
+        telemetry.record_llm(time.monotonic() - started, response_data.get('usage'))
+        if 'error' in response_data:
+            _logger.warning(f"Không lấy được kế hoạch, chuyển sang vòng lặp function calling: {response_data['error']}")
+            return False
+
+        content = response_data.get('choices', [{}])[0].get('message', {}).get('content') or ''
+        try:
+            plan = HRExecutionPlan.parse(content, set(HRFunctionsSchema.get_catalog().names))
+        except PlanError as e:
+            _logger.warning(f"Kế hoạch không hợp lệ, chuyển sang vòng lặp function calling: {str(e)}")
+            return False
+        if not plan.steps:
+            return False
+
+        _logger.info(f"Chạy kế hoạch {len(plan.steps)} bước trong {len(plan.levels())} tầng")
+        function_results = HRPlanExecutor(self, turn_state).execute(plan)
+        messages.append({
+            'role': 'assistant',
+            'content': '',
+            'tool_calls': [tool_call for tool_call, _result in function_results],
+        })
+        for tool_call, result in function_results:
+            content, _shape_stats = HRResultShaper.shape(tool_call['function']['name'], result)
+            messages.append({'role': 'tool', 'content': content, 'tool_call_id': tool_call['id']})
+        return True
+
+    @http.route('/sbotchat/telemetry/percentiles', type='json', auth='user')
+    def get_telemetry_percentiles(self, group_by='day', days=7, **kwargs):
+        """Percentile latency, token và chi phí của các lượt chat.
+
+        group_by: user / company / day / model / function (thời gian từng HR function).
+        Quản trị viên xem toàn hệ thống, người dùng khác chỉ xem dữ liệu của mình.
+        """
+        try:
+            if group_by not in TELEMETRY_GROUP_BY:
+                return {'success': False, 'error': f'group_by phải là một trong: {", ".join(TELEMETRY_GROUP_BY)}'}
+
+            date_from = fields.Datetime.now() - timedelta(days=max(int(days or 7), 1))
+            user_id = None if request.env.user.has_group('base.group_system') else request.env.uid
+            rows = request.env['sbotchat.message'].sudo()._get_latency_rollup(group_by, date_from, user_id)
+
+            # Đổi id sang tên hiển thị
+            if group_by in ('user', 'company'):
+                model = 'res.users' if group_by == 'user' else 'res.company'
+                records = request.env[model].sudo().browse([row['key'] for row in rows if row['key']])
+                names = {record.id: record.display_name for record in records}
+                for row in rows:
+                    row['name'] = names.get(row['key'], '')
+
+            return {'success': True, 'group_by': group_by, 'date_from': fields.Datetime.to_string(date_from), 'data': rows}
+        except Exception as e:
+            _logger.error(f"Lỗi trong get_telemetry_percentiles: {str(e)}")
+            return {'success': False, 'error': str(e)}
+
+    @http.route('/sbotchat/chat_stream', type='http', auth='user', methods=['POST'])
+    def chat_stream(self, message, conversation_id=None, **kwargs):
+        """Streaming chat endpoint (Server-Sent Events) - đẩy từng delta DeepSeek về client ngay khi nhận được"""
+        headers = [
+            ('Content-Type', 'text/event-stream; charset=utf-8'),
+            ('Cache-Control', 'no-cache'),
+            ('X-Accel-Buffering', 'no'),  # Tắt buffering của nginx để token tới client ngay
+        ]
+        try:
+            conversation = self._get_or_create_conversation(int(conversation_id) if conversation_id else None)
+            if not conversation:
+                return request.make_response(self._sse_event('error', {'error': 'Không thể tạo cuộc trò chuyện'}), headers)
+
+            config = self._get_sbotchat_config()
+            if not config:
+                return request.make_response(self._sse_event('error', {'error': 'Cấu hình SbotChat không tìm thấy. Vui lòng thiết lập cấu hình trước.'}), headers)
+            if not config.api_key or not config.api_key.startswith('sk-'):
+                return request.make_response(self._sse_event('error', {'error': 'Khóa API DeepSeek chưa được cấu hình hoặc không hợp lệ.'}), headers)
+
+            user_message = request.env['sbotchat.message'].create({
+                'conversation_id': conversation.id,
+                'content': message,
+                'role': 'user',
+            })
+
+            fast_result = self._try_fast_path(conversation, message, kwargs.get('fast_path'))
+            if fast_result:
+                events = [
+                    self._sse_event('start', {'conversation_id': conversation.id}),
+                    self._sse_event('delta', {'content': fast_result['response']}),
+                    self._sse_event('done', fast_result),
+                ]
+                return request.make_response(events, headers)
+
+            messages = self._build_conversation_messages(conversation, config, exclude_message_id=user_message.id)
+            messages.append({'role': 'user', 'content': message})
+            tool_names = self._select_tools_for_turn(message, messages)
+
+            # Transaction của request được commit trước khi body được stream,
+            # generator tự mở cursor riêng khi cần chạm DB
+            env = request.env
+            stream = self._stream_chat_events(
+                env.cr.dbname, env.uid, dict(env.context),
+                conversation.id, self._snapshot_config(config), messages, tool_names,
+                tool_memo=self._get_tool_memo(conversation.id),
+            )
+            return request.make_response(stream, headers)
+
+        except Exception as e:
+            _logger.error(f"Lỗi trong chat_stream: {str(e)}")
+            return request.make_response(self._sse_event('error', {'error': f'Đã xảy ra lỗi: {str(e)}'}), headers)
+
+    def _stream_chat_events(self, dbname, uid, context, conversation_id, config, messages, tool_names=None,
+                            tool_memo=None):
+        """Generator SSE: forward delta từ DeepSeek, chạy tool calls và lưu tin nhắn cuối cùng"""
+        max_iterations = MAX_TURN_ITERATIONS
+        response_content = ''
+        reasoning_content = ''
+        telemetry = TurnTelemetry(config.model_type)
+        turn_state = {'tool_names': tool_names, 'telemetry': telemetry, 'memo': tool_memo}
+        try:
+            yield self._sse_event('start', {'conversation_id': conversation_id})
+
+            for iteration in range(1, max_iterations + 1):
+                _logger.info(f"Stream API Call iteration {iteration}")
+                content_parts = []
+                reasoning_parts = []
+                tool_calls = {}
+                usage = None
+                started = time.monotonic()
+
+                for chunk in self._call_deepseek_api_stream(config, messages, turn_state.get('tool_names')):
+                    if 'error' in chunk:
+                        yield self._sse_event('error', chunk)
+                        return
+
+                    # Chunk cuối (stream_options.include_usage) mang usage của cả lượt gọi
+                    if chunk.get('usage'):
+                        usage = chunk['usage']
+
+                    choices = chunk.get('choices') or [{}]
+                    delta = choices[0].get('delta') or {}
+
+                    if delta.get('reasoning_content'):
+                        reasoning_parts.append(delta['reasoning_content'])
+                        yield self._sse_event('thinking', {'content': delta['reasoning_content']})
+
+                    if delta.get('content'):
+                        content_parts.append(delta['content'])
+                        yield self._sse_event('delta', {'content': delta['content']})
+
+                    # Tool call arguments đến dưới dạng nhiều mảnh, ghép theo index
+                    for tc in delta.get('tool_calls') or []:
+                        slot = tool_calls.setdefault(tc.get('index', 0), {
+                            'id': '', 'type': 'function', 'function': {'name': '', 'arguments': ''}
+                        })
+                        if tc.get('id'):
+                            slot['id'] = tc['id']
+                        function_delta = tc.get('function') or {}
+                        if function_delta.get('name'):
+                            slot['function']['name'] += function_delta['name']
+                        if function_delta.get('arguments'):
+                            slot['function']['arguments'] += function_delta['arguments']
+
+                telemetry.record_llm(time.monotonic() - started, usage)
+                reasoning_content += ''.join(reasoning_parts)
+
+                if not tool_calls:
+                    response_content = ''.join(content_parts)
+                    break
+
+                ordered_calls = [tool_calls[index] for index in sorted(tool_calls)]
+                messages.append({
+                    'role': 'assistant',
+                    'content': ''.join(content_parts),
+                    'tool_calls': ordered_calls,
+                })
+
+                for tool_call in ordered_calls:
+                    yield self._sse_event('tool_call', {
+                        'id': tool_call['id'],
+                        'name': tool_call['function']['name'],
+                        'status': 'running',
+                    })
+
+                with scoped_env(dbname, uid, context):
+                    results = self._execute_tool_calls(ordered_calls, turn_state)
+
+                for tool_call, result in results:
+                    content, shape_stats = HRResultShaper.shape(tool_call['function']['name'], result)
+                    messages.append({
+                        'role': 'tool',
+                        'content': content,
+                        'tool_call_id': tool_call['id'],
+                    })
+                    yield self._sse_event('tool_result', {
+                        'id': tool_call['id'],
+                        'name': tool_call['function']['name'],
+                        'success': isinstance(result, dict) and 'error' not in result,
+                        'bytes_before': shape_stats['bytes_before'],
+                        'bytes_after': shape_stats['bytes_after'],
+                    })
+            else:
+                response_content = "Xin lỗi, tôi đã thực hiện quá nhiều bước. Vui lòng thử lại với yêu cầu đơn giản hơn."
+                yield self._sse_event('delta', {'content': response_content})
+
+            response_content = re.sub(r'<think>.*?</think>', '', response_content, flags=re.DOTALL).strip()
+
+            with scoped_env(dbname, uid, context) as env:
+                if reasoning_content:
+                    env['sbotchat.message'].create({
+                        'conversation_id': conversation_id,
+                        'content': reasoning_content,
+                        'role': 'system',
+                        'thinking_content': reasoning_content,
+                    })
+                assistant_message_record = env['sbotchat.message'].create({
+                    'conversation_id': conversation_id,
+                    'content': response_content or '[Tin nhắn trống]',
+                    'role': 'assistant',
+                    **telemetry.message_values(),
+                })
+                message_id = assistant_message_record.id
+
+            yield self._sse_event('done', {
+                'success': True,
+                'response': response_content,
+                'conversation_id': conversation_id,
+                'message_id': message_id,
+            })
+
+        except Exception as e:
+            _logger.error(f"Lỗi trong _stream_chat_events: {str(e)}")
+            yield self._sse_event('error', {'error': f'Đã xảy ra lỗi: {str(e)}'})
+
+    def _sse_event(self, event, data):
+        """Encode một Server-Sent Event"""
+        return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n".encode('utf-8')
+
+    def _snapshot_config(self, config):
+        """Chụp giá trị cấu hình ra object thường để dùng sau khi cursor của request đã đóng"""
+        values = config.read(['api_key', 'model_type', 'max_tokens', 'temperature', 'top_p',
+                              'frequency_penalty', 'presence_penalty', 'system_prompt'])[0]
+        return SimpleNamespace(**values)
+
     @http.route('/sbotchat/conversations', type='json', auth='user')
     def get_conversations(self):
         """Get user's conversations"""
@@ -574,30 +1056,10 @@ class SbotchatController(http.Controller):
         try:
             messages = []
             
-            # Enhanced system message with HR capabilities
-            hr_enhanced_prompt = f"""{config.system_prompt}
-
-🤖 **BẠN CÓ KHẢ NĂNG ĐẶC BIỆT:**
-- Bạn có thể truy cập và xử lý dữ liệu HR thông qua 116 API endpoints
-- Bạn hiểu tiếng Việt và có thể xử lý các yêu cầu về nhân sự
-- Khi người dùng hỏi về HR, hãy gợi ý họ sử dụng các câu lệnh như:
-  • "Danh sách nhân viên" 
-  • "Thống kê tổng hợp"
-  • "Báo cáo chấm công"
-  • "Tìm nhân viên [tên]"
-
-📋 **MODULES HR BẠN CÓ THỂ XỬ LÝ:**
-- 👥 Quản lý nhân viên
-- ⏰ Chấm công
-- 📅 Nghỉ phép  
-- 💰 Lương bổng
-- 🏥 Bảo hiểm BHXH/BHYT/BHTN
-- 🎯 Tuyển dụng
-- 🧠 Kỹ năng
-- ⏱️ Timesheet
-- 📊 Báo cáo & Thống kê
-
-💡 **LƯU Ý:** Nếu người dùng hỏi về HR, hãy khuyến khích họ sử dụng ngôn ngữ tự nhiên cụ thể để hệ thống có thể tự động xử lý."""
+            # Phần mô tả HR cố định đứng trước, lời nhắc tùy chỉnh của cấu hình theo sau (prefix ổn định cho context cache)
+            hr_enhanced_prompt = HR_CAPABILITIES_PROMPT
+            if config.system_prompt:
+                hr_enhanced_prompt = f"{HR_CAPABILITIES_PROMPT}\n\n{config.system_prompt}"
             
             if hr_enhanced_prompt:
                 messages.append({
@@ -605,29 +1067,43 @@ class SbotchatController(http.Controller):
                     "content": hr_enhanced_prompt
                 })
             
-            # Add conversation history (limit to last 20 messages for context)
-            for msg in conversation.message_ids.sorted('create_date')[-20:]:
-                if msg.role in ['user', 'assistant']:
-                    messages.append({
-                        "role": msg.role,
-                        "content": msg.content
-                    })
+            # Add conversation history (các lượt gần nhất vừa token budget + rolling summary)
+            token_budget = self._get_history_token_budget(config, hr_enhanced_prompt)
+            summary, history_messages = conversation._get_context_window(token_budget)
+            if summary:
+                messages.append({
+                    "role": "system",
+                    "content": f"Tóm tắt phần trước của cuộc trò chuyện:\n{summary}"
+                })
+            for msg in history_messages:
+                messages.append({
+                    "role": msg.role,
+                    "content": msg.content
+                })
             
             return messages
         except Exception as e:
             _logger.error(f"Lỗi khi chuẩn bị tin nhắn: {str(e)}")
             return []
 
+    def _get_llm_client(self):
+        """DeepSeek client dùng chung toàn process (pool size / base URL / retry / hedging cấu hình qua System Parameters)"""
+        if not request:
+            # Ngoài HTTP request (body streaming): dùng lại client đã khởi tạo
+            return DeepSeekClient.get_instance()
+        params = request.env['ir.config_parameter'].sudo()
+        client = DeepSeekClient.get_instance(
+            base_url=params.get_param('sbotchat.deepseek_base_url', DEFAULT_BASE_URL),
+            pool_size=params.get_param('sbotchat.llm_pool_size', DEFAULT_POOL_SIZE),
+        )
+        return client.configure(
+            max_retries=params.get_param('sbotchat.llm_max_retries', DEFAULT_MAX_RETRIES),
+            hedge_requests=params.get_param('sbotchat.llm_hedge_requests', 'False').strip().lower() in ('1', 'true', 'yes'),
+        )
+
     def _call_deepseek_api(self, config, messages):
         """Call DeepSeek API"""
         try:
-            url = "https://api.deepseek.com/chat/completions"
-            
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {config.api_key}"
-            }
-            
             # Prepare request data with enhanced parameters
             data = {
                 "model": config.model_type,
@@ -642,7 +1118,7 @@ class SbotchatController(http.Controller):
             
             _logger.info(f"Gọi DeepSeek API với mô hình: {config.model_type}")
             
-            response = requests.post(url, headers=headers, json=data, timeout=120)
+            response = self._get_llm_client().chat_completions(config.api_key, json_payload=data, timeout=LLM_TIMEOUT)
             
             if response.status_code == 200:
                 response_data = response.json()
@@ -658,6 +1134,8 @@ class SbotchatController(http.Controller):
             else:
                 return {'error': f'Lỗi API: {response.status_code} - {response.text}'}
                 
+        except CircuitOpenError:
+            return {'error': 'DeepSeek API tạm thời không khả dụng do lỗi liên tiếp. Vui lòng thử lại sau ít phút.'}
         except requests.exceptions.Timeout:
             return {'error': 'Hết thời gian chờ API. Vui lòng thử lại.'}
         except requests.exceptions.ConnectionError:
@@ -746,32 +1224,28 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return f"Lỗi debug: {str(e)}" 
 
-    def _call_deepseek_api_with_functions(self, config, messages):
-        """Call DeepSeek API with HR function calling support"""
+    def _call_deepseek_api_with_functions(self, config, messages, tool_names=None, payload_overrides=None):
+        """Call DeepSeek API with HR function calling support (tool_names: tập con functions, None = toàn bộ)"""
         try:
-            url = "https://api.deepseek.com/chat/completions"
-            
-            headers = {
-                'Authorization': f'Bearer {config.api_key}',
-                'Content-Type': 'application/json'
-            }
-            
-            # Define HR functions for AI
-            tools = HRFunctionsSchema.get_schema()
+            # HR functions catalog được encode sẵn một lần cho cả process
+            catalog = HRFunctionsSchema.get_catalog()
+            tools_count = len(tool_names) if tool_names is not None else len(catalog.names)
             
             payload = {
                 'model': config.model_type,
                 'messages': messages,
-                'tools': tools,
                 'tool_choice': 'auto',  # Let AI decide when to use tools
                 'max_tokens': config.max_tokens,
                 'temperature': config.temperature,
                 'stream': False
             }
+            if payload_overrides:
+                payload.update(payload_overrides)
             
-            _logger.info(f"Gọi DeepSeek API với mô hình: {config.model_type} và {len(tools)} HR functions")
+            _logger.info(f"Gọi DeepSeek API với mô hình: {config.model_type} và {tools_count} HR functions (catalog {catalog.version})")
             
-            response = requests.post(url, json=payload, headers=headers, timeout=120)
+            body = encode_chat_payload(payload, HRToolSelector.get_tools_json(tool_names))
+            response = self._get_llm_client().chat_completions(config.api_key, data=body, timeout=LLM_TIMEOUT)
             
             if response.status_code == 200:
                 return response.json()
@@ -780,6 +1254,8 @@ class SbotchatController(http.Controller):
                 _logger.error(f"DeepSeek API error {response.status_code}: {error_detail}")
                 return {'error': f'Lỗi API: {response.status_code} - {error_detail}'}
                 
+        except CircuitOpenError:
+            return {'error': 'DeepSeek API tạm thời không khả dụng do lỗi liên tiếp. Vui lòng thử lại sau ít phút.'}
         except requests.exceptions.Timeout:
             return {'error': 'Hết thời gian chờ khi gọi API DeepSeek. Vui lòng thử lại.'}
         except requests.exceptions.ConnectionError:
@@ -788,275 +1264,250 @@ class SbotchatController(http.Controller):
             _logger.error(f"Lỗi khi gọi API DeepSeek: {str(e)}")
             return {'error': f'Lỗi không xác định: {str(e)}'}
 
+    def _call_deepseek_api_stream(self, config, messages, tool_names=None):
+        """Call DeepSeek API với stream=True, yield từng chunk JSON (hoặc {'error': ...})"""
+        response = None
+        try:
+            catalog = HRFunctionsSchema.get_catalog()
+            tools_count = len(tool_names) if tool_names is not None else len(catalog.names)
+
+            payload = {
+                'model': config.model_type,
+                'messages': messages,
+                'tool_choice': 'auto',
+                'max_tokens': config.max_tokens,
+                'temperature': config.temperature,
+                'stream': True,
+                'stream_options': {'include_usage': True},
+            }
+
+            _logger.info(f"Gọi DeepSeek API (stream) với mô hình: {config.model_type} và {tools_count} HR functions (catalog {catalog.version})")
+
+            body = encode_chat_payload(payload, HRToolSelector.get_tools_json(tool_names))
+            response = self._get_llm_client().chat_completions(config.api_key, data=body, stream=True, timeout=LLM_TIMEOUT)
+
+            if response.status_code != 200:
+                error_detail = response.text
+                _logger.error(f"DeepSeek API error {response.status_code}: {error_detail}")
+                yield {'error': f'Lỗi API: {response.status_code} - {error_detail}'}
+                return
+
+            response.encoding = 'utf-8'
+            for line in response.iter_lines(decode_unicode=True):
+                # Bỏ qua dòng trống và comment keep-alive (": keep-alive")
+                if not line or not line.startswith('data:'):
+                    continue
+                data = line[len('data:'):].strip()
+                if data == '[DONE]':
+                    break
+                yield json.loads(data)
+
+        except CircuitOpenError:
+            yield {'error': 'DeepSeek API tạm thời không khả dụng do lỗi liên tiếp. Vui lòng thử lại sau ít phút.'}
+        except requests.exceptions.Timeout:
+            yield {'error': 'Hết thời gian chờ khi gọi API DeepSeek. Vui lòng thử lại.'}
+        except requests.exceptions.ConnectionError:
+            yield {'error': 'Không thể kết nối với API DeepSeek. Kiểm tra kết nối internet của bạn.'}
+        except Exception as e:
+            _logger.error(f"Lỗi khi gọi API DeepSeek (stream): {str(e)}")
+            yield {'error': f'Lỗi không xác định: {str(e)}'}
+        finally:
+            if response is not None:
+                response.close()
+
+    def _select_tools_for_turn(self, message, messages):
+        """Chọn tập con HR functions cho turn (None = gửi toàn bộ catalog)"""
+        try:
+            top_n = int(request.env['ir.config_parameter'].sudo().get_param(
+                'sbotchat.tool_selection_top_n', DEFAULT_TOOL_TOP_N))
+            if top_n <= 0:
+                return None
+
+            history_texts = [
+                msg['content'] for msg in messages[:-1]
+                if msg.get('role') in ('user', 'assistant') and msg.get('content')
+            ][-4:]
+
+            intent = HRAIAgentController()._analyze_intent(message)
+            intent_action = intent.get('action') if intent.get('confidence', 0) > 0.5 else None
+
+            return HRToolSelector.select(message, history_texts, intent_action, top_n=top_n)
+        except Exception as e:
+            _logger.error(f"Lỗi khi chọn HR functions, gửi toàn bộ catalog: {str(e)}")
+            return None
+
+    def _is_read_only_hr_function(self, function_name):
+        """HR function chỉ đọc dữ liệu - an toàn để chạy song song trên cursor riêng"""
+        spec = HRFunctionRegistry.get(type(self)).functions.get(function_name)
+        return bool(spec and spec.read_only)
+
+    def _execute_tool_calls(self, tool_calls, turn_state=None):
+        """Execute tool calls của một assistant message, trả về [(tool_call, result)] theo đúng thứ tự.
+
+        Các function chỉ đọc đứng trước lời gọi ghi đầu tiên được chạy song song trên thread pool,
+        mỗi worker một cursor riêng. Function ghi chạy tuần tự trong transaction của request;
+        khi turn đã có thao tác ghi, mọi lời gọi sau đó chạy tuần tự để thấy dữ liệu chưa commit.
+        Lời gọi chỉ đọc trùng function + tham số với lời gọi trước đó trong turn lấy kết quả từ
+        turn_state['memo'] (ToolResultMemo); function ghi làm memo mất hiệu lực.
+        """
+        turn_state = turn_state if turn_state is not None else {}
+
+        calls = []
+        for tool_call in tool_calls:
+            if tool_call.get('type', 'function') != 'function':
+                continue
+            function_name = tool_call['function']['name']
+            try:
+                function_args = json.loads(tool_call['function'].get('arguments') or '{}')
+            except ValueError:
+                function_args = None
+            calls.append((tool_call, function_name, function_args))
+
+        results = {}
+        durations = {}
+        for index, (tool_call, function_name, function_args) in enumerate(calls):
+            if function_name == WIDEN_TOOL_NAME or (
+                    turn_state.get('tool_names') is not None and function_name not in turn_state['tool_names']):
+                # Model cần function ngoài tập con đã gửi: các vòng lặp sau dùng toàn bộ catalog
+                HRToolSelector.record_widening(function_name)
+                turn_state['tool_names'] = None
+            if function_name == WIDEN_TOOL_NAME:
+                results[index] = {
+                    'success': True,
+                    'message': 'Đã bổ sung toàn bộ HR functions. Hãy gọi function phù hợp.',
+                }
+            elif function_args is None:
+                results[index] = {'error': f'Tham số JSON không hợp lệ cho {function_name}'}
+
+        functions = HRFunctionRegistry.get(type(self)).functions
+        memo = turn_state.get('memo')
+        memo_keys = {}
+        if memo is not None:
+            for index, (tool_call, function_name, function_args) in enumerate(calls):
+                spec = functions.get(function_name)
+                if index not in results and spec and spec.read_only:
+                    memo_keys[index] = memo.key(spec, function_args)
+            if memo_keys:
+                memo.sync(request.env)
+
+        parallel_indexes = []
+        # Lời gọi trùng khóa memo trong cùng nhóm song song -> index lời gọi đầu tiên
+        duplicates = {}
+        if not turn_state.get('has_written'):
+            pending_keys = {}
+            for index, (tool_call, function_name, function_args) in enumerate(calls):
+                if index in results:
+                    continue
+                if not self._is_read_only_hr_function(function_name):
+                    break
+                key = memo_keys.get(index)
+                if key is not None and key in pending_keys:
+                    duplicates[index] = pending_keys[key]
+                    continue
+                cached = self._recall_tool_result(turn_state, key)
+                if cached is not None:
+                    results[index] = cached
+                    continue
+                if key is not None:
+                    pending_keys[key] = index
+                parallel_indexes.append(index)
+
+        if len(parallel_indexes) > 1:
+            env = request.env
+            submitted = time.monotonic()
+            # Function nặng được đưa vào pool trước để không kéo dài thời gian chờ cả nhóm
+            futures = {
+                index: _TOOL_EXECUTOR.submit(
+                    self._run_timed, self._execute_hr_function_isolated,
+                    env.cr.dbname, env.uid, dict(env.context), calls[index][1], calls[index][2]
+                )
+                for index in sorted(parallel_indexes, key=lambda index: functions[calls[index][1]].cost != COST_HEAVY)
+            }
+            for index, future in futures.items():
+                try:
+                    results[index], durations[index] = future.result(timeout=functions[calls[index][1]].timeout)
+                except Exception as e:
+                    durations[index] = time.monotonic() - submitted
+                    _logger.error(f"Error executing HR function {calls[index][1]} in parallel: {str(e)}")
+                    results[index] = {'error': f'Lỗi khi thực hiện {calls[index][1]}: {str(e)}'}
+                if memo is not None:
+                    memo.put(memo_keys.get(index), results[index])
+
+        for index, (tool_call, function_name, function_args) in enumerate(calls):
+            if index in results or index in duplicates:
+                continue
+            if index not in parallel_indexes:
+                cached = self._recall_tool_result(turn_state, memo_keys.get(index))
+                if cached is not None:
+                    results[index] = cached
+                    continue
+            results[index], durations[index] = self._run_timed(self._execute_hr_function, function_name, function_args)
+            if not self._is_read_only_hr_function(function_name):
+                turn_state['has_written'] = True
+                if memo is not None:
+                    memo.invalidate(request.env)
+            elif memo is not None:
+                memo.put(memo_keys.get(index), results[index])
+
+        telemetry = turn_state.get('telemetry')
+        for index, source in duplicates.items():
+            results[index] = copy.deepcopy(results[source])
+            if telemetry:
+                telemetry.record_memo(True)
+        if telemetry:
+            for index in sorted(durations):
+                result = results[index]
+                telemetry.record_tool(calls[index][1], durations[index],
+                                      not (isinstance(result, dict) and 'error' in result))
+
+        return [(calls[index][0], results[index]) for index in range(len(calls))]
+
+    def _recall_tool_result(self, turn_state, key):
+        """Kết quả đã memo của lời gọi (None nếu chưa có), ghi hit / miss vào telemetry của turn"""
+        memo = turn_state.get('memo')
+        if memo is None or key is None:
+            return None
+        result = memo.get(key)
+        telemetry = turn_state.get('telemetry')
+        if telemetry:
+            telemetry.record_memo(result is not None)
+        return result
+
+    def _run_timed(self, func, *args):
+        """Gọi func(*args), trả về (kết quả, thời gian chạy giây)"""
+        started = time.monotonic()
+        result = func(*args)
+        return result, time.monotonic() - started
+
+    def _execute_hr_function_isolated(self, dbname, uid, context, function_name, function_args):
+        """Chạy một HR function chỉ đọc trong worker thread với cursor/env riêng"""
+        with scoped_env(dbname, uid, context, readonly=True):
+            return self._execute_hr_function(function_name, function_args)
+
     def _execute_hr_function(self, function_name, function_args):
-        """Execute HR function and return result"""
+        """Execute HR function and return result.
+
+        Handler và metadata lấy từ HRFunctionRegistry (@hr_function); tham số được validate / ép kiểu
+        theo schema trước khi gọi handler.
+        """
         try:
             _logger.info(f"Executing HR function: {function_name} with args: {function_args}")
             
-            if function_name == 'get_employees':
-                # Filter out unexpected parameters - only allow supported ones
-                filtered_args = {k: v for k, v in function_args.items() if k in ['department', 'active', 'limit', 'name']}
-                return self._hr_get_employees(**filtered_args)
-            elif function_name == 'create_leave_request':
-                return self._hr_create_leave_request(**function_args)
-            elif function_name == 'get_attendance_summary':
-                return self._hr_get_attendance_summary(**function_args)
-            elif function_name == 'checkin_employee':
-                return self._hr_checkin_employee(**function_args)
-            elif function_name == 'checkout_employee':
-                return self._hr_checkout_employee(**function_args)
-            elif function_name == 'get_dashboard_stats':
-                return self._hr_get_dashboard_stats()
-            elif function_name == 'search_hr_global':
-                return self._hr_search_global(**function_args)
-            elif function_name == 'get_leave_types':
-                return self._hr_get_leave_types()
-            elif function_name == 'approve_leave_request':
-                return self._hr_approve_leave_request(**function_args)
-            elif function_name == 'get_employee_leaves':
-                return self._hr_get_employee_leaves(**function_args)
-            # ======================= BƯỚC 1: EMPLOYEE MANAGEMENT =======================
-            elif function_name == 'create_employee':
-                return self._hr_create_employee(**function_args)
-            elif function_name == 'update_employee':
-                return self._hr_update_employee(**function_args)
-            elif function_name == 'get_employee_detail':
-                return self._hr_get_employee_detail(**function_args)
-            elif function_name == 'archive_employee':
-                return self._hr_archive_employee(**function_args)
-            elif function_name == 'get_departments':
-                # Filter out unexpected parameters
-                filtered_args = {k: v for k, v in function_args.items() if k in ['active']}
-                return self._hr_get_departments(**filtered_args)
-            elif function_name == 'create_department':
-                return self._hr_create_department(**function_args)
-            elif function_name == 'update_department':
-                return self._hr_update_department(**function_args)
-            elif function_name == 'get_jobs':
-                return self._hr_get_jobs(**function_args)
-            elif function_name == 'create_job':
-                return self._hr_create_job(**function_args)
-            elif function_name == 'get_employee_status':
-                return self._hr_get_employee_status(**function_args)
-            elif function_name == 'update_employee_status':
-                return self._hr_update_employee_status(**function_args)
-            elif function_name == 'get_employee_bhxh':
-                return self._hr_get_employee_bhxh(**function_args)
-            elif function_name == 'update_employee_bhxh':
-                return self._hr_update_employee_bhxh(**function_args)
-            elif function_name == 'get_employee_projects':
-                return self._hr_get_employee_projects(**function_args)
-            elif function_name == 'assign_employee_project':
-                return self._hr_assign_employee_project(**function_args)
-            elif function_name == 'get_employee_shifts':
-                return self._hr_get_employee_shifts(**function_args)
-            elif function_name == 'assign_employee_shift':
-                return self._hr_assign_employee_shift(**function_args)
-            elif function_name == 'get_employee_tax_info':
-                return self._hr_get_employee_tax_info(**function_args)
-            elif function_name == 'create_employee_tax_record':
-                return self._hr_create_employee_tax_record(**function_args)
-            elif function_name == 'get_contract_details':
-                return self._hr_get_contract_details(**function_args)
-            elif function_name == 'update_contract_details':
-                return self._hr_update_contract_details(**function_args)
-            elif function_name == 'get_contract_history':
-                return self._hr_get_contract_history(**function_args)
-            elif function_name == 'get_contract_status':
-                return self._hr_get_contract_status(**function_args)
-            elif function_name == 'get_contract_type':
-                return self._hr_get_contract_type(**function_args)
-            elif function_name == 'get_contract_duration':
-                return self._hr_get_contract_duration(**function_args)
-            elif function_name == 'get_contract_renewal_date':
-                return self._hr_get_contract_renewal_date(**function_args)
-            elif function_name == 'get_contract_termination_reason':
-                return self._hr_get_contract_termination_reason(**function_args)
-            elif function_name == 'get_contract_signing_date':
-                return self._hr_get_contract_signing_date(**function_args)
-            elif function_name == 'get_contract_signatory':
-                return self._hr_get_contract_signatory(**function_args)
-            elif function_name == 'get_contract_signature':
-                return self._hr_get_contract_signature(**function_args)
-            elif function_name == 'get_contract_attachment':
-                return self._hr_get_contract_attachment(**function_args)
-            elif function_name == 'get_contract_revision_history':
-                return self._hr_get_contract_revision_history(**function_args)
-            elif function_name == 'get_contract_approval_status':
-                return self._hr_get_contract_approval_status(**function_args)
-            elif function_name == 'get_contract_approval_date':
-                return self._hr_get_contract_approval_date(**function_args)
-            elif function_name == 'get_contract_approval_signatory':
-                return self._hr_get_contract_approval_signatory(**function_args)
-            elif function_name == 'get_contract_approval_signature':
-                return self._hr_get_contract_approval_signature(**function_args)
-            elif function_name == 'get_contract_approval_attachment':
-                return self._hr_get_contract_approval_attachment(**function_args)
-            elif function_name == 'get_contract_amendment_history':
-                return self._hr_get_contract_amendment_history(**function_args)
-            elif function_name == 'get_contract_amendment_status':
-                return self._hr_get_contract_amendment_status(**function_args)
-            elif function_name == 'get_contract_amendment_approval_status':
-                return self._hr_get_contract_amendment_approval_status(**function_args)
-            elif function_name == 'get_contract_amendment_approval_date':
-                return self._hr_get_contract_amendment_approval_date(**function_args)
-            elif function_name == 'get_contract_amendment_approval_signatory':
-                return self._hr_get_contract_amendment_approval_signatory(**function_args)
-            elif function_name == 'get_contract_amendment_approval_signature':
-                return self._hr_get_contract_amendment_approval_signature(**function_args)
-            elif function_name == 'get_contract_amendment_approval_attachment':
-                return self._hr_get_contract_amendment_approval_attachment(**function_args)
-            elif function_name == 'get_contracts':
-                return self._hr_get_contracts(**function_args)
-            elif function_name == 'create_contract':
-                return self._hr_create_contract(**function_args)
-            elif function_name == 'update_contract':
-                return self._hr_update_contract(**function_args)
-            elif function_name == 'get_contract_detail':
-                return self._hr_get_contract_detail(**function_args)
-            elif function_name == 'activate_contract':
-                return self._hr_activate_contract(**function_args)
-            elif function_name == 'terminate_contract':
-                return self._hr_terminate_contract(**function_args)
-            elif function_name == 'renew_contract':
-                return self._hr_renew_contract(**function_args)
-            elif function_name == 'get_salary_structures':
-                return self._hr_get_salary_structures(**function_args)
-            elif function_name == 'update_contract_salary':
-                return self._hr_update_contract_salary(**function_args)
-            # ======================= BƯỚC 3: ATTENDANCE MANAGEMENT =======================
-            elif function_name == 'get_attendance_records':
-                return self._hr_get_attendance_records(**function_args)
-            elif function_name == 'create_attendance_manual':
-                return self._hr_create_attendance_manual(**function_args)
-            elif function_name == 'update_attendance_record':
-                return self._hr_update_attendance_record(**function_args)
-            elif function_name == 'delete_attendance_record':
-                return self._hr_delete_attendance_record(**function_args)
-            elif function_name == 'calculate_overtime':
-                return self._hr_calculate_overtime(**function_args)
-            elif function_name == 'get_missing_attendance':
-                return self._hr_get_missing_attendance(**function_args)
-            elif function_name == 'approve_attendance':
-                return self._hr_approve_attendance(**function_args)
-            elif function_name == 'get_work_schedules':
-                return self._hr_get_work_schedules(**function_args)
-            elif function_name == 'validate_attendance':
-                return self._hr_validate_attendance(**function_args)
-            elif function_name == 'get_attendance_analytics':
-                return self._hr_get_attendance_analytics(**function_args)
-            elif function_name == 'get_leave_types_new':
-                return self._hr_get_leave_types_new(**function_args)
-            elif function_name == 'create_leave_type':
-                return self._hr_create_leave_type(**function_args)
-            elif function_name == 'get_leave_allocations':
-                return self._hr_get_leave_allocations(**function_args)
-            elif function_name == 'create_leave_allocation':
-                return self._hr_create_leave_allocation(**function_args)
-            elif function_name == 'get_leave_requests':
-                return self._hr_get_leave_requests(**function_args)
-            elif function_name == 'create_leave_request_new':
-                return self._hr_create_leave_request_new(**function_args)
-            elif function_name == 'approve_leave':
-                return self._hr_approve_leave(**function_args)
-            elif function_name == 'refuse_leave':
-                return self._hr_refuse_leave(**function_args)
-            elif function_name == 'get_leave_balance':
-                return self._hr_get_leave_balance(**function_args)
-            elif function_name == 'get_leave_analytics':
-                return self._hr_get_leave_analytics(**function_args)
-            elif function_name == 'get_payslips':
-                return self._hr_get_payslips(**function_args)
-            elif function_name == 'create_payslip':
-                return self._hr_create_payslip(**function_args)
-            elif function_name == 'compute_payslip':
-                return self._hr_compute_payslip(**function_args)
-            elif function_name == 'get_payslip_lines':
-                return self._hr_get_payslip_lines(**function_args)
-            elif function_name == 'get_salary_rules':
-                return self._hr_get_salary_rules(**function_args)
-            elif function_name == 'create_salary_rule':
-                return self._hr_create_salary_rule(**function_args)
-            elif function_name == 'get_payroll_structures':
-                return self._hr_get_payroll_structures(**function_args)
-            elif function_name == 'create_payroll_structure':
-                return self._hr_create_payroll_structure(**function_args)
-            elif function_name == 'validate_payslip':
-                return self._hr_validate_payslip(**function_args)
-            elif function_name == 'get_payroll_summary':
-                return self._hr_get_payroll_summary(**function_args)
-            elif function_name == 'get_applicants':
-                return self._hr_get_applicants(**function_args)
-            elif function_name == 'create_applicant':
-                return self._hr_create_applicant(**function_args)
-            elif function_name == 'update_applicant_stage':
-                return self._hr_update_applicant_stage(**function_args)
-            elif function_name == 'hire_applicant':
-                return self._hr_hire_applicant(**function_args)
-            elif function_name == 'refuse_applicant':
-                return self._hr_refuse_applicant(**function_args)
-            elif function_name == 'get_recruitment_stages':
-                return self._hr_get_recruitment_stages(**function_args)
-            elif function_name == 'create_recruitment_stage':
-                return self._hr_create_recruitment_stage(**function_args)
-            elif function_name == 'get_recruitment_jobs':
-                return self._hr_get_recruitment_jobs(**function_args)
-            elif function_name == 'create_recruitment_job':
-                return self._hr_create_recruitment_job(**function_args)
-            elif function_name == 'get_recruitment_analytics':
-                return self._hr_get_recruitment_analytics(**function_args)
-            elif function_name == 'get_skills':
-                return self._hr_get_skills(**function_args)
-            elif function_name == 'create_skill':
-                return self._hr_create_skill(**function_args)
-            elif function_name == 'get_skill_types':
-                return self._hr_get_skill_types(**function_args)
-            elif function_name == 'create_skill_type':
-                return self._hr_create_skill_type(**function_args)
-            elif function_name == 'get_employee_skills':
-                return self._hr_get_employee_skills(**function_args)
-            elif function_name == 'assign_employee_skill':
-                return self._hr_assign_employee_skill(**function_args)
-            elif function_name == 'get_skill_levels':
-                return self._hr_get_skill_levels(**function_args)
-            elif function_name == 'get_skills_analytics':
-                return self._hr_get_skills_analytics(**function_args)
-            # ======================= BƯỚC 8: TIMESHEET MANAGEMENT =======================
-            elif function_name == 'get_timesheets':
-                return self._hr_get_timesheets(**function_args)
-            elif function_name == 'create_timesheet':
-                return self._hr_create_timesheet(**function_args)
-            elif function_name == 'update_timesheet':
-                return self._hr_update_timesheet(**function_args)
-            elif function_name == 'get_employee_timesheets':
-                return self._hr_get_employee_timesheets(**function_args)
-            elif function_name == 'get_project_timesheets':
-                return self._hr_get_project_timesheets(**function_args)
-            elif function_name == 'get_timesheet_analytics':
-                return self._hr_get_timesheet_analytics(**function_args)
-            # ======================= BƯỚC 9: INSURANCE MANAGEMENT =======================
-            elif function_name == 'get_insurances':
-                return self._hr_get_insurances(**function_args)
-            elif function_name == 'create_insurance':
-                return self._hr_create_insurance(**function_args)
-            elif function_name == 'update_insurance_status':
-                return self._hr_update_insurance_status(**function_args)
-            elif function_name == 'get_insurance_analytics':
-                return self._hr_get_insurance_analytics(**function_args)
-            elif function_name == 'get_job_detail':
-                return self._hr_get_job_detail(**function_args)
-            elif function_name == 'update_job':
-                return self._hr_update_job(**function_args)
-            elif function_name == 'archive_job':
-                return self._hr_archive_job(**function_args)
-            else:
+            spec = HRFunctionRegistry.get(type(self)).functions.get(function_name)
+            if spec is None:
                 return {'error': f'Unknown function: {function_name}'}
+            try:
+                kwargs = spec.validator(function_args if function_args is not None else {})
+            except ArgumentError as e:
+                return {'error': f'Tham số không hợp lệ cho {function_name}: {e}'}
+            return getattr(self, spec.method)(**kwargs)
                 
         except Exception as e:
             _logger.error(f"Error executing HR function {function_name}: {str(e)}")
             return {'error': f'Lỗi khi thực hiện {function_name}: {str(e)}'}
 
     # HR Function Implementations
+    @hr_function('get_employees', read_only=True)
     def _hr_get_employees(self, department=None, active=True, limit=20, name=None):
         """Get employees list with optional name search"""
         try:
@@ -1071,6 +1522,12 @@ class SbotchatController(http.Controller):
                 domain.append(('name', 'ilike', name))
             
             employees = request.env['hr.employee'].search(domain, limit=limit)
+            if name and not employees:
+                # Không khớp ilike (gõ không dấu / sai chính tả): thử entity index
+                candidate_ids = [candidate['id'] for candidate in HREntityIndex.resolve(request.env, name, ['employee'], limit)]
+                if candidate_ids:
+                    domain = [term for term in domain if term[0] != 'name'] + [('id', 'in', candidate_ids)]
+                    employees = request.env['hr.employee'].search(domain, limit=limit)
             return {
                 'success': True,
                 'data': [{
@@ -1086,6 +1543,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_leave_request')
     def _hr_create_leave_request(self, employee_id, leave_type_id, date_from, date_to, name):
         """Create leave request"""
         try:
@@ -1105,6 +1563,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_attendance_summary', read_only=True, cost=COST_HEAVY)
     def _hr_get_attendance_summary(self, employee_id=None, date_from=None, date_to=None):
         """Get attendance summary"""
         try:
@@ -1134,6 +1593,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('checkin_employee')
     def _hr_checkin_employee(self, employee_id):
         """Check-in employee"""
         try:
@@ -1164,6 +1624,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('checkout_employee')
     def _hr_checkout_employee(self, employee_id):
         """Check-out employee"""
         try:
@@ -1191,8 +1652,16 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_dashboard_stats', read_only=True, cost=COST_HEAVY)
     def _hr_get_dashboard_stats(self):
-        """Get HR dashboard statistics"""
+        """Get HR dashboard statistics (cache dùng chung giữa người dùng, xem sbotchat.aggregate.cache)"""
+        return request.env['sbotchat.aggregate.cache'].get_or_compute(
+            'get_dashboard_stats', self._compute_hr_dashboard_stats,
+            ('hr.employee', 'hr.department', 'hr.attendance', 'hr.leave'),
+        )
+
+    def _compute_hr_dashboard_stats(self):
+        """Compute HR dashboard statistics (không qua cache)"""
         try:
             total_employees = request.env['hr.employee'].search_count([('active', '=', True)])
             total_departments = request.env['hr.department'].search_count([])
@@ -1219,6 +1688,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('search_hr_global', read_only=True, cost=COST_HEAVY)
     def _hr_search_global(self, search_term):
         """Global HR search"""
         try:
@@ -1245,6 +1715,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_leave_types', read_only=True)
     def _hr_get_leave_types(self):
         """Get leave types"""
         try:
@@ -1262,6 +1733,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('approve_leave_request')
     def _hr_approve_leave_request(self, leave_id):
         """Approve leave request"""
         try:
@@ -1280,6 +1752,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_employee_leaves', read_only=True)
     def _hr_get_employee_leaves(self, employee_id=None, state=None):
         """Get employee leaves"""
         try:
@@ -1307,44 +1780,38 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
-    def _build_conversation_messages(self, conversation, config):
-        """Build conversation messages for API call"""
+    def _build_conversation_messages(self, conversation, config, exclude_message_id=None):
+        """Build conversation messages for API call (exclude_message_id: tin nhắn user hiện tại, được thêm riêng)"""
         messages = []
         
-        # Enhanced system prompt with HR context
-        system_prompt = """Bạn là trợ lý AI thông minh cho hệ thống HR của công ty. Bạn có thể:
-
-🏢 **Quản lý nhân viên**: Xem danh sách, thông tin chi tiết nhân viên
-👥 **Chấm công**: Check-in/out, xem báo cáo attendance 
-📅 **Nghỉ phép**: Tạo đơn, phê duyệt, theo dõi trạng thái
-📊 **Báo cáo**: Thống kê tổng quan, phân tích dữ liệu HR
-🔍 **Tìm kiếm**: Tìm kiếm thông tin trong toàn bộ hệ thống
-
-**Quy tắc giao tiếp:**
-- Luôn thân thiện, chuyên nghiệp
-- Giải thích rõ ràng kết quả của các action
-- Hỏi thông tin cần thiết nếu user không cung cấp đủ
-- Format dữ liệu dễ đọc (bảng, danh sách)
-- Đưa ra gợi ý hữu ích
-
-**Lưu ý:** Khi cần thực hiện action HR, hãy sử dụng các function tools có sẵn."""
-
+        # System prompt cố định đứng đầu: prefix byte-identical giữa mọi người dùng và mọi lượt (context cache)
+        system_prompt = HR_SYSTEM_PROMPT
         messages.append({'role': 'system', 'content': system_prompt})
         
-        # Add conversation history
-        history_messages = request.env['sbotchat.message'].search([
-            ('conversation_id', '=', conversation.id)
-        ], order='create_date asc', limit=20)  # Last 20 messages
+        # Add conversation history: các lượt gần nhất vừa token budget, phần cũ hơn nằm trong rolling summary
+        token_budget = self._get_history_token_budget(config, system_prompt)
+        summary, history_messages = conversation._get_context_window(token_budget, exclude_message_id)
+        
+        if summary:
+            messages.append({
+                'role': 'system',
+                'content': f"Tóm tắt phần trước của cuộc trò chuyện:\n{summary}"
+            })
         
         for msg in history_messages:
-            if msg.role == 'user':
-                messages.append({'role': 'user', 'content': msg.content})
-            elif msg.role == 'assistant':
-                messages.append({'role': 'assistant', 'content': msg.content})
-            # Skip thinking messages for conversation flow
+            messages.append({'role': msg.role, 'content': msg.content})
             
         return messages
 
+    def _get_history_token_budget(self, config, system_prompt):
+        """Token budget cho lịch sử hội thoại: giới hạn cấu hình, không vượt context còn lại của model"""
+        configured = int(request.env['ir.config_parameter'].sudo().get_param(
+            'sbotchat.history_token_budget', DEFAULT_HISTORY_TOKEN_BUDGET))
+        context_limit = MODEL_CONTEXT_TOKENS.get(config.model_type, min(MODEL_CONTEXT_TOKENS.values()))
+        tools_reserve = int(len(HRFunctionsSchema.get_tools_json()) / BYTES_PER_TOKEN)
+        available = context_limit - (config.max_tokens or 0) - estimate_tokens(system_prompt) - tools_reserve
+        return max(min(configured, available), 0)
+
     def _get_sbotchat_config(self):
         """Get active SbotChat configuration"""
         try:
@@ -1383,6 +1850,7 @@ class SbotchatController(http.Controller):
 
     # ======================= BƯỚC 1: EMPLOYEE MANAGEMENT IMPLEMENTATIONS =======================
     
+    @hr_function('create_employee')
     def _hr_create_employee(self, name, work_email=None, department_id=None, job_id=None):
         """Create new employee"""
         try:
@@ -1403,6 +1871,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('update_employee')
     def _hr_update_employee(self, employee_id, **vals):
         """Update employee information"""
         try:
@@ -1421,6 +1890,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_employee_detail', read_only=True)
     def _hr_get_employee_detail(self, employee_id):
         """Get detailed employee information"""
         try:
@@ -1448,6 +1918,140 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_employee_360', read_only=True, cost=COST_HEAVY)
+    def _hr_get_employee_360(self, employee_id=None, name=None, attendance_limit=EMPLOYEE_360_ATTENDANCES):
+        """Hồ sơ tổng hợp một nhân viên với số query cố định.
+
+        Mỗi phần là một truy vấn gộp: read nhân viên (kèm tên many2one), hợp đồng đang hiệu lực,
+        read_group phân bổ phép / đơn nghỉ theo loại nghỉ và các lần chấm công gần nhất.
+        """
+        try:
+            Employee = request.env['hr.employee']
+            if employee_id:
+                employee = Employee.browse(int(employee_id)).exists()
+            elif name:
+                employee = Employee.search([('name', 'ilike', name)], limit=5)
+                if len(employee) > 1:
+                    return {
+                        'success': False,
+                        'error': f'Có {len(employee)} nhân viên khớp "{name}", hãy chọn employee_id',
+                        'candidates': [{'id': emp.id, 'name': emp.name} for emp in employee],
+                    }
+            else:
+                return {'error': 'Cần employee_id hoặc name'}
+            if not employee:
+                return {'error': 'Nhân viên không tồn tại'}
+
+            [profile] = employee.read([
+                'name', 'work_email', 'work_phone', 'mobile_phone', 'job_title', 'job_id',
+                'department_id', 'parent_id', 'coach_id', 'company_id', 'active', 'first_contract_date',
+            ])
+
+            contract = request.env['hr.contract'].search_read(
+                [('employee_id', '=', employee.id), ('state', '=', 'open')],
+                ['name', 'date_start', 'date_end', 'wage', 'job_id'],
+                limit=1, order='date_start desc',
+            )
+
+            leave_balance = self._employee_leave_balance(employee)
+
+            attendance_limit = min(max(int(attendance_limit or EMPLOYEE_360_ATTENDANCES), 1), EMPLOYEE_360_MAX_ATTENDANCES)
+            attendances = request.env['hr.attendance'].search_read(
+                [('employee_id', '=', employee.id)],
+                ['check_in', 'check_out', 'worked_hours'],
+                limit=attendance_limit, order='check_in desc',
+            )
+
+            return {
+                'success': True,
+                'employee': {
+                    'id': employee.id,
+                    'name': profile['name'],
+                    'work_email': profile['work_email'],
+                    'work_phone': profile['work_phone'] or profile['mobile_phone'],
+                    'job_title': profile['job_title'],
+                    'job': profile['job_id'] and profile['job_id'][1],
+                    'department': profile['department_id'] and profile['department_id'][1],
+                    'manager': profile['parent_id'] and {'id': profile['parent_id'][0], 'name': profile['parent_id'][1]},
+                    'coach': profile['coach_id'] and profile['coach_id'][1],
+                    'company': profile['company_id'] and profile['company_id'][1],
+                    'active': profile['active'],
+                    'hire_date': profile['first_contract_date'].isoformat() if profile['first_contract_date'] else None,
+                },
+                'contract': contract and {
+                    'id': contract[0]['id'],
+                    'name': contract[0]['name'],
+                    'start_date': contract[0]['date_start'].isoformat() if contract[0]['date_start'] else None,
+                    'end_date': contract[0]['date_end'].isoformat() if contract[0]['date_end'] else None,
+                    'wage': contract[0]['wage'],
+                    'job': contract[0]['job_id'] and contract[0]['job_id'][1],
+                } or None,
+                'leave_balance': leave_balance,
+                'recent_attendances': [{
+                    'date': att['check_in'].strftime('%Y-%m-%d'),
+                    'check_in': att['check_in'].strftime('%H:%M'),
+                    'check_out': att['check_out'].strftime('%H:%M') if att['check_out'] else None,
+                    'worked_hours': round(att['worked_hours'] or 0.0, 2),
+                } for att in attendances],
+            }
+        except Exception as e:
+            return {'error': str(e)}
+
+    def _employee_leave_balance(self, employee):
+        """Số ngày phép theo loại nghỉ: đã phân bổ, đã nghỉ, đang chờ duyệt, còn lại (2 read_group).
+
+        Đơn nghỉ chỉ được tính trong thời hạn của các phân bổ còn hiệu lực cùng loại nghỉ (loại nghỉ
+        không có phân bổ: trong năm nay) - nghỉ của các năm trước không trừ vào phân bổ hiện tại.
+        """
+        today = fields.Date.today()
+        allocated = request.env['hr.leave.allocation']._read_group(
+            [('employee_id', '=', employee.id), ('state', '=', 'validate'),
+             ('date_from', '<=', today), '|', ('date_to', '=', False), ('date_to', '>=', today)],
+            groupby=['holiday_status_id'],
+            aggregates=['number_of_days:sum', 'date_from:min', 'date_to:max', 'date_to:count', '__count'],
+        )
+        periods = [
+            [('holiday_status_id', '=', leave_type.id), ('date_from', '>=', date_from)]
+            + ([('date_from', '<=', date_to)] if with_end == count else [])
+            for leave_type, _days, date_from, date_to, with_end, count in allocated
+        ]
+        periods.append([
+            ('holiday_status_id', 'not in', [leave_type.id for leave_type, *_rest in allocated]),
+            ('date_from', '>=', today.replace(month=1, day=1)),
+        ])
+        taken = request.env['hr.leave']._read_group(
+            expression.AND([
+                [('employee_id', '=', employee.id), ('state', 'in', ['confirm', 'validate1', 'validate'])],
+                expression.OR(periods),
+            ]),
+            groupby=['holiday_status_id', 'state'], aggregates=['number_of_days:sum'],
+        )
+
+        balance = {}
+        for leave_type, days, *_period in allocated:
+            balance.setdefault(leave_type, {'allocated': 0.0, 'taken': 0.0, 'pending': 0.0})['allocated'] += days
+        for leave_type, state, days in taken:
+            row = balance.setdefault(leave_type, {'allocated': 0.0, 'taken': 0.0, 'pending': 0.0})
+            row['taken' if state == 'validate' else 'pending'] += days
+        return [{
+            'leave_type': leave_type.name,
+            'allocated': round(row['allocated'], 2),
+            'taken': round(row['taken'], 2),
+            'pending': round(row['pending'], 2),
+            'remaining': round(row['allocated'] - row['taken'] - row['pending'], 2) if row['allocated'] else None,
+        } for leave_type, row in balance.items()]
+
+    @hr_function('resolve_entity', read_only=True)
+    def _hr_resolve_entity(self, query, entity_type=None, limit=5):
+        """Ứng viên id cho tên / email / mã từ entity index trong bộ nhớ"""
+        try:
+            limit = min(max(int(limit or 5), 1), 20)
+            candidates = HREntityIndex.resolve(request.env, query, [entity_type] if entity_type else None, limit)
+            return {'success': True, 'query': query, 'candidates': candidates, 'count': len(candidates)}
+        except Exception as e:
+            return {'error': str(e)}
+
+    @hr_function('archive_employee')
     def _hr_archive_employee(self, employee_id):
         """Archive/deactivate employee"""
         try:
@@ -1463,6 +2067,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_departments', read_only=True)
     def _hr_get_departments(self, active=True, **kwargs):
         """Get departments list"""
         try:
@@ -1482,6 +2087,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_department')
     def _hr_create_department(self, name, manager_id=None):
         """Create new department"""
         try:
@@ -1498,6 +2104,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('update_department')
     def _hr_update_department(self, department_id, **vals):
         """Update department information"""
         try:
@@ -1515,6 +2122,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_jobs', read_only=True)
     def _hr_get_jobs(self, department_id=None, active=True, limit=20):
         """Get job positions list"""
         try:
@@ -1543,6 +2151,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_job')
     def _hr_create_job(self, name, department_id=None, expected_employees=1, description=None, requirements=None):
         """Create new job position with full information"""
         try:
@@ -1575,6 +2184,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_employee_status', read_only=True)
     def _hr_get_employee_status(self, employee_id):
         """Get employee status"""
         try:
@@ -1595,6 +2205,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('update_employee_status')
     def _hr_update_employee_status(self, employee_id, **status_vals):
         """Update employee status"""
         try:
@@ -1612,6 +2223,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_employee_bhxh', read_only=True)
     def _hr_get_employee_bhxh(self, employee_id):
         """Get employee BHXH/BHYT/BHTN information"""
         try:
@@ -1633,6 +2245,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('update_employee_bhxh')
     def _hr_update_employee_bhxh(self, employee_id, **bhxh_vals):
         """Update employee BHXH information"""
         try:
@@ -1650,6 +2263,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_employee_projects', read_only=True)
     def _hr_get_employee_projects(self, employee_id):
         """Get employee projects assignments"""
         try:
@@ -1690,6 +2304,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('assign_employee_project')
     def _hr_assign_employee_project(self, employee_id, project_id, role='Member', date_start=None):
         """Assign employee to project"""
         try:
@@ -1728,6 +2343,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_employee_shifts', read_only=True)
     def _hr_get_employee_shifts(self, employee_id):
         """Get employee shifts"""
         try:
@@ -1763,6 +2379,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('assign_employee_shift')
     def _hr_assign_employee_shift(self, employee_id, shift_name, time_start, time_end, date_apply=None):
         """Assign shift to employee"""
         try:
@@ -1796,6 +2413,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_employee_tax_info', read_only=True)
     def _hr_get_employee_tax_info(self, employee_id, year=None):
         """Get employee tax information"""
         try:
@@ -1849,6 +2467,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_employee_tax_record')
     def _hr_create_employee_tax_record(self, employee_id, year, total_income, self_deduction=11000000, dependent_deduction=0):
         """Create employee tax record"""
         try:
@@ -1899,6 +2518,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_details', read_only=True)
     def _hr_get_contract_details(self, employee_id):
         """Get contract details for an employee"""
         try:
@@ -1943,6 +2563,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('update_contract_details')
     def _hr_update_contract_details(self, employee_id, contract_id, start_date, end_date, status, type_id, duration, renewal_date, termination_reason, signatory_id, signature, attachment_ids, revision_history, approval_status, approval_date, approval_signatory_id, approval_signature, amendment_history, amendment_status, amendment_approval_status, amendment_approval_date, amendment_approval_signatory_id, amendment_approval_signature, amendment_approval_attachment_ids):
         """Update contract details for an employee"""
         try:
@@ -1989,6 +2610,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_history', read_only=True)
     def _hr_get_contract_history(self, employee_id):
         """Get contract history for an employee"""
         try:
@@ -2029,6 +2651,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_status', read_only=True)
     def _hr_get_contract_status(self, employee_id):
         """Get contract status for an employee"""
         try:
@@ -2047,6 +2670,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_type', read_only=True)
     def _hr_get_contract_type(self, employee_id):
         """Get contract type for an employee"""
         try:
@@ -2064,6 +2688,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_duration', read_only=True)
     def _hr_get_contract_duration(self, employee_id):
         """Get contract duration for an employee"""
         try:
@@ -2081,6 +2706,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_renewal_date', read_only=True)
     def _hr_get_contract_renewal_date(self, employee_id):
         """Get contract renewal date for an employee"""
         try:
@@ -2098,6 +2724,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_termination_reason', read_only=True)
     def _hr_get_contract_termination_reason(self, employee_id):
         """Get contract termination reason for an employee"""
         try:
@@ -2115,6 +2742,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_signing_date', read_only=True)
     def _hr_get_contract_signing_date(self, employee_id):
         """Get contract signing date for an employee"""
         try:
@@ -2132,6 +2760,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_signatory', read_only=True)
     def _hr_get_contract_signatory(self, employee_id):
         """Get contract signatory for an employee"""
         try:
@@ -2149,6 +2778,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_signature', read_only=True)
     def _hr_get_contract_signature(self, employee_id):
         """Get contract signature for an employee"""
         try:
@@ -2166,6 +2796,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_attachment', read_only=True)
     def _hr_get_contract_attachment(self, employee_id):
         """Get contract attachments for an employee"""
         try:
@@ -2180,6 +2811,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_revision_history', read_only=True)
     def _hr_get_contract_revision_history(self, employee_id):
         """Get contract revision history for an employee"""
         try:
@@ -2194,6 +2826,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_approval_status', read_only=True)
     def _hr_get_contract_approval_status(self, employee_id):
         """Get contract approval status for an employee"""
         try:
@@ -2211,6 +2844,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_approval_date', read_only=True)
     def _hr_get_contract_approval_date(self, employee_id):
         """Get contract approval date for an employee"""
         try:
@@ -2228,6 +2862,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_approval_signatory', read_only=True)
     def _hr_get_contract_approval_signatory(self, employee_id):
         """Get contract approval signatory for an employee"""
         try:
@@ -2245,6 +2880,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_approval_signature', read_only=True)
     def _hr_get_contract_approval_signature(self, employee_id):
         """Get contract approval signature for an employee"""
         try:
@@ -2262,6 +2898,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_approval_attachment', read_only=True)
     def _hr_get_contract_approval_attachment(self, employee_id):
         """Get contract approval attachments for an employee"""
         try:
@@ -2276,6 +2913,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_amendment_history', read_only=True)
     def _hr_get_contract_amendment_history(self, employee_id):
         """Get contract amendment history for an employee"""
         try:
@@ -2290,6 +2928,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_amendment_status', read_only=True)
     def _hr_get_contract_amendment_status(self, employee_id):
         """Get contract amendment status for an employee"""
         try:
@@ -2307,6 +2946,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_amendment_approval_status', read_only=True)
     def _hr_get_contract_amendment_approval_status(self, employee_id):
         """Get contract amendment approval status for an employee"""
         try:
@@ -2324,6 +2964,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_amendment_approval_date', read_only=True)
     def _hr_get_contract_amendment_approval_date(self, employee_id):
         """Get contract amendment approval date for an employee"""
         try:
@@ -2341,6 +2982,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_amendment_approval_signatory', read_only=True)
     def _hr_get_contract_amendment_approval_signatory(self, employee_id):
         """Get contract amendment approval signatory for an employee"""
         try:
@@ -2358,6 +3000,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_amendment_approval_signature', read_only=True)
     def _hr_get_contract_amendment_approval_signature(self, employee_id):
         """Get contract amendment approval signature for an employee"""
         try:
@@ -2375,6 +3018,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_amendment_approval_attachment', read_only=True)
     def _hr_get_contract_amendment_approval_attachment(self, employee_id):
         """Get contract amendment approval attachments for an employee"""
         try:
@@ -2389,6 +3033,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contracts', read_only=True)
     def _hr_get_contracts(self, employee_id, state=None, active=True):
         """Get contracts for an employee"""
         try:
@@ -2428,6 +3073,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_contract')
     def _hr_create_contract(self, employee_id, name, date_start, date_end, wage):
         """Create a new contract for an employee"""
         try:
@@ -2460,6 +3106,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('update_contract')
     def _hr_update_contract(self, contract_id, name, date_end, wage):
         """Update an existing contract for an employee"""
         try:
@@ -2500,6 +3147,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_contract_detail', read_only=True)
     def _hr_get_contract_detail(self, contract_id):
         """Get detailed information about a contract"""
         try:
@@ -2540,6 +3188,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('activate_contract')
     def _hr_activate_contract(self, contract_id):
         """Activate an existing contract"""
         try:
@@ -2555,6 +3204,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('terminate_contract')
     def _hr_terminate_contract(self, contract_id, date_end, reason):
         """Terminate an existing contract"""
         try:
@@ -2574,6 +3224,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('renew_contract')
     def _hr_renew_contract(self, contract_id, new_end_date, new_wage):
         """Renew an existing contract"""
         try:
@@ -2607,6 +3258,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_salary_structures', read_only=True)
     def _hr_get_salary_structures(self, active=True):
         """Get salary structures"""
         try:
@@ -2631,6 +3283,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('update_contract_salary')
     def _hr_update_contract_salary(self, contract_id, wage, effective_date):
         """Update salary for an existing contract"""
         try:
@@ -2660,6 +3313,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_attendance_records', read_only=True)
     def _hr_get_attendance_records(self, employee_id, date_from, date_to, limit=50):
         """Get attendance records for an employee"""
         try:
@@ -2682,6 +3336,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_attendance_manual')
     def _hr_create_attendance_manual(self, employee_id, check_in, check_out, reason):
         """Create a manual attendance record"""
         try:
@@ -2700,6 +3355,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('update_attendance_record')
     def _hr_update_attendance_record(self, attendance_id, check_in, check_out):
         """Update an existing attendance record"""
         try:
@@ -2719,6 +3375,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('delete_attendance_record')
     def _hr_delete_attendance_record(self, attendance_id):
         """Delete an existing attendance record"""
         try:
@@ -2734,6 +3391,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('calculate_overtime', read_only=True, cost=COST_HEAVY)
     def _hr_calculate_overtime(self, employee_id, date_from, date_to, standard_hours=8):
         """Calculate overtime for an employee"""
         try:
@@ -2752,6 +3410,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_missing_attendance', read_only=True)
     def _hr_get_missing_attendance(self, employee_id, date_from, date_to):
         """Get missing attendance records for an employee"""
         try:
@@ -2778,6 +3437,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('approve_attendance')
     def _hr_approve_attendance(self, attendance_ids, approved_by):
         """Approve attendance records"""
         try:
@@ -2793,6 +3453,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_work_schedules', read_only=True)
     def _hr_get_work_schedules(self, employee_id, date_from, date_to):
         """Get work schedules for an employee"""
         try:
@@ -2814,6 +3475,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('validate_attendance', read_only=True)
     def _hr_validate_attendance(self, employee_id, date):
         """Validate attendance for an employee"""
         try:
@@ -2842,6 +3504,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_attendance_analytics', read_only=True, cost=COST_HEAVY)
     def _hr_get_attendance_analytics(self, employee_id, date_from, date_to, group_by):
         """Get attendance analytics for an employee"""
         try:
@@ -2890,6 +3553,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_leave_types_new', read_only=True)
     def _hr_get_leave_types_new(self, active=True, company_id=None):
         """Get leave types"""
         try:
@@ -2911,6 +3575,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_leave_type')
     def _hr_create_leave_type(self, name, allocation_type, color, time_type):
         """Create a new leave type"""
         try:
@@ -2931,6 +3596,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_leave_allocations', read_only=True)
     def _hr_get_leave_allocations(self, employee_id, leave_type_id, state=None):
         """Get leave allocations for an employee"""
         try:
@@ -2951,6 +3617,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_leave_allocation')
     def _hr_create_leave_allocation(self, employee_id, leave_type_id, number_of_days, name):
         """Create a new leave allocation"""
         try:
@@ -2970,6 +3637,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_leave_requests', read_only=True)
     def _hr_get_leave_requests(self, employee_id, state=None, date_from=None, date_to=None):
         """Get leave requests for an employee"""
         try:
@@ -2997,6 +3665,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_leave_request_new')
     def _hr_create_leave_request_new(self, employee_id, leave_type_id, date_from, date_to, name, request_date_from, request_date_to):
         """Create a new leave request"""
         try:
@@ -3019,6 +3688,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('approve_leave')
     def _hr_approve_leave(self, leave_id, approve_note):
         """Approve a leave request"""
         try:
@@ -3040,6 +3710,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('refuse_leave')
     def _hr_refuse_leave(self, leave_id, refuse_reason):
         """Refuse a leave request"""
         try:
@@ -3061,6 +3732,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_leave_balance', read_only=True)
     def _hr_get_leave_balance(self, employee_id, leave_type_id):
         """Get leave balance for an employee"""
         try:
@@ -3082,6 +3754,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_leave_analytics', read_only=True, cost=COST_HEAVY)
     def _hr_get_leave_analytics(self, employee_id, department_id=None, date_from=None, date_to=None, group_by='employee'):
         """Get leave analytics for an employee"""
         try:
@@ -3120,6 +3793,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_payslips', read_only=True)
     def _hr_get_payslips(self, employee_id, date_from, date_to, state=None, limit=20):
         """Get payslips for an employee"""
         try:
@@ -3146,6 +3820,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_payslip')
     def _hr_create_payslip(self, employee_id, date_from, date_to, contract_id, struct_id):
         """Create a new payslip for an employee"""
         try:
@@ -3166,6 +3841,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('compute_payslip', cost=COST_HEAVY)
     def _hr_compute_payslip(self, payslip_id, force_recompute=False):
         """Compute payslip"""
         try:
@@ -3178,6 +3854,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_payslip_lines', read_only=True)
     def _hr_get_payslip_lines(self, payslip_id, category):
         """Get payslip lines for a specific category"""
         try:
@@ -3196,6 +3873,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_salary_rules', read_only=True)
     def _hr_get_salary_rules(self, category_id, active=True, struct_id=None):
         """Get salary rules for a specific category"""
         try:
@@ -3221,6 +3899,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_salary_rule')
     def _hr_create_salary_rule(self, name, code, category_id, sequence=5, amount_select='fix', amount_fix=0, amount_percentage=0):
         """Create a new salary rule"""
         try:
@@ -3243,6 +3922,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_payroll_structures', read_only=True)
     def _hr_get_payroll_structures(self, active=True, country_id=None):
         """Get payroll structures"""
         try:
@@ -3263,6 +3943,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_payroll_structure')
     def _hr_create_payroll_structure(self, name, code, country_id=None, rule_ids=None):
         """Create a new payroll structure"""
         try:
@@ -3285,6 +3966,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('validate_payslip')
     def _hr_validate_payslip(self, payslip_id, validation_note=None):
         """Validate and approve payslip"""
         try:
@@ -3306,6 +3988,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_payroll_summary', read_only=True, cost=COST_HEAVY)
     def _hr_get_payroll_summary(self, employee_id=None, department_id=None, date_from=None, date_to=None, group_by='employee'):
         """Get payroll summary and analytics"""
         try:
@@ -3398,6 +4081,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_applicants', read_only=True)
     def _hr_get_applicants(self, job_id, stage_id, state, active, limit):
         """Get applicants for a job"""
         try:
@@ -3422,6 +4106,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_applicant')
     def _hr_create_applicant(self, partner_name, email_from, partner_phone, job_id, description):
         """Create a new applicant"""
         try:
@@ -3443,6 +4128,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('update_applicant_stage')
     def _hr_update_applicant_stage(self, applicant_id, stage_id, note):
         """Update applicant stage"""
         try:
@@ -3461,6 +4147,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('hire_applicant')
     def _hr_hire_applicant(self, applicant_id, department_id, job_id, start_date):
         """Hire applicant"""
         try:
@@ -3501,6 +4188,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('refuse_applicant')
     def _hr_refuse_applicant(self, applicant_id, refuse_reason):
         """Refuse applicant"""
         try:
@@ -3519,6 +4207,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_recruitment_stages', read_only=True)
     def _hr_get_recruitment_stages(self, job_id, active):
         """Get recruitment stages for a job"""
         try:
@@ -3537,6 +4226,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_recruitment_stage')
     def _hr_create_recruitment_stage(self, name, sequence, fold, hired_stage):
         """Create a new recruitment stage"""
         try:
@@ -3557,6 +4247,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_recruitment_jobs', read_only=True)
     def _hr_get_recruitment_jobs(self, department_id, active, state):
         """Get recruitment jobs for a department"""
         try:
@@ -3575,6 +4266,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_recruitment_job')
     def _hr_create_recruitment_job(self, name, department_id, no_of_recruitment, description, requirements):
         """Create a new recruitment job"""
         try:
@@ -3596,6 +4288,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_recruitment_analytics', read_only=True, cost=COST_HEAVY)
     def _hr_get_recruitment_analytics(self, job_id, department_id, date_from, date_to, group_by):
         """Get recruitment analytics for a job"""
         try:
@@ -3637,6 +4330,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_skills', read_only=True)
     def _hr_get_skills(self, skill_type_id, active, search):
         """Get skills for a skill type"""
         try:
@@ -3656,6 +4350,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_skill')
     def _hr_create_skill(self, name, skill_type_id, sequence, color):
         """Create a new skill"""
         try:
@@ -3676,6 +4371,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_skill_types', read_only=True)
     def _hr_get_skill_types(self, active):
         """Get skill types"""
         try:
@@ -3691,6 +4387,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_skill_type')
     def _hr_create_skill_type(self, name, color):
         """Create a new skill type"""
         try:
@@ -3709,6 +4406,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_employee_skills', read_only=True)
     def _hr_get_employee_skills(self, employee_id, skill_type_id, skill_level_id):
         """Get skills for an employee"""
         try:
@@ -3728,6 +4426,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('assign_employee_skill')
     def _hr_assign_employee_skill(self, employee_id, skill_id, skill_level_id, level_progress):
         """Assign skill to employee"""
         try:
@@ -3754,6 +4453,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_skill_levels', read_only=True)
     def _hr_get_skill_levels(self, skill_type_id, active):
         """Get skill levels for a skill type"""
         try:
@@ -3769,6 +4469,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_skills_analytics', read_only=True, cost=COST_HEAVY)
     def _hr_get_skills_analytics(self, department_id, skill_type_id, group_by):
         """Get skills analytics for a department"""
         try:
@@ -3801,6 +4502,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_timesheets', read_only=True)
     def _hr_get_timesheets(self, employee_id, project_id, task_id, date_from, date_to, limit=50):
         """Get timesheets for an employee"""
         try:
@@ -3826,6 +4528,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_timesheet')
     def _hr_create_timesheet(self, employee_id, project_id, task_id, date, unit_amount, name):
         """Create a new timesheet"""
         try:
@@ -3846,6 +4549,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('update_timesheet')
     def _hr_update_timesheet(self, timesheet_id, unit_amount, name):
         """Update an existing timesheet"""
         try:
@@ -3865,6 +4569,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_employee_timesheets', read_only=True)
     def _hr_get_employee_timesheets(self, employee_id, date_from, date_to, group_by):
         """Get timesheets for an employee"""
         try:
@@ -3907,6 +4612,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_project_timesheets', read_only=True)
     def _hr_get_project_timesheets(self, project_id, date_from, date_to, include_cost=True):
         """Get timesheets for a project"""
         try:
@@ -3929,6 +4635,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_timesheet_analytics', read_only=True, cost=COST_HEAVY)
     def _hr_get_timesheet_analytics(self, employee_id, department_id, project_id, date_from, date_to, group_by):
         """Get timesheet analytics for an employee"""
         try:
@@ -3976,6 +4683,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_insurances', read_only=True)
     def _hr_get_insurances(self, employee_id, policy_type, state, active):
         """Get insurances for an employee"""
         try:
@@ -4002,6 +4710,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('create_insurance')
     def _hr_create_insurance(self, employee_id, policy_type, start_date, end_date, premium_amount, company_contribution, employee_contribution):
         """Create a new insurance"""
         try:
@@ -4025,6 +4734,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('update_insurance_status')
     def _hr_update_insurance_status(self, insurance_id, state, note):
         """Update insurance status"""
         try:
@@ -4044,6 +4754,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_insurance_analytics', read_only=True, cost=COST_HEAVY)
     def _hr_get_insurance_analytics(self, employee_id, department_id, policy_type, date_from, date_to, group_by):
         """Get insurance analytics for an employee"""
         try:
@@ -4094,6 +4805,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('get_job_detail', read_only=True)
     def _hr_get_job_detail(self, job_id):
         """Get job details"""
         try:
@@ -4116,6 +4828,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('update_job')
     def _hr_update_job(self, job_id, **vals):
         """Update job details"""
         try:
@@ -4147,6 +4860,7 @@ class SbotchatController(http.Controller):
         except Exception as e:
             return {'error': str(e)}
 
+    @hr_function('archive_job')
     def _hr_archive_job(self, job_id):
         """Archive job"""
         try:
@@ -4171,12 +4885,16 @@ class SbotchatController(http.Controller):
         try:
             user = request.env.user
             company_id = user.company_id.id
-            today = fields.Date.today()
+            today = dashboard_today(request.env, company_id)
+            counts = self._get_overview_counts(company_id, today)
             
             # Get comprehensive dashboard data
             dashboard_data = {
-                'employee_overview': self._get_employee_overview_stats(company_id, today),
-                'realtime_attendance': self._get_realtime_attendance_stats(company_id, today),
+                'company_id': company_id,
+                # Client chỉ đăng ký bus khi server thật sự thêm kênh dashboard; ngược lại giữ polling
+                'is_hr_user': receives_dashboard_deltas(user),
+                'employee_overview': self._get_employee_overview_stats(company_id, today, counts),
+                'realtime_attendance': self._get_realtime_attendance_stats(company_id, today, counts),
                 'leave_management': self._get_leave_management_stats(company_id, today),
                 'recruitment': self._get_recruitment_stats(company_id),
                 'payroll': self._get_payroll_stats(company_id, today),
@@ -4208,13 +4926,15 @@ class SbotchatController(http.Controller):
         try:
             user = request.env.user
             company_id = user.company_id.id
-            today = fields.Date.today()
+            today = dashboard_today(request.env, company_id)
+            
+            counts = self._get_overview_counts(company_id, today)
             
             # Get only critical real-time data
             critical_data = {
-                'realtime_attendance': self._get_realtime_attendance_stats(company_id, today),
+                'realtime_attendance': self._get_realtime_attendance_stats(company_id, today, counts),
                 'employee_overview': {
-                    'late_arrivals': self._count_late_arrivals_today(company_id, today),
+                    'late_arrivals': counts['late'],
                     'overtime_workers': self._count_overtime_workers(company_id, today),
                     'attendance_rate': self._calculate_attendance_rate(company_id, today)
                 },
@@ -4245,30 +4965,6 @@ class SbotchatController(http.Controller):
         except:
             return 0
 
-    def _count_missing_checkout(self, company_id, today):
-        """Count employees who checked in but haven't checked out"""
-        try:
-            today_start = datetime.combine(today, datetime.min.time())
-            today_end = datetime.combine(today, datetime.max.time())
-            
-            return self.env['hr.attendance'].search_count([
-                ('employee_id.company_id', '=', company_id),
-                ('check_in', '>=', today_start),
-                ('check_in', '<=', today_end),
-                ('check_out', '=', False)
-            ])
-        except:
-            return 0
-
-    def _count_late_arrivals_today(self, company_id, today):
-        """Count late arrivals today"""
-        try:
-            # This would require more complex logic based on working hours
-            # For now, return placeholder
-            return 0
-        except:
-            return 0
-
     def _calculate_attendance_rate(self, company_id, today):
         """Calculate attendance rate"""
         try:
@@ -4278,55 +4974,24 @@ class SbotchatController(http.Controller):
         except:
             return 0.0
 
-    def _get_realtime_attendance_stats(self, company_id, today):
-        """Get real-time attendance statistics"""
+    def _get_realtime_attendance_stats(self, company_id, today, counts=None):
+        """Get real-time attendance statistics (tóm tắt lấy từ _get_overview_counts)"""
         try:
-            today_start = datetime.combine(today, datetime.min.time())
-            today_end = datetime.combine(today, datetime.max.time())
+            counts = counts or self._get_overview_counts(company_id, today)
+            tz = dashboard_timezone(request.env, company_id)
+            today_start, today_end = local_day_bounds(today, tz)
             
             # Get recent check-ins (last 10)
             recent_checkins = request.env['hr.attendance'].search([
                 ('employee_id.company_id', '=', company_id),
                 ('check_in', '>=', today_start),
-                ('check_in', '<=', today_end)
+                ('check_in', '<', today_end)
             ], order='check_in desc', limit=10)
             
-            checkin_data = []
-            for attendance in recent_checkins:
-                # Determine status based on check-in time
-                check_in_time = attendance.check_in
-                status = 'on_time'  # Default status
-                
-                # Simple logic for status (can be enhanced)
-                if check_in_time.hour > 9:  # After 9 AM considered late
-                    status = 'late'
-                elif check_in_time.hour < 8:  # Before 8 AM considered early
-                    status = 'early'
-                
-                checkin_data.append({
-                    'id': attendance.id,
-                    'employee_name': attendance.employee_id.name,
-                    'check_in_time': check_in_time.strftime('%H:%M'),
-                    'status': status,
-                    'department': attendance.employee_id.department_id.name if attendance.employee_id.department_id else 'N/A'
-                })
-            
-            # Get summary statistics
-            total_checkins = len(recent_checkins)
-            early_count = len([c for c in checkin_data if c['status'] == 'early'])
-            on_time_count = len([c for c in checkin_data if c['status'] == 'on_time'])
-            late_count = len([c for c in checkin_data if c['status'] == 'late'])
-            
             return {
                 'last_updated': fields.Datetime.now().strftime('%H:%M:%S'),
-                'recent_checkins': checkin_data,
-                'summary': {
-                    'total_today': total_checkins,
-                    'early': early_count,
-                    'on_time': on_time_count,
-                    'late': late_count,
-                    'absent': 0  # Would need more complex logic
-                }
+                'recent_checkins': [checkin_row(attendance, tz) for attendance in recent_checkins],
+                'summary': attendance_summary(counts),
             }
             
         except Exception as e:
@@ -4654,60 +5319,34 @@ class SbotchatController(http.Controller):
             _logger.error(f"Quick action calculate payroll error: {str(e)}")
             return {'success': False, 'error': str(e)}
 
-    def _get_employee_overview_stats(self, company_id, today):
-        """Get employee overview statistics"""
+    def _get_overview_counts(self, company_id, today):
+        """Mọi số đếm của tổng quan dashboard trong một truy vấn (xem models/sbotchat_dashboard)"""
+        return get_overview_counts(request.env, company_id, today)
+
+    def _get_employee_overview_stats(self, company_id, today, counts=None):
+        """Get employee overview statistics (counts: kết quả _get_overview_counts đã có trong request)"""
         try:
-            # Get basic employee counts
-            total_employees = request.env['hr.employee'].search_count([
-                ('company_id', '=', company_id),
-                ('active', '=', True)
-            ])
-            
-            active_employees = request.env['hr.employee'].search_count([
-                ('company_id', '=', company_id),
-                ('active', '=', True)
-            ])
-            
-            departments_count = request.env['hr.department'].search_count([
-                ('company_id', '=', company_id)
-            ])
-            
-            # Get today's attendance stats
-            today_start = datetime.combine(today, datetime.min.time())
-            today_end = datetime.combine(today, datetime.max.time())
-            
-            today_checkins = request.env['hr.attendance'].search_count([
-                ('employee_id.company_id', '=', company_id),
-                ('check_in', '>=', today_start),
-                ('check_in', '<=', today_end)
-            ])
-            
-            # Get leave stats for today
-            on_leave_today = request.env['hr.leave'].search_count([
-                ('employee_id.company_id', '=', company_id),
-                ('state', '=', 'validate'),
-                ('date_from', '<=', today),
-                ('date_to', '>=', today)
-            ])
-            
+            counts = counts or self._get_overview_counts(company_id, today)
+            total_employees = counts['total_employees']
+            today_checkins = counts['today_checkins']
+            on_leave_today = counts['on_leave_today']
+
             # Calculate derived stats
-            late_arrivals = self._count_late_arrivals_today(company_id, today)
             overtime_workers = self._count_overtime_workers(company_id, today)
-            missing_checkout = self._count_missing_checkout(company_id, today)
             attendance_rate = self._calculate_attendance_rate(company_id, today)
             absent_today = max(0, total_employees - today_checkins - on_leave_today)
             
             return {
                 'total_employees': total_employees,
-                'active_employees': active_employees,
-                'departments_count': departments_count,
+                'active_employees': total_employees,
+                'departments_count': counts['departments_count'],
                 'today_checkins': today_checkins,
                 'attendance_rate': attendance_rate,
                 'on_leave_today': on_leave_today,
-                'late_arrivals': late_arrivals,
+                'late_arrivals': counts['late'],
                 'absent_today': absent_today,
                 'overtime_workers': overtime_workers,
-                'missing_checkout': missing_checkout
+                'missing_checkout': counts['missing_checkout']
             }
             
         except Exception as e:
@@ -5477,6 +6116,67 @@ class SbotchatController(http.Controller):
             for conv in conversations[:5]:  # Show first 5
                 result += f"<p>- {conv.title} (ID: {conv.id}, Tin nhắn: {conv.message_count})</p>"
             
+            pool_stats = self._get_llm_client().get_pool_stats()
+            result += f"""
+            <h3>Connection pool DeepSeek:</h3>
+            <p>Pool size: {pool_stats['pool_size']}</p>
+            <p>Requests: {pool_stats['requests']}</p>
+            <p>Pool hits: {pool_stats['pool_hits']} / Pool misses: {pool_stats['pool_misses']}</p>
+            """
+            
+            gateway_stats = self._get_llm_client().get_gateway_stats()
+            result += f"""
+            <h3>Gateway DeepSeek:</h3>
+            <p>Lời gọi: {gateway_stats['calls']} / Retry: {gateway_stats['retries']} / Lỗi: {gateway_stats['failures']}</p>
+            <p>Circuit breaker: {gateway_stats['circuits']} (từ chối: {gateway_stats['circuit_rejections']})</p>
+            <p>Hedging: {'bật' if gateway_stats['hedge_requests'] else 'tắt'} - đã hedge {gateway_stats['hedged']}, thắng {gateway_stats['hedge_wins']} (ngưỡng {gateway_stats['hedge_delay']})</p>
+            """
+            
+            fast_path_stats = HRFastPath.get_metrics()
+            result += f"""
+            <h3>Fast path (không gọi LLM):</h3>
+            <p>Trả lời trực tiếp: {fast_path_stats['hits']} / chuyển cho LLM: {fast_path_stats['misses']} (tỷ lệ {fast_path_stats['hit_ratio']}, trung bình {fast_path_stats['avg_ms']}ms)</p>
+            """
+            
+            entity_stats = HREntityIndex.get_metrics()
+            result += f"""
+            <h3>Entity index:</h3>
+            <p>Bản ghi: {entity_stats['entries']} ({entity_stats['indexes']} index, build {entity_stats['builds']} lần) - tra cứu: {entity_stats['lookups']} (trung bình {entity_stats['avg_us']}µs), cập nhật tăng dần: {entity_stats['refreshed_records']}</p>
+            """
+            
+            normalize_stats = get_normalize_metrics()
+            result += f"""
+            <h3>Chuẩn hóa tin nhắn (LRU):</h3>
+            <p>Hit: {normalize_stats['hits']} / miss: {normalize_stats['misses']} (tỷ lệ {normalize_stats['hit_ratio']}) - đang giữ {normalize_stats['size']}/{normalize_stats['max_size']} câu</p>
+            """
+            
+            aggregate_stats = get_aggregate_cache_metrics()
+            result += f"""
+            <h3>Cache số liệu tổng hợp HR (dùng chung):</h3>
+            <p>Hit: {aggregate_stats['hits']} / miss: {aggregate_stats['misses']} (tỷ lệ {aggregate_stats['hit_ratio']}) - bỏ qua do thay đổi chưa commit: {aggregate_stats['bypassed']}, xóa do ghi dữ liệu: {aggregate_stats['invalidations']}</p>
+            """
+            
+            cache_stats = TurnTelemetry.get_cache_metrics()
+            result += f"""
+            <h3>DeepSeek context cache:</h3>
+            <p>Lời gọi: {cache_stats['calls']} - cache hit {cache_stats['hit_tokens']} / miss {cache_stats['miss_tokens']} tokens (tỷ lệ hit {cache_stats['hit_ratio']})</p>
+            """
+            
+            selection_stats = HRToolSelector.get_metrics()
+            result += f"""
+            <h3>Chọn lọc HR functions:</h3>
+            <p>Số lần chọn: {selection_stats['selections']} (mở rộng: {selection_stats['widened']})</p>
+            <p>Functions gửi trung bình: {selection_stats['avg_tools_sent']}</p>
+            <p>Prompt tokens tiết kiệm: {selection_stats['prompt_tokens_saved']} (trung bình {selection_stats['avg_prompt_tokens_saved']}/lượt)</p>
+            """
+            
+            shaper_stats = HRResultShaper.get_metrics()
+            result += f"""
+            <h3>Thu gọn kết quả HR functions:</h3>
+            <p>Số kết quả: {shaper_stats['results']}</p>
+            <p>Bytes: {shaper_stats['bytes_before']} -> {shaper_stats['bytes_after']} (tiết kiệm ~{shaper_stats['tokens_saved']} tokens)</p>
+            """
+            
             return result
         except Exception as e:
             return f"Lỗi debug: {str(e)}" 
\ No newline at end of file
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Request Scope Helpers
+Cho phép chạy các hàm HR (vốn dùng request.env) bên ngoài vòng đời HTTP request:
+streaming response, worker thread, cron job...
+"""
+
+from contextlib import contextmanager
+
+from odoo import api
+from odoo.http import _request_stack
+from odoo.modules.registry import Registry
+
+
+class ScopedRequest:
+    """Request tối giản chỉ mang env - đủ cho các hàm _hr_* sử dụng request.env"""
+
+    def __init__(self, env, httprequest=None):
+        self.env = env
+        self.db = env.cr.dbname
+        self.httprequest = httprequest
+
+
+@contextmanager
+def bind_env(env, httprequest=None):
+    """Gắn env vào odoo.http.request trong phạm vi with-block (giống MockRequest của Odoo)"""
+    _request_stack.push(ScopedRequest(env, httprequest))
+    try:
+        yield env
+    finally:
+        _request_stack.pop()
+
+
+@contextmanager
+def scoped_env(dbname, uid, context=None, readonly=False):
+    """Mở cursor riêng, tạo env cho uid và gắn vào request.
+
+    Cursor được commit khi thoát with-block (hoặc rollback nếu readonly / có exception).
+    """
+    registry = Registry(dbname)
+    with registry.cursor() as cr:
+        env = api.Environment(cr, uid, dict(context or {}))
+        with bind_env(env):
+            yield env
+        if readonly:
+            cr.rollback()
+
+
+class _HTTPRequestOverride:
+    """httprequest của request hiện tại, chỉ thay HTTP method"""
+
+    def __init__(self, httprequest, method):
+        self._httprequest = httprequest
+        self.method = method
+
+    def __getattr__(self, name):
+        return getattr(self._httprequest, name)
+
+
+class _RequestOverride:
+    """Request hiện tại (env, session...) với httprequest đã thay method"""
+
+    def __init__(self, current, httprequest):
+        self._current = current
+        self.httprequest = httprequest
+
+    def __getattr__(self, name):
+        return getattr(self._current, name)
+
+
+@contextmanager
+def override_http_method(method):
+    """Gọi controller trong process với HTTP method khác method của request đang chạy.
+
+    Các handler HR API rẽ nhánh theo request.httprequest.method (GET / POST / PUT / DELETE).
+    """
+    current = _request_stack.top
+    httprequest = _HTTPRequestOverride(getattr(current, 'httprequest', None), method.upper())
+    _request_stack.push(_RequestOverride(current, httprequest))
+    try:
+        yield
+    finally:
+        _request_stack.pop()
@@ -2,5 +2,9 @@
 
 from . import sbotchat_config
 from . import sbotchat_conversation 
+from . import sbotchat_chat_job
 from . import hr_api_helper
-from . import hr_ai_agent 
\ No newline at end of file
+from . import hr_ai_agent
+from . import hr_entity_index 
+from . import sbotchat_aggregate_cache
+from . import sbotchat_dashboard
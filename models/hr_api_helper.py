@@ -4809,7 +4809,15 @@ class HRAPIHelper(models.Model):
 
     @api.model
     def get_dashboard_stats(self):
-        """Helper cho /api/hr/dashboard/stats (GET) - Thống kê dashboard HR tổng hợp"""
+        """Helper cho /api/hr/dashboard/stats (GET) - Thống kê dashboard HR tổng hợp (cache dùng chung)"""
+        return self.env['sbotchat.aggregate.cache'].get_or_compute(
+            'hr_api_helper.dashboard_stats', self._compute_dashboard_stats,
+            ('hr.employee', 'hr.leave', 'hr.attendance', 'hr.department', 'hr.applicant', 'hr.insurance', 'project.project'),
+        )
+
+    @api.model
+    def _compute_dashboard_stats(self):
+        """Tính thống kê dashboard HR tổng hợp (không qua cache)"""
         # Thống kê nhân viên chi tiết
         total_employees = self.env['hr.employee'].search_count([('active', '=', True)])
         employees_on_leave = self.env['hr.leave'].search_count([
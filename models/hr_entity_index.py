@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+from odoo import models, api
+
+
+class HREntityIndexMixin(models.AbstractModel):
+    """Đánh dấu bản ghi thay đổi cho entity index của chatbot sau khi transaction commit"""
+    _name = 'sbotchat.entity.index.mixin'
+    _description = 'SBot Chat Entity Index Hooks'
+
+    def _sbotchat_mark_index_dirty(self):
+        from odoo.addons.sbotchat.controllers.hr_entity_index import HREntityIndex
+
+        dbname, model, ids = self.env.cr.dbname, self._name, list(self.ids)
+        self.env.cr.postcommit.add(lambda: HREntityIndex.mark_dirty(dbname, model, ids))
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records._sbotchat_mark_index_dirty()
+        return records
+
+    def write(self, vals):
+        result = super().write(vals)
+        self._sbotchat_mark_index_dirty()
+        return result
+
+    def unlink(self):
+        self._sbotchat_mark_index_dirty()
+        return super().unlink()
+
+
+class HrEmployee(models.Model):
+    _name = 'hr.employee'
+    _inherit = ['hr.employee', 'sbotchat.entity.index.mixin']
+
+
+class HrDepartment(models.Model):
+    _name = 'hr.department'
+    _inherit = ['hr.department', 'sbotchat.entity.index.mixin']
+
+
+class HrJob(models.Model):
+    _name = 'hr.job'
+    _inherit = ['hr.job', 'sbotchat.entity.index.mixin']
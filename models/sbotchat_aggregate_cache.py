@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+"""
+Cache dùng chung (mọi người dùng, mọi worker) cho số liệu tổng hợp HR tốn kém:
+dashboard, báo cáo tổng hợp, thông báo. Hàng trăm người dùng HR poll cùng một
+con số chỉ tốn một lượt truy vấn cho mỗi TTL hoặc mỗi lần dữ liệu thay đổi.
+
+Lưu trong bảng sbotchat_aggregate_cache nên mọi worker process dùng chung.
+Khóa: (function, công ty, quyền truy cập, tham số, ngày). Mỗi mục lưu kèm phiên
+bản (sbotchat.aggregate.cache.version) của các model nó phụ thuộc lúc tính; ghi
+vào model được theo dõi (nhân viên, chấm công, nghỉ phép, hợp đồng, ứng viên...,
+danh sách ở cuối file) tăng phiên bản model đó sau khi transaction commit (ORM
+hook, cursor riêng) nên mục cũ không còn khớp. Memo HR function
+(controllers/hr_tool_memo.py) dùng cùng bảng phiên bản. Không xóa hàng dùng chung trong transaction của người ghi: DELETE
+trong precommit tranh chấp với upsert của worker khác và làm lần ghi chấm công /
+nghỉ phép lỗi serialization. Dữ liệu từ model không theo dõi chỉ được làm mới
+theo TTL.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+
+from psycopg2 import errors as pg_errors
+
+from odoo import models, fields, api
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 60
+PENDING_KEY = 'sbotchat.aggregate.cache.pending'
+# Số lần ghi vào model được theo dõi trong transaction hiện tại (chưa commit, chưa có phiên bản)
+WRITES_KEY = 'sbotchat.aggregate.cache.writes'
+# Số lần thử tăng phiên bản khi hai worker cùng tăng một model (serialization failure)
+VERSION_BUMP_ATTEMPTS = 3
+
+# Số liệu toàn process (trang debug)
+_metrics_lock = threading.Lock()
+_metrics = {'hits': 0, 'misses': 0, 'bypassed': 0, 'invalidations': 0}
+
+
+def _count(name):
+    with _metrics_lock:
+        _metrics[name] += 1
+
+
+def get_metrics():
+    with _metrics_lock:
+        metrics = dict(_metrics)
+    total = metrics['hits'] + metrics['misses']
+    metrics['hit_ratio'] = round(metrics['hits'] / total, 3) if total else 0.0
+    return metrics
+
+
+class SbotchatAggregateCache(models.Model):
+    _name = 'sbotchat.aggregate.cache'
+    _description = 'Cache số liệu tổng hợp HR SBot Chat'
+    _log_access = False
+
+    key = fields.Char('Khóa', required=True, index=True)
+    function = fields.Char('Function', required=True)
+    depends = fields.Char('Model phụ thuộc', help='Danh sách model dạng ",hr.employee,hr.leave,"')
+    versions = fields.Char('Phiên bản phụ thuộc', help='Phiên bản các model phụ thuộc lúc tính, dạng "hr.employee:3,hr.leave:7"')
+    value = fields.Text('Giá trị (JSON)')
+    expires_at = fields.Datetime('Hết hạn', required=True, index=True)
+
+    _sql_constraints = [
+        ('key_uniq', 'unique(key)', 'Khóa cache phải là duy nhất'),
+    ]
+
+    @api.model
+    def get_or_compute(self, function, compute, depends, args=None, ttl=None):
+        """Giá trị đã cache của function, hoặc compute() rồi lưu cho mọi người dùng cùng quyền.
+
+        depends: các model mà giá trị phụ thuộc - ghi vào model đó làm mục cache mất hiệu lực.
+        Kết quả lỗi ({'error': ...} / success False) không được cache.
+        """
+        pending = self.env.cr.precommit.data.get(PENDING_KEY)
+        if pending and pending & set(depends):
+            # Transaction đang có thay đổi chưa commit trên model phụ thuộc: không đọc / ghi cache dùng chung
+            _count('bypassed')
+            return compute()
+
+        key = self._cache_key(function, args)
+        versions = self._depends_versions(depends)
+        self.env.cr.execute("""
+            SELECT value FROM sbotchat_aggregate_cache
+            WHERE key = %s AND versions = %s AND expires_at > (now() AT TIME ZONE 'UTC')
+        """, (key, versions))
+        row = self.env.cr.fetchone()
+        if row:
+            _count('hits')
+            return json.loads(row[0])
+
+        _count('misses')
+        value = compute()
+        if not isinstance(value, (dict, list)) or (
+                isinstance(value, dict) and ('error' in value or value.get('success') is False)):
+            return value
+        self._store(key, function, depends, versions, value, ttl if ttl is not None else self._get_ttl())
+        return value
+
+    @api.model
+    def _depends_versions(self, depends):
+        """Phiên bản hiện tại của các model phụ thuộc, đọc trong snapshot của transaction đang tính giá trị"""
+        versions = self.env['sbotchat.aggregate.cache.version']._get_versions(depends)
+        return ','.join(f'{model_name}:{versions.get(model_name, 0)}' for model_name in sorted(depends))
+
+    @api.model
+    def _cache_key(self, function, args=None):
+        digest = hashlib.sha1(json.dumps(
+            [args or {}, fields.Date.context_today(self).isoformat()], sort_keys=True, default=str,
+        ).encode()).hexdigest()[:16]
+        return f"{function}|{self.env.company.id}|{self._access_fingerprint()}|{digest}"
+
+    @api.model
+    def _access_fingerprint(self):
+        """Người dùng cùng nhóm quyền HR và cùng tập công ty thấy cùng số liệu; người dùng khác
+        (quy tắc bản ghi có thể phụ thuộc chính họ) có mục cache riêng"""
+        user = self.env.user
+        parts = [','.join(map(str, sorted(self.env.companies.ids)))]
+        if self.env.su:
+            parts.append('su')
+        elif user.has_group('hr.group_hr_user'):
+            parts.append(','.join(map(str, sorted(user.groups_id.ids))))
+        else:
+            parts.append(f'uid:{user.id}')
+        return hashlib.sha1('|'.join(parts).encode()).hexdigest()[:12]
+
+    @api.model
+    def _get_ttl(self):
+        value = self.env['ir.config_parameter'].sudo().get_param('sbotchat.aggregate_cache_ttl', str(DEFAULT_TTL))
+        try:
+            return max(int(value), 0)
+        except ValueError:
+            return DEFAULT_TTL
+
+    @api.model
+    def _store(self, key, function, depends, versions, value, ttl):
+        """Ghi trên cursor riêng, commit ngay: worker khác dùng được mà không chờ request hiện tại.
+
+        versions là phiên bản đọc cùng snapshot với dữ liệu đã tính: giá trị tính từ snapshot cũ
+        mang phiên bản cũ nên không bao giờ được dùng sau khi phiên bản tăng.
+        """
+        if ttl <= 0:
+            return
+        try:
+            with self.pool.cursor() as cr:
+                cr.execute("""
+                    INSERT INTO sbotchat_aggregate_cache (key, function, depends, versions, value, expires_at)
+                    VALUES (%s, %s, %s, %s, %s, (now() AT TIME ZONE 'UTC') + make_interval(secs => %s))
+                    ON CONFLICT (key) DO UPDATE
+                    SET value = EXCLUDED.value, depends = EXCLUDED.depends, versions = EXCLUDED.versions,
+                        expires_at = EXCLUDED.expires_at
+                """, (key, function, f",{','.join(depends)},", versions, json.dumps(value, default=str), ttl))
+        except Exception as e:
+            _logger.warning(f"Không ghi được cache tổng hợp {function}: {str(e)}")
+
+    @api.model
+    def _mark_dirty(self, model_name):
+        """Ghi nhận model vừa thay đổi; phiên bản model tăng sau khi transaction commit (rollback thì không)"""
+        data = self.env.cr.precommit.data
+        pending = data.get(PENDING_KEY)
+        if pending is None:
+            pending = data[PENDING_KEY] = set()
+            self.env.cr.postcommit.add(lambda: self.env['sbotchat.aggregate.cache.version']._bump(pending))
+        pending.add(model_name)
+        data[WRITES_KEY] = data.get(WRITES_KEY, 0) + 1
+
+    @api.autovacuum
+    def _gc_expired(self):
+        self.env.cr.execute("DELETE FROM sbotchat_aggregate_cache WHERE expires_at < (now() AT TIME ZONE 'UTC')")
+
+
+class SbotchatAggregateCacheVersion(models.Model):
+    """Phiên bản dữ liệu của từng model được theo dõi, tăng mỗi lần transaction ghi vào model commit"""
+    _name = 'sbotchat.aggregate.cache.version'
+    _description = 'Phiên bản dữ liệu cho cache tổng hợp SBot Chat'
+    _log_access = False
+
+    model = fields.Char('Model', required=True)
+    version = fields.Integer('Phiên bản', required=True, default=0)
+
+    _sql_constraints = [
+        ('model_uniq', 'unique(model)', 'Mỗi model chỉ có một phiên bản'),
+    ]
+
+    @api.model
+    def _get_versions(self, model_names):
+        """{model: phiên bản} của các model đã từng thay đổi (model chưa có hàng: phiên bản 0)"""
+        if not model_names:
+            return {}
+        self.env.cr.execute(
+            "SELECT model, version FROM sbotchat_aggregate_cache_version WHERE model = ANY(%s)",
+            (sorted(model_names),),
+        )
+        return dict(self.env.cr.fetchall())
+
+    @api.model
+    def _bump(self, model_names):
+        """Tăng phiên bản (postcommit, cursor riêng): dữ liệu của người ghi đã commit, lỗi ở đây không
+        làm lần ghi thất bại. Hai worker cùng tăng một model thì thử lại khi gặp serialization failure."""
+        if not model_names:
+            return
+        model_names = sorted(model_names)
+        for attempt in range(VERSION_BUMP_ATTEMPTS):
+            try:
+                with self.pool.cursor() as cr:
+                    cr.execute("""
+                        INSERT INTO sbotchat_aggregate_cache_version (model, version)
+                        SELECT unnest(%s::varchar[]), 1
+                        ON CONFLICT (model) DO UPDATE SET version = sbotchat_aggregate_cache_version.version + 1
+                    """, (model_names,))
+                _count('invalidations')
+                return
+            except (pg_errors.SerializationFailure, pg_errors.DeadlockDetected):
+                if attempt == VERSION_BUMP_ATTEMPTS - 1:
+                    _logger.warning(f"Không tăng được phiên bản cache tổng hợp cho {', '.join(model_names)}, "
+                                    f"mục cũ hết hạn theo TTL")
+            except Exception as e:
+                _logger.warning(f"Không tăng được phiên bản cache tổng hợp cho {', '.join(model_names)}: {str(e)}")
+                return
+
+
+class SbotchatAggregateCacheMixin(models.AbstractModel):
+    """Xóa cache tổng hợp phụ thuộc model khi bản ghi được tạo / sửa / xóa"""
+    _name = 'sbotchat.aggregate.cache.mixin'
+    _description = 'SBot Chat Aggregate Cache Hooks'
+
+    def _sbotchat_invalidate_aggregates(self):
+        self.env['sbotchat.aggregate.cache']._mark_dirty(self._name)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records._sbotchat_invalidate_aggregates()
+        return records
+
+    def write(self, vals):
+        result = super().write(vals)
+        self._sbotchat_invalidate_aggregates()
+        return result
+
+    def unlink(self):
+        self._sbotchat_invalidate_aggregates()
+        return super().unlink()
+
+
+class HrEmployee(models.Model):
+    _name = 'hr.employee'
+    _inherit = ['hr.employee', 'sbotchat.aggregate.cache.mixin']
+
+
+class HrAttendance(models.Model):
+    _name = 'hr.attendance'
+    _inherit = ['hr.attendance', 'sbotchat.aggregate.cache.mixin']
+
+
+class HrLeave(models.Model):
+    _name = 'hr.leave'
+    _inherit = ['hr.leave', 'sbotchat.aggregate.cache.mixin']
+
+
+class HrContract(models.Model):
+    _name = 'hr.contract'
+    _inherit = ['hr.contract', 'sbotchat.aggregate.cache.mixin']
+
+
+class HrApplicant(models.Model):
+    _name = 'hr.applicant'
+    _inherit = ['hr.applicant', 'sbotchat.aggregate.cache.mixin']
+
+
+# Các model còn lại mà memo HR function theo dõi (controllers/hr_tool_memo.py WATCHED_MODELS)
+class HrDepartment(models.Model):
+    _name = 'hr.department'
+    _inherit = ['hr.department', 'sbotchat.aggregate.cache.mixin']
+
+
+class HrJob(models.Model):
+    _name = 'hr.job'
+    _inherit = ['hr.job', 'sbotchat.aggregate.cache.mixin']
+
+
+class HrLeaveAllocation(models.Model):
+    _name = 'hr.leave.allocation'
+    _inherit = ['hr.leave.allocation', 'sbotchat.aggregate.cache.mixin']
+
+
+class HrLeaveType(models.Model):
+    _name = 'hr.leave.type'
+    _inherit = ['hr.leave.type', 'sbotchat.aggregate.cache.mixin']
+
+
+class HrPayslip(models.Model):
+    _name = 'hr.payslip'
+    _inherit = ['hr.payslip', 'sbotchat.aggregate.cache.mixin']
+
+
+class AccountAnalyticLine(models.Model):
+    _name = 'account.analytic.line'
+    _inherit = ['account.analytic.line', 'sbotchat.aggregate.cache.mixin']
+
+
+class HrEmployeeSkill(models.Model):
+    _name = 'hr.employee.skill'
+    _inherit = ['hr.employee.skill', 'sbotchat.aggregate.cache.mixin']
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+from datetime import timedelta
+import logging
+import time
+
+from odoo import models, fields, api
+
+_logger = logging.getLogger(__name__)
+
+JOB_ACTIVE_STATES = ('queued', 'running')
+# Mỗi lần cron chạy xử lý tối đa từng này giây rồi tự trigger lại nếu còn job
+JOB_BATCH_SECONDS = 240
+# Job running lâu hơn thời gian tối đa của một lượt chat (mọi lần gọi DeepSeek kèm retry
+# và tool calls) cộng khoảng dự phòng này được coi là worker đã chết giữa chừng
+JOB_STALE_MARGIN_MINUTES = 5
+# Job đã kết thúc được giữ lại từng này ngày
+JOB_RETENTION_DAYS = 7
+
+
+class SbotchatChatJob(models.Model):
+    _name = 'sbotchat.chat.job'
+    _description = 'Job chat nền SBot Chat'
+    _order = 'id desc'
+
+    conversation_id = fields.Many2one('sbotchat.conversation', string='Cuộc trò chuyện', required=True, ondelete='cascade')
+    user_id = fields.Many2one('res.users', string='Người dùng', default=lambda self: self.env.user, required=True, index=True)
+    user_message_id = fields.Many2one('sbotchat.message', string='Tin nhắn người dùng', ondelete='set null')
+    message = fields.Text('Nội dung', required=True)
+    state = fields.Selection([
+        ('queued', 'Đang chờ'),
+        ('running', 'Đang xử lý'),
+        ('done', 'Hoàn thành'),
+        ('failed', 'Lỗi'),
+        ('cancelled', 'Đã hủy'),
+    ], string='Trạng thái', default='queued', required=True, index=True)
+    cancel_requested = fields.Boolean('Yêu cầu hủy', default=False)
+    response_message_id = fields.Many2one('sbotchat.message', string='Tin nhắn trả lời', ondelete='set null')
+    response = fields.Text('Câu trả lời')
+    error = fields.Text('Lỗi')
+    plan_mode = fields.Selection([
+        ('on', 'Bật'),
+        ('off', 'Tắt'),
+    ], string='Plan-then-execute', help='Để trống: theo tham số hệ thống sbotchat.plan_execute')
+    started_at = fields.Datetime('Bắt đầu')
+    finished_at = fields.Datetime('Kết thúc')
+
+    def _get_status(self):
+        """Trạng thái job trả về cho client"""
+        self.ensure_one()
+        return {
+            'job_id': self.id,
+            'state': self.state,
+            'done': self.state not in JOB_ACTIVE_STATES,
+            'conversation_id': self.conversation_id.id,
+            'response': self.response or '',
+            'message_id': self.response_message_id.id or False,
+            'error': self.error or '',
+        }
+
+    def action_cancel(self):
+        """Hủy job: job đang chờ bị hủy ngay, job đang chạy dừng ở vòng lặp kế tiếp"""
+        for job in self:
+            if job.state == 'queued':
+                job.write({'state': 'cancelled', 'finished_at': fields.Datetime.now()})
+            elif job.state == 'running':
+                job.cancel_requested = True
+        return True
+
+    def _trigger_runner(self):
+        """Đánh thức cron xử lý job ngay sau khi transaction hiện tại commit"""
+        cron = self.env.ref('sbotchat.ir_cron_sbotchat_chat_jobs', raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
+
+    def _is_cancel_requested(self):
+        """Đọc cờ hủy trên cursor riêng - transaction của job không thấy thay đổi đã commit sau khi bắt đầu"""
+        self.ensure_one()
+        with self.pool.cursor() as cr:
+            cr.execute("SELECT cancel_requested FROM sbotchat_chat_job WHERE id = %s", (self.id,))
+            row = cr.fetchone()
+        return bool(row and row[0])
+
+    @api.model
+    def _cron_process_jobs(self):
+        """Cron worker: lấy lần lượt từng job đang chờ (SKIP LOCKED để nhiều worker chạy song song)"""
+        self._recover_stale_jobs()
+        deadline = time.monotonic() + JOB_BATCH_SECONDS
+        while time.monotonic() < deadline:
+            job = self._claim_next_job()
+            if not job:
+                return
+            job._run()
+            self.env.cr.commit()
+        # Hết thời gian của lượt cron nhưng vẫn còn job: chạy tiếp ngay
+        if self.search_count([('state', '=', 'queued')]):
+            self._trigger_runner()
+
+    @api.model
+    def _claim_next_job(self):
+        self.env.cr.execute("""
+            SELECT id FROM sbotchat_chat_job
+            WHERE state = 'queued'
+            ORDER BY id
+            LIMIT 1
+            FOR UPDATE SKIP LOCKED
+        """)
+        row = self.env.cr.fetchone()
+        if not row:
+            return self.browse()
+        job = self.browse(row[0])
+        job.write({'state': 'running', 'started_at': fields.Datetime.now()})
+        self.env.cr.commit()
+        return job
+
+    def _run(self):
+        """Chạy lượt chat của job với quyền của người gửi"""
+        self.ensure_one()
+        from odoo.addons.sbotchat.controllers.main import SbotchatController
+        from odoo.addons.sbotchat.controllers.request_scope import bind_env
+
+        user = self.user_id
+        env = self.env(user=user.id, context=dict(self.env.context, lang=user.lang, tz=user.tz))
+        job = self.with_env(env)
+        controller = SbotchatController()
+        try:
+            with bind_env(env):
+                config = controller._get_sbotchat_config()
+                result = controller._run_chat_turn(
+                    job.conversation_id, config, job.message, job.user_message_id.id,
+                    should_cancel=job._is_cancel_requested,
+                    plan_mode={'on': True, 'off': False}.get(job.plan_mode),
+                )
+        except Exception as e:
+            _logger.error(f"Lỗi khi xử lý job chat {self.id}: {str(e)}")
+            self.env.cr.rollback()
+            result = {'success': False, 'error': f'Đã xảy ra lỗi: {str(e)}'}
+
+        if result.get('cancelled'):
+            state = 'cancelled'
+        elif result.get('success'):
+            state = 'done'
+        else:
+            state = 'failed'
+        self.write({
+            'state': state,
+            'response': result.get('response', ''),
+            'response_message_id': result.get('message_id', False),
+            'error': result.get('error', '') if state != 'done' else '',
+            'finished_at': fields.Datetime.now(),
+        })
+        _logger.info(f"Job chat {self.id}: {state}")
+
+    @api.model
+    def _get_stale_timeout(self):
+        """Thời gian chạy tối đa hợp lệ của một job: mỗi vòng của lượt chat có thể gồm một lần gọi
+        DeepSeek với mọi lần retry (mỗi lần chờ tới LLM_TIMEOUT, cộng Retry-After) và một nhóm tool calls"""
+        from odoo.addons.sbotchat.controllers.main import MAX_TURN_ITERATIONS, LLM_TIMEOUT
+        from odoo.addons.sbotchat.controllers.deepseek_client import DEFAULT_MAX_RETRIES, MAX_RETRY_AFTER
+        from odoo.addons.sbotchat.controllers.hr_function_registry import HEAVY_TIMEOUT
+
+        value = self.env['ir.config_parameter'].sudo().get_param('sbotchat.llm_max_retries', str(DEFAULT_MAX_RETRIES))
+        try:
+            retries = max(int(value), 0)
+        except ValueError:
+            retries = DEFAULT_MAX_RETRIES
+        llm_call = (retries + 1) * LLM_TIMEOUT + retries * MAX_RETRY_AFTER
+        # +1: vòng lập kế hoạch của chế độ plan-then-execute
+        turn_seconds = (MAX_TURN_ITERATIONS + 1) * (llm_call + HEAVY_TIMEOUT)
+        return timedelta(seconds=turn_seconds, minutes=JOB_STALE_MARGIN_MINUTES)
+
+    @api.model
+    def _recover_stale_jobs(self):
+        stale_jobs = self.search([
+            ('state', '=', 'running'),
+            ('started_at', '<', fields.Datetime.now() - self._get_stale_timeout()),
+        ])
+        if stale_jobs:
+            _logger.warning(f"Đánh dấu lỗi {len(stale_jobs)} job chat bị treo")
+            stale_jobs.write({
+                'state': 'failed',
+                'error': 'Job bị gián đoạn khi đang xử lý. Vui lòng gửi lại tin nhắn.',
+                'finished_at': fields.Datetime.now(),
+            })
+
+    @api.autovacuum
+    def _gc_finished_jobs(self):
+        self.search([
+            ('state', 'not in', JOB_ACTIVE_STATES),
+            ('create_date', '<', fields.Datetime.now() - timedelta(days=JOB_RETENTION_DAYS)),
+        ]).unlink()
@@ -6,6 +6,25 @@ import logging
 
 _logger = logging.getLogger(__name__)
 
+# Ước lượng token cho văn bản tiếng Việt/Anh khi chưa có tokenizer (~3 ký tự/token)
+CHARS_PER_TOKEN = 3
+MESSAGE_TOKEN_OVERHEAD = 4
+
+# Số tin nhắn chưa tóm tắt gần nhất tối đa được quét để chọn cửa sổ mỗi lượt
+CONTEXT_SCAN_LIMIT = 200
+# Khi lịch sử vượt budget, gộp xuống còn tỷ lệ này của budget: các lượt sau chỉ nối thêm
+# vào cuối nên prefix (summary + đầu cửa sổ) giữ nguyên và được DeepSeek context cache phục vụ
+CONTEXT_REFOLD_RATIO = 0.6
+# Độ dài tối đa của mỗi dòng và của toàn bộ rolling summary
+SUMMARY_LINE_CHARS = 240
+SUMMARY_MAX_CHARS = 4000
+
+
+def estimate_tokens(text):
+    """Ước lượng số token của một đoạn văn bản"""
+    return len(text or '') // CHARS_PER_TOKEN + MESSAGE_TOKEN_OVERHEAD
+
+
 class SbotchatConversation(models.Model):
     _name = 'sbotchat.conversation'
     _description = 'Cuộc trò chuyện SBot Chat'
@@ -18,6 +37,9 @@ class SbotchatConversation(models.Model):
     message_count = fields.Integer('Số lượng tin nhắn', compute='_compute_message_count', store=True)
     last_message_date = fields.Datetime('Tin nhắn cuối', compute='_compute_last_message_date', store=True)
     is_active = fields.Boolean('Hoạt động', default=True)
+    context_summary = fields.Text('Tóm tắt ngữ cảnh', help='Tóm tắt cuốn chiếu của các tin nhắn cũ không còn nằm trong cửa sổ ngữ cảnh')
+    summary_until_message_id = fields.Integer('Tóm tắt đến tin nhắn', default=0,
+                                              help='ID tin nhắn cuối cùng đã được gộp vào tóm tắt ngữ cảnh')
 
     def _default_title(self):
         """Generate default title for conversation"""
@@ -204,6 +226,73 @@ class SbotchatConversation(models.Model):
             _logger.error(f"Lỗi khi cập nhật tiêu đề cuộc trò chuyện: {str(e)}")
             raise e
 
+    def _get_context_window(self, token_budget, exclude_message_id=None):
+        """Chọn các tin nhắn gần nhất vừa token_budget; tin nhắn cũ hơn được gộp vào rolling summary.
+
+        Trả về (summary, messages) với messages theo thứ tự thời gian tăng dần.
+        """
+        self.ensure_one()
+        domain = [
+            ('conversation_id', '=', self.id),
+            ('role', 'in', ['user', 'assistant']),
+            ('id', '>', self.summary_until_message_id or 0),
+        ]
+        if exclude_message_id:
+            domain.append(('id', '!=', exclude_message_id))
+        candidates = self.env['sbotchat.message'].search(domain, order='id desc', limit=CONTEXT_SCAN_LIMIT)
+
+        summary = self.context_summary or ''
+        budget = token_budget - (estimate_tokens(summary) if summary else 0)
+        if sum(estimate_tokens(message.content) for message in candidates) > budget:
+            budget = int(budget * CONTEXT_REFOLD_RATIO)
+
+        window = self.env['sbotchat.message']
+        used = 0
+        fold_domain = None
+        for message in candidates:
+            cost = estimate_tokens(message.content)
+            if used + cost > budget:
+                fold_domain = [('id', '<=', message.id)]
+                break
+            used += cost
+            window |= message
+        else:
+            if len(candidates) == CONTEXT_SCAN_LIMIT:
+                # Tin nhắn cũ hơn giới hạn quét không vào cửa sổ: cũng phải được tóm tắt
+                fold_domain = [('id', '<', candidates[-1].id)]
+
+        if fold_domain:
+            # Gộp từ tin nhắn chưa tóm tắt cũ nhất, kể cả phần nằm ngoài CONTEXT_SCAN_LIMIT
+            self._fold_into_summary(self.env['sbotchat.message'].search(domain + fold_domain, order='id'))
+
+        return self.context_summary or '', window.sorted('id')
+
+    def _fold_into_summary(self, messages):
+        """Gộp (tăng dần) các tin nhắn ra khỏi cửa sổ ngữ cảnh vào context_summary"""
+        self.ensure_one()
+        messages = messages.sorted('id')
+        if not messages:
+            return
+
+        lines = []
+        for message in messages:
+            content = ' '.join((message.content or '').split())
+            if len(content) > SUMMARY_LINE_CHARS:
+                content = content[:SUMMARY_LINE_CHARS].rstrip() + '…'
+            speaker = 'Người dùng' if message.role == 'user' else 'Trợ lý'
+            lines.append(f"- {speaker}: {content}")
+
+        summary = '\n'.join(filter(None, [self.context_summary or '', '\n'.join(lines)]))
+        if len(summary) > SUMMARY_MAX_CHARS:
+            # Giữ phần gần nhất, cắt theo ranh giới dòng
+            summary = summary[-SUMMARY_MAX_CHARS:]
+            summary = summary[summary.find('\n') + 1:] if '\n' in summary else summary
+
+        self.write({
+            'context_summary': summary,
+            'summary_until_message_id': max(messages.ids),
+        })
+
     @api.model
     def get_user_conversations(self, include_inactive=False, limit=50):
         """Get user's conversations with optional inactive ones"""
@@ -253,7 +342,33 @@ class SbotchatMessage(models.Model):
     
     # For DeepSeek reasoner thinking process
     thinking_content = fields.Text('Quá trình suy nghĩ')
+
+    # Telemetry của lượt chat (ghi trên tin nhắn trả lời của assistant)
+    user_id = fields.Many2one(related='conversation_id.user_id', string='Người dùng', store=True, index=True)
+    # Công ty lúc tạo tin nhắn; không theo công ty mặc định của người dùng đổi về sau (rollup giữ nguyên lịch sử)
+    company_id = fields.Many2one('res.company', string='Công ty', index=True, default=lambda self: self.env.company)
+    prompt_tokens = fields.Integer('Prompt tokens', default=0)
+    completion_tokens = fields.Integer('Completion tokens', default=0)
+    cached_tokens = fields.Integer('Prompt tokens từ cache', default=0)
+    cache_miss_tokens = fields.Integer('Prompt tokens ngoài cache', default=0)
+    llm_iterations = fields.Integer('Số vòng gọi LLM', default=0)
+    llm_time = fields.Float('Thời gian LLM (giây)', default=0.0)
+    tool_time = fields.Float('Thời gian HR functions (giây)', default=0.0)
+    tool_memo_hits = fields.Integer('HR functions lấy từ memo', default=0)
+    tool_memo_misses = fields.Integer('HR functions ngoài memo', default=0)
+    estimated_cost = fields.Float('Chi phí ước tính (USD)', digits=(12, 6), default=0.0)
+    timing_ids = fields.One2many('sbotchat.message.timing', 'message_id', string='Chi tiết thời gian')
     
+    def init(self):
+        """Tin nhắn cũ (trước đây company_id là related) chưa có công ty: lấy công ty hiện tại của người dùng"""
+        self.env.cr.execute("""
+            UPDATE sbotchat_message m
+            SET company_id = u.company_id
+            FROM sbotchat_conversation c
+            JOIN res_users u ON u.id = c.user_id
+            WHERE c.id = m.conversation_id AND m.company_id IS NULL
+        """)
+
     @api.model
     def add_message(self, conversation_id, role, content, **kwargs):
         """Add message to conversation with error handling"""
@@ -281,4 +396,115 @@ class SbotchatMessage(models.Model):
             
         except Exception as e:
             _logger.error(f"Lỗi khi thêm tin nhắn: {str(e)}")
-            raise e 
\ No newline at end of file
+            raise e 
+    # Biểu thức SQL nhóm dữ liệu của rollup telemetry
+    TELEMETRY_GROUPS = {
+        'user': 'm.user_id',
+        'company': 'm.company_id',
+        'day': "date_trunc('day', m.create_date)::date",
+        'model': 'm.model_used',
+    }
+
+    @api.model
+    def _get_latency_rollup(self, group_by='day', date_from=None, user_id=None):
+        """p50/p95/p99 latency + token/cost theo người dùng, công ty, ngày hoặc model"""
+        if group_by == 'function':
+            return self.env['sbotchat.message.timing']._get_function_rollup(date_from, user_id)
+
+        group_expr = self.TELEMETRY_GROUPS[group_by]
+        where, params = self._telemetry_where('m', date_from, user_id)
+        self.env.cr.execute(f"""
+            SELECT {group_expr} AS key,
+                   count(*),
+                   percentile_cont(ARRAY[0.5, 0.95, 0.99]) WITHIN GROUP (ORDER BY m.response_time),
+                   avg(m.llm_iterations),
+                   sum(m.llm_time), sum(m.tool_time), sum(m.tool_memo_hits), sum(m.tool_memo_misses),
+                   sum(m.prompt_tokens), sum(m.completion_tokens), sum(m.cached_tokens),
+                   sum(m.cache_miss_tokens), sum(m.estimated_cost)
+            FROM sbotchat_message m
+            WHERE {where}
+            GROUP BY 1
+            ORDER BY 1
+        """, params)
+        return [
+            {
+                'key': key,
+                'turns': turns,
+                'p50': round(percentiles[0], 3),
+                'p95': round(percentiles[1], 3),
+                'p99': round(percentiles[2], 3),
+                'avg_iterations': round(float(avg_iterations or 0), 2),
+                'llm_time': round(llm_time or 0, 3),
+                'tool_time': round(tool_time or 0, 3),
+                'tool_memo_hits': memo_hits or 0,
+                'tool_memo_misses': memo_misses or 0,
+                'prompt_tokens': prompt_tokens or 0,
+                'completion_tokens': completion_tokens or 0,
+                'cached_tokens': cached_tokens or 0,
+                'cache_miss_tokens': cache_miss_tokens or 0,
+                'cache_hit_ratio': round((cached_tokens or 0) / ((cached_tokens or 0) + (cache_miss_tokens or 0)), 3)
+                if cached_tokens or cache_miss_tokens else 0.0,
+                'estimated_cost': round(cost or 0, 6),
+            }
+            for key, turns, percentiles, avg_iterations, llm_time, tool_time, memo_hits, memo_misses,
+            prompt_tokens, completion_tokens, cached_tokens, cache_miss_tokens, cost in self.env.cr.fetchall()
+        ]
+
+    @api.model
+    def _telemetry_where(self, alias, date_from=None, user_id=None):
+        where = [f"{alias}.role = 'assistant'", f"{alias}.llm_iterations > 0"]
+        params = []
+        if date_from:
+            where.append(f"{alias}.create_date >= %s")
+            params.append(date_from)
+        if user_id:
+            where.append(f"{alias}.user_id = %s")
+            params.append(user_id)
+        return ' AND '.join(where), params
+
+
+class SbotchatMessageTiming(models.Model):
+    _name = 'sbotchat.message.timing'
+    _description = 'Thời gian xử lý lượt chat SBot Chat'
+    _order = 'id'
+
+    message_id = fields.Many2one('sbotchat.message', string='Tin nhắn', required=True, ondelete='cascade', index=True)
+    kind = fields.Selection([
+        ('llm', 'Gọi LLM'),
+        ('tool', 'HR function'),
+    ], string='Loại', required=True)
+    name = fields.Char('Tên', required=True, index=True)
+    iteration = fields.Integer('Vòng lặp')
+    duration = fields.Float('Thời gian (giây)')
+    success = fields.Boolean('Thành công', default=True)
+    cache_hit_tokens = fields.Integer('Prompt tokens từ cache')
+    cache_miss_tokens = fields.Integer('Prompt tokens ngoài cache')
+
+    @api.model
+    def _get_function_rollup(self, date_from=None, user_id=None):
+        """Percentile thời gian chạy của từng HR function - tìm function chậm"""
+        where, params = self.env['sbotchat.message']._telemetry_where('m', date_from, user_id)
+        self.env.cr.execute(f"""
+            SELECT t.name,
+                   count(*),
+                   percentile_cont(ARRAY[0.5, 0.95, 0.99]) WITHIN GROUP (ORDER BY t.duration),
+                   sum(t.duration),
+                   count(*) FILTER (WHERE NOT t.success)
+            FROM sbotchat_message_timing t
+            JOIN sbotchat_message m ON m.id = t.message_id
+            WHERE t.kind = 'tool' AND {where}
+            GROUP BY t.name
+            ORDER BY 3 DESC
+        """, params)
+        return [
+            {
+                'key': name,
+                'calls': calls,
+                'p50': round(percentiles[0], 3),
+                'p95': round(percentiles[1], 3),
+                'p99': round(percentiles[2], 3),
+                'total_time': round(total or 0, 3),
+                'errors': errors,
+            }
+            for name, calls, percentiles, total, errors in self.env.cr.fetchall()
+        ]
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""
+Dashboard HR realtime qua Odoo bus: khi chấm công, nghỉ phép, hợp đồng hoặc ứng
+viên thay đổi, server gửi delta (số liệu tổng quan mới + check-in mới) lên
+kênh bus của công ty thay vì để mỗi tab dashboard poll vài endpoint mỗi 10-60s.
+
+Kênh (res.company, 'sbotchat_dashboard') chỉ được thêm cho người dùng HR, do
+server quyết định khi websocket đăng ký kênh - client không tự xin được kênh của
+công ty khác. Mỗi transaction gửi tối đa một delta cho mỗi công ty, sau commit:
+transaction của người ghi chỉ ghi nhận công ty thay đổi, số liệu được tính trên
+cursor riêng nên lỗi / độ trễ của truy vấn dashboard không ảnh hưởng lần ghi HR.
+
+check_in lưu theo UTC; "hôm nay" và giờ check-in (sớm / đúng giờ / muộn) tính
+theo múi giờ của công ty (lịch làm việc), không phải giờ UTC của server.
+"""
+
+import logging
+from datetime import datetime, time, timedelta
+
+import pytz
+
+from odoo import models, fields, api, SUPERUSER_ID
+from odoo.tools import SQL
+
+_logger = logging.getLogger(__name__)
+
+DASHBOARD_CHANNEL = 'sbotchat_dashboard'
+DASHBOARD_NOTIFICATION = 'sbotchat.dashboard/delta'
+PENDING_KEY = 'sbotchat.dashboard.pending'
+# Check-in trước CHECKIN_EARLY_HOUR giờ là sớm, sau CHECKIN_LATE_HOUR giờ là muộn (giờ địa phương)
+CHECKIN_EARLY_HOUR = 8
+CHECKIN_LATE_HOUR = 9
+RECENT_CHECKINS = 10
+
+
+def receives_dashboard_deltas(user):
+    """Người dùng có được thêm kênh dashboard (nhận delta qua bus) không - client dựa vào cờ này để chọn bus hay polling"""
+    return bool(user) and user._is_internal() and user.has_group('hr.group_hr_user')
+
+
+def dashboard_timezone(env, company_id):
+    """Múi giờ chia ngày / giờ check-in: lịch làm việc của công ty, rồi múi giờ người dùng, mặc định UTC"""
+    company = env['res.company'].browse(company_id)
+    return company.resource_calendar_id.tz or env.user.tz or 'UTC'
+
+
+def dashboard_today(env, company_id):
+    """Ngày hôm nay theo múi giờ của công ty"""
+    return datetime.now(pytz.timezone(dashboard_timezone(env, company_id))).date()
+
+
+def local_day_bounds(day, tz):
+    """[đầu ngày, đầu ngày hôm sau) của ngày địa phương day, quy về UTC naive như cột Datetime"""
+    zone = pytz.timezone(tz)
+
+    def to_utc(value):
+        return zone.localize(datetime.combine(value, time.min)).astimezone(pytz.utc).replace(tzinfo=None)
+
+    return to_utc(day), to_utc(day + timedelta(days=1))
+
+
+def get_overview_counts(env, company_id, today):
+    """Mọi số đếm của tổng quan dashboard trong một truy vấn.
+
+    today là ngày theo múi giờ của công ty (dashboard_today). Mỗi nhóm số là một subquery dựng
+    từ _search (giữ record rules / active_test của ORM); các số chấm công hôm nay (tổng, chưa
+    check-out, sớm, muộn) gom trong một lần quét bằng FILTER, giờ check-in đổi sang giờ địa phương.
+    """
+    tz = dashboard_timezone(env, company_id)
+    today_start, today_end = local_day_bounds(today, tz)
+
+    employees = env['hr.employee']._search([('company_id', '=', company_id), ('active', '=', True)])
+    departments = env['hr.department']._search([('company_id', '=', company_id)])
+    attendances = env['hr.attendance']._search([
+        ('employee_id.company_id', '=', company_id),
+        ('check_in', '>=', today_start),
+        ('check_in', '<', today_end),
+    ])
+    leaves = env['hr.leave']._search([
+        ('employee_id.company_id', '=', company_id),
+        ('state', '=', 'validate'),
+        ('date_from', '<=', today),
+        ('date_to', '>=', today),
+    ])
+    check_in_hour = SQL("extract(hour FROM (%s AT TIME ZONE 'UTC') AT TIME ZONE %s)",
+                        SQL.identifier(attendances.table, 'check_in'), tz)
+    [row] = env.execute_query(SQL(
+        "SELECT * FROM (%s) employees, (%s) departments, (%s) attendances, (%s) leaves",
+        employees.select(SQL("count(*)")),
+        departments.select(SQL("count(*)")),
+        attendances.select(
+            SQL("count(*)"),
+            SQL("count(*) FILTER (WHERE %s IS NULL)", SQL.identifier(attendances.table, 'check_out')),
+            SQL("count(*) FILTER (WHERE %s < %s)", check_in_hour, CHECKIN_EARLY_HOUR),
+            SQL("count(*) FILTER (WHERE %s > %s)", check_in_hour, CHECKIN_LATE_HOUR),
+        ),
+        leaves.select(SQL("count(*)")),
+    ))
+    total_employees, departments_count, today_checkins, missing_checkout, early, late, on_leave_today = row
+    return {
+        'total_employees': total_employees,
+        'departments_count': departments_count,
+        'today_checkins': today_checkins,
+        'missing_checkout': missing_checkout,
+        'early': early,
+        'late': late,
+        'on_time': today_checkins - early - late,
+        'on_leave_today': on_leave_today,
+    }
+
+
+def attendance_summary(counts):
+    """Phần 'summary' của realtime_attendance từ get_overview_counts"""
+    return {
+        'total_today': counts['today_checkins'],
+        'early': counts['early'],
+        'on_time': counts['on_time'],
+        'late': counts['late'],
+        'absent': max(0, counts['total_employees'] - counts['today_checkins'] - counts['on_leave_today']),
+    }
+
+
+def checkin_row(attendance, tz='UTC'):
+    """Một dòng 'recent_checkins' của dashboard; giờ check-in theo múi giờ tz"""
+    check_in_time = pytz.utc.localize(attendance.check_in).astimezone(pytz.timezone(tz))
+    status = 'on_time'
+    if check_in_time.hour > CHECKIN_LATE_HOUR:
+        status = 'late'
+    elif check_in_time.hour < CHECKIN_EARLY_HOUR:
+        status = 'early'
+    return {
+        'id': attendance.id,
+        'employee_name': attendance.employee_id.name,
+        'check_in_time': check_in_time.strftime('%H:%M'),
+        'status': status,
+        'department': attendance.employee_id.department_id.name if attendance.employee_id.department_id else 'N/A'
+    }
+
+
+class SbotchatDashboardBusMixin(models.AbstractModel):
+    """Gửi delta dashboard lên bus của công ty khi bản ghi được tạo / sửa / xóa"""
+    _name = 'sbotchat.dashboard.bus.mixin'
+    _description = 'SBot Chat Dashboard Bus Hooks'
+
+    def _sbotchat_dashboard_companies(self):
+        if 'company_id' in self._fields:
+            return self.company_id
+        return self.employee_id.company_id
+
+    def _sbotchat_mark_dashboard_dirty(self, created=False):
+        """Ghi nhận công ty có số liệu dashboard thay đổi; delta được gửi một lần sau khi transaction commit"""
+        company_ids = self.sudo()._sbotchat_dashboard_companies().ids
+        if not company_ids:
+            return
+        data = self.env.cr.precommit.data
+        pending = data.get(PENDING_KEY)
+        if pending is None:
+            pending = data[PENDING_KEY] = {'companies': {}, 'checkins': set()}
+            self.env.cr.postcommit.add(lambda: self.env['sbotchat.dashboard.bus.mixin']._sbotchat_send_dashboard_deltas(pending))
+        for company_id in company_ids:
+            pending['companies'].setdefault(company_id, set()).add(self._name)
+        if created and self._name == 'hr.attendance':
+            pending['checkins'].update(self.ids)
+
+    @api.model
+    def _sbotchat_send_dashboard_deltas(self, pending):
+        """Tính và gửi delta (postcommit) trên cursor riêng, commit khi xong; dữ liệu HR đã commit trước đó"""
+        try:
+            with self.pool.cursor() as cr:
+                self.env(cr=cr, user=SUPERUSER_ID)['sbotchat.dashboard.bus.mixin']._sbotchat_publish_dashboard_deltas(pending)
+        except Exception as e:
+            _logger.warning(f"Không gửi được delta dashboard: {str(e)}")
+
+    @api.model
+    def _sbotchat_publish_dashboard_deltas(self, pending):
+        env = self.env(su=True)
+        checkins = env['hr.attendance'].browse(pending['checkins']).exists().filtered('check_in').sorted('check_in', reverse=True)
+        for company_id, model_names in pending['companies'].items():
+            tz = dashboard_timezone(env, company_id)
+            today = dashboard_today(env, company_id)
+            today_start, today_end = local_day_bounds(today, tz)
+            try:
+                # Savepoint: truy vấn lỗi không làm hỏng cursor, các công ty khác vẫn được gửi
+                with env.cr.savepoint():
+                    counts = get_overview_counts(env, company_id, today)
+            except Exception as e:
+                _logger.warning(f"Không tính được delta dashboard cho công ty {company_id}: {str(e)}")
+                continue
+            company = env['res.company'].browse(company_id)
+            env['bus.bus']._sendone((company, DASHBOARD_CHANNEL), DASHBOARD_NOTIFICATION, {
+                'company_id': company_id,
+                'changed': sorted(model_names),
+                'employee_overview': {
+                    'total_employees': counts['total_employees'],
+                    'active_employees': counts['total_employees'],
+                    'departments_count': counts['departments_count'],
+                    'today_checkins': counts['today_checkins'],
+                    'on_leave_today': counts['on_leave_today'],
+                    'late_arrivals': counts['late'],
+                    'missing_checkout': counts['missing_checkout'],
+                    'absent_today': attendance_summary(counts)['absent'],
+                },
+                'attendance_summary': attendance_summary(counts),
+                'recent_checkins': [
+                    checkin_row(attendance, tz)
+                    for attendance in checkins.filtered(lambda attendance: attendance.employee_id.company_id.id == company_id
+                                                        and today_start <= attendance.check_in < today_end)
+                ][:RECENT_CHECKINS],
+                'last_updated': fields.Datetime.now().strftime('%H:%M:%S'),
+            })
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records._sbotchat_mark_dashboard_dirty(created=True)
+        return records
+
+    def write(self, vals):
+        result = super().write(vals)
+        self._sbotchat_mark_dashboard_dirty()
+        return result
+
+    def unlink(self):
+        self._sbotchat_mark_dashboard_dirty()
+        return super().unlink()
+
+
+class IrWebsocket(models.AbstractModel):
+    _inherit = 'ir.websocket'
+
+    def _build_bus_channel_list(self, channels):
+        """Người dùng HR nhận delta dashboard của các công ty họ được truy cập"""
+        channels = [channel for channel in channels if channel != DASHBOARD_CHANNEL]
+        if self.env.uid and receives_dashboard_deltas(self.env.user):
+            channels.extend((company, DASHBOARD_CHANNEL) for company in self.env.user.company_ids)
+        return super()._build_bus_channel_list(channels)
+
+
+class HrAttendance(models.Model):
+    _name = 'hr.attendance'
+    _inherit = ['hr.attendance', 'sbotchat.dashboard.bus.mixin']
+
+
+class HrLeave(models.Model):
+    _name = 'hr.leave'
+    _inherit = ['hr.leave', 'sbotchat.dashboard.bus.mixin']
+
+
+class HrContract(models.Model):
+    _name = 'hr.contract'
+    _inherit = ['hr.contract', 'sbotchat.dashboard.bus.mixin']
+
+
+class HrApplicant(models.Model):
+    _name = 'hr.applicant'
+    _inherit = ['hr.applicant', 'sbotchat.dashboard.bus.mixin']
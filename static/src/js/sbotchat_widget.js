@@ -4,6 +4,14 @@ import { Component, useState, onMounted, onWillUnmount } from "@odoo/owl";
 import { registry } from "@web/core/registry";
 import { useService } from "@web/core/utils/hooks";
 
+// Delta dashboard do server gửi qua bus (models/sbotchat_dashboard.py)
+const DASHBOARD_BUS_NOTIFICATION = "sbotchat.dashboard/delta";
+// Khi có bus: chỉ tải lại toàn bộ dashboard mỗi 5 phút để đối soát
+const DASHBOARD_RECONCILE_INTERVAL = 300000;
+// Lịch sử được làm mới sau delta, tối đa một lần mỗi 60 giây
+const HISTORY_REFRESH_THROTTLE = 60000;
+const RECENT_CHECKINS_LIMIT = 10;
+
 /**
  * SBot Chat Widget - Premium Modern Design 2025
  * Advanced AI Chat Interface with DeepSeek Integration and HR Dashboard
@@ -53,6 +61,7 @@ class SbotchatWidget extends Component {
             },
             lastMessageId: 0,
             connectionStatus: 'online', // online, offline, thinking
+            streamingEnabled: true, // Dùng /sbotchat/chat_stream (SSE) khi trình duyệt hỗ trợ
             userTyping: false,
             hrSuggestions: []
         });
@@ -63,6 +72,14 @@ class SbotchatWidget extends Component {
         this.historyRefreshInterval = null;
         this.clockInterval = null;
 
+        // Dashboard realtime qua bus (không có bus_service hoặc server không thêm kênh thì quay về polling)
+        this.busService = this.env.services?.bus_service || null;
+        this.dashboardBusEnabled = false;
+        this.dashboardBusSubscribed = false;
+        this.historyRefreshTimeout = null;
+        this.lastHistoryRefresh = 0;
+        this.onDashboardDelta = this.applyDashboardDelta.bind(this);
+
         // Auto-scroll and typing detection
         this.autoScrollTimeout = null;
         this.typingTimeout = null;
@@ -821,6 +838,11 @@ class SbotchatWidget extends Component {
         this.state.connectionStatus = 'thinking';
 
         try {
+            // Ưu tiên streaming (SSE) để hiển thị token ngay khi có, fallback về JSON-RPC
+            if (this.state.streamingEnabled && await this.sendMessageStreaming(message)) {
+                return;
+            }
+
             // Enhanced API call with HR Function Calling support
             const response = await this.rpc('/sbotchat/send_message', {
                 message: message,
@@ -901,6 +923,137 @@ class SbotchatWidget extends Component {
         }
     }
 
+    /**
+     * Send message qua /sbotchat/chat_stream (Server-Sent Events).
+     * Trả về true nếu stream đã xử lý xong tin nhắn, false nếu cần fallback sang RPC.
+     */
+    async sendMessageStreaming(message) {
+        const body = new URLSearchParams({ message: message });
+        if (this.state.currentConversationId) {
+            body.append('conversation_id', this.state.currentConversationId);
+        }
+        if (window.odoo && window.odoo.csrf_token) {
+            body.append('csrf_token', window.odoo.csrf_token);
+        }
+
+        let response;
+        try {
+            response = await fetch('/sbotchat/chat_stream', {
+                method: 'POST',
+                headers: { 'Accept': 'text/event-stream' },
+                body: body,
+            });
+        } catch (error) {
+            console.warn('Streaming không khả dụng, chuyển sang RPC:', error);
+            return false;
+        }
+        if (!response.ok || !response.body) {
+            return false;
+        }
+
+        this.state.messages.push({
+            id: ++this.state.lastMessageId,
+            role: 'assistant',
+            content: '',
+            thinking: null,
+            timestamp: new Date(),
+            isStreaming: true,
+            toolCalls: [],
+            isLocal: true
+        });
+        // Lấy lại object qua reactive proxy để mutation trigger render
+        const assistantMessage = this.state.messages[this.state.messages.length - 1];
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let finished = false;
+
+        const handleEvent = async (event, data) => {
+            switch (event) {
+                case 'start':
+                    if (data.conversation_id && !this.state.currentConversationId) {
+                        this.state.currentConversationId = data.conversation_id;
+                    }
+                    break;
+                case 'thinking':
+                    assistantMessage.thinking = (assistantMessage.thinking || '') + data.content;
+                    break;
+                case 'delta':
+                    if (this.state.isTyping) {
+                        this.state.isTyping = false;
+                    }
+                    assistantMessage.content += data.content;
+                    this.scrollToBottom();
+                    break;
+                case 'tool_call':
+                    assistantMessage.toolCalls.push({ id: data.id, name: data.name, status: 'running' });
+                    this.state.connectionStatus = 'thinking';
+                    break;
+                case 'tool_result': {
+                    const toolCall = assistantMessage.toolCalls.find((tc) => tc.id === data.id);
+                    if (toolCall) {
+                        toolCall.status = data.success ? 'done' : 'error';
+                    }
+                    break;
+                }
+                case 'done':
+                    finished = true;
+                    assistantMessage.content = data.response || assistantMessage.content || 'Không có phản hồi';
+                    assistantMessage.isStreaming = false;
+                    if (data.conversation_id && !this.state.conversations.find((c) => c.id === data.conversation_id)) {
+                        await this.loadConversations();
+                    }
+                    setTimeout(() => {
+                        this.formatAllMessages();
+                        this.scrollToBottom();
+                    }, 100);
+                    break;
+                case 'error':
+                    throw new Error(data.error || 'Lỗi streaming');
+            }
+        };
+
+        try {
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) {
+                    break;
+                }
+                buffer += decoder.decode(value, { stream: true });
+
+                let separator;
+                while ((separator = buffer.indexOf('\n\n')) !== -1) {
+                    const rawEvent = buffer.slice(0, separator);
+                    buffer = buffer.slice(separator + 2);
+
+                    let event = 'message';
+                    let data = '';
+                    for (const line of rawEvent.split('\n')) {
+                        if (line.startsWith('event:')) {
+                            event = line.slice(6).trim();
+                        } else if (line.startsWith('data:')) {
+                            data += line.slice(5).trim();
+                        }
+                    }
+                    await handleEvent(event, data ? JSON.parse(data) : {});
+                }
+            }
+        } catch (error) {
+            // Bỏ tin nhắn đang stream dở, để sendMessage hiển thị lỗi
+            const index = this.state.messages.indexOf(assistantMessage);
+            if (index !== -1) {
+                this.state.messages.splice(index, 1);
+            }
+            throw error;
+        }
+
+        if (!finished) {
+            assistantMessage.isStreaming = false;
+        }
+        return true;
+    }
+
     /**
      * Show HR Action feedback to user
      */
@@ -1391,6 +1544,8 @@ class SbotchatWidget extends Component {
                 this.clockInterval = null;
             }
             
+            this.unsubscribeDashboardBus();
+            
             // Clear timeouts
             if (this.autoScrollTimeout) {
                 clearTimeout(this.autoScrollTimeout);
@@ -1702,6 +1857,7 @@ class SbotchatWidget extends Component {
             if (response && response.success) {
                 // Validate and clean data before setting
                 const cleanedData = this.validateAndCleanDashboardData(response.data);
+                this.updateDashboardBusEnabled(response.data);
                 
                 this.state.dashboardData = {
                     ...cleanedData,
@@ -1802,6 +1958,21 @@ class SbotchatWidget extends Component {
         // Clear existing intervals
         this.stopRealTimeUpdates();
         
+        if (this.subscribeDashboardBus()) {
+            // Server đẩy delta qua bus; chỉ giữ một lần đối soát chậm
+            this.dashboardRefreshInterval = setInterval(async () => {
+                if (this.state.showDashboard && this.state.autoRefreshEnabled) {
+                    console.log('Reconciling dashboard...');
+                    await this.loadDashboardData();
+                    await this.refreshHistoryData();
+                    this.lastHistoryRefresh = Date.now();
+                }
+            }, DASHBOARD_RECONCILE_INTERVAL);
+            console.log('Real-time updates enabled (bus)');
+            return;
+        }
+        
+        // Không có bus: polling như cũ
         // Auto-refresh dashboard every 30 seconds
         this.dashboardRefreshInterval = setInterval(async () => {
             if (this.state.showDashboard && this.state.autoRefreshEnabled) {
@@ -1833,10 +2004,91 @@ class SbotchatWidget extends Component {
         
         // Also stop history auto-refresh
         this.stopHistoryAutoRefresh();
+        this.unsubscribeDashboardBus();
         
         console.log('Real-time updates stopped');
     }
 
+    updateDashboardBusEnabled(data) {
+        // Server báo người dùng có nhận delta qua bus không (is_hr_user); mất quyền thì quay lại polling
+        this.dashboardBusEnabled = Boolean(data && data.is_hr_user);
+        if (this.dashboardBusSubscribed && !this.dashboardBusEnabled) {
+            this.setupDashboardAutoRefresh();
+        }
+    }
+
+    subscribeDashboardBus() {
+        // Kênh dashboard của công ty chỉ được server thêm cho người dùng HR; người dùng khác không
+        // nhận delta nào nên phải polling
+        if (!this.busService || !this.dashboardBusEnabled) return false;
+        if (!this.dashboardBusSubscribed) {
+            try {
+                this.busService.subscribe(DASHBOARD_BUS_NOTIFICATION, this.onDashboardDelta);
+                this.busService.start();
+                this.dashboardBusSubscribed = true;
+            } catch (error) {
+                console.warn('Bus service not available, falling back to polling:', error);
+                return false;
+            }
+        }
+        return true;
+    }
+
+    unsubscribeDashboardBus() {
+        if (this.dashboardBusSubscribed) {
+            this.busService.unsubscribe(DASHBOARD_BUS_NOTIFICATION, this.onDashboardDelta);
+            this.dashboardBusSubscribed = false;
+        }
+        if (this.historyRefreshTimeout) {
+            clearTimeout(this.historyRefreshTimeout);
+            this.historyRefreshTimeout = null;
+        }
+    }
+
+    applyDashboardDelta(payload) {
+        // Gộp delta từ server vào dữ liệu dashboard hiện có, không gọi lại API
+        if (!payload || !this.state.showDashboard || !this.state.autoRefreshEnabled) return;
+        const current = this.state.dashboardData;
+        if (current.company_id && payload.company_id !== current.company_id) return;
+        
+        const attendance = current.realtime_attendance || {};
+        const newCheckins = this.validateAndCleanDashboardData({
+            realtime_attendance: { recent_checkins: payload.recent_checkins || [] }
+        }).realtime_attendance.recent_checkins;
+        const newIds = new Set(newCheckins.map(checkin => checkin.id));
+        const recentCheckins = [
+            ...newCheckins,
+            ...(attendance.recent_checkins || []).filter(checkin => !newIds.has(checkin.id))
+        ].slice(0, RECENT_CHECKINS_LIMIT);
+        
+        this.state.dashboardData = {
+            ...current,
+            employee_overview: { ...current.employee_overview, ...payload.employee_overview },
+            realtime_attendance: {
+                ...attendance,
+                summary: { ...attendance.summary, ...payload.attendance_summary },
+                recent_checkins: recentCheckins,
+                last_updated: payload.last_updated
+            },
+            last_updated: this.formatTimestamp(new Date())
+        };
+        if (this.state.notificationsEnabled) {
+            this.checkForNotifications(payload);
+        }
+        this.scheduleHistoryRefresh();
+    }
+
+    scheduleHistoryRefresh() {
+        // Các bảng lịch sử chỉ đổi khi có delta: làm mới sau delta, tối đa một lần mỗi HISTORY_REFRESH_THROTTLE
+        if (this.historyRefreshTimeout) return;
+        const delay = Math.max(0, this.lastHistoryRefresh + HISTORY_REFRESH_THROTTLE - Date.now());
+        this.historyRefreshTimeout = setTimeout(async () => {
+            this.historyRefreshTimeout = null;
+            this.lastHistoryRefresh = Date.now();
+            await this.refreshHistoryData();
+        }, delay);
+    }
+
     async updateCriticalData() {
         try {
             // Update only critical real-time data (attendance, notifications)
@@ -2402,6 +2654,9 @@ class SbotchatWidget extends Component {
     }
 
     setupHistoryAutoRefresh() {
+        // Có bus: lịch sử được làm mới theo delta và lần đối soát (setupRealTimeUpdates)
+        if (this.dashboardBusSubscribed) return;
+        
         // Setup auto-refresh for history data every 60 seconds
         if (this.historyRefreshInterval) {
             clearInterval(this.historyRefreshInterval);
@@ -2647,6 +2902,7 @@ class SbotchatWidget extends Component {
             
             if (response && response.success) {
                 this.state.dashboardData = response.data;
+                this.updateDashboardBusEnabled(response.data);
                 
                 // Initialize charts with real data only after DOM is ready
                 this.scheduleChartInitialization();
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Chat Benchmark
+Cho N người dùng giả lập đồng thời chạy các lượt chat qua controller thật
+(SbotchatController._run_chat_turn hoặc HRAIAgentController.hr_ai_agent),
+LLM được thay bằng Mock DeepSeek Server. Báo cáo p50/p95/p99 latency mỗi lượt,
+số SQL query mỗi lượt và worker occupancy.
+
+    python3 benchmark_chat.py -c /etc/odoo/odoo.conf -d bench_db --users 10 --turns 5 --latency 0.8
+
+System Parameter sbotchat.deepseek_base_url được trỏ tạm sang mock server và khôi
+phục khi kết thúc. Dữ liệu chat tạo ra được rollback sau mỗi lượt trừ khi có --keep-data.
+Chỉ chạy trên database thử nghiệm.
+"""
+
+import argparse
+import math
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from mock_deepseek_server import MockDeepSeekServer  # noqa: E402
+
+DEFAULT_MESSAGES = [
+    'Cho tôi xem tổng quan nhân sự công ty',
+    'Danh sách nhân viên phòng kỹ thuật',
+    'Có những loại nghỉ phép nào?',
+    'Thống kê chấm công tháng này',
+]
+
+BASE_URL_PARAM = 'sbotchat.deepseek_base_url'
+
+
+def percentile(values, fraction):
+    """Percentile theo nearest-rank (values chưa sắp xếp)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(math.ceil(fraction * len(ordered)) - 1, 0)
+    return ordered[min(index, len(ordered) - 1)]
+
+
+def benchmark_config():
+    """Cấu hình LLM cho benchmark - không phụ thuộc sbotchat.config trong database"""
+    return SimpleNamespace(
+        api_key='sk-benchmark', model_type='deepseek-chat', max_tokens=1000, temperature=0.7,
+        top_p=1.0, frequency_penalty=0.0, presence_penalty=0.0, system_prompt=False,
+    )
+
+
+def run_turn(dbname, uid, message, target, keep_data, plan_mode=False):
+    """Một lượt chat trên cursor riêng (như một HTTP worker), trả về latency và số query"""
+    from odoo.addons.sbotchat.controllers.hr_ai_agent import HRAIAgentController
+    from odoo.addons.sbotchat.controllers.main import SbotchatController
+    from odoo.addons.sbotchat.controllers.request_scope import scoped_env
+
+    with scoped_env(dbname, uid, readonly=not keep_data) as env:
+        queries_before = env.cr.sql_log_count
+        started = time.monotonic()
+        if target == 'agent':
+            result = HRAIAgentController().hr_ai_agent(message)
+        else:
+            conversation = env['sbotchat.conversation'].create({'title': 'Benchmark'})
+            user_message = env['sbotchat.message'].create({
+                'conversation_id': conversation.id,
+                'content': message,
+                'role': 'user',
+            })
+            result = SbotchatController()._run_chat_turn(
+                conversation, benchmark_config(), message, user_message.id, plan_mode=plan_mode)
+        return {
+            'latency': time.monotonic() - started,
+            'queries': env.cr.sql_log_count - queries_before,
+            'success': bool(result.get('success')),
+        }
+
+
+def simulate_user(dbname, uid, turns, target, keep_data, think_time, user_index, results, lock, plan_mode=False):
+    for turn in range(turns):
+        message = DEFAULT_MESSAGES[(user_index + turn) % len(DEFAULT_MESSAGES)]
+        try:
+            outcome = run_turn(dbname, uid, message, target, keep_data, plan_mode)
+        except Exception as e:
+            outcome = {'latency': 0.0, 'queries': 0, 'success': False, 'error': str(e)}
+        with lock:
+            results.append(outcome)
+        if think_time:
+            time.sleep(think_time)
+
+
+def set_base_url(registry, base_url):
+    """Đặt System Parameter base URL (commit ngay), trả về giá trị cũ"""
+    from odoo import api, SUPERUSER_ID
+
+    with registry.cursor() as cr:
+        params = api.Environment(cr, SUPERUSER_ID, {})['ir.config_parameter']
+        previous = params.get_param(BASE_URL_PARAM)
+        params.set_param(BASE_URL_PARAM, base_url or False)
+    return previous
+
+
+def report(results, wall_time, users, mock_stats):
+    ok = [item for item in results if item['success']]
+    latencies = [item['latency'] for item in ok]
+    queries = [item['queries'] for item in ok]
+    busy = sum(item['latency'] for item in results)
+
+    print(f"Lượt chat: {len(results)} (thành công {len(ok)}, lỗi {len(results) - len(ok)})")
+    print(f"Thời gian: {wall_time:.2f}s - throughput {len(results) / wall_time:.2f} lượt/s")
+    if latencies:
+        print(f"Latency mỗi lượt: p50 {percentile(latencies, 0.5):.3f}s / p95 {percentile(latencies, 0.95):.3f}s "
+              f"/ p99 {percentile(latencies, 0.99):.3f}s / max {max(latencies):.3f}s")
+        print(f"SQL query mỗi lượt: trung bình {sum(queries) / len(queries):.1f} / p95 {percentile(queries, 0.95)} / max {max(queries)}")
+    print(f"Worker occupancy: {busy / (users * wall_time) * 100:.1f}% ({users} worker giả lập)")
+    if busy:
+        print(f"Thời gian chờ LLM (mock): {mock_stats['busy_seconds'] / busy * 100:.1f}% thời gian worker bận "
+              f"- {mock_stats['requests']} request, {mock_stats['errors']} lỗi 503")
+    errors = {item['error'] for item in results if item.get('error')}
+    for error in sorted(errors)[:5]:
+        print(f"  Lỗi: {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark vòng lặp chat SBot Chat với mock DeepSeek')
+    parser.add_argument('-c', '--config', help='File cấu hình Odoo')
+    parser.add_argument('-d', '--database', required=True, help='Database thử nghiệm')
+    parser.add_argument('--login', default='admin', help='Người dùng chạy các lượt chat')
+    parser.add_argument('--users', type=int, default=10, help='Số người dùng đồng thời')
+    parser.add_argument('--turns', type=int, default=5, help='Số lượt chat mỗi người dùng')
+    parser.add_argument('--target', choices=['chat', 'agent'], default='chat',
+                        help='chat: vòng lặp function calling, agent: HR AI Agent (không gọi LLM)')
+    parser.add_argument('--latency', type=float, default=0.8, help='Độ trễ mock LLM (giây)')
+    parser.add_argument('--jitter', type=float, default=0.2, help='Dao động độ trễ ± (giây)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Tỷ lệ mock trả về 503')
+    parser.add_argument('--think-time', type=float, default=0.0, help='Nghỉ giữa hai lượt của một người dùng (giây)')
+    parser.add_argument('--plan-mode', action='store_true', help='Chạy lượt chat ở chế độ plan-then-execute')
+    parser.add_argument('--keep-data', action='store_true', help='Commit dữ liệu chat thay vì rollback')
+    args = parser.parse_args()
+
+    import odoo
+    from odoo.modules.registry import Registry
+    from odoo.tools import config
+
+    config.parse_config((['-c', args.config] if args.config else []) + ['-d', args.database])
+    odoo.modules.module.initialize_sys_path()
+    registry = Registry(args.database)
+
+    with registry.cursor() as cr:
+        cr.execute("SELECT id FROM res_users WHERE login = %s", (args.login,))
+        row = cr.fetchone()
+    if not row:
+        parser.error(f'Không tìm thấy người dùng {args.login}')
+    uid = row[0]
+
+    mock = MockDeepSeekServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate).start()
+    previous_base_url = set_base_url(registry, mock.base_url)
+    print(f"Mock DeepSeek: {mock.base_url} - {args.users} người dùng x {args.turns} lượt ({args.target})")
+
+    results = []
+    lock = threading.Lock()
+    started = time.monotonic()
+    try:
+        with ThreadPoolExecutor(max_workers=args.users) as executor:
+            for user_index in range(args.users):
+                executor.submit(simulate_user, args.database, uid, args.turns, args.target,
+                                args.keep_data, args.think_time, user_index, results, lock, args.plan_mode)
+        wall_time = time.monotonic() - started
+    finally:
+        set_base_url(registry, previous_base_url)
+        mock.stop()
+
+    report(results, wall_time, args.users, mock.stats)
+
+
+if __name__ == '__main__':
+    main()
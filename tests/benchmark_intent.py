@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+Intent Matcher Benchmark
+So sánh thời gian phân tích intent của HRIntentMatcher (Aho-Corasick, một lượt
+duyệt) với chuỗi if / any(keyword in ...) kiểu cũ được sinh lại từ chính
+INTENT_RULES (list keyword dựng lại ở mỗi lần gọi như trước đây).
+
+    python3 benchmark_intent.py --repeat 2000
+    python3 benchmark_intent.py --corpus messages.txt   # mỗi dòng một tin nhắn
+
+Không cần Odoo: các module controllers chỉ dùng thư viện chuẩn.
+"""
+
+import argparse
+import os
+import sys
+import time
+import types
+
+CONTROLLERS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'controllers')
+
+# Tin nhắn thực tế: khớp sớm, khớp muộn, nhiều bước và không khớp rule nào (fallback)
+DEFAULT_CORPUS = [
+    'Danh sách nhân viên phòng kỹ thuật',
+    'Tạo nhân viên mới tên Nguyễn Văn A',
+    'Cho tôi xem thông tin nhân viên Trần Thị Lan',
+    'Thống kê tổng quan nhân sự tháng này',
+    'Báo cáo chấm công tuần trước của phòng kinh doanh',
+    'Check in cho nhân viên 12',
+    'Tạo đơn xin nghỉ phép 3 ngày từ thứ hai',
+    'Có những loại nghỉ phép nào?',
+    'Phê duyệt đơn nghỉ phép của Minh',
+    'Bảng lương tháng 5 của nhân viên Hùng',
+    'Danh sách hợp đồng sắp hết hạn',
+    'Tính bảo hiểm xã hội cho nhân viên mới',
+    'Tuyển dụng vị trí lập trình viên Python',
+    'Danh sách ứng viên đang phỏng vấn',
+    'Kỹ năng của nhân viên Phạm Thu Hà',
+    'Timesheet dự án ERP tuần này',
+    'Tìm kiếm nhân viên tên Lan',
+    'Show employee list for the sales department',
+    'Create a leave request for tomorrow',
+    'What is the overtime policy?',
+    'Xin chào, bạn có thể giúp gì cho tôi?',
+    'Cảm ơn bạn nhiều nhé',
+    'Hôm nay thời tiết thế nào?',
+    'Giải thích quy trình onboarding cho người mới và gửi email chào mừng',
+]
+
+
+def load_matcher_module():
+    """Nạp hr_intent_matcher như một package ảo để chạy ngoài Odoo"""
+    package = types.ModuleType('sbotchat_controllers')
+    package.__path__ = [CONTROLLERS_DIR]
+    sys.modules.setdefault('sbotchat_controllers', package)
+    from sbotchat_controllers import hr_intent_matcher
+    return hr_intent_matcher
+
+
+def build_legacy_analyzer(rules, fallback):
+    """Sinh lại _analyze_intent kiểu cũ (if any(keyword in message_lower for keyword in [...]))"""
+    lines = ['def analyze(message):', '    message_lower = message.lower()']
+    for rule in rules:
+        lines.append(f"    if any(keyword in message_lower for keyword in {list(rule['keywords'])!r}):")
+        variants = rule.get('variants') or [{'result': rule['result']}]
+        for index, variant in enumerate(variants):
+            if variant.get('keywords'):
+                keyword = 'if' if index == 0 else 'elif'
+                lines.append(f"        {keyword} any(keyword in message_lower for keyword in {list(variant['keywords'])!r}):")
+                lines.append(f"            return {variant['result']!r}")
+            elif index:
+                lines.append('        else:')
+                lines.append(f"            return {variant['result']!r}")
+            else:
+                lines.append(f"        return {variant['result']!r}")
+    lines.append(f'    return {fallback!r}')
+    namespace = {}
+    exec(compile('\n'.join(lines), '<legacy_analyze_intent>', 'exec'), namespace)
+    return namespace['analyze']
+
+
+def time_per_message(func, corpus, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for message in corpus:
+            func(message)
+    return (time.perf_counter() - started) / (repeat * len(corpus))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark phân tích intent: Aho-Corasick vs chuỗi if kiểu cũ')
+    parser.add_argument('--corpus', help='File tin nhắn (mỗi dòng một tin nhắn)')
+    parser.add_argument('--repeat', type=int, default=1000, help='Số lần lặp toàn bộ corpus')
+    args = parser.parse_args()
+
+    corpus = DEFAULT_CORPUS
+    if args.corpus:
+        with open(args.corpus, encoding='utf-8') as handle:
+            corpus = [line.strip() for line in handle if line.strip()]
+
+    module = load_matcher_module()
+    started = time.perf_counter()
+    matcher = module.HRIntentMatcher()
+    compile_time = time.perf_counter() - started
+    legacy = build_legacy_analyzer(module.INTENT_RULES, module.INTENT_FALLBACK)
+
+    mismatches = [message for message in corpus if legacy(message) != matcher.match(message.lower())]
+    if mismatches:
+        print(f"CẢNH BÁO: {len(mismatches)} tin nhắn cho kết quả khác nhau, ví dụ: {mismatches[0]!r}")
+
+    legacy_time = time_per_message(legacy, corpus, args.repeat)
+    compiled_time = time_per_message(lambda message: matcher.match(message.lower()), corpus, args.repeat)
+    all_time = time_per_message(lambda message: matcher.match_all(message.lower()), corpus, args.repeat)
+
+    print(f"Rules: {len(matcher.rules)}, keywords: {len(matcher.keywords)}, "
+          f"automaton: {len(matcher.automaton.goto)} states, biên dịch {compile_time * 1000:.1f}ms")
+    print(f"Corpus: {len(corpus)} tin nhắn x {args.repeat} lần")
+    print(f"Chuỗi if kiểu cũ:       {legacy_time * 1e6:8.1f}µs / tin nhắn")
+    print(f"Aho-Corasick match:     {compiled_time * 1e6:8.1f}µs / tin nhắn ({legacy_time / compiled_time:.1f}x)")
+    print(f"Aho-Corasick match_all: {all_time * 1e6:8.1f}µs / tin nhắn (mọi intent khớp)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+Mock DeepSeek Server
+Server OpenAI-compatible (POST /chat/completions) phát lại transcript tool-call
+theo kịch bản với độ trễ cấu hình được - dùng để test tải vòng lặp chat mà
+không cần API thật.
+
+Server không giữ trạng thái: bước của transcript được xác định bằng số tin nhắn
+'assistant' sau tin nhắn 'user' cuối cùng trong request. Request lập kế hoạch
+(response_format json_object) nhận về kế hoạch gồm các tool call của bước hiện tại.
+
+Chạy độc lập:
+    python3 mock_deepseek_server.py --port 8765 --latency 0.8 --jitter 0.2
+rồi đặt System Parameter sbotchat.deepseek_base_url = http://127.0.0.1:8765
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Mỗi transcript: 'match' (chuỗi con của tin nhắn user, None = mặc định) và danh sách bước.
+# Bước là {'tool_calls': [{'name', 'arguments'}]} hoặc {'content': ...}
+DEFAULT_TRANSCRIPTS = [
+    {
+        'match': 'nghỉ phép',
+        'steps': [
+            {'tool_calls': [{'name': 'get_leave_types', 'arguments': {}}]},
+            {'content': 'Công ty hiện có các loại nghỉ phép đã liệt kê ở trên.'},
+        ],
+    },
+    {
+        'match': None,
+        'steps': [
+            {'tool_calls': [
+                {'name': 'get_dashboard_stats', 'arguments': {}},
+                {'name': 'get_employees', 'arguments': {'limit': 5}},
+            ]},
+            {'content': 'Tổng quan nhân sự: số liệu dashboard và 5 nhân viên đầu tiên đã được tổng hợp.'},
+        ],
+    },
+]
+
+CHARS_PER_TOKEN = 3
+
+
+class MockDeepSeekServer:
+    """ThreadingHTTPServer chạy nền, phát lại transcript với latency + jitter"""
+
+    def __init__(self, transcripts=None, latency=0.5, jitter=0.1, chunk_delay=0.02,
+                 error_rate=0.0, host='127.0.0.1', port=0):
+        self.transcripts = transcripts or DEFAULT_TRANSCRIPTS
+        self.latency = latency
+        self.jitter = jitter
+        self.chunk_delay = chunk_delay
+        self.error_rate = error_rate
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+        self._stats_lock = threading.Lock()
+        self.stats = {'requests': 0, 'errors': 0, 'busy_seconds': 0.0}
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='mock_deepseek', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self.stats = {'requests': 0, 'errors': 0, 'busy_seconds': 0.0}
+
+    def _record(self, key, value=1):
+        with self._stats_lock:
+            self.stats[key] += value
+
+    def next_step(self, messages):
+        """Bước transcript tiếp theo cho message list của request"""
+        last_user = 0
+        for index, message in enumerate(messages):
+            if message.get('role') == 'user':
+                last_user = index
+        user_text = (messages[last_user].get('content') or '') if messages else ''
+        # Mỗi tin nhắn assistant sau tin nhắn user cuối là một bước đã phát
+        step_index = sum(1 for message in messages[last_user:] if message.get('role') == 'assistant')
+
+        transcript = next(
+            (item for item in self.transcripts if item.get('match') and item['match'] in user_text.lower()),
+            next((item for item in self.transcripts if not item.get('match')), self.transcripts[0]),
+        )
+        steps = transcript['steps']
+        return steps[min(step_index, len(steps) - 1)]
+
+    def build_message(self, step):
+        if 'tool_calls' in step:
+            return {
+                'role': 'assistant',
+                'content': '',
+                'tool_calls': [
+                    {
+                        'id': f'call_{uuid.uuid4().hex[:12]}',
+                        'type': 'function',
+                        'function': {
+                            'name': call['name'],
+                            'arguments': json.dumps(call.get('arguments', {}), ensure_ascii=False),
+                        },
+                    }
+                    for call in step['tool_calls']
+                ],
+            }
+        return {'role': 'assistant', 'content': step.get('content', '')}
+
+    @staticmethod
+    def build_plan(step):
+        """Kế hoạch plan-then-execute tương ứng với một bước tool_calls của transcript"""
+        steps = [
+            {'id': f's{index + 1}', 'function': call['name'], 'arguments': call.get('arguments', {})}
+            for index, call in enumerate(step.get('tool_calls', []))
+        ]
+        return {'role': 'assistant', 'content': json.dumps({'steps': steps}, ensure_ascii=False)}
+
+    @staticmethod
+    def build_usage(body, message):
+        prompt_tokens = len(body) // CHARS_PER_TOKEN
+        completion_tokens = len(json.dumps(message, ensure_ascii=False)) // CHARS_PER_TOKEN
+        # Giả lập context cache: phần tools + system prompt (~nửa đầu request) được cache
+        cache_hit = prompt_tokens // 2
+        return {
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'total_tokens': prompt_tokens + completion_tokens,
+            'prompt_cache_hit_tokens': cache_hit,
+            'prompt_cache_miss_tokens': prompt_tokens - cache_hit,
+        }
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                started = time.monotonic()
+                server._record('requests')
+                body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                try:
+                    payload = json.loads(body or b'{}')
+                except ValueError:
+                    return self._send_json(400, {'error': {'message': 'Invalid JSON'}})
+
+                time.sleep(max(server.latency + random.uniform(-server.jitter, server.jitter), 0))
+                if server.error_rate and random.random() < server.error_rate:
+                    server._record('errors')
+                    server._record('busy_seconds', time.monotonic() - started)
+                    return self._send_json(503, {'error': {'message': 'Server busy'}}, {'Retry-After': '1'})
+
+                step = server.next_step(payload.get('messages', []))
+                if (payload.get('response_format') or {}).get('type') == 'json_object':
+                    message = server.build_plan(step)
+                else:
+                    message = server.build_message(step)
+                usage = server.build_usage(body, message)
+                if payload.get('stream'):
+                    self._send_stream(payload, message, usage)
+                else:
+                    self._send_json(200, {
+                        'id': f'chatcmpl-{uuid.uuid4().hex}',
+                        'object': 'chat.completion',
+                        'created': int(time.time()),
+                        'model': payload.get('model', 'deepseek-chat'),
+                        'choices': [{
+                            'index': 0,
+                            'message': message,
+                            'finish_reason': 'tool_calls' if message.get('tool_calls') else 'stop',
+                        }],
+                        'usage': usage,
+                    })
+                server._record('busy_seconds', time.monotonic() - started)
+
+            def _send_json(self, status, data, headers=None):
+                raw = json.dumps(data, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(raw)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def _send_stream(self, payload, message, usage):
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+
+                deltas = []
+                if message.get('tool_calls'):
+                    for index, call in enumerate(message['tool_calls']):
+                        deltas.append({'tool_calls': [dict(call, index=index)]})
+                else:
+                    words = message['content'].split(' ')
+                    deltas.extend({'content': word + (' ' if i < len(words) - 1 else '')} for i, word in enumerate(words))
+
+                for delta in deltas:
+                    self._write_chunk({'choices': [{'index': 0, 'delta': delta}]})
+                    time.sleep(server.chunk_delay)
+                self._write_chunk({'choices': [], 'usage': usage})
+                self._write_raw(b'data: [DONE]\n\n')
+                self.wfile.write(b'0\r\n\r\n')
+
+            def _write_chunk(self, data):
+                self._write_raw(b'data: ' + json.dumps(data, ensure_ascii=False).encode('utf-8') + b'\n\n')
+
+            def _write_raw(self, raw):
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(raw), raw))
+                self.wfile.flush()
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mock DeepSeek API server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.5, help='Độ trễ mỗi request (giây)')
+    parser.add_argument('--jitter', type=float, default=0.1, help='Dao động độ trễ ± (giây)')
+    parser.add_argument('--chunk-delay', type=float, default=0.02, help='Độ trễ giữa các chunk khi stream (giây)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Tỷ lệ request trả về 503')
+    parser.add_argument('--transcripts', help='File JSON chứa danh sách transcript')
+    args = parser.parse_args()
+
+    transcripts = None
+    if args.transcripts:
+        with open(args.transcripts, encoding='utf-8') as handle:
+            transcripts = json.load(handle)
+
+    server = MockDeepSeekServer(
+        transcripts=transcripts, latency=args.latency, jitter=args.jitter, chunk_delay=args.chunk_delay,
+        error_rate=args.error_rate, host=args.host, port=args.port,
+    )
+    print(f'Mock DeepSeek server: {server.base_url}')
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
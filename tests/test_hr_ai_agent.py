@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import json
 import logging
+from odoo import fields
 from odoo.tests.common import TransactionCase
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
@@ -430,6 +431,1074 @@ class TestHRAIAgent(TransactionCase):
         # Should handle gracefully
         self.assertIsInstance(result, list)
 
+    def test_stream_chat_events(self):
+        """Test streaming generator: delta, tool call và lưu tin nhắn cuối"""
+        from contextlib import contextmanager
+        from types import SimpleNamespace
+        from odoo.addons.sbotchat.controllers.main import SbotchatController
+
+        controller = SbotchatController()
+        config = SimpleNamespace(api_key='sk-test', model_type='deepseek-chat', max_tokens=100, temperature=0.7)
+
+        tool_turn = [
+            {'choices': [{'delta': {'tool_calls': [{'index': 0, 'id': 'call_1', 'function': {'name': 'get_dashboard_stats', 'arguments': ''}}]}}]},
+            {'choices': [{'delta': {'tool_calls': [{'index': 0, 'function': {'arguments': '{}'}}]}}]},
+        ]
+        answer_turn = [
+            {'choices': [{'delta': {'content': 'Xin '}}]},
+            {'choices': [{'delta': {'content': 'chào'}}]},
+        ]
+
+        @contextmanager
+        def fake_scope(*args, **kwargs):
+            yield self.env
+
+        with patch.object(SbotchatController, '_call_deepseek_api_stream', side_effect=[iter(tool_turn), iter(answer_turn)]), \
+                patch('odoo.addons.sbotchat.controllers.main.scoped_env', fake_scope), \
+                patch.object(SbotchatController, '_execute_hr_function', return_value={'success': True}):
+            events = list(controller._stream_chat_events(
+                self.env.cr.dbname, self.env.uid, {}, self.test_conversation.id, config,
+                [{'role': 'user', 'content': 'Xin chào'}]
+            ))
+
+        payload = b''.join(events).decode('utf-8')
+        self.assertIn('event: tool_call', payload)
+        self.assertIn('event: delta', payload)
+        self.assertIn('event: done', payload)
+
+        assistant = self.env['sbotchat.message'].search([
+            ('conversation_id', '=', self.test_conversation.id),
+            ('role', '=', 'assistant'),
+        ])
+        self.assertEqual(assistant.content, 'Xin chào')
+
+    def test_execute_tool_calls_parallel_reads(self):
+        """Test tool calls chỉ đọc chạy qua thread pool, function ghi chạy tuần tự và giữ thứ tự kết quả"""
+        from odoo.addons.sbotchat.controllers.main import SbotchatController
+
+        controller = SbotchatController()
+        tool_calls = [
+            {'id': 'c1', 'type': 'function', 'function': {'name': 'get_dashboard_stats', 'arguments': '{}'}},
+            {'id': 'c2', 'type': 'function', 'function': {'name': 'get_leave_types', 'arguments': '{}'}},
+            {'id': 'c3', 'type': 'function', 'function': {'name': 'checkin_employee', 'arguments': json.dumps({'employee_id': self.test_employee.id})}},
+            {'id': 'c4', 'type': 'function', 'function': {'name': 'get_employees', 'arguments': 'not-json'}},
+        ]
+
+        isolated_calls = []
+
+        def fake_isolated(dbname, uid, context, function_name, function_args):
+            isolated_calls.append(function_name)
+            return controller._execute_hr_function(function_name, function_args)
+
+        turn_state = {}
+        with patch('odoo.addons.sbotchat.controllers.main.request') as mock_request, \
+                patch.object(SbotchatController, '_execute_hr_function_isolated', side_effect=fake_isolated):
+            mock_request.env = self.env
+            results = controller._execute_tool_calls(tool_calls, turn_state)
+
+        self.assertEqual([tc['id'] for tc, result in results], ['c1', 'c2', 'c3', 'c4'])
+        self.assertEqual(sorted(isolated_calls), ['get_dashboard_stats', 'get_leave_types'])
+        self.assertTrue(turn_state.get('has_written'))
+        self.assertIn('error', results[3][1])
+
+    def test_execute_tool_calls_memoizes_reads(self):
+        """Test lời gọi chỉ đọc trùng tham số trong turn lấy từ memo, function ghi làm memo mất hiệu lực"""
+        from odoo.addons.sbotchat.controllers.main import SbotchatController
+        from odoo.addons.sbotchat.controllers.chat_telemetry import TurnTelemetry
+        from odoo.addons.sbotchat.controllers.hr_tool_memo import ToolResultMemo
+
+        controller = SbotchatController()
+        executed = []
+        execute = SbotchatController._execute_hr_function
+
+        def counting_execute(self, function_name, function_args):
+            executed.append(function_name)
+            return execute(self, function_name, function_args)
+
+        def call(call_id, name, args):
+            return {'id': call_id, 'type': 'function', 'function': {'name': name, 'arguments': json.dumps(args)}}
+
+        telemetry = TurnTelemetry('deepseek-chat')
+        turn_state = {'telemetry': telemetry, 'memo': ToolResultMemo()}
+        with patch('odoo.addons.sbotchat.controllers.main.request') as mock_request, \
+                patch.object(SbotchatController, '_execute_hr_function', counting_execute), \
+                patch.object(SbotchatController, '_execute_hr_function_isolated',
+                             side_effect=lambda dbname, uid, context, name, args: controller._execute_hr_function(name, args)):
+            mock_request.env = self.env
+            first = controller._execute_tool_calls([
+                call('c1', 'get_employees', {'limit': 5}),
+                call('c2', 'get_employees', {'limit': 5}),
+                call('c3', 'get_leave_types', {}),
+            ], turn_state)
+            # Tham số được chuẩn hóa qua validator: "5" trùng 5, tham số lạ bị bỏ
+            second = controller._execute_tool_calls([call('c4', 'get_employees', {'limit': '5', 'unexpected_param': 1})], turn_state)
+            self.assertEqual(sorted(executed), ['get_employees', 'get_leave_types'])
+            self.assertEqual(second[0][1], first[0][1])
+            self.assertEqual(first[1][1], first[0][1])
+
+            controller._execute_tool_calls([
+                call('c5', 'checkin_employee', {'employee_id': self.test_employee.id}),
+                call('c6', 'get_employees', {'limit': 5}),
+            ], turn_state)
+            self.assertEqual(executed[-2:], ['checkin_employee', 'get_employees'])
+
+        self.assertEqual(telemetry.memo_hits, 2)
+        self.assertEqual(telemetry.memo_misses, 3)
+        self.assertEqual(telemetry.message_values()['tool_memo_hits'], 2)
+
+        # Dữ liệu HR đổi ngoài turn (ghi chưa commit): memo bị xóa ở nhóm tool calls tiếp theo
+        memo = turn_state['memo']
+        self.assertTrue(memo.entries)
+        employee = self.env['hr.employee'].create({'name': 'AI Test Memo Employee'})
+        memo.sync(self.env)
+        self.assertFalse(memo.entries)
+
+        # Commit của worker khác: phiên bản model tăng sau commit
+        memo.put(('get_employees', '{}'), {'success': True})
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+        self.env.cr.postcommit.run()
+        memo.sync(self.env)
+        self.assertFalse(memo.entries)
+
+        # Xóa bản ghi cũng được tính; kiểm tra phiên bản là một truy vấn, không quét bảng HR
+        memo.put(('get_employees', '{}'), {'success': True})
+        memo.sync(self.env)
+        self.assertTrue(memo.entries)
+        employee.unlink()
+        with self.assertQueryCount(1):
+            memo.sync(self.env)
+        self.assertFalse(memo.entries)
+
+    def test_context_window_keeps_recent_and_summarizes_older(self):
+        """Test cửa sổ ngữ cảnh lấy tin nhắn gần nhất theo token budget và gộp phần cũ vào summary"""
+        Message = self.env['sbotchat.message']
+        created = Message
+        for index in range(6):
+            created |= Message.create({
+                'conversation_id': self.test_conversation.id,
+                'role': 'user' if index % 2 == 0 else 'assistant',
+                'content': f'Tin nhắn số {index} ' + 'x' * 300,
+            })
+
+        # Mỗi tin nhắn ~110 tokens: vượt budget 400 nên gộp xuống 60% (240) - vừa 2 tin nhắn gần nhất
+        summary, window = self.test_conversation._get_context_window(400)
+        self.assertEqual(window.ids, created[-2:].ids)
+        self.assertIn('Tin nhắn số 0', summary)
+        self.assertEqual(self.test_conversation.summary_until_message_id, created[3].id)
+
+        # Lượt sau: không gộp lại tin nhắn đã tóm tắt, có thể loại tin nhắn hiện tại
+        summary_again, window = self.test_conversation._get_context_window(1000, exclude_message_id=created[-1].id)
+        self.assertEqual(window.ids, created[4:5].ids)
+        self.assertEqual(summary_again.count('Tin nhắn số 0'), 1)
+
+    def test_context_window_folds_from_oldest_unsummarized(self):
+        """Test tin nhắn cũ hơn giới hạn quét vẫn được gộp vào summary theo thứ tự, không bị bỏ qua"""
+        Message = self.env['sbotchat.message']
+        created = Message
+        for index in range(8):
+            created |= Message.create({
+                'conversation_id': self.test_conversation.id,
+                'role': 'user' if index % 2 == 0 else 'assistant',
+                'content': f'Tin nhắn số {index} ' + 'x' * 300,
+            })
+
+        with patch('odoo.addons.sbotchat.models.sbotchat_conversation.CONTEXT_SCAN_LIMIT', 3):
+            # 3 tin nhắn quét được (~324 tokens) vượt budget 300: gộp xuống 180 - chỉ giữ tin nhắn cuối
+            summary, window = self.test_conversation._get_context_window(300)
+        self.assertEqual(window.ids, created[-1:].ids)
+        for index in range(7):
+            self.assertIn(f'Tin nhắn số {index}', summary)
+        self.assertLess(summary.index('Tin nhắn số 0'), summary.index('Tin nhắn số 6'))
+        self.assertEqual(self.test_conversation.summary_until_message_id, created[6].id)
+
+        # Mọi tin nhắn gần nhất vừa budget nhưng còn tin nhắn cũ hơn giới hạn quét: vẫn được gộp
+        self.test_conversation.write({'context_summary': False, 'summary_until_message_id': 0})
+        with patch('odoo.addons.sbotchat.models.sbotchat_conversation.CONTEXT_SCAN_LIMIT', 3):
+            summary, window = self.test_conversation._get_context_window(100000)
+        self.assertEqual(window.ids, created[-3:].ids)
+        self.assertIn('Tin nhắn số 0', summary)
+        self.assertEqual(self.test_conversation.summary_until_message_id, created[4].id)
+
+    def test_deepseek_gateway_retry_and_circuit_breaker(self):
+        """Test gateway: retry lỗi 503 theo Retry-After, circuit breaker mở khi API lỗi liên tiếp"""
+        from odoo.addons.sbotchat.controllers.deepseek_client import DeepSeekClient, CircuitOpenError
+
+        def fake_response(status_code, headers=None):
+            response = MagicMock(status_code=status_code)
+            response.headers = headers or {}
+            return response
+
+        client = DeepSeekClient(base_url='http://deepseek.test')
+        with patch.object(client.session, 'post', side_effect=[
+                fake_response(503, {'Retry-After': '0'}), fake_response(200)]) as post:
+            response = client.chat_completions('sk-test', json_payload={})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(post.call_count, 2)
+
+        client.configure(max_retries=0)
+        with patch.object(client.session, 'post', return_value=fake_response(500)):
+            for _attempt in range(5):
+                client.chat_completions('sk-test', json_payload={})
+            with self.assertRaises(CircuitOpenError):
+                client.chat_completions('sk-test', json_payload={})
+        self.assertEqual(client.get_gateway_stats()['circuits']['/chat/completions'], 'open')
+        client.close()
+
+    def test_chat_turn_against_mock_server(self):
+        """Test vòng lặp function calling end-to-end với Mock DeepSeek Server"""
+        from odoo.addons.sbotchat.controllers.main import SbotchatController
+        from odoo.addons.sbotchat.controllers.request_scope import bind_env
+        from odoo.addons.sbotchat.tests.benchmark_chat import benchmark_config
+        from odoo.addons.sbotchat.tests.mock_deepseek_server import MockDeepSeekServer
+
+        mock = MockDeepSeekServer(latency=0, jitter=0).start()
+        try:
+            self.env['ir.config_parameter'].sudo().set_param('sbotchat.deepseek_base_url', mock.base_url)
+            user_message = self.env['sbotchat.message'].create({
+                'conversation_id': self.test_conversation.id,
+                'content': 'Tổng quan nhân sự',
+                'role': 'user',
+            })
+            with bind_env(self.env):
+                result = SbotchatController()._run_chat_turn(
+                    self.test_conversation, benchmark_config(), 'Tổng quan nhân sự', user_message.id)
+        finally:
+            mock.stop()
+
+        self.assertTrue(result['success'])
+        self.assertIn('Tổng quan nhân sự', result['response'])
+        # Một request gọi tool + một request trả lời cuối
+        self.assertEqual(mock.stats['requests'], 2)
+
+        # Telemetry của lượt chat được ghi trên tin nhắn trả lời
+        assistant = self.env['sbotchat.message'].browse(result['message_id'])
+        self.assertEqual(assistant.llm_iterations, 2)
+        self.assertGreater(assistant.prompt_tokens, 0)
+        self.assertGreater(assistant.cached_tokens, 0)
+        self.assertGreater(assistant.cache_miss_tokens, 0)
+        self.assertEqual(sorted(assistant.timing_ids.filtered(lambda t: t.kind == 'tool').mapped('name')),
+                         ['get_dashboard_stats', 'get_employees'])
+
+        rollup = self.env['sbotchat.message']._get_latency_rollup('function')
+        self.assertIn('get_employees', [row['key'] for row in rollup])
+
+        # Công ty ghi lúc tạo: đổi công ty mặc định của người dùng không chuyển lượt cũ sang công ty khác
+        company = self.env.company
+        self.assertEqual(assistant.company_id, company)
+        other_company = self.env['res.company'].create({'name': 'AI Test Telemetry Company'})
+        self.env.user.write({'company_ids': [(4, other_company.id)], 'company_id': other_company.id})
+        self.env.flush_all()
+        assistant.invalidate_recordset(['company_id'])
+        self.assertEqual(assistant.company_id, company)
+
+    def test_aggregate_cache_shared_and_invalidated(self):
+        """Test cache tổng hợp: dùng chung giữa người dùng cùng quyền, ghi dữ liệu phụ thuộc làm mục cache mất hiệu lực"""
+        cache = self.env['sbotchat.aggregate.cache']
+        computed = []
+        # Dữ liệu tạo trong setUp coi như đã commit
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+        self.env.cr.postcommit.run()
+
+        def compute():
+            computed.append(True)
+            return {'success': True, 'total': self.env['hr.employee'].search_count([])}
+
+        first = cache.get_or_compute('test.employee_total', compute, ('hr.employee',))
+        second = cache.get_or_compute('test.employee_total', compute, ('hr.employee',))
+        self.assertEqual(len(computed), 1)
+        self.assertEqual(first, second)
+
+        # Người dùng HR cùng nhóm quyền / công ty dùng chung khóa; người dùng thường có khóa riêng
+        hr_group = self.env.ref('hr.group_hr_user')
+        hr_users = [self.env['res.users'].create({
+            'name': f'AI Test HR User {index}',
+            'login': f'ai_test_hr_user_{index}',
+            'groups_id': [(6, 0, [hr_group.id, self.env.ref('base.group_user').id])],
+        }) for index in range(2)]
+        plain_user = self.env['res.users'].create({'name': 'AI Test Plain User', 'login': 'ai_test_plain_user'})
+        keys = [cache.with_user(user)._cache_key('test.employee_total') for user in hr_users + [plain_user]]
+        self.assertEqual(keys[0], keys[1])
+        self.assertNotEqual(keys[0], keys[2])
+
+        # Thay đổi chưa commit trên model phụ thuộc: không dùng cache dùng chung
+        self.env['hr.employee'].create({'name': 'AI Test Aggregate Employee'})
+        self.assertEqual(cache.get_or_compute('test.employee_total', compute, ('hr.employee',))['total'], first['total'] + 1)
+        self.assertEqual(len(computed), 2)
+
+        # Commit: phiên bản hr.employee tăng sau commit (không xóa hàng dùng chung), lần gọi sau tính lại
+        versions = self.env['sbotchat.aggregate.cache.version']
+        before = versions._get_versions(['hr.employee']).get('hr.employee', 0)
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+        self.assertEqual(cache.search_count([('function', '=', 'test.employee_total')]), 1)
+        self.env.cr.postcommit.run()
+        self.assertEqual(versions._get_versions(['hr.employee'])['hr.employee'], before + 1)
+        third = cache.get_or_compute('test.employee_total', compute, ('hr.employee',))
+        self.assertEqual(len(computed), 3)
+        self.assertEqual(third['total'], first['total'] + 1)
+        fourth = cache.get_or_compute('test.employee_total', compute, ('hr.employee',))
+        self.assertEqual((len(computed), fourth), (3, third))
+
+    def test_dashboard_overview_single_query(self):
+        """Test tổng quan dashboard: mọi số đếm trong một truy vấn, không tăng theo số bản ghi"""
+        from odoo.addons.sbotchat.controllers.main import SbotchatController
+        from odoo.addons.sbotchat.controllers.request_scope import bind_env
+
+        from odoo.addons.sbotchat.models.sbotchat_dashboard import dashboard_timezone
+
+        controller = SbotchatController()
+        company_id = self.env.company.id
+        self.env.company.resource_calendar_id.tz = 'UTC'
+        today = fields.Date.today()
+        morning = datetime.combine(today, datetime.min.time())
+
+        def measure():
+            with bind_env(self.env):
+                self.env.flush_all()
+                self.env.invalidate_all()
+                # Múi giờ công ty đã có trong cache ORM của request thực tế
+                dashboard_timezone(self.env, company_id)
+                queries_before = self.env.cr.sql_log_count
+                stats = controller._get_employee_overview_stats(company_id, today)
+                return stats, self.env.cr.sql_log_count - queries_before
+
+        before, first_count = measure()
+        employees = self.env['hr.employee'].create([
+            {'name': f'AI Test Overview {index}', 'company_id': company_id} for index in range(3)
+        ])
+        self.env['hr.attendance'].create([
+            {'employee_id': employees[0].id, 'check_in': morning + timedelta(hours=7), 'check_out': morning + timedelta(hours=8)},
+            {'employee_id': employees[1].id, 'check_in': morning + timedelta(hours=10)},
+        ])
+        after, second_count = measure()
+
+        self.assertEqual(first_count, second_count)
+        self.assertLessEqual(second_count, 2)
+        self.assertEqual(after['total_employees'], before['total_employees'] + 3)
+        self.assertEqual(after['today_checkins'], before['today_checkins'] + 2)
+        self.assertEqual(after['missing_checkout'], before['missing_checkout'] + 1)
+        self.assertEqual(after['late_arrivals'], before['late_arrivals'] + 1)
+
+    def test_dashboard_checkins_use_company_timezone(self):
+        """Test dashboard: ngày và giờ check-in (sớm / đúng giờ / muộn) tính theo múi giờ công ty, không theo UTC"""
+        from odoo.addons.sbotchat.models.sbotchat_dashboard import (
+            checkin_row, dashboard_today, get_overview_counts, local_day_bounds,
+        )
+
+        company_id = self.env.company.id
+        self.env.company.resource_calendar_id.tz = 'Asia/Ho_Chi_Minh'
+        today = dashboard_today(self.env, company_id)
+        local_midnight, _end = local_day_bounds(today, 'Asia/Ho_Chi_Minh')
+        self.assertEqual(local_midnight, datetime.combine(today, datetime.min.time()) - timedelta(hours=7))
+
+        before = get_overview_counts(self.env, company_id, today)
+        employees = self.env['hr.employee'].create([
+            {'name': f'AI Test Timezone {index}', 'company_id': company_id} for index in range(3)
+        ])
+        # 08:30, 07:15 và 10:00 giờ Việt Nam = 01:30, 00:15 và 03:00 UTC
+        attendances = self.env['hr.attendance'].create([
+            {'employee_id': employees[0].id, 'check_in': local_midnight + timedelta(hours=8, minutes=30)},
+            {'employee_id': employees[1].id, 'check_in': local_midnight + timedelta(hours=7, minutes=15)},
+            {'employee_id': employees[2].id, 'check_in': local_midnight + timedelta(hours=10)},
+        ])
+        self.env.flush_all()
+        after = get_overview_counts(self.env, company_id, today)
+
+        self.assertEqual(after['today_checkins'], before['today_checkins'] + 3)
+        self.assertEqual(after['early'], before['early'] + 1)
+        self.assertEqual(after['late'], before['late'] + 1)
+        self.assertEqual(after['on_time'], before['on_time'] + 1)
+        rows = [checkin_row(attendance, 'Asia/Ho_Chi_Minh') for attendance in attendances]
+        self.assertEqual([(row['check_in_time'], row['status']) for row in rows],
+                         [('08:30', 'on_time'), ('07:15', 'early'), ('10:00', 'late')])
+
+    def test_dashboard_delta_failure_keeps_hr_write(self):
+        """Test dashboard realtime: truy vấn delta lỗi không làm hỏng transaction ghi chấm công"""
+        from odoo.addons.sbotchat.models.sbotchat_dashboard import DASHBOARD_NOTIFICATION
+
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+        self.env.cr.postcommit.run()
+        notifications = self.env['bus.bus'].sudo()
+        before = notifications.search([]).ids
+
+        def failing_counts(env, company_id, today):
+            env.cr.execute("SELECT 1 / 0")
+
+        employee = self.env['hr.employee'].create({'name': 'AI Test Bus Failure', 'company_id': self.env.company.id})
+        attendance = self.env['hr.attendance'].create({'employee_id': employee.id, 'check_in': fields.Datetime.now()})
+        with patch('odoo.addons.sbotchat.models.sbotchat_dashboard.get_overview_counts', side_effect=failing_counts), \
+                self.assertLogs('odoo.addons.sbotchat.models.sbotchat_dashboard', level='WARNING'):
+            # Trình tự commit: flush, precommit, COMMIT, postcommit
+            self.env.flush_all()
+            self.env.cr.precommit.run()
+            self.env.cr.postcommit.run()
+
+        # Cursor của người ghi vẫn dùng được, bản ghi chấm công còn nguyên, không có delta
+        self.env.cr.execute("SELECT count(*) FROM hr_attendance WHERE id = %s", (attendance.id,))
+        self.assertEqual(self.env.cr.fetchone()[0], 1)
+        self.assertFalse(notifications.search([('id', 'not in', before)]).filtered(
+            lambda notification: DASHBOARD_NOTIFICATION in notification.message))
+
+    def test_dashboard_delta_sent_on_bus(self):
+        """Test dashboard realtime: chấm công mới gửi một delta lên kênh bus của công ty khi commit"""
+        import json
+        from odoo.addons.sbotchat.controllers.main import SbotchatController
+        from odoo.addons.sbotchat.controllers.request_scope import bind_env
+        from odoo.addons.sbotchat.models.sbotchat_dashboard import DASHBOARD_CHANNEL, DASHBOARD_NOTIFICATION
+
+        company = self.env.company
+        company.resource_calendar_id.tz = 'UTC'
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+        self.env.cr.postcommit.run()
+        notifications = self.env['bus.bus'].sudo()
+        before = notifications.search([]).ids
+
+        morning = datetime.combine(fields.Date.today(), datetime.min.time())
+        employee = self.env['hr.employee'].create({'name': 'AI Test Bus Employee', 'company_id': company.id})
+        attendance = self.env['hr.attendance'].create({'employee_id': employee.id, 'check_in': morning + timedelta(hours=10)})
+        attendance.write({'check_out': morning + timedelta(hours=11)})
+        self.env.flush_all()
+        # Trong transaction của người ghi không có delta nào; delta được tính sau commit trên cursor riêng
+        self.env.cr.precommit.run()
+        self.assertFalse(notifications.search([('id', 'not in', before)]).filtered(
+            lambda notification: DASHBOARD_NOTIFICATION in notification.message))
+        self.env.cr.postcommit.run()
+
+        messages = [
+            json.loads(notification.message)
+            for notification in notifications.search([('id', 'not in', before)])
+        ]
+        deltas = [message for message in messages if message['type'] == DASHBOARD_NOTIFICATION]
+        # Nhiều thay đổi trong một transaction: một delta cho công ty
+        self.assertEqual(len(deltas), 1)
+        payload = deltas[0]['payload']
+        self.assertEqual(payload['company_id'], company.id)
+        self.assertIn('hr.attendance', payload['changed'])
+        self.assertIn(attendance.id, [checkin['id'] for checkin in payload['recent_checkins']])
+        self.assertEqual(payload['recent_checkins'][0]['status'], 'late')
+
+        # Chỉ người dùng HR được thêm kênh dashboard của công ty
+        hr_user = self.env['res.users'].create({
+            'name': 'AI Test Bus HR User',
+            'login': 'ai_test_bus_hr_user',
+            'groups_id': [(6, 0, [self.env.ref('hr.group_hr_user').id, self.env.ref('base.group_user').id])],
+        })
+        plain_user = self.env['res.users'].create({'name': 'AI Test Bus Plain User', 'login': 'ai_test_bus_plain_user'})
+        hr_channels = self.env['ir.websocket'].with_user(hr_user)._build_bus_channel_list([DASHBOARD_CHANNEL])
+        plain_channels = self.env['ir.websocket'].with_user(plain_user)._build_bus_channel_list([DASHBOARD_CHANNEL])
+        self.assertIn((company, DASHBOARD_CHANNEL), hr_channels)
+        self.assertNotIn((company, DASHBOARD_CHANNEL), plain_channels)
+        self.assertNotIn(DASHBOARD_CHANNEL, plain_channels)
+
+        # realtime_stats báo client có nhận delta qua bus không; người dùng không phải HR phải polling
+        controller = SbotchatController()
+        with bind_env(self.env(user=hr_user)):
+            hr_stats = controller.dashboard_realtime_stats()
+        with bind_env(self.env(user=plain_user)):
+            plain_stats = controller.dashboard_realtime_stats()
+        self.assertTrue(hr_stats['data']['is_hr_user'])
+        self.assertFalse(plain_stats['data'].get('is_hr_user'))
+
+    def test_employee_360_constant_queries(self):
+        """Test hồ sơ 360: đủ các phần, số query không tăng theo số bản ghi liên quan"""
+        from odoo.addons.sbotchat.controllers.main import SbotchatController
+        from odoo.addons.sbotchat.controllers.request_scope import bind_env
+
+        manager = self.env['hr.employee'].create({'name': 'AI Test Manager', 'department_id': self.test_department.id})
+        other = self.env['hr.employee'].create({
+            'name': 'AI Test Other',
+            'department_id': self.test_department.id,
+            'parent_id': manager.id,
+        })
+        self.test_employee.parent_id = manager
+        now = datetime.now().replace(microsecond=0)
+        self.env['hr.attendance'].create({
+            'employee_id': other.id,
+            'check_in': now - timedelta(days=1, hours=8),
+            'check_out': now - timedelta(days=1),
+        })
+        self.env['hr.attendance'].create([{
+            'employee_id': self.test_employee.id,
+            'check_in': now - timedelta(days=day, hours=8),
+            'check_out': now - timedelta(days=day),
+        } for day in range(1, 5)])
+
+        controller = SbotchatController()
+        query_counts = []
+        with bind_env(self.env):
+            for employee in (other, self.test_employee):
+                self.env.invalidate_all()
+                queries_before = self.env.cr.sql_log_count
+                result = controller._execute_hr_function('get_employee_360', {'employee_id': employee.id, 'attendance_limit': 3})
+                query_counts.append(self.env.cr.sql_log_count - queries_before)
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['employee']['department'], self.test_department.name)
+        self.assertEqual(result['employee']['manager']['id'], manager.id)
+        self.assertEqual(len(result['recent_attendances']), 3)
+        self.assertIn('leave_balance', result)
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_employee_leave_balance_counts_current_period(self):
+        """Test số ngày đã nghỉ chỉ tính trong thời hạn phân bổ hiện tại (loại không phân bổ: năm nay)"""
+        from datetime import date
+        from odoo.addons.sbotchat.controllers.main import SbotchatController
+        from odoo.addons.sbotchat.controllers.request_scope import bind_env
+
+        today = fields.Date.today()
+        leave_type = self.env['hr.leave.type'].create({
+            'name': 'AI Test Nghỉ không phân bổ',
+            'requires_allocation': 'no',
+            'leave_validation_type': 'no_validation',
+        })
+        leaves = self.env['hr.leave'].create([{
+            'name': f'AI Test nghỉ {year}',
+            'employee_id': self.test_employee.id,
+            'holiday_status_id': leave_type.id,
+            'request_date_from': date(year, 3, 3),
+            'request_date_to': date(year, 3, 4),
+        } for year in (today.year - 2, today.year - 1, today.year)])
+        self.assertEqual(set(leaves.mapped('state')), {'validate'})
+
+        with bind_env(self.env):
+            balance = SbotchatController()._employee_leave_balance(self.test_employee)
+        [row] = [row for row in balance if row['leave_type'] == leave_type.name]
+        self.assertEqual(row['taken'], round(leaves[-1].number_of_days, 2))
+        self.assertIsNone(row['remaining'])
+
+    def test_intent_matcher_matches_rule_order(self):
+        """Test Aho-Corasick matcher cho kết quả giống đánh giá tuần tự theo thứ tự rule"""
+        from odoo.addons.sbotchat.controllers.hr_ai_agent import HRAIAgentController
+        from odoo.addons.sbotchat.controllers.hr_intent_matcher import HRIntentMatcher
+
+        matcher = HRIntentMatcher.get()
+        messages = matcher.keywords + [
+            'Tạo nhân viên mới tên Nguyễn Văn A',
+            'Danh sách nhân viên và thống kê chấm công',
+            'Xin chào',
+        ]
+        for message in messages:
+            self.assertEqual(matcher.match(message.lower()), matcher.match_sequential(message.lower()), message)
+
+        agent = HRAIAgentController()
+        self.assertEqual(agent._analyze_intent('Tạo nhân viên mới')['action'], 'create_employee')
+        self.assertEqual(agent._analyze_intent('Danh sách nhân viên')['action'], 'list_employees')
+        self.assertEqual(agent._analyze_intent('Xin chào')['confidence'], 0.5)
+
+        matches = matcher.match_all('danh sách nhân viên và thống kê')
+        self.assertEqual(matches[0]['action'], 'list_employees')
+        self.assertIn('dashboard_stats', [item['action'] for item in matches])
+        self.assertEqual([item['priority'] for item in matches], sorted(item['priority'] for item in matches))
+
+    def test_intent_ranker_fallback(self):
+        """Test intent ranker: top-k có xác suất, chỉ dùng khi không rule nào khớp"""
+        from odoo.addons.sbotchat.controllers.hr_ai_agent import HRAIAgentController
+        from odoo.addons.sbotchat.controllers.hr_intent_ranker import HRIntentRanker, MAX_CONFIDENCE
+
+        ranker = HRIntentRanker.get()
+        ranked = ranker.rank('danh sach ung vien', 3)
+        self.assertEqual(ranked[0]['action'], 'list_applicants')
+        self.assertEqual(len(ranked), 3)
+        self.assertEqual([item['score'] for item in ranked], sorted((item['score'] for item in ranked), reverse=True))
+        self.assertLessEqual(sum(item['score'] for item in ranked), 1.0001)
+
+        # Không dấu: rule không khớp, ranker chọn intent chỉ đọc với độ tin cậy dưới ngưỡng fast path
+        agent = HRAIAgentController()
+        intent = agent._analyze_intent('danh sach ung vein')
+        self.assertEqual(intent['action'], 'list_applicants')
+        self.assertEqual(intent['method'], 'GET')
+        self.assertLessEqual(intent['confidence'], MAX_CONFIDENCE)
+        self.assertEqual(intent['candidates'][0]['action'], 'list_applicants')
+
+        # Thao tác ghi đoán từ câu sai chính tả không bao giờ được trả về để tự chạy
+        for message, action in (('delete', 'bulk_delete_hr'), ('aprove leave', 'approve_leave')):
+            self.assertEqual(ranker.rank(message, 1)[0]['action'], action)
+            self.assertIsNone(ranker.suggest(message))
+            self.assertEqual(agent._analyze_intent(message)['action'], 'dashboard_stats')
+
+        # Câu ngoài lề vẫn rơi về fallback; rule khớp thì không qua ranker
+        self.assertIsNone(ranker.suggest('Xin chào'))
+        self.assertNotIn('candidates', agent._analyze_intent('Danh sách nhân viên'))
+
+    def test_text_normalizer(self):
+        """Test chuẩn hóa tin nhắn: NFC, bỏ dấu, dấu câu, memo và so khớp không dấu"""
+        import re
+        import unicodedata
+        from odoo.addons.sbotchat.controllers.hr_ai_agent import HRAIAgentController
+        from odoo.addons.sbotchat.controllers.hr_text_normalizer import normalize, search
+
+        normalized = normalize(unicodedata.normalize('NFD', 'Nhân  viên “Đức”\u00a0phòng Kế toán'))
+        self.assertEqual(normalized.text, 'Nhân viên "Đức" phòng Kế toán')
+        self.assertEqual(normalized.folded, 'nhan vien "duc" phong ke toan')
+        self.assertEqual(normalized.tokens, ('nhan', 'vien', 'duc', 'phong', 'ke', 'toan'))
+        self.assertIs(normalize(normalized), normalized)
+        self.assertIs(normalize('Danh sách nhân viên'), normalize('Danh sách nhân viên'))
+        # Regex không dấu, giá trị bắt được giữ dấu của tin nhắn gốc
+        self.assertEqual(search(re.compile(r'phong (.+)$'), normalized), ('Kế toán',))
+
+        agent = HRAIAgentController()
+        self.assertEqual(agent._analyze_intent('danh sach nhan vien'), agent._analyze_intent('Danh sách nhân viên'))
+        # Keyword ngắn sau khi bỏ dấu chỉ khớp trọn từ
+        self.assertEqual(agent._analyze_intent('thoi gian')['confidence'], 0.5)
+        params = agent._extract_parameters('tao nhan vien "Nguyễn Văn A" thang 5 nam 2024', 'create_employee')
+        self.assertEqual((params['vals']['name'], params['month'], params['year']), ('Nguyễn Văn A', '5', '2024'))
+
+    def test_execute_hr_api_route_table(self):
+        """Test bảng route HR API: mọi endpoint của intent rule gọi được, method và tham số path đúng"""
+        import re
+        from odoo.addons.sbotchat.controllers.hr_ai_agent import HRAIAgentController
+        from odoo.addons.sbotchat.controllers.hr_api_routes import HRAPIRouter
+        from odoo.addons.sbotchat.controllers.hr_entity_index import HREntityIndex
+        from odoo.addons.sbotchat.controllers.hr_intent_rules import INTENT_RULES
+        from odoo.addons.sbotchat.controllers.request_scope import bind_env
+
+        router = HRAPIRouter.get()
+        for rule in INTENT_RULES:
+            for variant in rule.get('variants') or [{'result': rule['result']}]:
+                result = variant['result']
+                path = re.sub(r'\{\w+\}', '1', result['api_endpoint'])
+                endpoint, _args = router.match(path, result.get('method', 'GET'))
+                self.assertTrue(endpoint.startswith('hr_'), result['api_endpoint'])
+        self.assertEqual(router.match(f'/api/hr/employee/{self.test_employee.id}/status'),
+                         ('hr_employee_status', {'employee_id': self.test_employee.id}))
+
+        agent = HRAIAgentController()
+        HREntityIndex.clear(self.env.cr.dbname)
+        with bind_env(self.env):
+            # Handler chạy nhánh GET dù request bao ngoài không phải GET
+            listed = agent._execute_hr_api('/api/hr/employees', {'domain': [('id', '=', self.test_employee.id)]}, 'GET')
+            by_name = agent._execute_hr_api('/api/hr/employee/{employee_id}', {'employee_id': 'AI Test Employee'}, 'GET')
+            missing = agent._execute_hr_api('/api/hr/payslip/{payslip_id}', {}, 'GET')
+            not_allowed = agent._execute_hr_api('/api/hr/employees', {}, 'DELETE')
+            unknown = agent._execute_hr_api('/api/hr/does-not-exist', {}, 'GET')
+
+        self.assertEqual([employee['id'] for employee in listed['data']], [self.test_employee.id])
+        self.assertEqual(by_name['data']['id'], self.test_employee.id)
+        self.assertIn('payslip_id', missing['error'])
+        for result in (missing, not_allowed, unknown):
+            self.assertFalse(result['success'])
+
+    def test_hr_ai_agent_dispatches_intent_method(self):
+        """Test endpoint hr_agent: handler được gọi với method của intent (POST cho thao tác ghi, GET cho đọc)"""
+        from odoo.addons.sbotchat.controllers.hr_ai_agent import HRAIAgentController
+        from odoo.addons.sbotchat.controllers.request_scope import bind_env
+
+        agent = HRAIAgentController()
+        with bind_env(self.env):
+            checkin = agent.hr_ai_agent(f'Check in id {self.test_employee.id}')
+            listed = agent.hr_ai_agent('Danh sách nhân viên')
+
+        # Intent POST chạy handler check-in (trước đây bị gửi bằng GET -> MethodNotAllowed)
+        self.assertTrue(checkin['success'])
+        self.assertEqual(checkin['api_called'], '/api/hr/employee/{employee_id}/checkin')
+        self.assertNotIn('❌', checkin['response'])
+        self.assertEqual(self.env['hr.attendance'].search_count([
+            ('employee_id', '=', self.test_employee.id), ('check_out', '=', False)]), 1)
+        self.assertEqual(checkin['data']['id'], self.env['hr.attendance'].search([
+            ('employee_id', '=', self.test_employee.id)], limit=1).id)
+
+        # Intent GET vẫn chạy nhánh đọc
+        self.assertTrue(listed['success'])
+        self.assertIn(self.test_employee.id, [employee['id'] for employee in listed['data']])
+
+    def test_entity_index_resolves_names(self):
+        """Test entity index: tra cứu không dấu, gần đúng và cập nhật tăng dần"""
+        from odoo.addons.sbotchat.controllers.hr_entity_index import HREntityIndex
+        from odoo.addons.sbotchat.controllers.main import SbotchatController
+        from odoo.addons.sbotchat.controllers.request_scope import bind_env
+
+        dbname = self.env.cr.dbname
+        HREntityIndex.clear(dbname)
+        try:
+            employee = self.env['hr.employee'].create({'name': 'AI Test Nguyễn Thị Lan'})
+
+            exact = HREntityIndex.resolve(self.env, 'ai test nguyen thi lan', ['employee'])
+            self.assertEqual((exact[0]['id'], exact[0]['score']), (employee.id, 1.0))
+            typo = HREntityIndex.resolve(self.env, 'AI Test Nguyen Thi Lam', ['employee'])
+            self.assertEqual(typo[0]['id'], employee.id)
+            department = HREntityIndex.resolve(self.env, 'ai test department', ['department'])
+            self.assertEqual(department[0]['id'], self.test_department.id)
+
+            # Hook ORM đánh dấu sau commit - trong test đánh dấu trực tiếp
+            employee.name = 'AI Test Trần Văn Đức'
+            HREntityIndex.mark_dirty(dbname, 'hr.employee', employee.ids)
+            with bind_env(self.env):
+                result = SbotchatController()._execute_hr_function('resolve_entity', {'query': 'ai test tran van duc'})
+            self.assertEqual(result['candidates'][0]['id'], employee.id)
+            self.assertNotIn(employee.id, [c['id'] for c in HREntityIndex.resolve(self.env, 'ai test nguyen thi lan', ['employee'])
+                                           if c['score'] == 1.0])
+        finally:
+            HREntityIndex.clear(dbname)
+
+    def test_entity_index_reuses_slots_on_update(self):
+        """Test entity index: cập nhật cùng một bản ghi nhiều lần dùng lại slot, index không phình ra"""
+        from odoo.addons.sbotchat.controllers.hr_entity_index import HREntityIndex
+
+        dbname = self.env.cr.dbname
+        HREntityIndex.clear(dbname)
+        try:
+            employee = self.env['hr.employee'].create({'name': 'AI Test Slot Employee', 'work_email': 'slot@example.com'})
+            HREntityIndex.resolve(self.env, 'ai test slot employee', ['employee'])
+            index = HREntityIndex._indexes[(dbname, self.env.company.id)]
+            size = len(index.slots)
+            for revision in range(50):
+                employee.name = f'AI Test Slot Employee {revision}'
+                HREntityIndex.mark_dirty(dbname, 'hr.employee', employee.ids)
+                HREntityIndex.resolve(self.env, 'ai test slot employee', ['employee'])
+            self.assertEqual(len(index.slots), size)
+            self.assertEqual(HREntityIndex.resolve(self.env, 'ai test slot employee 49', ['employee'])[0]['id'], employee.id)
+        finally:
+            HREntityIndex.clear(dbname)
+
+    def test_entity_index_respects_caller_access(self):
+        """Test entity index: mã định danh chỉ người dùng HR tra được và không bao giờ bị trả về"""
+        from odoo.addons.sbotchat.controllers.hr_entity_index import HREntityIndex
+
+        dbname = self.env.cr.dbname
+        HREntityIndex.clear(dbname)
+        try:
+            employee = self.env['hr.employee'].create({
+                'name': 'AI Test Identity Holder',
+                'identification_id': '079123456789',
+                'barcode': '99887766',
+            })
+            hr_user = self.env['res.users'].create({
+                'name': 'AI Test Index HR User',
+                'login': 'ai_test_index_hr_user',
+                'groups_id': [(6, 0, [self.env.ref('hr.group_hr_user').id, self.env.ref('base.group_user').id])],
+            })
+            plain_user = self.env['res.users'].create({'name': 'AI Test Index Plain User', 'login': 'ai_test_index_plain_user'})
+
+            by_id = HREntityIndex.resolve(self.env(user=hr_user), '079123456789', ['employee'])
+            self.assertEqual(by_id[0]['id'], employee.id)
+            self.assertEqual(by_id[0]['matched_field'], 'identification_id')
+            self.assertIsNone(by_id[0]['matched'])
+
+            for query in ('079123456789', '0791234567', '99887766'):
+                candidates = HREntityIndex.resolve(self.env(user=plain_user), query)
+                self.assertNotIn(employee.id, [c['id'] for c in candidates if c['type'] == 'employee'])
+                self.assertFalse([c for c in candidates if c['matched'] in ('079123456789', '99887766')])
+
+            # Bản ghi người gọi không đọc được (record rule công ty) bị loại
+            other_company = self.env['res.company'].create({'name': 'AI Test Other Company'})
+            hidden = self.env['hr.department'].create({'name': 'AI Test Hidden Department', 'company_id': other_company.id})
+            candidates = [{'type': 'department', 'id': record.id} for record in (hidden, self.test_department)]
+            self.assertEqual([c['id'] for c in HREntityIndex._filter_readable(self.env(user=hr_user), candidates)],
+                             [self.test_department.id])
+        finally:
+            HREntityIndex.clear(dbname)
+
+    def test_plan_then_execute_mode(self):
+        """Test chế độ plan-then-execute: một vòng lập kế hoạch, DAG chạy cục bộ, một vòng trả lời"""
+        from odoo.addons.sbotchat.controllers.hr_plan_executor import HRExecutionPlan, HRPlanExecutor, PlanError
+        from odoo.addons.sbotchat.controllers.main import SbotchatController
+        from odoo.addons.sbotchat.controllers.request_scope import bind_env
+        from odoo.addons.sbotchat.tests.benchmark_chat import benchmark_config
+        from odoo.addons.sbotchat.tests.mock_deepseek_server import MockDeepSeekServer
+
+        transcripts = [{
+            'match': None,
+            'steps': [
+                {'tool_calls': [
+                    {'name': 'get_employees', 'arguments': {'name': 'AI Test Employee'}},
+                    {'name': 'get_employee_leaves', 'arguments': {'employee_id': '$s1.data.0.id'}},
+                ]},
+                {'content': 'Nhân viên AI Test Employee không có đơn nghỉ phép chờ duyệt.'},
+            ],
+        }]
+        mock = MockDeepSeekServer(transcripts=transcripts, latency=0, jitter=0).start()
+        try:
+            self.env['ir.config_parameter'].sudo().set_param('sbotchat.deepseek_base_url', mock.base_url)
+            message = 'Tìm AI Test Employee và xem đơn nghỉ phép chờ duyệt'
+            user_message = self.env['sbotchat.message'].create({
+                'conversation_id': self.test_conversation.id,
+                'content': message,
+                'role': 'user',
+            })
+            with bind_env(self.env):
+                result = SbotchatController()._run_chat_turn(
+                    self.test_conversation, benchmark_config(), message, user_message.id, plan_mode=True)
+        finally:
+            mock.stop()
+
+        self.assertTrue(result['success'])
+        self.assertEqual(mock.stats['requests'], 2)
+        assistant = self.env['sbotchat.message'].browse(result['message_id'])
+        self.assertEqual(assistant.llm_iterations, 2)
+        self.assertEqual(assistant.timing_ids.filtered(lambda t: t.kind == 'tool').mapped('name'),
+                         ['get_employees', 'get_employee_leaves'])
+
+        # Tham chiếu giữa các bước được resolve từ kết quả bước trước
+        outputs = {'s1': {'success': True, 'data': [{'id': self.test_employee.id}]}}
+        self.assertEqual(HRPlanExecutor.resolve({'employee_id': '$s1.data.0.id'}, outputs),
+                         {'employee_id': self.test_employee.id})
+        with self.assertRaises(PlanError):
+            HRExecutionPlan.parse(json.dumps({'steps': [
+                {'id': 'a', 'function': 'get_employees', 'arguments': {'name': '$b.data.0.name'}},
+                {'id': 'b', 'function': 'get_employees', 'arguments': {'name': '$a.data.0.name'}},
+            ]}), {'get_employees'})
+
+    def test_plan_failure_keeps_full_iteration_budget(self):
+        """Test kế hoạch lỗi không tính vào số lần gọi: câu trả lời ở lần gọi cuối cùng được giữ"""
+        from odoo.addons.sbotchat.controllers.main import SbotchatController, MAX_TURN_ITERATIONS
+        from odoo.addons.sbotchat.controllers.request_scope import bind_env
+        from odoo.addons.sbotchat.tests.benchmark_chat import benchmark_config
+        from odoo.addons.sbotchat.tests.mock_deepseek_server import MockDeepSeekServer
+
+        answer = 'Đã tra cứu xong danh sách nhân viên.'
+        tool_steps = [
+            {'tool_calls': [{'name': 'get_employees', 'arguments': {'limit': index + 1}}]}
+            for index in range(MAX_TURN_ITERATIONS - 1)
+        ]
+        mock = MockDeepSeekServer(transcripts=[{'match': None, 'steps': tool_steps + [{'content': answer}]}],
+                                  latency=0, jitter=0).start()
+        try:
+            self.env['ir.config_parameter'].sudo().set_param('sbotchat.deepseek_base_url', mock.base_url)
+            self.env['ir.config_parameter'].sudo().set_param('sbotchat.tool_memo', 'off')
+            message = 'Tra cứu nhân viên nhiều bước'
+            user_message = self.env['sbotchat.message'].create({
+                'conversation_id': self.test_conversation.id,
+                'content': message,
+                'role': 'user',
+            })
+            with bind_env(self.env), patch.object(SbotchatController, '_run_plan_phase', return_value=False):
+                result = SbotchatController()._run_chat_turn(
+                    self.test_conversation, benchmark_config(), message, user_message.id, plan_mode=True)
+        finally:
+            mock.stop()
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['response'], answer)
+        self.assertEqual(mock.stats['requests'], MAX_TURN_ITERATIONS)
+
+    def test_chat_job_run_and_cancel(self):
+        """Test job chat nền: chạy lượt chat với quyền người gửi, hủy job đang chờ"""
+        from odoo.addons.sbotchat.controllers.main import SbotchatController
+
+        Job = self.env['sbotchat.chat.job']
+        job = Job.create({
+            'conversation_id': self.test_conversation.id,
+            'message': 'Có bao nhiêu nhân viên?',
+        })
+        self.assertEqual(job.state, 'queued')
+
+        turn_result = {'success': True, 'response': 'Có 10 nhân viên', 'conversation_id': self.test_conversation.id, 'message_id': False}
+        with patch.object(SbotchatController, '_run_chat_turn', return_value=turn_result) as run_turn:
+            job.write({'state': 'running'})
+            job._run()
+
+        self.assertEqual(run_turn.call_args[0][2], 'Có bao nhiêu nhân viên?')
+        # Không chọn chế độ: theo tham số hệ thống
+        self.assertIsNone(run_turn.call_args.kwargs['plan_mode'])
+        self.assertEqual(job.state, 'done')
+        self.assertEqual(job._get_status()['response'], 'Có 10 nhân viên')
+        self.assertTrue(job._get_status()['done'])
+
+        queued_job = Job.create({
+            'conversation_id': self.test_conversation.id,
+            'message': 'Xin chào',
+        })
+        queued_job.action_cancel()
+        self.assertEqual(queued_job.state, 'cancelled')
+
+        # Chế độ plan-then-execute của client được chuyển tới job nền
+        plan_job = Job.create({'conversation_id': self.test_conversation.id, 'message': 'Lập báo cáo', 'plan_mode': 'on'})
+        with patch.object(SbotchatController, '_run_chat_turn', return_value=turn_result) as run_turn:
+            plan_job.write({'state': 'running'})
+            plan_job._run()
+        self.assertIs(run_turn.call_args.kwargs['plan_mode'], True)
+
+        # Job chạy lâu nhưng chưa vượt thời gian tối đa của một lượt chat (kèm retry) không bị đánh dấu lỗi
+        self.env['ir.config_parameter'].sudo().set_param('sbotchat.llm_max_retries', '2')
+        self.assertGreater(Job._get_stale_timeout(), timedelta(minutes=45))
+        now = fields.Datetime.now()
+        live_job = Job.create({'conversation_id': self.test_conversation.id, 'message': 'Job dài'})
+        dead_job = Job.create({'conversation_id': self.test_conversation.id, 'message': 'Job treo'})
+        live_job.write({'state': 'running', 'started_at': now - timedelta(minutes=30)})
+        dead_job.write({'state': 'running', 'started_at': now - Job._get_stale_timeout() - timedelta(minutes=1)})
+        Job._recover_stale_jobs()
+        self.assertEqual(live_job.state, 'running')
+        self.assertEqual(dead_job.state, 'failed')
+
+    def test_chat_job_visible_only_to_owner(self):
+        """Test job chat nền: người dùng chỉ đọc được job của mình, không tự ghi / tạo job"""
+        from odoo.exceptions import AccessError
+
+        owner = self.env['res.users'].create({'name': 'AI Test Job Owner', 'login': 'ai_test_job_owner'})
+        other = self.env['res.users'].create({'name': 'AI Test Job Other', 'login': 'ai_test_job_other'})
+        job = self.env['sbotchat.chat.job'].create({
+            'user_id': owner.id,
+            'conversation_id': self.test_conversation.id,
+            'message': 'Tin nhắn riêng tư',
+        })
+
+        self.assertEqual(job.with_user(owner).read(['message'])[0]['message'], 'Tin nhắn riêng tư')
+        self.assertFalse(self.env['sbotchat.chat.job'].with_user(other).search([('id', '=', job.id)]))
+        with self.assertRaises(AccessError):
+            job.with_user(other).read(['message'])
+        with self.assertRaises(AccessError):
+            job.with_user(owner).write({'state': 'cancelled'})
+        with self.assertRaises(AccessError):
+            self.env['sbotchat.chat.job'].with_user(owner).create({
+                'conversation_id': self.test_conversation.id,
+                'message': 'Job tự tạo',
+            })
+
+    def test_prompt_prefix_is_byte_stable(self):
+        """Test system prompt + tools giống hệt nhau giữa các cuộc trò chuyện (prefix cho context cache)"""
+        from types import SimpleNamespace
+        from odoo.addons.sbotchat.controllers.deepseek_client import encode_chat_payload
+        from odoo.addons.sbotchat.controllers.hr_tool_selector import HRToolSelector
+        from odoo.addons.sbotchat.controllers.main import SbotchatController, HR_SYSTEM_PROMPT
+        from odoo.addons.sbotchat.controllers.request_scope import bind_env
+
+        controller = SbotchatController()
+        config = SimpleNamespace(model_type='deepseek-chat', max_tokens=1000)
+        other_conversation = self.env['sbotchat.conversation'].create({'title': 'Test Prefix'})
+        self.env['sbotchat.message'].create({
+            'conversation_id': other_conversation.id,
+            'content': 'Tin nhắn cũ',
+            'role': 'user',
+        })
+
+        with bind_env(self.env):
+            first = controller._build_conversation_messages(self.test_conversation, config)
+            second = controller._build_conversation_messages(other_conversation, config)
+
+        self.assertEqual(first[0], {'role': 'system', 'content': HR_SYSTEM_PROMPT})
+        self.assertEqual(first[0], second[0])
+        self.assertEqual(HRToolSelector.get_tools_json(None), HRToolSelector.get_tools_json(None))
+        body = encode_chat_payload({'messages': first[:1]}, HRToolSelector.get_tools_json(None))
+        self.assertEqual(body, encode_chat_payload({'messages': second[:1]}, HRToolSelector.get_tools_json(None)))
+
+    def test_result_shaper_compacts_tool_results(self):
+        """Test kết quả tool được chiếu field, giới hạn số dòng và tóm tắt số liệu"""
+        from odoo.addons.sbotchat.controllers.hr_result_shaper import HRResultShaper
+
+        result = {
+            'success': True,
+            'timesheets': [
+                {'id': index, 'date': '2024-01-01', 'unit_amount': 2.0, 'name': 'Task', 'include_cost': False}
+                for index in range(40)
+            ],
+            'count': 40,
+        }
+        content, stats = HRResultShaper.shape('get_project_timesheets', result)
+        compacted = json.loads(content)
+
+        self.assertEqual(len(compacted['timesheets']), 15)
+        self.assertNotIn('include_cost', compacted['timesheets'][0])
+        self.assertEqual(compacted['timesheets_more_available'], 25)
+        self.assertEqual(compacted['timesheets_summary']['unit_amount']['sum'], 80.0)
+        self.assertLess(stats['bytes_after'], stats['bytes_before'])
+        self.assertLessEqual(stats['tokens_after'], stats['tokens_before'])
+
+    def test_result_shaper_projections_match_handlers(self):
+        """Test mỗi projection khớp key / field thật của handler và giữ mọi field nghiệp vụ"""
+        from datetime import date
+        from odoo.addons.sbotchat.controllers.main import SbotchatController
+        from odoo.addons.sbotchat.controllers.hr_result_shaper import HRResultShaper, FUNCTION_PROJECTIONS
+
+        contract = MagicMock()
+        contract.configure_mock(
+            id=7, state='open', duration_type='fixed', termination_reason='Hết hạn hợp đồng',
+            date_start=date(2024, 1, 1), date_end=None, renewal_date=None, date_signed=date(2023, 12, 20),
+            signature='A' * 5000, approval_signature='B' * 5000, amendment_approval_signature=False,
+            revision_history='v2: điều chỉnh lương', amendment_history='PL01', approval_status='approved',
+            approval_date=None, amendment_status=False, amendment_approval_status=False,
+            amendment_approval_date=None, signatory_id=False, approval_signatory_id=False,
+            amendment_approval_signatory_id=False, attachment_ids=False, amendment_approval_attachment_ids=False,
+        )
+        contract.name = 'HĐ-007'
+        contract.type_id.name = 'Chính thức'
+        timesheet = MagicMock(id=3, date=date(2024, 1, 2), unit_amount=4.0)
+        timesheet.name = 'Họp dự án'
+
+        cases = {
+            'get_contract_details': ('_hr_get_contract_details', {'employee_id': 1}),
+            'get_contracts': ('_hr_get_contracts', {'employee_id': 1}),
+            'get_project_timesheets': ('_hr_get_project_timesheets', {'project_id': 1, 'date_from': '2024-01-01', 'date_to': '2024-01-31'}),
+        }
+        self.assertEqual(set(cases), set(FUNCTION_PROJECTIONS))
+
+        controller = SbotchatController()
+        with patch('odoo.addons.sbotchat.controllers.main.request') as mock_request:
+            model = mock_request.env.__getitem__.return_value
+            model.browse.return_value.contract_ids.filtered.return_value = contract
+            for function_name, (method, kwargs) in cases.items():
+                with self.subTest(function=function_name):
+                    model.search.return_value = [timesheet] if 'timesheets' in function_name else [contract]
+                    result = getattr(controller, method)(**kwargs)
+                    self.assertTrue(result.get('success'), result)
+                    compacted = HRResultShaper.compact(function_name, result)
+                    for key, projected_fields in FUNCTION_PROJECTIONS[function_name].items():
+                        self.assertIn(key, result, f"{function_name} không trả về key {key}")
+                        rows = result[key] if isinstance(result[key], list) else [result[key]]
+                        compacted_rows = compacted[key] if isinstance(compacted[key], list) else [compacted[key]]
+                        for row, compacted_row in zip(rows, compacted_rows):
+                            self.assertLessEqual(set(projected_fields), set(row), f"{function_name}: field không có trong kết quả")
+                            for field in projected_fields:
+                                if row[field] is not None:
+                                    self.assertEqual(compacted_row[field], row[field])
+
+        contract_row = HRResultShaper.compact('get_contracts', {'contracts': [{
+            'id': 7, 'termination_reason': 'Hết hạn hợp đồng', 'amendment_status': False, 'signature': 'A' * 5000,
+        }]})['contracts'][0]
+        self.assertNotIn('signature', contract_row)
+        self.assertEqual(contract_row['termination_reason'], 'Hết hạn hợp đồng')
+        # False / 0 có nghĩa, không bị bỏ
+        self.assertIs(contract_row['amendment_status'], False)
+        self.assertEqual(HRResultShaper.compact('get_employees', {'data': [{'active': False, 'count': 0}]})['data'][0],
+                         {'active': False, 'count': 0})
+
+    def test_fast_path_answers_simple_lookups(self):
+        """Test tra cứu đơn giản trả lời không qua LLM, câu phức tạp chuyển cho model"""
+        from odoo.addons.sbotchat.controllers.hr_entity_index import HREntityIndex
+        from odoo.addons.sbotchat.controllers.hr_fast_path import HRFastPath
+        from odoo.addons.sbotchat.controllers.request_scope import bind_env
+
+        # Phòng ban được tra qua entity index - build lại để thấy dữ liệu của test
+        HREntityIndex.clear(self.env.cr.dbname)
+        with bind_env(self.env):
+            stats = HRFastPath.answer('Thống kê tổng quan')
+            employees = HRFastPath.answer(f'Danh sách nhân viên phòng {self.test_department.name}')
+            unaccented = HRFastPath.answer('danh sach nhan vien')
+            multi_step = HRFastPath.answer('Thống kê tổng quan rồi tạo đơn nghỉ phép cho tôi')
+            unknown_department = HRFastPath.answer('Danh sách nhân viên phòng Không Tồn Tại XYZ')
+            write_action = HRFastPath.answer('Tạo nhân viên mới tên Nguyễn Văn A')
+
+        self.assertEqual(stats['action'], 'dashboard_stats')
+        self.assertTrue(stats['response'])
+        self.assertEqual(employees['action'], 'list_employees')
+        self.assertIn(self.test_employee.name, employees['response'])
+        self.assertEqual(unaccented['action'], 'list_employees')
+        self.assertIsNone(multi_step)
+        self.assertIsNone(unknown_department)
+        self.assertIsNone(write_action)
+        self.assertGreaterEqual(HRFastPath.get_metrics()['hits'], 2)
+
+    def test_fast_path_falls_through_on_unhandled_filters(self):
+        """Test câu có điều kiện fetcher không áp dụng được (trạng thái, người, ngày, lương) chuyển cho LLM"""
+        from odoo.addons.sbotchat.controllers.hr_fast_path import HRFastPath
+        from odoo.addons.sbotchat.controllers.request_scope import bind_env
+
+        with bind_env(self.env):
+            for message in (
+                'danh sách nhân viên đi muộn hôm nay',
+                'danh sách nhân viên nghỉ việc',
+                'danh sách nghỉ phép của nhân viên An',
+                'thống kê lương nhân viên phòng IT',
+            ):
+                with self.subTest(message=message):
+                    self.assertIsNone(HRFastPath.answer(message))
+            # Từ đệm quanh cụm từ kích hoạt vẫn đi đường tắt
+            self.assertEqual(HRFastPath.answer('Cho tôi xem danh sách nhân viên')['action'], 'list_employees')
+            self.assertEqual(HRFastPath.answer('Danh sách đơn nghỉ phép')['action'], 'list_leaves')
+
     def tearDown(self):
         """Clean up after tests"""
         super().tearDown()
@@ -100,6 +100,64 @@ class TestHRFunctionsSchemaImport(TransactionCase):
                 self.assertIn(expected_func, function_names, 
                              f"Function '{expected_func}' should be present in schema")
 
+    def test_catalog_cached_and_pre_encoded(self):
+        """Test catalog được build một lần và giữ JSON bytes sẵn"""
+        import json
+
+        catalog = HRFunctionsSchema.get_catalog()
+        self.assertIs(catalog, HRFunctionsSchema.get_catalog(), "Catalog should be built once per process")
+        self.assertEqual(len(set(catalog.names)), len(catalog.names), "Function names should be unique")
+
+        decoded = json.loads(HRFunctionsSchema.get_tools_json())
+        self.assertEqual([tool['function']['name'] for tool in decoded], list(catalog.names))
+        self.assertEqual(len(HRFunctionsSchema.get_schema_version()), 16)
+
+    def test_tools_json_subset_keeps_catalog_order(self):
+        """Test tập con tools giữ thứ tự catalog để prefix byte-stable"""
+        import json
+
+        subset = json.loads(HRFunctionsSchema.get_tools_json(['archive_job', 'get_employees']))
+        self.assertEqual([tool['function']['name'] for tool in subset], ['get_employees', 'archive_job'])
+
+    def test_tool_selector_subset(self):
+        """Test tool selector giữ core set, thêm function liên quan và meta-tool mở rộng"""
+        import json
+        from odoo.addons.sbotchat.controllers.hr_tool_selector import HRToolSelector, CORE_TOOLS, WIDEN_TOOL_NAME
+
+        names = HRToolSelector.select('Xem phiếu lương tháng này', top_n=10)
+        self.assertIsNotNone(names)
+        for core_tool in CORE_TOOLS:
+            self.assertIn(core_tool, names)
+        self.assertIn('get_payslips', names)
+        self.assertLess(len(names), len(HRFunctionsSchema.get_catalog().names))
+
+        tools = json.loads(HRToolSelector.get_tools_json(names))
+        self.assertEqual(tools[-1]['function']['name'], WIDEN_TOOL_NAME)
+        self.assertGreater(HRToolSelector.get_metrics()['prompt_tokens_saved'], 0)
+
+    def test_function_registry_validates_arguments(self):
+        """Test registry: mọi function trong schema có handler, tham số được ép kiểu / từ chối trước khi gọi"""
+        from odoo.addons.sbotchat.controllers.hr_function_registry import HRFunctionRegistry, ArgumentError
+
+        registry = HRFunctionRegistry.get(SbotchatController)
+        self.assertEqual(set(registry.functions), set(HRFunctionsSchema.get_catalog().names))
+        self.assertTrue(registry.functions['get_employees'].read_only)
+        self.assertFalse(registry.functions['create_employee'].read_only)
+
+        validator = registry.functions['get_employees'].validator
+        self.assertEqual(validator({'limit': '5', 'active': 'false', 'unexpected_param': 1}), {'limit': 5, 'active': False})
+        with self.assertRaises(ArgumentError):
+            validator({'limit': 'nhiều'})
+        # Tham số tùy chọn trong schema nhưng bắt buộc theo chữ ký handler: truyền None
+        self.assertIsNone(registry.functions['get_payslips'].validator({'employee_id': 1})['date_from'])
+
+        with patch.object(SbotchatController, '_hr_get_employee_detail') as handler:
+            result = self.controller._execute_hr_function('get_employee_detail', {'employee_id': 'abc'})
+            missing = self.controller._execute_hr_function('get_employee_detail', {})
+        handler.assert_not_called()
+        self.assertIn('employee_id', result['error'])
+        self.assertIn('employee_id', missing['error'])
+
     def test_get_employees_function_with_name_parameter(self):
         """Test get_employees function với parameter name"""
         # Test case 1: get_employees with name parameter
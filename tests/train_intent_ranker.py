@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Intent Ranker Training
+Huấn luyện HRIntentRanker từ keyword của INTENT_RULES và một corpus câu có nhãn,
+in độ chính xác top-1 / top-k trên phần giữ lại để hiệu chỉnh rồi ghi model JSON.
+
+    python3 train_intent_ranker.py --corpus utterances.tsv   # mỗi dòng: action<TAB>câu
+    python3 train_intent_ranker.py --output /tmp/intent_ranker.json
+
+Mỗi câu thứ --holdout của corpus được giữ lại để chọn nhiệt độ softmax và đánh giá.
+Không cần Odoo: các module controllers chỉ dùng thư viện chuẩn.
+"""
+
+import argparse
+import os
+import sys
+import time
+import types
+
+CONTROLLERS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'controllers')
+
+
+def load_ranker_module():
+    """Nạp hr_intent_ranker như một package ảo để chạy ngoài Odoo"""
+    package = types.ModuleType('sbotchat_controllers')
+    package.__path__ = [CONTROLLERS_DIR]
+    sys.modules.setdefault('sbotchat_controllers', package)
+    from sbotchat_controllers import hr_intent_ranker
+    return hr_intent_ranker
+
+
+def read_corpus(path):
+    examples = []
+    with open(path, encoding='utf-8') as handle:
+        for line_number, line in enumerate(handle, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            action, separator, text = line.partition('\t')
+            if not separator or not text.strip():
+                print(f"Bỏ qua dòng {line_number}: cần 'action<TAB>câu'")
+                continue
+            examples.append((text.strip(), action.strip()))
+    return examples
+
+
+def evaluate(ranker, examples, k):
+    """(top-1, top-k) accuracy theo action"""
+    if not examples:
+        return 0.0, 0.0
+    top1 = topk = 0
+    for text, action in examples:
+        actions = [item['action'] for item in ranker.rank(text, k)]
+        top1 += bool(actions) and actions[0] == action
+        topk += action in actions
+    return top1 / len(examples), topk / len(examples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Huấn luyện intent ranker n-gram ký tự cho HR agent')
+    parser.add_argument('--corpus', help='File TSV: action<TAB>câu')
+    parser.add_argument('--holdout', type=int, default=5, help='Giữ lại mỗi câu thứ N để hiệu chỉnh / đánh giá')
+    parser.add_argument('--top-k', type=int, default=3, help='k khi báo cáo độ chính xác top-k')
+    parser.add_argument('--output', help='Đường dẫn model (mặc định data/intent_ranker.json)')
+    args = parser.parse_args()
+
+    module = load_ranker_module()
+    examples = read_corpus(args.corpus) if args.corpus else []
+    calibration = examples[args.holdout - 1::args.holdout] if args.holdout > 0 else []
+    training = [example for index, example in enumerate(examples)
+                if args.holdout <= 0 or (index + 1) % args.holdout]
+
+    started = time.perf_counter()
+    ranker = module.HRIntentRanker.train(training, calibration or None)
+    train_time = time.perf_counter() - started
+
+    keywords = [(keyword, ranker.variants[priority][-1][1]['action'])
+                for priority, rule in enumerate(module.INTENT_RULES)
+                for keyword in rule['keywords'] if not rule.get('variants')]
+    print(f"Rules: {len(ranker.centroids)}, câu huấn luyện: {len(training)}, giữ lại: {len(calibration)}, "
+          f"huấn luyện {train_time:.2f}s, nhiệt độ {ranker.temperature}")
+    for label, data in (('Keyword (rule không variant)', keywords), ('Câu giữ lại', calibration)):
+        if data:
+            top1, topk = evaluate(ranker, data, args.top_k)
+            print(f"{label}: top-1 {top1:.1%}, top-{args.top_k} {topk:.1%} ({len(data)} câu)")
+
+    queries = [text for text, _action in keywords[:200]]
+    started = time.perf_counter()
+    for text in queries:
+        ranker.rank(text, args.top_k)
+    print(f"Xếp hạng: {(time.perf_counter() - started) / len(queries) * 1e6:.0f}µs / câu")
+
+    output = args.output or module.MODEL_PATH
+    ranker.save(output)
+    print(f"Đã ghi model: {output} ({os.path.getsize(output) / 1024:.0f} KB)")
+
+
+if __name__ == '__main__':
+    main()